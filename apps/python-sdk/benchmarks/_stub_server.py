@@ -0,0 +1,77 @@
+"""
+Minimal local stub of the Firecrawl API used by the benchmark scripts.
+
+The server speaks HTTP/1.1 with keep-alive so client-side connection reuse is
+observable. Responses are produced by a ``handler(method, path, body) -> (status, payload)``
+callable; an optional fixed ``latency`` (seconds) is injected before each reply.
+"""
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional, Tuple
+
+Handler = Callable[[str, str, bytes], Tuple[int, Any]]
+
+
+def _default_handler(method: str, path: str, body: bytes) -> Tuple[int, Any]:
+    return 200, {"success": True, "data": {"markdown": "# stub", "metadata": {"sourceURL": path}}}
+
+
+class StubServer:
+    def __init__(self, handler: Optional[Handler] = None, latency: float = 0.0) -> None:
+        self.handler = handler or _default_handler
+        self.latency = latency
+        self.connections = 0
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        assert self._httpd is not None
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubServer":
+        stub = self
+
+        class _RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                stub.connections += 1
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                if stub.latency:
+                    threading.Event().wait(stub.latency)
+                status, payload = stub.handler(self.command, self.path, body)
+                raw = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            do_GET = _respond
+            do_POST = _respond
+            do_DELETE = _respond
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RequestHandler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
@@ -0,0 +1,59 @@
+"""
+Requests/second of the sync v2 HttpClient against a local stub server,
+comparing per-call connections (module-level ``requests.post``, the previous
+behaviour) with the pooled keep-alive session.
+
+Usage:
+    python benchmarks/bench_connection_pool.py [--requests 2000] [--threads 8]
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from _stub_server import StubServer
+from firecrawl.v2.utils.http_client import HttpClient
+
+
+def _run(send, n: int, threads: int) -> float:
+    start = time.perf_counter()
+    if threads <= 1:
+        for _ in range(n):
+            send()
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(lambda _: send(), range(n)))
+    return n / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with StubServer() as server:
+        url = f"{server.url}/v2/scrape"
+        payload = {"url": "https://example.com"}
+        headers = {"Authorization": "Bearer bench", "Content-Type": "application/json"}
+
+        for threads in (1, args.threads):
+            server.connections = 0
+            before = _run(lambda: requests.post(url, json=payload, headers=headers), args.requests, threads)
+            before_conns = server.connections
+
+            server.connections = 0
+            with HttpClient("bench", server.url, max_connections_per_host=max(threads, 1)) as client:
+                after = _run(lambda: client.post("/v2/scrape", dict(payload)), args.requests, threads)
+            after_conns = server.connections
+
+            print(
+                f"threads={threads:<3} per-call: {before:8.0f} req/s ({before_conns} conns)   "
+                f"pooled: {after:8.0f} req/s ({after_conns} conns)   speedup: {after / before:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Decode/encode time per MB of a crawl status page for each available JSON
+codec, compared with the previous path (``response.json()``: bytes decoded to
+``str`` then parsed by the stdlib).
+
+Usage:
+    python benchmarks/bench_json_codec.py [--docs 200] [--doc-kb 20] [--rounds 20]
+"""
+
+import argparse
+import json
+import time
+
+from firecrawl.v2.utils import json_codec
+
+
+def _payload(docs: int, doc_kb: int) -> bytes:
+    markdown = ("# Heading\n\nSome *markdown* with unicode — ✓ and links [x](https://example.com).\n" * 64)
+    markdown = (markdown * (doc_kb * 1024 // len(markdown) + 1))[: doc_kb * 1024]
+    body = {
+        "success": True,
+        "status": "completed",
+        "completed": docs,
+        "total": docs,
+        "creditsUsed": docs,
+        "expiresAt": "2030-01-01T00:00:00.000Z",
+        "next": None,
+        "data": [
+            {
+                "markdown": markdown,
+                "html": f"<html><body><p>{i}</p></body></html>",
+                "metadata": {"sourceURL": f"https://example.com/{i}", "statusCode": 200, "title": f"Page {i}"},
+            }
+            for i in range(docs)
+        ],
+    }
+    return json.dumps(body).encode("utf-8")
+
+
+def _time(fn, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--doc-kb", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    raw = _payload(args.docs, args.doc_kb)
+    obj = json.loads(raw)
+    mb = len(raw) / (1024 * 1024)
+    print(f"payload: {mb:.1f} MB ({args.docs} documents)")
+
+    baseline_decode = _time(lambda: json.loads(raw.decode("utf-8")), args.rounds) / mb
+    baseline_encode = _time(lambda: json.dumps(obj).encode("utf-8"), args.rounds) / mb
+    print(f"{'baseline':<8} decode {baseline_decode * 1000:7.2f} ms/MB   encode {baseline_encode * 1000:7.2f} ms/MB")
+
+    for name in ("stdlib", "msgspec", "orjson"):
+        try:
+            codec = json_codec.set_codec(name)
+        except ValueError:
+            print(f"{name:<8} not installed")
+            continue
+        decode = _time(lambda: codec.loads(raw), args.rounds) / mb
+        encode = _time(lambda: codec.dumps(obj), args.rounds) / mb
+        print(
+            f"{name:<8} decode {decode * 1000:7.2f} ms/MB ({(baseline_decode - decode) * 1000:+6.2f} saved)   "
+            f"encode {encode * 1000:7.2f} ms/MB ({(baseline_encode - encode) * 1000:+6.2f} saved)"
+        )
+
+
+if __name__ == "__main__":
+    main()
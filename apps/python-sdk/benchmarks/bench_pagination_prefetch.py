@@ -0,0 +1,96 @@
+"""
+Pages per second of ``get_crawl_status`` following ``next`` cursors serially
+versus with ``PaginationConfig(prefetch_depth=N)``, against a local stub that
+injects a fixed latency per page.
+
+Usage:
+    python benchmarks/bench_pagination_prefetch.py [--pages 20] [--docs 200] [--doc-kb 10] [--latency 0.02] [--depth 2]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs, urlparse
+
+from _stub_server import StubServer
+
+from firecrawl.v2.methods import crawl as crawl_module
+from firecrawl.v2.methods.aio import crawl as async_crawl
+from firecrawl.v2.types import PaginationConfig
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+def _handler(pages: int, docs: int, doc_kb: int):
+    markdown = ("# Heading\n\nSome *markdown* with links [x](https://example.com).\n" * 64)
+    markdown = (markdown * (doc_kb * 1024 // len(markdown) + 1))[: doc_kb * 1024]
+    bodies = {}
+
+    def handler(method: str, path: str, body: bytes):
+        page = int(parse_qs(urlparse(path).query).get("skip", ["0"])[0]) // docs
+        if page not in bodies:
+            bodies[page] = json.dumps({
+                "success": True,
+                "status": "completed",
+                "completed": pages * docs,
+                "total": pages * docs,
+                "next": (
+                    f"{handler.base}/v2/crawl/bench?skip={(page + 1) * docs}" if page + 1 < pages else None
+                ),
+                "data": [
+                    {"markdown": markdown, "metadata": {"sourceURL": f"https://example.com/{page}/{i}", "statusCode": 200}}
+                    for i in range(docs)
+                ],
+            }).encode()
+        return 200, bodies[page]
+
+    return handler
+
+
+def _run_sync(url: str, config: PaginationConfig) -> float:
+    client = HttpClient("key", url)
+    start = time.perf_counter()
+    job = crawl_module.get_crawl_status(client, "bench", pagination_config=config)
+    elapsed = time.perf_counter() - start
+    client.close()
+    return elapsed if job.data else float("nan")
+
+
+async def _run_async(url: str, config: PaginationConfig) -> float:
+    client = AsyncHttpClient("key", url)
+    start = time.perf_counter()
+    job = await async_crawl.get_crawl_status(client, "bench", pagination_config=config)
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return elapsed if job.data else float("nan")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--doc-kb", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--depth", type=int, default=2)
+    args = parser.parse_args()
+
+    handler = _handler(args.pages, args.docs, args.doc_kb)
+    with StubServer(handler, latency=args.latency) as stub:
+        handler.base = stub.url
+        print(f"{args.pages} pages x {args.docs} docs x {args.doc_kb} KB, {args.latency * 1000:.0f} ms latency per page")
+        for name, run in (
+            ("sync", _run_sync),
+            ("async", lambda url, config: asyncio.run(_run_async(url, config))),
+        ):
+            serial = run(stub.url, PaginationConfig())
+            prefetched = run(stub.url, PaginationConfig(prefetch_depth=args.depth))
+            print(
+                f"{name:<5} serial {args.pages / serial:6.1f} pages/s   "
+                f"prefetch(depth={args.depth}) {args.pages / prefetched:6.1f} pages/s   "
+                f"speedup {serial / prefetched:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Wall time of downloading a completed crawl by following ``next`` cursors
+serially versus ``PaginationConfig(parallel_pages=N)`` (concurrent
+``skip``/``limit`` ranges), for a growing number of pages, against a local
+stub with a fixed latency per page.
+
+Usage:
+    python benchmarks/bench_parallel_pages.py [--pages 5 10 20 40] [--docs 20] [--latency 0.05] [--parallel 8]
+"""
+
+import argparse
+import asyncio
+import time
+from urllib.parse import parse_qs, urlparse
+
+from _stub_server import StubServer
+
+from firecrawl.v2.methods import crawl as crawl_module
+from firecrawl.v2.methods.aio import crawl as async_crawl
+from firecrawl.v2.types import PaginationConfig
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+class _Job:
+    """A completed crawl of ``total`` documents served ``page_size`` at a time (or ``limit``)."""
+
+    def __init__(self, page_size: int) -> None:
+        self.page_size = page_size
+        self.total = 0
+        self.base = ""
+
+    def __call__(self, method: str, path: str, body: bytes):
+        query = parse_qs(urlparse(path).query)
+        skip = int(query.get("skip", ["0"])[0])
+        size = int(query.get("limit", [str(self.page_size)])[0])
+        end = min(self.total, skip + size)
+        limit = f"&limit={query['limit'][0]}" if "limit" in query else ""
+        return 200, {
+            "success": True,
+            "status": "completed",
+            "completed": self.total,
+            "total": self.total,
+            "next": f"{self.base}/v2/crawl/bench?skip={end}{limit}" if end < self.total else None,
+            "data": [
+                {"markdown": f"# Page {i}\n\n" + "lorem ipsum " * 200, "metadata": {"sourceURL": f"https://example.com/{i}"}}
+                for i in range(skip, end)
+            ],
+        }
+
+
+def _run_sync(url: str, config: PaginationConfig) -> float:
+    client = HttpClient("key", url, max_connections_per_host=max(10, config.parallel_pages))
+    start = time.perf_counter()
+    crawl_module.get_crawl_status(client, "bench", pagination_config=config)
+    elapsed = time.perf_counter() - start
+    client.close()
+    return elapsed
+
+
+async def _run_async(url: str, config: PaginationConfig) -> float:
+    client = AsyncHttpClient("key", url)
+    start = time.perf_counter()
+    await async_crawl.get_crawl_status(client, "bench", pagination_config=config)
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, nargs="+", default=[5, 10, 20, 40])
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--parallel", type=int, default=8)
+    args = parser.parse_args()
+
+    job = _Job(args.docs)
+    with StubServer(job, latency=args.latency) as stub:
+        job.base = stub.url
+        print(f"{args.docs} docs per page, {args.latency * 1000:.0f} ms latency per page, parallel_pages={args.parallel}")
+        print(f"{'pages':>5}  {'sync serial':>11}  {'sync par.':>9}  {'async serial':>12}  {'async par.':>10}")
+        for pages in args.pages:
+            job.total = pages * args.docs
+            serial = PaginationConfig()
+            parallel = PaginationConfig(parallel_pages=args.parallel)
+            times = [
+                _run_sync(stub.url, serial),
+                _run_sync(stub.url, parallel),
+                asyncio.run(_run_async(stub.url, serial)),
+                asyncio.run(_run_async(stub.url, parallel)),
+            ]
+            print(
+                f"{pages:>5}  {times[0]:>10.2f}s  {times[1]:>8.2f}s  {times[2]:>11.2f}s  {times[3]:>9.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Watching many jobs over WebSockets with one ``Watcher`` (thread and event
+loop) per job versus one ``WatcherHub`` for all of them, against a local
+WebSocket server that streams a few documents per job and then ``done``.
+Reports wall time until every job finished and the peak thread count. Jobs
+past the hub's ``--max-connections`` are polled over HTTP, which the server
+answers with the finished job.
+
+Usage:
+    python benchmarks/bench_watcher_hub.py [--jobs 500] [--docs 3] [--delay 0.5] [--max-connections 256]
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from typing import Callable, List, Tuple
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.watcher import Watcher
+
+
+class _WsServer:
+    """Streams ``docs`` documents per job over ``delay`` seconds, then ``done``; plain GETs get the finished job."""
+
+    def __init__(self, docs: int, delay: float) -> None:
+        self.docs = docs
+        self.delay = delay
+        self.url = ""
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._stop: "asyncio.Future[None]"
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def _status(self, connection, request):
+        if "upgrade" in request.headers.get("Connection", "").lower():
+            return None
+        job_id = request.path.split("?")[0].rsplit("/", 1)[1]
+        docs = [{"markdown": f"# {job_id} {i}"} for i in range(self.docs)]
+        body = {"success": True, "status": "completed", "completed": self.docs, "total": self.docs, "data": docs}
+        response = connection.respond(200, json.dumps(body))
+        response.headers["Content-Type"] = "application/json"
+        return response
+
+    async def _job(self, connection) -> None:
+        job_id = connection.request.path.rsplit("/", 1)[1]
+        for i in range(self.docs):
+            await asyncio.sleep(self.delay / (self.docs + 1))
+            doc = {"markdown": f"# {job_id} {i}", "metadata": {"sourceURL": f"https://example.com/{job_id}/{i}"}}
+            await connection.send(json.dumps({"type": "document", "data": doc}))
+        await asyncio.sleep(self.delay / (self.docs + 1))
+        done = {"status": "completed", "completed": self.docs, "total": self.docs, "data": []}
+        await connection.send(json.dumps({"type": "done", "data": done}))
+
+    async def _main(self) -> None:
+        from websockets.asyncio.server import serve
+
+        self._stop = self._loop.create_future()
+        async with serve(self._job, "127.0.0.1", 0, process_request=self._status, backlog=2048) as server:
+            port = next(iter(server.sockets)).getsockname()[1]
+            self.url = f"http://127.0.0.1:{port}"
+            self._ready.set()
+            await self._stop
+
+    def _serve(self) -> None:
+        self._loop.run_until_complete(self._main())
+
+    def __enter__(self) -> "_WsServer":
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._loop.call_soon_threadsafe(self._stop.set_result, None)
+        self._thread.join()
+
+
+def _measure(start_all: Callable[[Callable[[], None]], None], jobs: int, baseline: int) -> Tuple[float, int]:
+    """Run ``start_all(on_done)`` until ``on_done`` was called ``jobs`` times; returns wall time and threads added."""
+    lock = threading.Lock()
+    finished = threading.Event()
+    count = [0]
+
+    def on_done() -> None:
+        with lock:
+            count[0] += 1
+            if count[0] == jobs:
+                finished.set()
+
+    peak = [threading.active_count()]
+    sampling = threading.Event()
+
+    def sample() -> None:
+        while not sampling.is_set():
+            peak[0] = max(peak[0], threading.active_count())
+            time.sleep(0.01)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    start_all(on_done)
+    finished.wait(120)
+    elapsed = time.perf_counter() - start
+    sampling.set()
+    sampler.join()
+    if count[0] != jobs:
+        raise RuntimeError(f"only {count[0]} of {jobs} jobs finished")
+    # The sampler itself is not part of either approach
+    return elapsed, peak[0] - 1 - baseline
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--docs", type=int, default=3)
+    parser.add_argument("--delay", type=float, default=0.5)
+    parser.add_argument("--max-connections", type=int, default=256)
+    args = parser.parse_args()
+
+    with _WsServer(args.docs, args.delay) as server:
+        client = FirecrawlClient(api_key="bench", api_url=server.url)
+        job_ids = [f"job-{i}" for i in range(args.jobs)]
+
+        def per_job(on_done: Callable[[], None]) -> None:
+            watchers: List[Watcher] = []
+            for job_id in job_ids:
+                watcher = client.watcher(job_id, poll_interval=30)
+                watcher.add_event_listener("done", lambda detail: on_done())
+                watcher.start()
+                watchers.append(watcher)
+
+        def hub(on_done: Callable[[], None]) -> None:
+            watcher_hub = client.watcher_hub(poll_interval=args.delay, max_connections=args.max_connections)
+            for job_id in job_ids:
+                watcher_hub.watch(job_id).add_event_listener("done", lambda detail: on_done())
+            hubs.append(watcher_hub)
+
+        hubs = []
+        baseline = threading.active_count()
+        print(f"{args.jobs} jobs, {args.docs} documents each over {args.delay:.2f}s, hub max_connections={args.max_connections}")
+        print(f"{'approach':>18}  {'wall':>7}  {'peak threads':>12}")
+        for name, start_all in (("Watcher per job", per_job), ("WatcherHub", hub)):
+            elapsed, threads = _measure(start_all, args.jobs, baseline)
+            print(f"{name:>18}  {elapsed:>6.2f}s  {threads:>12}")
+            for watcher_hub in hubs:
+                watcher_hub.close()
+            # Let finished watcher threads exit so they do not count against the next run
+            while threading.active_count() > baseline:
+                time.sleep(0.05)
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
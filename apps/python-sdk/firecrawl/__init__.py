@@ -9,6 +9,9 @@ import os
 from .client import Firecrawl, AsyncFirecrawl, FirecrawlApp, AsyncFirecrawlApp
 from .v2.watcher import Watcher
 from .v2.watcher_async import AsyncWatcher
+from .v2.watcher_hub import WatcherHub
+from .v2.monitor import JobMonitor, AsyncJobMonitor
+from .v2.futures import JobFuture, AsyncJobFuture
 from .v1 import (
     V1FirecrawlApp,
     AsyncV1FirecrawlApp,
@@ -79,6 +82,11 @@ __all__ = [
     'AsyncFirecrawlApp',
     'Watcher',
     'AsyncWatcher',
+    'WatcherHub',
+    'JobMonitor',
+    'AsyncJobMonitor',
+    'JobFuture',
+    'AsyncJobFuture',
     'V1FirecrawlApp',
     'AsyncV1FirecrawlApp',
     'V1JsonConfig',
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+import threading
+
+import pytest
+from aiohttp import web
+
+from firecrawl.v1 import AsyncV1FirecrawlApp
+
+
+async def _start_server(counter):
+    async def handler(request):
+        counter["requests"] += 1
+        return web.json_response({"success": True, "status": "completed"})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_session():
+    counter = {"requests": 0}
+    runner, url = await _start_server(counter)
+    try:
+        async with AsyncV1FirecrawlApp(api_key="key", api_url=url, connector_limit_per_host=4) as app:
+            headers = app._prepare_headers()
+            await app._async_get_request(f"{url}/v1/crawl/a", headers)
+            session = app._session
+            await app._async_post_request(f"{url}/v1/crawl", {"url": "https://example.com"}, headers)
+            await app.cancel_crawl("a")
+            assert app._session is session
+            assert session.connector.limit_per_host == 4
+        assert session.closed
+        assert counter["requests"] == 3
+    finally:
+        await runner.cleanup()
+
+
+def test_session_is_recreated_per_event_loop():
+    app = AsyncV1FirecrawlApp(api_key="key", api_url="http://localhost")
+
+    async def grab():
+        session = await app._get_session()
+        return session
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+    asyncio.run(app.close())
+
+
+def test_replaced_session_is_closed_on_its_running_loop(caplog):
+    app = AsyncV1FirecrawlApp(api_key="key", api_url="http://localhost")
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever, daemon=True)
+    thread.start()
+
+    async def grab():
+        return await app._get_session()
+
+    try:
+        first = asyncio.run_coroutine_threadsafe(grab(), other).result(timeout=5)
+        second = asyncio.run(grab())
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other).result(timeout=5)
+        assert first.closed and not second.closed
+    finally:
+        other.call_soon_threadsafe(other.stop)
+        thread.join()
+        other.close()
+
+    with caplog.at_level(logging.DEBUG, logger="firecrawl"):
+        asyncio.run(grab())
+    assert "event loop has stopped" in caplog.text
+    asyncio.run(app.close())
@@ -2,11 +2,17 @@
 Unit tests for Firecrawl v2 pagination functionality.
 """
 
+import asyncio
+import io
+import json
 import pytest
 import time
 from unittest.mock import Mock, patch, AsyncMock
 from typing import Dict, Any, List
 
+import httpx
+import requests
+
 from firecrawl.v2.types import (
     PaginationConfig, 
     CrawlJob, 
@@ -14,10 +20,13 @@ from firecrawl.v2.types import (
     Document, 
     DocumentMetadata
 )
-from firecrawl.v2.methods.crawl import get_crawl_status, _fetch_all_pages
-from firecrawl.v2.methods.batch import get_batch_scrape_status, _fetch_all_batch_pages
+from firecrawl.v2.methods.crawl import get_crawl_status, _fetch_all_pages, iter_crawl_documents, wait_for_crawl_completion
+from firecrawl.v2.methods.batch import get_batch_scrape_status, _fetch_all_batch_pages, iter_batch_documents
 from firecrawl.v2.methods.aio.crawl import get_crawl_status as get_crawl_status_async, _fetch_all_pages_async
+from firecrawl.v2.methods.aio.crawl import iter_crawl_documents as iter_crawl_documents_async
 from firecrawl.v2.methods.aio.batch import get_batch_scrape_status as get_batch_scrape_status_async, _fetch_all_batch_pages_async
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.pagination import DeltaCursor, fetch_pages_parallel, peek_next, prefetch_pages
 
 
 class TestPaginationConfig:
@@ -30,6 +39,7 @@ class TestPaginationConfig:
         assert config.max_pages is None
         assert config.max_results is None
         assert config.max_wait_time is None
+        assert config.stream_pages is False
     
     def test_custom_values(self):
         """Test custom values for PaginationConfig."""
@@ -598,5 +608,545 @@ class TestPaginationEdgeCases:
         assert self.mock_client.get.call_count == 2
 
 
+class TestStreamedPagination:
+    """Test pagination with stream_pages=True (documents decoded one at a time)."""
+
+    def setup_method(self):
+        self.sample_doc = {
+            "url": "https://example.com",
+            "markdown": "# Test Content",
+            "metadata": {"title": "Test Page", "statusCode": 200},
+        }
+
+    def _page(self, next_url, docs):
+        return json.dumps({
+            "success": True,
+            "status": "completed",
+            "completed": 3,
+            "total": 3,
+            "creditsUsed": 3,
+            "expiresAt": "2024-01-01T00:00:00Z",
+            "next": next_url,
+            "data": docs,
+        }).encode()
+
+    def _response(self, raw):
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(raw)
+        return response
+
+    def test_get_crawl_status_streams_pages(self):
+        mock_client = Mock()
+        mock_client.get.side_effect = [
+            self._response(self._page("https://api.firecrawl.dev/v2/crawl/abc?skip=2", [self.sample_doc] * 2)),
+            self._response(self._page(None, [self.sample_doc])),
+        ]
+
+        result = get_crawl_status(mock_client, "abc", PaginationConfig(stream_pages=True))
+
+        assert len(result.data) == 3
+        assert all(isinstance(doc, Document) for doc in result.data)
+        assert result.credits_used == 3
+        assert all(call.kwargs.get("stream") is True for call in mock_client.get.call_args_list)
+
+    def test_get_batch_status_streams_pages_with_max_results(self):
+        mock_client = Mock()
+        mock_client.get.side_effect = [
+            self._response(self._page("https://api.firecrawl.dev/v2/batch/scrape/abc?skip=1", [self.sample_doc])),
+            self._response(self._page(None, [self.sample_doc] * 5)),
+        ]
+
+        result = get_batch_scrape_status(mock_client, "abc", PaginationConfig(stream_pages=True, max_results=3))
+
+        assert len(result.data) == 3
+
+    @pytest.mark.asyncio
+    async def test_async_get_crawl_status_streams_pages(self):
+        pages = iter([
+            self._page("https://api.firecrawl.dev/v2/crawl/abc?skip=2", [self.sample_doc] * 2),
+            self._page(None, [self.sample_doc]),
+        ])
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev")
+        client._client_instance = httpx.AsyncClient(
+            base_url=client.api_url,
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=next(pages))),
+        )
+        client._client_loop = asyncio.get_running_loop()
+
+        result = await get_crawl_status_async(client, "abc", PaginationConfig(stream_pages=True))
+
+        assert len(result.data) == 3
+        assert result.status == "completed"
+        await client.close()
+
+
+class TestDocumentIterators:
+    """Test lazy iter_crawl_documents / iter_batch_documents."""
+
+    setup_method = TestStreamedPagination.setup_method
+    _page = TestStreamedPagination._page
+    _response = TestStreamedPagination._response
+
+    def test_pages_are_fetched_on_demand(self):
+        mock_client = Mock()
+        mock_client.get.side_effect = [
+            self._response(self._page("https://api.firecrawl.dev/v2/crawl/abc?skip=2", [self.sample_doc] * 2)),
+            self._response(self._page(None, [self.sample_doc])),
+        ]
+
+        documents = iter_crawl_documents(mock_client, "abc")
+        first = next(documents)
+
+        assert isinstance(first, Document)
+        assert mock_client.get.call_count == 1
+        assert len([first, *documents]) == 3
+        assert mock_client.get.call_count == 2
+        assert mock_client.get.call_args_list[1].args[0] == "https://api.firecrawl.dev/v2/crawl/abc?skip=2"
+
+    def test_respects_pagination_limits(self):
+        mock_client = Mock()
+        mock_client.get.side_effect = [
+            self._response(self._page("https://api.firecrawl.dev/v2/batch/scrape/abc?skip=1", [self.sample_doc])),
+            self._response(self._page("https://api.firecrawl.dev/v2/batch/scrape/abc?skip=2", [self.sample_doc] * 5)),
+        ]
+
+        documents = list(iter_batch_documents(mock_client, "abc", PaginationConfig(max_results=3)))
+        assert len(documents) == 3
+        assert mock_client.get.call_count == 2
+
+    def test_max_pages_zero_yields_first_page_only(self):
+        mock_client = Mock()
+        mock_client.get.return_value = self._response(
+            self._page("https://api.firecrawl.dev/v2/crawl/abc?skip=2", [self.sample_doc] * 2)
+        )
+
+        assert len(list(iter_crawl_documents(mock_client, "abc", PaginationConfig(max_pages=0)))) == 2
+        assert mock_client.get.call_count == 1
+
+    def test_first_page_error_raises(self):
+        mock_client = Mock()
+        response = requests.Response()
+        response.status_code = 404
+        response._content = b'{"success": false, "error": "Job not found"}'
+        mock_client.get.return_value = response
+
+        with pytest.raises(Exception):
+            list(iter_crawl_documents(mock_client, "missing"))
+
+    @pytest.mark.asyncio
+    async def test_async_iterator(self):
+        pages = iter([
+            self._page("https://api.firecrawl.dev/v2/crawl/abc?skip=2", [self.sample_doc] * 2),
+            self._page(None, [self.sample_doc]),
+        ])
+        client = AsyncHttpClient(
+            "key",
+            "https://api.firecrawl.dev",
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=next(pages))),
+        )
+
+        documents = [doc async for doc in iter_crawl_documents_async(client, "abc")]
+
+        assert len(documents) == 3
+        assert all(isinstance(doc, Document) for doc in documents)
+        await client.close()
+
+
+class TestPrefetchPagination:
+    """Test pipelined pagination (prefetch_depth > 0)."""
+
+    sample_doc = {"markdown": "# Test Content", "metadata": {"title": "Test Page", "statusCode": 200}}
+
+    def _page(self, n, last):
+        return json.dumps({
+            "success": True,
+            "status": "completed",
+            "next": None if n == last else f"https://api.firecrawl.dev/v2/crawl/abc?skip={n + 1}",
+            "data": [dict(self.sample_doc, markdown=f"page {n}")],
+        }).encode()
+
+    def _client(self, last, delay=0.0):
+        calls = []
+
+        def get(url, **kwargs):
+            calls.append(url)
+            n = int(url.rsplit("=", 1)[1])
+            time.sleep(delay)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = self._page(n, last)
+            # Direct fetches of the document iterators stream the body
+            response.raw = io.BytesIO(response._content)
+            return response
+
+        client = Mock()
+        client.get.side_effect = get
+        return client, calls
+
+    def test_peek_next(self):
+        assert peek_next(self._page(1, 3)) == "https://api.firecrawl.dev/v2/crawl/abc?skip=2"
+        assert peek_next(self._page(3, 3)) is None
+        trailing = json.dumps({"success": True, "data": [self.sample_doc], "next": "https://x/y?skip=1"}).encode()
+        assert peek_next(trailing) == "https://x/y?skip=1"
+        assert peek_next(b'{"success": true, "data": []}') is None
+
+    def test_next_page_is_requested_while_current_is_consumed(self):
+        client, calls = self._client(last=3)
+        pages = prefetch_pages(client, "https://api.firecrawl.dev/v2/crawl/abc?skip=1", 1)
+        first = next(pages)
+        assert first.ok
+        # The second request goes out without the caller asking for it
+        deadline = time.monotonic() + 2
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(calls) == 2
+        assert len([first, *pages]) == 3
+        assert len(calls) == 3
+
+    def test_fetch_all_pages_prefetched_matches_serial(self):
+        serial_client, _ = self._client(last=5)
+        serial = _fetch_all_pages(serial_client, "https://api.firecrawl.dev/v2/crawl/abc?skip=2", [], PaginationConfig())
+
+        client, calls = self._client(last=5)
+        result = _fetch_all_pages(
+            client, "https://api.firecrawl.dev/v2/crawl/abc?skip=2", [], PaginationConfig(prefetch_depth=2)
+        )
+
+        assert [d.markdown for d in result] == [d.markdown for d in serial] == ["page 2", "page 3", "page 4", "page 5"]
+        assert all("stream" not in call.kwargs for call in client.get.call_args_list)
+
+    def test_prefetch_respects_max_pages(self):
+        client, calls = self._client(last=10)
+        result = _fetch_all_batch_pages(
+            client, "https://api.firecrawl.dev/v2/crawl/abc?skip=2", [], PaginationConfig(max_pages=2, prefetch_depth=4)
+        )
+        assert len(result) == 2
+        assert len(calls) == 2
+
+    def test_prefetch_overlaps_fetch_and_parse(self):
+        client, _ = self._client(last=4, delay=0.1)
+        started = time.monotonic()
+        documents = iter_crawl_documents(client, "abc?skip=1", PaginationConfig(prefetch_depth=2))
+        for _ in documents:
+            time.sleep(0.1)  # simulated per-page processing
+        # Serial would take ~8 x 100ms; pipelined overlaps fetching with processing
+        assert time.monotonic() - started < 0.7
+
+    @pytest.mark.asyncio
+    async def test_async_prefetch(self):
+        seen = []
+
+        def handler(request):
+            n = int(request.url.params.get("skip", "1"))
+            seen.append(n)
+            return httpx.Response(200, content=self._page(n, 4))
+
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+        result = await _fetch_all_pages_async(
+            client, "https://api.firecrawl.dev/v2/crawl/abc?skip=2", [], PaginationConfig(prefetch_depth=2)
+        )
+        assert [d.markdown for d in result] == ["page 2", "page 3", "page 4"]
+        assert seen == [2, 3, 4]
+        await client.close()
+
+    def test_prefetcher_stopping_early_falls_back_to_direct_fetch(self, monkeypatch):
+        # The prefetcher cannot peek any cursor, so it stops after the first page
+        monkeypatch.setattr("firecrawl.v2.utils.pagination.peek_next", lambda content: None)
+        for fetch_all in (_fetch_all_pages, _fetch_all_batch_pages):
+            client, calls = self._client(last=4)
+            result = fetch_all(client, "https://api.firecrawl.dev/v2/crawl/abc?skip=2", [], PaginationConfig(prefetch_depth=2))
+            assert [d.markdown for d in result] == ["page 2", "page 3", "page 4"]
+        client, _ = self._client(last=4)
+        documents = iter_crawl_documents(client, "abc?skip=1", PaginationConfig(prefetch_depth=2))
+        assert [d.markdown for d in documents] == ["page 1", "page 2", "page 3", "page 4"]
+
+    @pytest.mark.asyncio
+    async def test_async_prefetcher_stopping_early_falls_back(self, monkeypatch):
+        monkeypatch.setattr("firecrawl.v2.utils.pagination.peek_next", lambda content: None)
+
+        def handler(request):
+            n = int(request.url.params.get("skip", "1"))
+            return httpx.Response(200, content=self._page(n, 4))
+
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+        result = await _fetch_all_batch_pages_async(
+            client, "https://api.firecrawl.dev/v2/crawl/abc?skip=2", [], PaginationConfig(prefetch_depth=2)
+        )
+        assert [d.markdown for d in result] == ["page 2", "page 3", "page 4"]
+        documents = [d async for d in iter_crawl_documents_async(client, "abc?skip=1", PaginationConfig(prefetch_depth=2))]
+        assert [d.markdown for d in documents] == ["page 1", "page 2", "page 3", "page 4"]
+        await client.close()
+
+
+class TestDeltaPolling:
+    """Test that wait loops only download documents finished since the last poll."""
+
+    class _Job:
+        """A running job whose finished documents grow by ``step`` per poll, served ``page_size`` at a time."""
+
+        def __init__(self, total, step, page_size, base="https://api.firecrawl.dev/v2/crawl/abc"):
+            self.total, self.step, self.page_size, self.base = total, step, page_size, base
+            self.polls = 0
+            self.requested_skips = []
+            self.served = 0
+
+        def body(self, skip):
+            self.requested_skips.append(skip)
+            finished = min(self.total, self.step * (self.polls + 1))
+            data = [{"markdown": f"doc {i}"} for i in range(skip, min(finished, skip + self.page_size))]
+            self.served += len(data)
+            offset = skip + len(data)
+            return {
+                "success": True,
+                "status": "completed" if finished == self.total else "scraping",
+                "completed": finished,
+                "total": self.total,
+                "next": f"{self.base}?skip={offset}" if self.total > offset else None,
+                "data": data,
+            }
+
+    @staticmethod
+    def _skip(url):
+        return int(url.split("skip=")[1]) if "skip=" in url else 0
+
+    def test_cursor_advance(self):
+        cursor = DeltaCursor()
+        assert cursor.url("/v2/crawl/abc") == "/v2/crawl/abc"
+        assert cursor.advance({"data": [{"markdown": "a"}], "next": "https://x/v2/crawl/abc?skip=1"}) == "https://x/v2/crawl/abc?skip=1"
+        # Nothing new finished: the cursor repeats and the poll ends
+        assert cursor.advance({"data": [], "next": "https://x/v2/crawl/abc?skip=1"}) is None
+        assert cursor.url("/v2/crawl/abc") == "/v2/crawl/abc?skip=1"
+        assert cursor.advance({"data": [{"markdown": "b"}], "next": None}) is None
+        assert cursor.skip == 2
+        assert [d.markdown for d in cursor.documents] == ["a", "b"]
+
+    def test_wait_downloads_each_document_once(self, monkeypatch):
+        job = self._Job(total=7, step=3, page_size=2)
+
+        def get(url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response._content = json.dumps(job.body(self._skip(url))).encode()
+            return response
+
+        def sleep(seconds):
+            job.polls += 1
+
+        client = Mock()
+        client.get.side_effect = get
+        monkeypatch.setattr(time, "sleep", sleep)
+
+        result = wait_for_crawl_completion(client, "abc", poll_interval=1)
+
+        assert result.status == "completed"
+        assert [d.markdown for d in result.data] == [f"doc {i}" for i in range(7)]
+        assert job.served == 7
+        assert job.polls == 2
+        # Later polls resume where the previous one stopped
+        assert job.requested_skips == [0, 2, 3, 3, 5, 6, 6]
+
+    @pytest.mark.asyncio
+    async def test_async_status_with_cursor(self):
+        job = self._Job(total=4, step=2, page_size=10, base="https://api.firecrawl.dev/v2/batch/scrape/abc")
+
+        def handler(request):
+            return httpx.Response(200, json=job.body(self._skip(str(request.url))))
+
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+        cursor = DeltaCursor()
+        first = await get_batch_scrape_status_async(client, "abc", cursor=cursor)
+        assert first.status == "scraping" and len(first.data) == 2
+        job.polls += 1
+        second = await get_batch_scrape_status_async(client, "abc", cursor=cursor)
+        assert second.status == "completed"
+        assert [d.markdown for d in second.data] == ["doc 0", "doc 1", "doc 2", "doc 3"]
+        assert job.served == 4
+        await client.close()
+
+
+class TestPartialResults:
+    """Test partial_on_timeout waits and resuming them from their cursor."""
+
+    _Job = TestDeltaPolling._Job
+    _skip = staticmethod(TestDeltaPolling._skip)
+
+    def test_timeout_returns_partial_then_resumes(self, monkeypatch):
+        job = self._Job(total=100, step=2, page_size=10)
+        real_sleep = time.sleep
+
+        def get(url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response._content = json.dumps(job.body(self._skip(url))).encode()
+            return response
+
+        def sleep(seconds):
+            job.polls += 1
+            real_sleep(seconds)
+
+        client = Mock()
+        client.api_url = "https://api.firecrawl.dev"
+        client.get.side_effect = get
+        monkeypatch.setattr(time, "sleep", sleep)
+
+        with pytest.raises(TimeoutError):
+            wait_for_crawl_completion(client, "abc", poll_interval=0.05, timeout=0.12)
+
+        job.polls, job.served = 0, 0
+        partial = wait_for_crawl_completion(client, "abc", poll_interval=0.05, timeout=0.12, partial_on_timeout=True)
+        assert partial.is_partial and partial.status == "scraping"
+        collected = len(partial.data)
+        assert collected >= 2 and partial.data[-1].markdown == f"doc {collected - 1}"
+        assert partial.next == f"https://api.firecrawl.dev/v2/crawl/abc?skip={collected}"
+
+        # Continue from the partial job: nothing is downloaded twice
+        job.total = collected + 3
+        done = wait_for_crawl_completion(client, "abc", poll_interval=0.01, cursor=DeltaCursor.resume(partial))
+        assert done.status == "completed" and not done.is_partial
+        assert [d.markdown for d in done.data] == [f"doc {i}" for i in range(job.total)]
+        assert job.served == job.total
+
+    def test_partial_next_ignores_trailing_slash(self):
+        cursor = DeltaCursor()
+        cursor.skip = 4
+        client = Mock()
+        client.api_url = "https://api.firecrawl.dev/"
+        partial = cursor.partial(CrawlJob(status="scraping", completed=4, total=10, data=[]), client, "/v2/crawl/abc")
+        assert partial.next == "https://api.firecrawl.dev/v2/crawl/abc?skip=4"
+        assert DeltaCursor.resume(partial).skip == 4
+
+    @pytest.mark.asyncio
+    async def test_async_batch_partial(self):
+        from firecrawl.v2.client_async import AsyncFirecrawlClient
+
+        job = self._Job(total=100, step=2, page_size=10, base="https://api.firecrawl.dev/v2/batch/scrape/abc")
+
+        started = time.monotonic()
+
+        def handler(request):
+            # Two more documents finish every 30ms
+            job.polls = int((time.monotonic() - started) / 0.03)
+            return httpx.Response(200, json=job.body(self._skip(str(request.url))))
+
+        client = AsyncFirecrawlClient(api_key="key", transport=httpx.MockTransport(handler))
+        partial = await client.wait_batch_scrape("abc", poll_interval=0.03, timeout=0.1, partial_on_timeout=True)
+        assert isinstance(partial, BatchScrapeJob) and partial.is_partial
+        assert len(partial.data) == job.served
+        assert partial.next.endswith(f"/v2/batch/scrape/abc?skip={job.served}")
+        await client.close()
+
+
+class TestParallelPagination:
+    """Test concurrent skip/limit page fetching for completed jobs (parallel_pages > 0)."""
+
+    base = "https://api.firecrawl.dev/v2/crawl/abc"
+
+    def _server(self, total=10, page_size=3, cap=None, status="completed", fail_skip=None):
+        requested = []
+
+        def body(url):
+            query = dict(part.split("=") for part in url.split("?")[1].split("&")) if "?" in url else {}
+            requested.append(url)
+            skip = int(query.get("skip", 0))
+            if skip == fail_skip:
+                return 500, {"success": False, "error": "boom"}
+            size = int(query.get("limit", page_size))
+            if cap is not None:
+                size = min(size, cap)
+            data = [{"markdown": f"doc {i}"} for i in range(skip, min(total, skip + size))]
+            offset = skip + len(data)
+            limit = f"&limit={query['limit']}" if "limit" in query else ""
+            return 200, {
+                "success": True,
+                "status": status,
+                "completed": total,
+                "total": total,
+                "next": f"{self.base}?skip={offset}{limit}" if offset < total else None,
+                "data": data,
+            }
+
+        def get(url, **kwargs):
+            status_code, payload = body(url)
+            response = requests.Response()
+            response.status_code = status_code
+            response._content = json.dumps(payload).encode()
+            return response
+
+        client = Mock()
+        client.get.side_effect = get
+        return client, requested
+
+    def _markdowns(self, job):
+        return [d.markdown for d in job.data]
+
+    def test_parallel_matches_serial(self):
+        client, requested = self._server()
+        job = get_crawl_status(client, "abc", PaginationConfig(parallel_pages=4))
+        assert self._markdowns(job) == [f"doc {i}" for i in range(10)]
+        assert sorted(requested[1:]) == sorted(
+            [f"{self.base}?skip=3&limit=3", f"{self.base}?skip=6&limit=3", f"{self.base}?skip=9&limit=1"]
+        )
+
+    def test_running_job_walks_cursors(self):
+        client, requested = self._server(status="scraping")
+        job = get_crawl_status(client, "abc", PaginationConfig(parallel_pages=4))
+        assert self._markdowns(job) == [f"doc {i}" for i in range(10)]
+        assert requested[1:] == [f"{self.base}?skip=3", f"{self.base}?skip=6", f"{self.base}?skip=9"]
+
+    def test_gaps_from_short_pages_are_filled(self):
+        first = {
+            "success": True,
+            "status": "completed",
+            "total": 9,
+            "next": f"{self.base}?skip=3",
+            "data": [{"markdown": f"doc {i}"} for i in range(3)],
+        }
+        # Range pages are cut at 2 documents, as the API does for oversized pages
+        client, requested = self._server(total=9, cap=2)
+        result = fetch_pages_parallel(client, first, [], PaginationConfig(parallel_pages=2))
+        assert [d.markdown for d in result] == [f"doc {i}" for i in range(3, 9)]
+        assert sorted(requested) == sorted([
+            f"{self.base}?skip=3&limit=3", f"{self.base}?skip=5&limit=1",
+            f"{self.base}?skip=6&limit=3", f"{self.base}?skip=8&limit=1",
+        ])
+
+    def test_failed_range_truncates_to_prefix(self):
+        client, _ = self._server(fail_skip=6)
+        job = get_crawl_status(client, "abc", PaginationConfig(parallel_pages=4))
+        assert self._markdowns(job) == [f"doc {i}" for i in range(6)]
+
+    def test_limits(self):
+        client, requested = self._server()
+        job = get_crawl_status(client, "abc", PaginationConfig(parallel_pages=4, max_results=5))
+        assert self._markdowns(job) == [f"doc {i}" for i in range(5)]
+        assert requested[1:] == [f"{self.base}?skip=3&limit=2"]
+
+        client, requested = self._server()
+        job = get_crawl_status(client, "abc", PaginationConfig(parallel_pages=4, max_pages=1))
+        assert len(job.data) == 6
+        assert len(requested) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_parallel(self):
+        stub, _ = self._server(total=12)
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            response = stub.get(str(request.url))
+            return httpx.Response(response.status_code, content=response.content)
+
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+        job = await get_batch_scrape_status_async(client, "abc", PaginationConfig(parallel_pages=3))
+        assert [d.markdown for d in job.data] == [f"doc {i}" for i in range(12)]
+        assert peak == 3
+        await client.close()
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
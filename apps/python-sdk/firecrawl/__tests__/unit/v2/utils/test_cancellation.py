@@ -0,0 +1,130 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.methods import batch as batch_module
+from firecrawl.v2.methods import crawl as crawl_module
+from firecrawl.v2.types import CrawlRequest
+from firecrawl.v2.utils.cancellation import acancel_remote
+from firecrawl.v2.utils.deadline import DeadlineExceededError
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.retry import RetryPolicy
+
+RUNNING = b'{"success": true, "status": "scraping", "completed": 1, "total": 10, "next": null, "data": []}'
+
+
+def _response(status: int, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+def _client(delete_status=200):
+    client = HttpClient("key", "https://api.firecrawl.dev", retry_policy=RetryPolicy(max_attempts=1))
+    calls = []
+
+    def request(method, url, **kwargs):
+        calls.append((method, url, kwargs.get("timeout")))
+        if method == "DELETE":
+            return _response(delete_status, b'{"success": true, "status": "cancelled"}')
+        return _response(200, RUNNING)
+
+    client.session.request = request
+    return client, calls
+
+
+class TestSyncCancelOnTimeout:
+    def test_timeout_cancels_crawl(self):
+        client, calls = _client()
+        with pytest.raises(DeadlineExceededError) as info:
+            crawl_module.wait_for_crawl_completion(client, "abc", poll_interval=0.05, timeout=0.15, cancel_on_timeout=True)
+        assert info.value.remote_cancelled is True
+        method, url, timeout = calls[-1]
+        assert (method, url) == ("DELETE", "https://api.firecrawl.dev/v2/crawl/abc")
+        # The DELETE gets its own small budget, not the exhausted wait deadline
+        assert 4 < timeout[1] <= 5
+        assert client.metrics.get("cancel.succeeded") == 1
+
+    def test_off_by_default(self):
+        client, calls = _client()
+        with pytest.raises(DeadlineExceededError) as info:
+            batch_module.wait_for_batch_completion(client, "abc", poll_interval=0.05, timeout=0.1)
+        assert info.value.remote_cancelled is None
+        assert all(method == "GET" for method, _, _ in calls)
+
+    def test_failed_cancel_is_recorded_not_raised(self):
+        client, calls = _client(delete_status=500)
+        with pytest.raises(DeadlineExceededError) as info:
+            batch_module.wait_for_batch_completion(client, "abc", poll_interval=0.05, timeout=0.1, cancel_on_timeout=True)
+        assert info.value.remote_cancelled is False
+        assert calls[-1][:2] == ("DELETE", "https://api.firecrawl.dev/v2/batch/scrape/abc")
+        assert client.metrics.get("cancel.failed") == 1
+
+
+    def test_timeout_during_start_reports_no_cancel(self):
+        client, calls = _client()
+
+        def slow_start(method, url, **kwargs):
+            calls.append((method, url, kwargs.get("timeout")))
+            # The read timeout fires as the budget runs out
+            time.sleep(kwargs["timeout"][1])
+            raise requests.ReadTimeout()
+
+        client.session.request = slow_start
+        with pytest.raises(DeadlineExceededError) as info:
+            crawl_module.crawl(client, CrawlRequest(url="https://example.com"), timeout=0.05, cancel_on_timeout=True)
+        # No job ID came back, so no DELETE could be sent
+        assert info.value.remote_cancelled is False
+        assert [method for method, _, _ in calls] == ["POST"]
+        assert client.metrics.get("cancel.failed") == 1
+
+
+class TestAsyncCancelOnTimeout:
+    @staticmethod
+    def _client(deleted):
+        def handler(request):
+            if request.method == "DELETE":
+                deleted.append(request.url.path)
+                return httpx.Response(200, json={"success": True, "status": "cancelled"})
+            return httpx.Response(200, content=RUNNING)
+
+        return AsyncFirecrawlClient(api_key="key", transport=httpx.MockTransport(handler))
+
+    @pytest.mark.asyncio
+    async def test_task_cancellation_cancels_crawl(self):
+        deleted = []
+        client = self._client(deleted)
+        task = asyncio.ensure_future(client.wait_crawl("abc", poll_interval=0.05, cancel_on_timeout=True))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert deleted == ["/v2/crawl/abc"]
+        assert client.metrics.get("cancel.succeeded") == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_batch(self):
+        deleted = []
+        client = self._client(deleted)
+        with pytest.raises(DeadlineExceededError) as info:
+            await client.wait_batch_scrape("abc", poll_interval=0.05, timeout=0.1, cancel_on_timeout=True)
+        assert info.value.remote_cancelled is True
+        assert deleted == ["/v2/batch/scrape/abc"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_cancel_is_bounded(self):
+        async def hanging_cancel(client, job_id, deadline=None):
+            await asyncio.sleep(10)
+            return True
+
+        started = time.monotonic()
+        assert await acancel_remote(hanging_cancel, None, "abc", timeout=0.1) is False
+        assert time.monotonic() - started < 1
@@ -0,0 +1,165 @@
+import io
+import json
+import os
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.methods.aio.batch import iter_batch_documents as iter_batch_documents_async
+from firecrawl.v2.methods.crawl import iter_crawl_documents
+from firecrawl.v2.types import PaginationConfig
+from firecrawl.v2.utils.checkpoint import CheckpointStore, FileCheckpointStore, MemoryCheckpointStore
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+PAGE_SIZE = 2
+TOTAL = 7
+
+
+def _page(endpoint, skip):
+    data = [{"markdown": f"doc {i}"} for i in range(skip, min(TOTAL, skip + PAGE_SIZE))]
+    offset = skip + len(data)
+    return json.dumps({
+        "success": True,
+        "status": "completed",
+        "completed": TOTAL,
+        "total": TOTAL,
+        "next": f"https://api.firecrawl.dev{endpoint}?skip={offset}" if offset < TOTAL else None,
+        "data": data,
+    }).encode()
+
+
+def _skip(url):
+    return int(url.split("skip=")[1]) if "skip=" in url else 0
+
+
+class _Crash(Exception):
+    pass
+
+
+def _client(endpoint, fail_at_skip=None):
+    """Mock sync client serving the job; raises when ``fail_at_skip`` is requested."""
+    requested = []
+
+    def get(url, **kwargs):
+        skip = _skip(url)
+        requested.append(skip)
+        if skip == fail_at_skip:
+            raise requests.ConnectionError("worker lost its connection")
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(_page(endpoint, skip))
+        return response
+
+    client = Mock()
+    client.get.side_effect = get
+    return client, requested
+
+
+class TestStores:
+    def test_file_store_round_trip(self, tmp_path):
+        store = FileCheckpointStore(str(tmp_path))
+        assert store.load("/v2/crawl/abc") is None
+        store.save("/v2/crawl/abc", {"next": "https://x?skip=2", "documents": 2, "pages": 0})
+        assert store.load("/v2/crawl/abc") == {"next": "https://x?skip=2", "documents": 2, "pages": 0}
+        # Written by rename; no temporary files are left behind
+        assert os.listdir(tmp_path) == [os.path.basename(store.path("/v2/crawl/abc"))]
+        store.clear("/v2/crawl/abc")
+        store.clear("/v2/crawl/abc")
+        assert store.load("/v2/crawl/abc") is None
+
+    def test_file_store_ignores_corrupt_checkpoint(self, tmp_path):
+        store = FileCheckpointStore(str(tmp_path))
+        with open(store.path("k"), "w") as f:
+            f.write('{"next": "https://x?sk')
+        assert store.load("k") is None
+
+    def test_memory_store(self):
+        store = MemoryCheckpointStore()
+        state = {"next": "n", "documents": 1, "pages": 0}
+        store.save("k", state)
+        state["documents"] = 99
+        assert store.load("k")["documents"] == 1
+        store.clear("k")
+        assert store.load("k") is None
+
+
+    def test_store_missing_a_method_cannot_be_created(self):
+        class LoadOnly(CheckpointStore):
+            def load(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            LoadOnly()
+
+class TestResumableDownload:
+    def test_resumes_after_fetch_crash(self, tmp_path):
+        store = FileCheckpointStore(str(tmp_path))
+        client, _ = _client("/v2/crawl/abc", fail_at_skip=4)
+        seen = []
+        with pytest.raises(requests.ConnectionError):
+            for doc in iter_crawl_documents(client, "abc", checkpoint=store):
+                seen.append(doc.markdown)
+        assert seen == ["doc 0", "doc 1", "doc 2", "doc 3"]
+        assert store.load("/v2/crawl/abc")["documents"] == 4
+
+        # A new worker picks up at the saved cursor
+        client, requested = _client("/v2/crawl/abc")
+        rest = [doc.markdown for doc in iter_crawl_documents(client, "abc", checkpoint=FileCheckpointStore(str(tmp_path)))]
+        assert rest == ["doc 4", "doc 5", "doc 6"]
+        assert requested == [4, 6]
+        # Completed downloads clear their checkpoint
+        assert store.load("/v2/crawl/abc") is None
+
+    def test_partly_consumed_page_is_replayed(self):
+        store = MemoryCheckpointStore()
+        client, _ = _client("/v2/crawl/abc")
+        seen = []
+        with pytest.raises(_Crash):
+            for doc in iter_crawl_documents(client, "abc", checkpoint=store):
+                seen.append(doc.markdown)
+                if doc.markdown == "doc 3":
+                    raise _Crash()
+
+        client, requested = _client("/v2/crawl/abc")
+        rest = [doc.markdown for doc in iter_crawl_documents(client, "abc", checkpoint=store)]
+        # The page holding doc 3 was not finished, so it is yielded again
+        assert rest == ["doc 2", "doc 3", "doc 4", "doc 5", "doc 6"]
+        assert requested == [2, 4, 6]
+
+    def test_limits_count_resumed_documents(self):
+        store = MemoryCheckpointStore()
+        store.save("/v2/crawl/abc", {"next": "https://api.firecrawl.dev/v2/crawl/abc?skip=4", "documents": 4, "pages": 1})
+        client, requested = _client("/v2/crawl/abc")
+        rest = [d.markdown for d in iter_crawl_documents(client, "abc", PaginationConfig(max_results=5), checkpoint=store)]
+        assert rest == ["doc 4"]
+        assert requested == [4]
+
+    @pytest.mark.asyncio
+    async def test_async_resume(self, tmp_path):
+        store = FileCheckpointStore(str(tmp_path))
+        fail = {"skip": 2}
+        requested = []
+
+        def handler(request):
+            skip = _skip(str(request.url))
+            requested.append(skip)
+            if skip == fail["skip"]:
+                raise httpx.ConnectError("worker lost its connection")
+            return httpx.Response(200, content=_page("/v2/batch/scrape/abc", skip))
+
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+        seen = []
+        with pytest.raises(Exception):
+            async for doc in iter_batch_documents_async(client, "abc", checkpoint=store):
+                seen.append(doc.markdown)
+        assert seen == ["doc 0", "doc 1"]
+
+        fail["skip"] = None
+        requested.clear()
+        rest = [doc.markdown async for doc in iter_batch_documents_async(client, "abc", checkpoint=store)]
+        assert rest == ["doc 2", "doc 3", "doc 4", "doc 5", "doc 6"]
+        assert requested[0] == 2
+        assert store.load("/v2/batch/scrape/abc") is None
+        await client.close()
@@ -0,0 +1,215 @@
+import asyncio
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, Circuit, CircuitBreaker
+from firecrawl.v2.utils.error_handler import CircuitOpenError, FirecrawlError
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.retry import RetryPolicy
+
+
+def _response(status: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = b'{"success": true}'
+    response._content_consumed = True
+    return response
+
+
+def _circuit(**kwargs) -> Circuit:
+    settings = dict(window=4, min_calls=4, open_duration=0.05)
+    settings.update(kwargs)
+    return Circuit("scrape", **settings)
+
+
+class TestCircuit:
+    def test_opens_at_failure_rate(self):
+        circuit = _circuit()
+        for success in (True, False, True):
+            assert circuit.record(success, 0.01) is None
+        assert circuit.record(False, 0.01) == (CLOSED, OPEN)
+        assert circuit.allow() == (False, None)
+
+    def test_needs_min_calls(self):
+        circuit = _circuit(min_calls=10, window=10)
+        for _ in range(5):
+            circuit.record(False, 0.01)
+        assert circuit.state == CLOSED
+
+    def test_opens_on_slow_calls(self):
+        circuit = _circuit(slow_call_duration=0.5, slow_call_rate_threshold=0.75)
+        for latency in (1.0, 1.0, 0.1):
+            circuit.record(True, latency)
+        assert circuit.state == CLOSED
+        circuit.record(True, 2.0)
+        assert circuit.state == OPEN
+
+    def test_half_open_probe_closes_on_success(self):
+        circuit = _circuit()
+        for _ in range(4):
+            circuit.record(False, 0.01)
+        time.sleep(0.06)
+        assert circuit.allow() == (True, (OPEN, HALF_OPEN))
+        # Only one probe at a time
+        assert circuit.allow() == (False, None)
+        assert circuit.record(True, 0.01) == (HALF_OPEN, CLOSED)
+        assert circuit.allow() == (True, None)
+
+    def test_failed_probe_reopens(self):
+        circuit = _circuit()
+        for _ in range(4):
+            circuit.record(False, 0.01)
+        time.sleep(0.06)
+        circuit.allow()
+        assert circuit.record(False, 0.01) == (HALF_OPEN, OPEN)
+        assert circuit.retry_after() > 0
+
+    def test_release_frees_probe(self):
+        circuit = _circuit()
+        for _ in range(4):
+            circuit.record(False, 0.01)
+        time.sleep(0.06)
+        circuit.allow()
+        circuit.release()
+        assert circuit.allow()[0] is True
+
+
+    def test_stale_results_are_not_probes(self):
+        circuit = _circuit()
+        _, _, slow_call = circuit.admit()
+        for _ in range(4):
+            circuit.record(False, 0.01, circuit.admit()[2])
+        time.sleep(0.06)
+        allowed, change, probe = circuit.admit()
+        assert allowed and change == (OPEN, HALF_OPEN)
+        # A call admitted while closed finishes now: neither a probe outcome nor a freed slot
+        assert circuit.record(True, 0.01, slow_call) is None
+        circuit.release(slow_call)
+        assert circuit.state == HALF_OPEN and circuit.allow() == (False, None)
+        assert circuit.record(True, 0.01, probe) == (HALF_OPEN, CLOSED)
+
+class TestCircuitBreaker:
+    def test_families_are_independent(self):
+        breaker = CircuitBreaker(window=2, min_calls=2)
+        for _ in range(2):
+            breaker.record("/v2/scrape", False, 0.01)
+        assert breaker.state("scrape") == OPEN
+        with pytest.raises(CircuitOpenError) as exc:
+            breaker.before_request("/v2/scrape")
+        assert exc.value.family == "scrape"
+        assert isinstance(exc.value, FirecrawlError)
+        breaker.before_request("/v2/crawl/abc")
+
+    def test_family_filter(self):
+        breaker = CircuitBreaker(families=["crawl_status"], window=1, min_calls=1)
+        breaker.record("/v2/scrape", False, 0.01)
+        breaker.before_request("/v2/scrape")
+        breaker.record("/v2/crawl/abc", False, 0.01)
+        assert breaker.state("/v2/crawl/abc") == OPEN
+
+    def test_state_change_hooks(self):
+        changes = []
+        breaker = CircuitBreaker(window=1, min_calls=1, open_duration=0.01, on_state_change=lambda *c: changes.append(c))
+        breaker.record("/v2/scrape", False, 0.01)
+        time.sleep(0.02)
+        breaker.before_request("/v2/scrape")
+        breaker.record("/v2/scrape", True, 0.01)
+        assert changes == [("scrape", CLOSED, OPEN), ("scrape", OPEN, HALF_OPEN), ("scrape", HALF_OPEN, CLOSED)]
+
+    def test_rejects_bad_thresholds(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_rate_threshold=0)
+
+
+class TestHttpClientCircuitBreaker:
+    def test_fails_fast_and_stops_retrying(self):
+        breaker = CircuitBreaker(window=2, min_calls=2, open_duration=60)
+        client = HttpClient(
+            "key",
+            "https://api.firecrawl.dev",
+            retry_policy=RetryPolicy(max_attempts=5, backoff_factor=0),
+            circuit_breaker=breaker,
+        )
+        client.session.request = Mock(side_effect=lambda *a, **k: _response(503))
+
+        with pytest.raises(CircuitOpenError):
+            client.get("/v2/crawl/abc")
+
+        # Two 503s opened the circuit; the remaining retries were never sent
+        assert client.session.request.call_count == 2
+        assert client.metrics.get("circuit.rejected") == 1
+        with pytest.raises(CircuitOpenError):
+            client.get("/v2/crawl/abc")
+        assert client.session.request.call_count == 2
+
+    def test_transport_errors_count_as_failures(self):
+        breaker = CircuitBreaker(window=1, min_calls=1)
+        client = HttpClient(
+            "key",
+            "https://api.firecrawl.dev",
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=breaker,
+        )
+        client.session.request = Mock(side_effect=requests.ConnectTimeout("slow"))
+        with pytest.raises(requests.ConnectTimeout):
+            client.post("/v2/scrape", {"url": "https://example.com"})
+        assert breaker.state("scrape") == OPEN
+
+    def test_client_errors_do_not_trip(self):
+        breaker = CircuitBreaker(window=2, min_calls=2)
+        client = HttpClient("key", "https://api.firecrawl.dev", circuit_breaker=breaker)
+        client.session.request = Mock(return_value=_response(404))
+        for _ in range(3):
+            client.get("/v2/crawl/abc")
+        assert breaker.state("crawl_status") == CLOSED
+
+
+class TestAsyncHttpClientCircuitBreaker:
+    @pytest.mark.asyncio
+    async def test_opens_and_recovers(self):
+        statuses = [500, 500, 200]
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0), json={"success": True})
+
+        breaker = CircuitBreaker(window=2, min_calls=2, open_duration=0.05)
+        client = AsyncHttpClient(
+            "key",
+            "https://api.firecrawl.dev",
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=breaker,
+            transport=httpx.MockTransport(handler),
+        )
+        for _ in range(2):
+            await client.get("/v2/crawl/abc")
+        with pytest.raises(CircuitOpenError):
+            await client.get("/v2/crawl/abc")
+
+        await asyncio.sleep(0.06)
+        response = await client.get("/v2/crawl/abc")
+        assert response.status_code == 200
+        assert breaker.state("crawl_status") == CLOSED
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_is_released(self):
+        async def handler(request):
+            await asyncio.sleep(5)
+
+        breaker = CircuitBreaker(window=1, min_calls=1, open_duration=0)
+        breaker.record("/v2/scrape", False, 0.01)
+        client = AsyncHttpClient(
+            "key", "https://api.firecrawl.dev", circuit_breaker=breaker, transport=httpx.MockTransport(handler)
+        )
+        task = asyncio.ensure_future(client.post("/v2/scrape", {"url": "https://example.com"}))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert breaker.circuit("/v2/scrape").allow()[0] is True
+        await client.close()
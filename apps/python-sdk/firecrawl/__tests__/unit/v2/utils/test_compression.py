@@ -0,0 +1,132 @@
+import asyncio
+import gzip
+import io
+import json
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import requests
+from urllib3.response import HTTPResponse
+
+from firecrawl.v2.utils import compression
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+BODY = json.dumps({"success": True, "data": [{"markdown": "# Title\n" + "lorem ipsum " * 2000}]}).encode()
+
+
+def _gzip_response(raw: bytes) -> requests.Response:
+    compressed = gzip.compress(raw)
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Encoding"] = "gzip"
+    response.raw = HTTPResponse(
+        body=io.BytesIO(compressed),
+        headers={"Content-Encoding": "gzip"},
+        status=200,
+        preload_content=False,
+        decode_content=True,
+    )
+    return response
+
+
+class _AsyncBody(httpx.AsyncByteStream):
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    async def __aiter__(self):
+        yield self.data
+
+
+class TestCompressionHelpers:
+    def test_always_offers_gzip(self):
+        for encodings in (compression.requests_encodings(), compression.httpx_encodings()):
+            assert "gzip" in encodings and "deflate" in encodings
+
+    def test_optional_codings_follow_installed_libraries(self):
+        try:
+            import brotli  # noqa: F401
+            has_brotli = True
+        except ImportError:
+            has_brotli = False
+        assert ("br" in compression.httpx_encodings()) == has_brotli
+
+    def test_compress_body_threshold(self):
+        assert compression.compress_body(BODY, None) == (BODY, None)
+        assert compression.compress_body(BODY, len(BODY) + 1) == (BODY, None)
+        compressed, encoding = compression.compress_body(BODY, 1024)
+        assert encoding == "gzip"
+        assert gzip.decompress(compressed) == BODY
+
+    def test_incompressible_body_left_alone(self):
+        body = bytes(range(256)) * 2
+        assert compression.compress_body(gzip.compress(body), 1)[1] is None
+
+
+class TestHttpClientCompression:
+    def test_session_advertises_encodings(self):
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+
+    def test_counts_wire_and_decoded_bytes(self):
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        client.session.request = Mock(return_value=_gzip_response(BODY))
+
+        response = client.get("/v2/crawl/abc")
+
+        assert response.json()["success"] is True
+        assert client.metrics.get("bytes.response.decoded") == len(BODY)
+        assert client.metrics.get("bytes.response.wire") == len(gzip.compress(BODY))
+        assert client.metrics.get("compression.responses.gzip") == 1
+
+    def test_large_post_is_gzipped(self):
+        client = HttpClient("key", "https://api.firecrawl.dev", request_compression_threshold=1024)
+        client.session.request = Mock(return_value=_gzip_response(b"{}"))
+
+        client.post("/v2/batch/scrape", {"urls": [f"https://example.com/{i}" for i in range(1000)]})
+
+        kwargs = client.session.request.call_args.kwargs
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        payload = json.loads(gzip.decompress(kwargs["data"]))
+        assert len(payload["urls"]) == 1000
+        assert client.metrics.get("bytes.request.wire") < client.metrics.get("bytes.request.raw")
+
+    def test_small_post_is_not_compressed(self):
+        client = HttpClient("key", "https://api.firecrawl.dev", request_compression_threshold=1024)
+        client.session.request = Mock(return_value=_gzip_response(b"{}"))
+
+        client.post("/v2/scrape", {"url": "https://example.com"})
+
+        assert "Content-Encoding" not in client.session.request.call_args.kwargs["headers"]
+
+
+class TestAsyncHttpClientCompression:
+    @pytest.mark.asyncio
+    async def test_negotiates_and_counts_bytes(self):
+        seen = {}
+
+        def handler(request):
+            seen["accept"] = request.headers.get("Accept-Encoding")
+            seen["encoding"] = request.headers.get("Content-Encoding")
+            seen["body"] = gzip.decompress(request.content) if seen["encoding"] else request.content
+            return httpx.Response(200, stream=_AsyncBody(gzip.compress(BODY)), headers={"Content-Encoding": "gzip"})
+
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev", request_compression_threshold=1024)
+        client._client_instance = httpx.AsyncClient(
+            base_url=client.api_url,
+            headers={"Accept-Encoding": client._create_client().headers["Accept-Encoding"]},
+            transport=httpx.MockTransport(handler),
+        )
+        client._client_loop = asyncio.get_running_loop()
+
+        response = await client.post("/v2/batch/scrape", {"urls": ["https://example.com"] * 500})
+
+        assert response.json()["success"] is True
+        assert "gzip" in seen["accept"]
+        assert seen["encoding"] == "gzip"
+        assert len(json.loads(seen["body"])["urls"]) == 500
+        assert client.metrics.get("bytes.response.decoded") == len(BODY)
+        assert client.metrics.get("bytes.response.wire") == len(gzip.compress(BODY))
+        await client.close()
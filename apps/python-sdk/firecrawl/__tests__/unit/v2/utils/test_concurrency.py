@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from firecrawl.v2.types import ConcurrencyCheck
+from firecrawl.v2.utils.concurrency import (
+    ConcurrencyController,
+    run_concurrently,
+    run_concurrently_async,
+)
+from firecrawl.v2.utils.error_handler import RateLimitError
+
+
+def _succeed(controller, n):
+    for _ in range(n):
+        with controller.slot():
+            pass
+
+
+class TestConcurrencyController:
+    def test_seeds_from_server_headroom(self):
+        controller = ConcurrencyController()
+        controller.update_from_server(ConcurrencyCheck(concurrency=3, max_concurrency=10), seed=True)
+        assert controller.limit == 7
+        assert controller.max_limit == 10
+
+    def test_additive_increase_per_window(self):
+        controller = ConcurrencyController(initial_limit=2, max_limit=4)
+        _succeed(controller, 2)
+        assert controller.limit == 3
+        _succeed(controller, 3)
+        assert controller.limit == 4
+        _succeed(controller, 10)
+        assert controller.limit == 4
+
+    def test_multiplicative_decrease_on_429_once_per_wave(self):
+        controller = ConcurrencyController(initial_limit=8)
+        slots = [controller.slot() for _ in range(3)]
+        for s in slots:
+            s.__enter__()
+        for s in slots:
+            s.__exit__(RateLimitError, RateLimitError("slow down", 429), None)
+        assert controller.limit == 4
+        assert controller.metrics.get("concurrency.decreases") == 1
+
+        with pytest.raises(TimeoutError):
+            with controller.slot():
+                raise TimeoutError()
+        assert controller.limit == 2
+
+    def test_other_errors_do_not_decrease_and_release_slot(self):
+        controller = ConcurrencyController(initial_limit=2)
+        with pytest.raises(ValueError):
+            with controller.slot():
+                raise ValueError()
+        assert controller.limit == 2
+        assert controller.in_flight == 0
+
+    def test_periodic_refresh_updates_bound(self):
+        refresh = Mock(return_value=ConcurrencyCheck(concurrency=0, max_concurrency=2))
+        controller = ConcurrencyController(initial_limit=5, refresh=refresh, refresh_interval=0)
+        with controller.slot():
+            pass
+        refresh.assert_called()
+        assert controller.max_limit == 2
+        assert controller.limit == 2
+
+    def test_refresh_errors_are_counted_not_raised(self):
+        controller = ConcurrencyController(refresh=Mock(side_effect=RuntimeError()), refresh_interval=0)
+        with controller.slot():
+            pass
+        assert controller.metrics.get("concurrency.refresh_errors") == 1
+
+    def test_threads_never_exceed_limit(self):
+        controller = ConcurrencyController(initial_limit=3, max_limit=3)
+        peak = 0
+        lock = threading.Lock()
+
+        def work(_):
+            nonlocal peak
+            with lock:
+                peak = max(peak, controller.in_flight)
+            time.sleep(0.01)
+            return _
+
+        assert run_concurrently(work, range(20), controller) == list(range(20))
+        assert peak <= 3
+        assert controller.in_flight == 0
+
+
+class TestAsyncConcurrency:
+    @pytest.mark.asyncio
+    async def test_tasks_never_exceed_limit(self):
+        controller = ConcurrencyController(initial_limit=2, max_limit=2)
+        active = 0
+        peak = 0
+
+        async def work(i):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return i * 2
+
+        assert await run_concurrently_async(work, range(10), controller) == [i * 2 for i in range(10)]
+        assert peak == 2
+        assert controller.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        controller = ConcurrencyController(initial_limit=1, max_limit=1)
+        await controller.acquire_async()
+        waiter = asyncio.ensure_future(controller.acquire_async())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        controller._release()
+        await asyncio.sleep(0)
+        assert controller.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_async_refresh(self):
+        async def refresh():
+            return ConcurrencyCheck(concurrency=0, max_concurrency=6)
+
+        controller = ConcurrencyController(async_refresh=refresh, refresh_interval=0)
+        async with controller.async_slot():
+            pass
+        assert controller.max_limit == 6
@@ -0,0 +1,181 @@
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.methods import crawl as crawl_module
+from firecrawl.v2.methods.aio import batch as async_batch
+from firecrawl.v2.types import CrawlRequest
+from firecrawl.v2.utils.deadline import Deadline, DeadlineExceededError
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.retry import RetryPolicy
+
+
+def _response(status: int, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+class TestDeadline:
+    def test_unbounded(self):
+        deadline = Deadline(None)
+        assert deadline.remaining() is None
+        assert not deadline.expired()
+        assert deadline.fits(1e9)
+        assert deadline.clip(5) == 5
+        assert deadline.request_timeout() is None
+        assert deadline.httpx_timeout() is None
+
+    def test_budget_shrinks(self):
+        deadline = Deadline(1.0, connect_timeout=0.25)
+        assert deadline.clip(5) <= 1.0
+        assert not deadline.fits(2)
+        connect, read = deadline.request_timeout()
+        assert connect == 0.25 and 0.9 < read <= 1.0
+        timeout = deadline.httpx_timeout()
+        assert timeout.connect == 0.25 and timeout.read <= read
+
+    def test_expired(self):
+        deadline = Deadline(0)
+        assert deadline.expired()
+        with pytest.raises(DeadlineExceededError):
+            deadline.check("GET /v2/crawl/abc")
+        assert isinstance(deadline.error(), TimeoutError)
+
+    def test_rejects_negative(self):
+        with pytest.raises(ValueError):
+            Deadline(-1)
+
+
+class TestHttpClientDeadline:
+    def test_attempt_timeout_is_remaining_budget(self):
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        client.session.request = Mock(return_value=_response(200, b'{"success": true}'))
+        client.get("/v2/crawl/abc", deadline=Deadline(5, connect_timeout=1))
+        connect, read = client.session.request.call_args.kwargs["timeout"]
+        assert connect == 1 and 4 < read <= 5
+
+    def test_retry_skipped_when_backoff_does_not_fit(self):
+        def busy(*args, **kwargs):
+            response = _response(503, b"{}")
+            response.headers["Retry-After"] = "5"
+            return response
+
+        client = HttpClient("key", "https://api.firecrawl.dev", retry_policy=RetryPolicy(max_attempts=5))
+        client.session.request = Mock(side_effect=busy)
+        response = client.get("/v2/crawl/abc", deadline=Deadline(1))
+        assert response.status_code == 503
+        assert client.session.request.call_count == 1
+
+    def test_expired_deadline_raises_without_sending(self):
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        client.session.request = Mock()
+        with pytest.raises(DeadlineExceededError):
+            client.get("/v2/crawl/abc", deadline=Deadline(0))
+        client.session.request.assert_not_called()
+
+
+class TestCrawlDeadline:
+    def test_start_and_polls_share_one_deadline(self):
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        read_timeouts = []
+
+        def request(method, url, **kwargs):
+            read_timeouts.append(kwargs["timeout"][1])
+            if method == "POST":
+                return _response(200, b'{"success": true, "id": "abc", "url": "u"}')
+            return _response(200, b'{"success": true, "status": "scraping", "completed": 0, "total": 1}')
+
+        client.session.request = request
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            crawl_module.crawl(client, CrawlRequest(url="https://example.com"), poll_interval=0.05, timeout=0.3)
+
+        assert time.monotonic() - started < 0.5
+        assert len(read_timeouts) >= 3
+        # Later requests only get what is left of the shared budget
+        assert read_timeouts == sorted(read_timeouts, reverse=True)
+        assert read_timeouts[-1] < 0.3
+
+
+    def test_zero_timeout_starts_and_polls_once(self):
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        methods = []
+
+        def request(method, url, **kwargs):
+            methods.append(method)
+            if method == "POST":
+                return _response(200, b'{"success": true, "id": "abc", "url": "u"}')
+            return _response(200, b'{"success": true, "status": "scraping", "completed": 0, "total": 1}')
+
+        client.session.request = request
+        with pytest.raises(DeadlineExceededError):
+            crawl_module.crawl(client, CrawlRequest(url="https://example.com"), poll_interval=0.05, timeout=0)
+        assert methods == ["POST", "GET"]
+
+    def test_zero_timeout_extract_returns_first_status(self):
+        from firecrawl.v2.methods import extract as extract_module
+
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        methods = []
+
+        def request(method, url, **kwargs):
+            methods.append(method)
+            if method == "POST":
+                return _response(200, b'{"success": true, "id": "abc"}')
+            return _response(200, b'{"success": true, "status": "processing"}')
+
+        client.session.request = request
+        status = extract_module.extract(client, ["https://example.com"], prompt="p", timeout=0)
+        assert status.status == "processing"
+        assert methods == ["POST", "GET"]
+
+    def test_extract_returns_last_status_when_a_poll_times_out(self):
+        from firecrawl.v2.methods import extract as extract_module
+
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        polls = []
+
+        def request(method, url, **kwargs):
+            polls.append(method)
+            if len(polls) > 1:
+                # Hangs past the deadline's read timeout
+                time.sleep(kwargs["timeout"][1])
+                raise requests.exceptions.ReadTimeout()
+            return _response(200, b'{"success": true, "status": "processing"}')
+
+        client.session.request = request
+        status = extract_module.wait_extract(client, "abc", poll_interval=1, timeout=1.2)
+        assert status.status == "processing"
+        assert len(polls) >= 2
+
+class TestAsyncDeadline:
+    @pytest.mark.asyncio
+    async def test_pagination_uses_remaining_budget(self):
+        read_timeouts = []
+
+        def handler(request):
+            read_timeouts.append(request.extensions["timeout"]["read"])
+            if "skip" in str(request.url):
+                return httpx.Response(200, json={"success": True, "data": [{"markdown": "b"}]})
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "status": "completed",
+                    "data": [{"markdown": "a"}],
+                    "next": "https://api.firecrawl.dev/v2/batch/scrape/abc?skip=1",
+                },
+            )
+
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+        job = await async_batch.get_batch_scrape_status(client, "abc", deadline=Deadline(5))
+        assert [doc.markdown for doc in job.data] == ["a", "b"]
+        assert len(read_timeouts) == 2 and all(0 < t <= 5 for t in read_timeouts)
+        await client.close()
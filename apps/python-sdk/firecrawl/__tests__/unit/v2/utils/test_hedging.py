@@ -0,0 +1,175 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.methods import scrape as scrape_module
+from firecrawl.v2.methods.aio import scrape as async_scrape
+from firecrawl.v2.utils.hedging import HedgePolicy, hedged_call, hedged_call_async
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.metrics import ClientMetrics
+
+
+def _ok_response() -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"success": true, "data": {"markdown": "hi"}}'
+    return response
+
+
+class TestHedgePolicy:
+    def test_initial_delay_until_enough_samples(self):
+        policy = HedgePolicy(min_samples=5, initial_delay=1.5)
+        for _ in range(4):
+            policy.record(0.1)
+        assert policy.delay() == 1.5
+
+    def test_delay_tracks_percentile(self):
+        policy = HedgePolicy(0.9, min_samples=10, min_delay=0)
+        for i in range(1, 101):
+            policy.record(i / 100)
+        assert policy.delay() == pytest.approx(0.91)
+
+    def test_delay_is_clamped(self):
+        policy = HedgePolicy(min_samples=1, min_delay=0.2, max_delay=0.5)
+        policy.record(0.01)
+        assert policy.delay() == 0.2
+        policy.record(5.0)
+        policy.record(5.0)
+        assert policy.delay() == 0.5
+
+    def test_expected_latency_of_slow_calls(self):
+        policy = HedgePolicy()
+        for latency in (0.1, 0.2, 1.0, 3.0):
+            policy.record(latency)
+        assert policy.expected_latency(0.5) == pytest.approx(2.0)
+        assert policy.expected_latency(10) == 10
+
+    def test_rejects_bad_percentile(self):
+        with pytest.raises(ValueError):
+            HedgePolicy(1.0)
+
+
+class TestHedgedCall:
+    def test_fast_call_is_not_hedged(self):
+        metrics = ClientMetrics()
+        result = hedged_call(lambda: "ok", HedgePolicy(initial_delay=1), metrics)
+        assert result == "ok"
+        assert metrics.get("hedge.calls") == 1
+        assert metrics.get("hedge.sent") == 0
+
+    def test_hedge_wins_when_original_is_slow(self):
+        metrics = ClientMetrics()
+        policy = HedgePolicy(initial_delay=0.05, min_delay=0)
+        for _ in range(10):
+            policy.record(1.0)
+        calls = []
+        lock = threading.Lock()
+
+        def fn():
+            with lock:
+                calls.append(None)
+                first = len(calls) == 1
+            time.sleep(0.5 if first else 0.01)
+            return "slow" if first else "fast"
+
+        started = time.monotonic()
+        assert hedged_call(fn, policy, metrics) == "fast"
+        assert time.monotonic() - started < 0.4
+        assert metrics.get("hedge.sent") == 1
+        assert metrics.get("hedge.won") == 1
+        assert metrics.get("hedge.latency_saved_seconds") > 0.5
+
+    def test_failed_attempt_falls_back_to_the_other(self):
+        metrics = ClientMetrics()
+        calls = []
+
+        def fn():
+            calls.append(None)
+            if len(calls) == 1:
+                time.sleep(0.1)
+                raise RuntimeError("boom")
+            time.sleep(0.2)
+            return "second"
+
+        assert hedged_call(fn, HedgePolicy(initial_delay=0.05, min_delay=0), metrics) == "second"
+
+    def test_raises_original_error_when_all_fail(self):
+        def fn():
+            time.sleep(0.1)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            hedged_call(fn, HedgePolicy(initial_delay=0.01, min_delay=0), ClientMetrics())
+
+    @pytest.mark.asyncio
+    async def test_async_loser_is_cancelled(self):
+        metrics = ClientMetrics()
+        cancelled = asyncio.Event()
+        calls = []
+
+        async def fn():
+            calls.append(None)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return "hedge"
+
+        policy = HedgePolicy(initial_delay=0.02, min_delay=0)
+        assert await hedged_call_async(fn, policy, metrics) == "hedge"
+        assert cancelled.is_set()
+        assert metrics.get("hedge.won") == 1
+
+
+class TestHedgedScrape:
+    def test_both_attempts_share_idempotency_key(self):
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        seen = []
+        lock = threading.Lock()
+
+        def request(method, url, headers=None, **kwargs):
+            with lock:
+                seen.append(headers.get("x-idempotency-key"))
+                first = len(seen) == 1
+            time.sleep(0.3 if first else 0)
+            return _ok_response()
+
+        client.session.request = request
+        policy = HedgePolicy(initial_delay=0.05, min_delay=0)
+        doc = scrape_module.hedged_scrape(client, "https://example.com", policy=policy)
+
+        assert doc.markdown == "hi"
+        assert len(seen) == 2 and seen[0] == seen[1] and seen[0]
+        assert client.metrics.get("hedge.won") == 1
+
+    def test_invalid_url_raises_without_requests(self):
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        with pytest.raises(ValueError):
+            scrape_module.hedged_scrape(client, " ", policy=HedgePolicy())
+        assert client.metrics.get("hedge.calls") == 0
+
+    @pytest.mark.asyncio
+    async def test_async_hedged_scrape(self):
+        keys = []
+
+        async def handler(request):
+            keys.append(request.headers.get("x-idempotency-key"))
+            if len(keys) == 1:
+                await asyncio.sleep(5)
+            return httpx.Response(200, json={"success": True, "data": {"markdown": "hi"}})
+
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+        policy = HedgePolicy(initial_delay=0.05, min_delay=0)
+        doc = await async_scrape.hedged_scrape(client, "https://example.com", policy=policy)
+
+        assert doc.markdown == "hi"
+        assert keys[0] == keys[1]
+        assert client.metrics.get("hedge.sent") == 1
+        await client.close()
@@ -0,0 +1,104 @@
+import json
+import threading
+from unittest.mock import Mock
+
+import requests
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.utils.http_client import HttpClient
+
+
+def _ok_response(status_code: int = 200) -> Mock:
+    response = Mock()
+    response.status_code = status_code
+    return response
+
+
+class TestHttpClientPooling:
+    def test_session_is_reused_across_requests(self):
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        first = client.session
+        assert client.session is first
+
+        adapter = first.get_adapter("https://api.firecrawl.dev/v2/scrape")
+        assert adapter._pool_maxsize == 10
+        assert adapter.max_retries.total == 0
+
+    def test_pool_options_are_applied(self):
+        client = HttpClient(
+            "key",
+            "https://api.firecrawl.dev",
+            pool_connections=2,
+            max_connections_per_host=32,
+            pool_block=True,
+            keep_alive=False,
+        )
+        adapter = client.session.get_adapter("https://api.firecrawl.dev")
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+        assert client.session.headers["Connection"] == "close"
+
+    def test_requests_go_through_session(self, monkeypatch):
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        calls = []
+
+        def fake_request(self, method, url, **kwargs):
+            calls.append((method, url, kwargs))
+            return _ok_response()
+
+        monkeypatch.setattr(requests.Session, "request", fake_request)
+
+        client.post("/v2/scrape", {"url": "https://example.com"})
+        client.get("/v2/crawl/abc")
+        client.delete("/v2/crawl/abc")
+
+        assert [c[0] for c in calls] == ["POST", "GET", "DELETE"]
+        assert calls[0][1] == "https://api.firecrawl.dev/v2/scrape"
+        assert json.loads(calls[0][2]["data"])["url"] == "https://example.com"
+        assert calls[0][2]["headers"]["Authorization"] == "Bearer key"
+
+    def test_close_releases_session_and_reopens_lazily(self):
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        first = client.session
+        first.close = Mock()
+
+        client.close()
+        first.close.assert_called_once()
+        assert client._session is None
+        assert client.session is not first
+
+    def test_context_manager_closes(self):
+        with HttpClient("key", "https://api.firecrawl.dev") as client:
+            session = client.session
+            session.close = Mock()
+        session.close.assert_called_once()
+
+    def test_session_creation_is_thread_safe(self):
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        seen = []
+        barrier = threading.Barrier(8)
+
+        def grab():
+            barrier.wait()
+            seen.append(client.session)
+
+        threads = [threading.Thread(target=grab) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(s) for s in seen}) == 1
+
+
+class TestFirecrawlClientLifecycle:
+    def test_pool_options_are_wired_through(self):
+        client = FirecrawlClient(api_key="key", max_connections_per_host=4, keep_alive=False)
+        assert client.http_client.max_connections_per_host == 4
+        assert client.http_client.keep_alive is False
+
+    def test_context_manager_closes_http_client(self):
+        with FirecrawlClient(api_key="key") as client:
+            client.http_client.close = Mock()
+        client.http_client.close.assert_called_once()
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import threading
+
+import httpx
+import pytest
+
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+class TestAsyncHttpClientPooling:
+    def test_default_limits_keep_connections_alive(self):
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev")
+        assert client.limits.max_keepalive_connections == 20
+        assert client.limits.max_connections == 100
+        assert client.limits.keepalive_expiry == 5.0
+        assert client.http2 is False
+
+    def test_custom_limits(self):
+        client = AsyncHttpClient(
+            "key",
+            "https://api.firecrawl.dev",
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=30.0,
+        )
+        assert client.limits == httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=30.0)
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared_within_a_loop(self):
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev")
+        first = client._client
+        assert client._client is first
+        await client.close()
+        assert first.is_closed
+        assert client._client is not first
+        await client.close()
+
+    def test_client_is_recreated_for_a_new_loop(self):
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev")
+
+        async def grab():
+            return client._client
+
+        first = asyncio.run(grab())
+        second = asyncio.run(grab())
+        assert first is not second
+
+    def test_replaced_client_is_closed_on_its_running_loop(self, caplog):
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev")
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+
+        async def grab():
+            return client._client
+
+        try:
+            first = asyncio.run_coroutine_threadsafe(grab(), other).result(timeout=5)
+            second = asyncio.run(grab())
+            # The old loop is still running, so its client is closed there
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other).result(timeout=5)
+            assert first.is_closed and not second.is_closed
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join()
+            other.close()
+
+        # A client whose loop has stopped is dropped and the leak logged
+        with caplog.at_level(logging.DEBUG, logger="firecrawl"):
+            third = asyncio.run(grab())
+        assert third is not second and not second.is_closed
+        assert "event loop has stopped" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_requests_reuse_transport(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json={"success": True})
+
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev")
+        transport = httpx.MockTransport(handler)
+        client._client_instance = httpx.AsyncClient(base_url=client.api_url, transport=transport)
+        client._client_loop = asyncio.get_running_loop()
+
+        await asyncio.gather(*(client.get("/v2/crawl/abc") for _ in range(5)))
+        assert len(calls) == 5
+        await client.close()
+
+
+class TestAsyncFirecrawlClientLifecycle:
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_pools(self):
+        async with AsyncFirecrawlClient(api_key="key", max_connections=10) as client:
+            inner = client.async_http_client._client
+            assert client.async_http_client.limits.max_connections == 10
+        assert inner.is_closed
+        assert client.http_client._session is None
@@ -0,0 +1,78 @@
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from firecrawl.v2.utils import json_codec
+
+
+@pytest.fixture
+def restore_codec():
+    original = json_codec.get_codec()
+    yield
+    json_codec.set_codec(original)
+
+
+def _available():
+    names = []
+    for name in ("stdlib", "orjson", "msgspec"):
+        try:
+            json_codec.set_codec(name)
+        except ValueError:
+            continue
+        names.append(name)
+    return names
+
+
+class TestJsonCodec:
+    def test_default_prefers_fast_codec_when_installed(self):
+        installed = _available()
+        json_codec.set_codec(json_codec._default_codec())
+        expected = next((n for n in ("orjson", "msgspec") if n in installed), "stdlib")
+        assert json_codec.get_codec().name == expected
+
+    @pytest.mark.parametrize("name", ["stdlib", "orjson", "msgspec"])
+    def test_round_trip_from_bytes(self, name, restore_codec):
+        if name not in _available():
+            pytest.skip(f"{name} not installed")
+        codec = json_codec.set_codec(name)
+        obj = {"data": [{"markdown": "héllo ✓", "n": 1}], "next": None, "ok": True}
+        encoded = codec.dumps(obj)
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == obj
+        assert codec.loads(memoryview(encoded)) == obj
+        assert codec.loads(encoded.decode("utf-8")) == obj
+
+    @pytest.mark.parametrize("name", ["stdlib", "orjson", "msgspec"])
+    def test_invalid_json_raises_value_error(self, name, restore_codec):
+        if name not in _available():
+            pytest.skip(f"{name} not installed")
+        json_codec.set_codec(name)
+        with pytest.raises(ValueError):
+            json_codec.loads(b"{not json")
+
+    def test_wide_integers_fall_back_to_stdlib(self, restore_codec):
+        for name in _available():
+            json_codec.set_codec(name)
+            assert json_codec.loads(json_codec.dumps({"n": 2 ** 70})) == {"n": 2 ** 70}
+
+    def test_unknown_codec(self, restore_codec):
+        with pytest.raises(ValueError):
+            json_codec.set_codec("yaml")
+
+    def test_custom_codec(self, restore_codec):
+        codec = json_codec.JsonCodec("custom", lambda data: {"custom": True}, lambda obj: b"{}")
+        json_codec.set_codec(codec)
+        assert json_codec.loads(b"[]") == {"custom": True}
+
+
+class TestDecodeResponse:
+    def test_decodes_bytes_content(self):
+        response = requests.Response()
+        response._content = b'{"success": true, "data": []}'
+        assert json_codec.decode_response(response) == {"success": True, "data": []}
+
+    def test_falls_back_to_json_method(self):
+        response = Mock()
+        response.json.return_value = {"success": True}
+        assert json_codec.decode_response(response) == {"success": True}
@@ -0,0 +1,117 @@
+import io
+import json
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.utils.json_stream import (
+    AsyncStreamedPage,
+    JsonObjectStream,
+    StreamedPage,
+    iter_events,
+)
+
+
+PAGE = {
+    "success": True,
+    "status": "completed",
+    "completed": 3,
+    "total": 3,
+    "next": None,
+    "data": [
+        {"markdown": 'quote " and \\ backslash ✓', "metadata": {"sourceURL": "https://a", "tags": ["x", {"y": []}]}},
+        {"markdown": "[not] {structural}", "html": "<p>]</p>"},
+        "plain-string",
+    ],
+    "creditsUsed": 1.5,
+}
+
+
+def _chunks(raw: bytes, size: int):
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+def _collect(events):
+    fields, items = {}, []
+    for kind, key, value in events:
+        if kind == "item":
+            items.append(value)
+        else:
+            fields[key] = value
+    return fields, items
+
+
+def _requests_response(raw: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(raw)
+    return response
+
+
+class TestJsonObjectStream:
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+    def test_any_chunking_yields_same_result(self, size):
+        raw = json.dumps(PAGE, ensure_ascii=False, indent=1).encode("utf-8")
+        fields, items = _collect(iter_events(_chunks(raw, size)))
+        assert items == PAGE["data"]
+        assert fields == {k: v for k, v in PAGE.items() if k != "data"}
+
+    def test_fields_before_data_are_emitted_first(self):
+        raw = json.dumps(PAGE).encode()
+        stream = JsonObjectStream()
+        events = stream.feed(raw[: raw.index(b'"data"')])
+        assert [e[1] for e in events] == ["success", "status", "completed", "total", "next"]
+
+    def test_buffer_holds_at_most_one_document(self):
+        doc = {"rawHtml": "x" * 50_000}
+        raw = json.dumps({"success": True, "data": [doc] * 20}).encode()
+        stream = JsonObjectStream()
+        peak = 0
+        for chunk in _chunks(raw, 4096):
+            stream.feed(chunk)
+            peak = max(peak, len(stream._buf))
+        stream.close()
+        assert peak < 50_000 + 4096 * 2
+
+    def test_truncated_body_raises(self):
+        raw = json.dumps(PAGE).encode()
+        with pytest.raises(ValueError):
+            list(iter_events([raw[:-20]]))
+
+    def test_non_object_raises(self):
+        with pytest.raises(ValueError):
+            list(iter_events([b"[1, 2]"]))
+
+    def test_data_that_is_not_an_array_is_a_field(self):
+        fields, items = _collect(iter_events([b'{"data": null, "success": false}']))
+        assert fields == {"data": None, "success": False}
+        assert items == []
+
+
+class TestStreamedPage:
+    def test_header_available_before_iteration(self):
+        page = StreamedPage(_requests_response(json.dumps(PAGE).encode()), chunk_size=16)
+        assert page.get("success") is True
+        assert page.get("next") is None
+        assert list(page.get("data")) == PAGE["data"]
+        assert page.get("creditsUsed") == 1.5
+
+    def test_empty_page(self):
+        page = StreamedPage(_requests_response(b'{"success": true, "data": []}'))
+        assert list(page) == []
+
+    @pytest.mark.asyncio
+    async def test_async_page(self):
+        raw = json.dumps(PAGE).encode()
+
+        class Chunked(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for chunk in _chunks(raw, 5):
+                    yield chunk
+
+        response = httpx.Response(200, stream=Chunked())
+        page = await AsyncStreamedPage.open(response)
+        assert page.get("status") == "completed"
+        assert [item async for item in page.get("data")] == PAGE["data"]
+        assert page.get("creditsUsed") == 1.5
@@ -0,0 +1,118 @@
+from unittest.mock import Mock
+
+import pytest
+
+from firecrawl.v2.methods import crawl as crawl_module
+from firecrawl.v2.types import CrawlJob
+from firecrawl.v2.utils import polling as polling_module
+from firecrawl.v2.utils.metrics import ClientMetrics
+from firecrawl.v2.utils.polling import AdaptivePolling, FixedPolling, PollingStrategy
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(polling_module.time, "monotonic", clock)
+    return clock
+
+
+class TestFixedPolling:
+    def test_uses_poll_interval_by_default(self, clock):
+        schedule = FixedPolling().schedule(2)
+        assert schedule.next_delay(1, 10) == 2
+        assert FixedPolling(0.5).schedule(2).next_delay() == 0.5
+
+    def test_polls_saved_is_zero_for_baseline(self, clock):
+        schedule = FixedPolling().schedule(2)
+        for _ in range(3):
+            clock.now += schedule.next_delay()
+        assert schedule.polls_saved() == 0
+
+    def test_rejects_negative_interval(self):
+        with pytest.raises(ValueError):
+            FixedPolling(-1)
+
+
+    def test_strategy_without_schedule_cannot_be_created(self):
+        class Incomplete(PollingStrategy):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+class TestAdaptivePolling:
+    def test_fast_first_poll_then_backoff_without_progress(self, clock):
+        schedule = AdaptivePolling(initial_interval=0.5, backoff=2, max_interval=3).schedule(2)
+        assert schedule.next_delay(0, 100) == 0.5
+        clock.now += 0.5
+        assert schedule.next_delay(0, 100) == 1.0
+        clock.now += 1
+        assert schedule.next_delay(0, 100) == 2.0
+        clock.now += 2
+        assert schedule.next_delay(0, 100) == 3.0
+
+    def test_delay_follows_estimated_finish(self, clock):
+        schedule = AdaptivePolling(eta_fraction=0.5, smoothing=1.0, max_interval=60).schedule(2)
+        schedule.next_delay(0, 1000)
+        clock.now += 10
+        # 100 documents in 10s: 900 left at 10/s, poll again at half the estimate
+        assert schedule.next_delay(100, 1000) == pytest.approx(45)
+        clock.now += 45
+        # Nearly done: the interval tightens to the minimum
+        assert schedule.next_delay(999, 1000) == 0.25
+
+    def test_large_jobs_are_capped(self, clock):
+        schedule = AdaptivePolling(max_interval=30).schedule(2)
+        schedule.next_delay(0, 100000)
+        clock.now += 10
+        assert schedule.next_delay(10, 100000) == 30
+
+    def test_all_scraped_polls_at_minimum(self, clock):
+        schedule = AdaptivePolling(min_interval=0.1).schedule(2)
+        schedule.next_delay(5, 10)
+        clock.now += 1
+        assert schedule.next_delay(10, 10) == 0.1
+
+    def test_validates_arguments(self):
+        with pytest.raises(ValueError):
+            AdaptivePolling(min_interval=5, max_interval=1)
+        with pytest.raises(ValueError):
+            AdaptivePolling(backoff=0.5)
+        with pytest.raises(ValueError):
+            AdaptivePolling(eta_fraction=0)
+
+
+class TestWaitLoopIntegration:
+    def test_wait_uses_strategy_and_reports_saved_polls(self, monkeypatch, clock):
+        states = iter([(0, 0, "scraping")] + [(n, 1000, "scraping") for n in (100, 400, 700, 990)] + [(1000, 1000, "completed")])
+        sleeps = []
+
+        def fake_status(client, job_id, **kwargs):
+            completed, total, status = next(states)
+            return CrawlJob(status=status, completed=completed, total=total, data=[])
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock.now += seconds
+
+        monkeypatch.setattr(crawl_module, "get_crawl_status", fake_status)
+        monkeypatch.setattr(crawl_module.time, "sleep", fake_sleep)
+        client = Mock()
+        client.metrics = ClientMetrics()
+
+        job = crawl_module.wait_for_crawl_completion(client, "abc", poll_interval=2, polling=AdaptivePolling())
+
+        assert job.status == "completed"
+        assert len(sleeps) == 5
+        assert sleeps[0] == 0.5
+        assert client.metrics.get("polling.polls") == 6
+        expected_saved = int(sum(sleeps) // 2) + 1 - 6
+        assert client.metrics.get("polling.saved") == expected_saved
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from firecrawl.v2.utils.endpoints import endpoint_family
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.rate_limit import RateLimiter, TokenBucket
+from firecrawl.v2.utils.retry import RetryPolicy
+
+
+def _response(status_code, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class TestEndpointFamily:
+    @pytest.mark.parametrize(
+        "endpoint, family",
+        [
+            ("/v2/scrape", "scrape"),
+            ("/v2/search", "search"),
+            ("/v2/crawl", "crawl"),
+            ("/v2/crawl/params-preview", "crawl"),
+            ("/v2/crawl/abc-123", "crawl_status"),
+            ("/v2/crawl/abc-123/errors", "crawl_status"),
+            ("https://api.firecrawl.dev/v2/crawl/abc?skip=100", "crawl_status"),
+            ("/v2/batch/scrape", "batch"),
+            ("/v2/batch/scrape/abc", "batch_status"),
+            ("/v2/extract/abc", "extract_status"),
+            ("/v2/team/credit-usage", "usage"),
+            ("/v2/concurrency-check", "usage"),
+        ],
+    )
+    def test_families(self, endpoint, family):
+        assert endpoint_family(endpoint) == family
+
+
+class TestTokenBucket:
+    def test_burst_then_waits(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert 0.05 < bucket.reserve() <= 0.1
+        # Reservations queue up behind each other
+        assert 0.15 < bucket.reserve() <= 0.2
+
+    def test_aimd(self):
+        bucket = TokenBucket(rate=10, decrease_factor=0.5, recovery_step=0.1)
+        bucket.on_rate_limited()
+        assert bucket.rate == 5
+        bucket.on_success()
+        assert bucket.rate == pytest.approx(6)
+        for _ in range(10):
+            bucket.on_success()
+        assert bucket.rate == 10
+
+    def test_retry_after_pauses_bucket(self):
+        bucket = TokenBucket(rate=10, burst=10)
+        bucket.on_rate_limited(retry_after=2)
+        assert bucket.reserve() >= 2
+
+    def test_shared_across_threads(self):
+        bucket = TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # One token immediately, then five more at 50/s
+        assert time.monotonic() - start >= 0.09
+
+
+class TestRateLimiter:
+    def test_unlisted_families_are_not_limited(self):
+        limiter = RateLimiter({"scrape": 1})
+        assert limiter.bucket("/v2/search") is None
+        assert limiter.bucket("/v2/scrape") is limiter.bucket("/v2/scrape")
+
+    def test_per_minute(self):
+        limiter = RateLimiter.per_minute({"scrape": 120}, default_rate=60)
+        assert limiter.bucket("/v2/scrape").rate == 2
+        assert limiter.bucket("/v2/map").rate == 1
+
+    def test_record_only_affects_own_family(self):
+        limiter = RateLimiter({"scrape": 10, "crawl_status": 10})
+        limiter.record("/v2/scrape", 429)
+        assert limiter.bucket("/v2/scrape").rate == 5
+        assert limiter.bucket("/v2/crawl/abc").rate == 10
+
+
+class TestHttpClientRateLimiting:
+    def test_throttles_before_sending_and_adapts_on_429(self, monkeypatch):
+        monkeypatch.setattr("firecrawl.v2.utils.http_client.time.sleep", lambda s: None)
+        monkeypatch.setattr("firecrawl.v2.utils.rate_limit.time.sleep", lambda s: None)
+        limiter = RateLimiter({"scrape": 10}, burst=1)
+        client = HttpClient(
+            "key",
+            "https://api.firecrawl.dev",
+            retry_policy=RetryPolicy(backoff_factor=0.01),
+            rate_limiter=limiter,
+        )
+        client.session.request = Mock(side_effect=[_response(429), _response(200)])
+
+        result = client.post("/v2/scrape", {"url": "https://example.com"})
+
+        assert result.status_code == 200
+        assert client.metrics.get("rate_limit.throttled") == 1
+        assert limiter.bucket("/v2/scrape").rate == pytest.approx(5.5)
+
+
+class TestAsyncHttpClientRateLimiting:
+    @pytest.mark.asyncio
+    async def test_tasks_share_bucket(self):
+        limiter = RateLimiter({"crawl_status": 40}, burst=1)
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev", rate_limiter=limiter)
+        client._client_instance = httpx.AsyncClient(
+            base_url=client.api_url,
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+        )
+        client._client_loop = asyncio.get_running_loop()
+
+        start = time.monotonic()
+        await asyncio.gather(*(client.get("/v2/crawl/abc") for _ in range(5)))
+
+        assert time.monotonic() - start >= 0.09
+        assert client.metrics.get("rate_limit.throttled") == 4
+        await client.close()
@@ -0,0 +1,188 @@
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.utils.error_handler import IdempotencyConflictError
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.metrics import ClientMetrics
+from firecrawl.v2.utils.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def _response(status_code, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class TestRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 <= parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+
+    def test_invalid(self):
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestRetryPolicy:
+    def test_full_jitter_is_bounded(self):
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=4.0)
+        for attempt in range(6):
+            assert 0 <= policy.backoff(attempt) <= min(4.0, 2 ** attempt)
+
+    def test_post_without_key_only_retries_safe_statuses(self):
+        policy = RetryPolicy()
+        assert policy.for_response(0, 429, idempotent=False).delay is not None
+        assert policy.for_response(0, 504, idempotent=False).reason == "not_idempotent"
+        assert policy.for_response(0, 504, idempotent=True).delay is not None
+
+    def test_idempotency_key_makes_post_idempotent(self):
+        policy = RetryPolicy()
+        assert policy.is_idempotent("GET")
+        assert not policy.is_idempotent("POST", {"Authorization": "x"})
+        assert policy.is_idempotent("POST", {"x-idempotency-key": "abc"})
+
+    def test_transport_errors_on_post(self):
+        policy = RetryPolicy()
+        exc = requests.ReadTimeout()
+        assert policy.for_exception(0, exc, idempotent=False, connect_error=False).delay is None
+        assert policy.for_exception(0, exc, idempotent=False, connect_error=True).delay is not None
+
+    def test_retry_after_is_honoured(self):
+        policy = RetryPolicy(backoff_factor=0.1)
+        decision = policy.for_response(0, 429, idempotent=True, retry_after="2")
+        assert 2.0 <= decision.delay <= 2.1
+
+    def test_long_retry_after_is_not_retried(self):
+        policy = RetryPolicy(max_retry_after=5)
+        assert policy.for_response(0, 429, idempotent=True, retry_after="120").reason == "retry_after_too_long"
+
+    def test_attempts_exhausted(self):
+        policy = RetryPolicy(max_attempts=2)
+        assert policy.for_response(0, 503, idempotent=True).delay is not None
+        assert policy.for_response(1, 503, idempotent=True).reason == "exhausted"
+
+    def test_budget_limits_retries(self):
+        policy = RetryPolicy(max_attempts=10, budget=RetryBudget(ratio=0.5, min_tokens=1))
+        assert policy.for_response(0, 503, idempotent=True).delay is not None
+        assert policy.for_response(1, 503, idempotent=True).reason == "budget_exhausted"
+        policy.on_request()
+        policy.on_request()
+        assert policy.for_response(1, 503, idempotent=True).delay is not None
+
+
+class TestHttpClientRetries:
+    def test_retries_429_then_succeeds(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("firecrawl.v2.utils.http_client.time.sleep", sleeps.append)
+        responses = [_response(429, {"Retry-After": "1"}), _response(503), _response(200)]
+        client = HttpClient("key", "https://api.firecrawl.dev", retry_policy=RetryPolicy(backoff_factor=0.01))
+        client.session.request = Mock(side_effect=responses)
+
+        result = client.get("/v2/crawl/abc")
+
+        assert result.status_code == 200
+        assert len(sleeps) == 2 and sleeps[0] >= 1.0
+        assert client.metrics.get("retries") == 2
+        assert client.metrics.get("retries.status.429") == 1
+        assert client.metrics.get("retries.status.503") == 1
+
+    def test_returns_last_response_when_exhausted(self, monkeypatch):
+        monkeypatch.setattr("firecrawl.v2.utils.http_client.time.sleep", lambda s: None)
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        client.session.request = Mock(return_value=_response(429))
+
+        result = client.post("/v2/scrape", {"url": "https://example.com"})
+
+        assert result.status_code == 429
+        assert client.session.request.call_count == 3
+        assert client.metrics.get("retries.gave_up.exhausted") == 1
+
+    def test_post_read_timeout_not_retried_without_key(self, monkeypatch):
+        monkeypatch.setattr("firecrawl.v2.utils.http_client.time.sleep", lambda s: None)
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        client.session.request = Mock(side_effect=requests.ReadTimeout())
+
+        with pytest.raises(requests.ReadTimeout):
+            client.post("/v2/scrape", {"url": "https://example.com"})
+        assert client.session.request.call_count == 1
+
+        client.session.request.reset_mock()
+        with pytest.raises(requests.ReadTimeout):
+            client.post("/v2/batch/scrape", {"urls": []}, headers=client._prepare_headers("key-1"))
+        assert client.session.request.call_count == 3
+
+    def test_conflict_on_retried_keyed_post_is_distinct(self, monkeypatch):
+        monkeypatch.setattr("firecrawl.v2.utils.http_client.time.sleep", lambda s: None)
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        # The first attempt was accepted but its response was lost to a 502
+        client.session.request = Mock(side_effect=[_response(502), _response(409)])
+
+        with pytest.raises(IdempotencyConflictError) as info:
+            client.post("/v2/crawl", {"url": "https://example.com"}, headers=client._prepare_headers("key-1"))
+        assert info.value.idempotency_key == "key-1" and info.value.status_code == 409
+        assert client.metrics.get("retries.idempotency_conflict") == 1
+
+        # A 409 on the first attempt is the caller's own duplicate and is returned as before
+        client.session.request = Mock(return_value=_response(409))
+        response = client.post("/v2/crawl", {"url": "https://example.com"}, headers=client._prepare_headers("key-1"))
+        assert response.status_code == 409
+
+    def test_per_call_retries_override_policy(self, monkeypatch):
+        monkeypatch.setattr("firecrawl.v2.utils.http_client.time.sleep", lambda s: None)
+        client = HttpClient("key", "https://api.firecrawl.dev")
+        client.session.request = Mock(return_value=_response(503))
+        client.get("/v2/crawl/abc", retries=5)
+        assert client.session.request.call_count == 5
+
+
+class TestAsyncHttpClientRetries:
+    @pytest.mark.asyncio
+    async def test_async_retries_and_shares_metrics(self, monkeypatch):
+        async def no_sleep(_):
+            return None
+
+        monkeypatch.setattr("firecrawl.v2.utils.http_client_async.asyncio.sleep", no_sleep)
+        statuses = iter([429, 502, 200])
+
+        def handler(request):
+            return httpx.Response(next(statuses), json={"success": True})
+
+        metrics = ClientMetrics()
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev", metrics=metrics)
+        client._client_instance = httpx.AsyncClient(base_url=client.api_url, transport=httpx.MockTransport(handler))
+        client._client_loop = asyncio.get_running_loop()
+
+        response = await client.get("/v2/crawl/abc")
+
+        assert response.status_code == 200
+        assert metrics.get("retries") == 2
+        assert metrics.get("retries.status.502") == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_conflict_on_retried_keyed_post(self, monkeypatch):
+        async def no_sleep(_):
+            return None
+
+        monkeypatch.setattr("firecrawl.v2.utils.http_client_async.asyncio.sleep", no_sleep)
+        statuses = iter([503, 409])
+
+        def handler(request):
+            return httpx.Response(next(statuses), json={"success": False, "error": "Idempotency key already used"})
+
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+        with pytest.raises(IdempotencyConflictError) as info:
+            await client.post("/v2/batch/scrape", {"urls": []}, headers=client._headers("key-2"))
+        assert info.value.idempotency_key == "key-2"
+        await client.close()
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import os
+import socketserver
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler
+
+import httpx
+import pytest
+from requests.adapters import HTTPAdapter
+
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.transport import UnixSocketAdapter, mount_prefix, unix_socket_path
+
+
+class TestUnixSocketPath:
+    @pytest.mark.parametrize(
+        "url",
+        ["unix:///var/run/fc.sock", "http+unix:///var/run/fc.sock", "http+unix://%2Fvar%2Frun%2Ffc.sock"],
+    )
+    def test_parses_supported_forms(self, url):
+        assert unix_socket_path(url) == "/var/run/fc.sock"
+
+    @pytest.mark.parametrize("url", ["tcp://localhost:3002", "unix://", "/var/run/fc.sock"])
+    def test_rejects_other_urls(self, url):
+        with pytest.raises(ValueError):
+            unix_socket_path(url)
+
+    def test_mount_prefix(self):
+        assert mount_prefix("http://localhost:3002") == "http://localhost:3002/"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        payload = json.dumps({"success": True, "path": self.path, "host": self.headers["Host"], "echo": json.loads(body)})
+        raw = payload.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *args):
+        pass
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        # BaseHTTPRequestHandler expects a (host, port) client address
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+@pytest.fixture
+def unix_server():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "fc.sock")
+        server = _UnixServer(path, _Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield path
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestHttpClientTransport:
+    def test_requests_go_over_unix_socket(self, unix_server):
+        client = HttpClient("key", "http://localhost:3002", transport=f"unix://{unix_server}")
+
+        first = client.post("/v2/scrape", {"url": "https://example.com"}).json()
+        second = client.post("/v2/scrape", {"url": "https://example.org"}).json()
+
+        assert first["path"] == "/v2/scrape"
+        assert first["host"] == "localhost:3002"
+        assert second["echo"]["url"] == "https://example.org"
+        assert client.unix_socket_path == unix_server
+        client.close()
+
+    def test_unix_socket_requires_http_api_url(self):
+        with pytest.raises(ValueError):
+            HttpClient("key", "https://api.firecrawl.dev", transport="unix:///tmp/fc.sock")
+
+    def test_custom_adapter_is_mounted_for_api_url(self):
+        adapter = HTTPAdapter()
+        client = HttpClient("key", "http://firecrawl.internal:3002", transport=adapter)
+
+        assert client.session.get_adapter("http://firecrawl.internal:3002/v2/scrape") is adapter
+        assert client.session.get_adapter("http://elsewhere/") is not adapter
+        assert client.unix_socket_path is None
+
+    def test_unix_adapter_uses_pool_settings(self):
+        client = HttpClient("key", "http://localhost", transport="unix:///tmp/fc.sock", max_connections_per_host=7)
+        adapter = client.session.get_adapter("http://localhost/v2/scrape")
+        assert isinstance(adapter, UnixSocketAdapter)
+        assert adapter._pool_maxsize == 7
+
+
+class TestAsyncHttpClientTransport:
+    @pytest.mark.asyncio
+    async def test_custom_transport(self):
+        seen = []
+
+        def handler(request):
+            seen.append(str(request.url))
+            return httpx.Response(200, json={"success": True})
+
+        client = AsyncHttpClient("key", "http://firecrawl.internal", transport=httpx.MockTransport(handler))
+        response = await client.post("/v2/scrape", {"url": "https://example.com"})
+
+        assert response.json()["success"] is True
+        assert seen == ["http://firecrawl.internal/v2/scrape"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_requests_go_over_unix_socket(self, unix_server):
+        client = AsyncHttpClient("key", "http://localhost:3002", transport=f"unix://{unix_server}")
+
+        results = await asyncio.gather(
+            *(client.post("/v2/scrape", {"url": f"https://example.com/{i}"}) for i in range(3))
+        )
+
+        assert sorted(r.json()["echo"]["url"] for r in results) == [f"https://example.com/{i}" for i in range(3)]
+        await client.close()
+
+    def test_unix_socket_requires_http_api_url(self):
+        with pytest.raises(ValueError, match="plain http://"):
+            AsyncHttpClient("key", "https://api.firecrawl.dev", transport="unix:///tmp/fc.sock")
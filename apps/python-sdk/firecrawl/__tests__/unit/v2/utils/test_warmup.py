@@ -0,0 +1,111 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from firecrawl.v2.types import WarmupReport
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.warmup import resolve_host, warm_imports
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        body = b'{"success": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.connections = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestWarmupSteps:
+    def test_warm_imports(self):
+        warm_imports()
+
+    def test_resolve_host(self):
+        assert resolve_host("http://127.0.0.1:3002") == ["127.0.0.1"]
+        assert resolve_host("unix-only") == []
+
+
+class TestHttpClientWarmup:
+    def test_opens_and_parks_connections(self, server):
+        api_url = f"http://127.0.0.1:{server.server_address[1]}"
+        client = HttpClient("key", api_url, max_connections_per_host=10)
+
+        report = client.warmup(3)
+
+        assert isinstance(report, WarmupReport)
+        assert report.connections == 3
+        assert report.addresses == ["127.0.0.1"]
+        assert report.total_seconds >= report.connect_seconds >= 0
+        assert _wait_for(lambda: server.connections == 3)
+
+        # Requests reuse the parked connections instead of dialing again
+        for _ in range(3):
+            assert client.get("/v2/crawl/abc").status_code == 200
+        assert server.connections == 3
+        client.close()
+
+    def test_capped_at_pool_size(self, server):
+        api_url = f"http://127.0.0.1:{server.server_address[1]}"
+        client = HttpClient("key", api_url, max_connections_per_host=2)
+        assert client.warmup(5).connections == 2
+        client.close()
+
+    def test_unreachable_host_raises(self):
+        client = HttpClient("key", "http://127.0.0.1:1")
+        with pytest.raises(OSError):
+            client.warmup(2, timeout=1)
+        client.close()
+
+
+class TestAsyncHttpClientWarmup:
+    @pytest.mark.asyncio
+    async def test_sends_concurrent_head_requests(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.method)
+            return httpx.Response(200)
+
+        client = AsyncHttpClient(
+            "key", "http://127.0.0.1:3002", max_keepalive_connections=2, transport=httpx.MockTransport(handler)
+        )
+        report = await client.warmup(4)
+        assert report.connections == 2
+        assert seen == ["HEAD", "HEAD"]
+        assert report.addresses == ["127.0.0.1"]
+        await client.close()
@@ -0,0 +1,197 @@
+import asyncio
+import concurrent.futures
+import json
+import threading
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.futures import AsyncJobFuture, JobFuture
+from firecrawl.v2.monitor import AsyncJobMonitor, JobMonitor
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+def _response(status, payload):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload).encode()
+    response._content_consumed = True
+    return response
+
+
+def _status(job_id, polls):
+    """Job ``job-N`` finishes on its N-th poll; ``never`` keeps running."""
+    target = int(job_id.split("-")[1]) if job_id.startswith("job-") else 10 ** 6
+    done = polls >= target
+    return {
+        "success": True,
+        "status": "completed" if done else "scraping",
+        "completed": polls,
+        "total": target,
+        "next": None,
+        "data": [],
+    }
+
+
+def _sync_client():
+    lock = threading.Lock()
+    polls = {}
+    deleted = []
+
+    def get(url, **kwargs):
+        job_id = url.split("?")[0].rsplit("/", 1)[1]
+        with lock:
+            polls[job_id] = polls.get(job_id, 0) + 1
+            count = polls[job_id]
+        return _response(200, _status(job_id, count))
+
+    def delete(url, **kwargs):
+        deleted.append(url)
+        return _response(200, {"success": True, "status": "cancelled"})
+
+    client = Mock()
+    client.get.side_effect = get
+    client.delete.side_effect = delete
+    client.metrics = None
+    return client, deleted
+
+
+class TestJobFuture:
+    def test_as_completed_across_many_jobs(self):
+        client, _ = _sync_client()
+        threads_before = threading.active_count()
+        with JobMonitor(client, poll_interval=0.01, max_concurrency=4) as monitor:
+            futures = [monitor.submit(f"job-{1 + i % 3}-{i}") for i in range(60)]
+            # One scheduler thread plus the check pool, not a thread per job
+            assert threading.active_count() <= threads_before + 5
+            finished = [f.result() for f in concurrent.futures.as_completed(futures, timeout=10)]
+        assert len(finished) == 60
+        assert all(job.status == "completed" for job in finished)
+
+    def test_wait_first_completed_and_cancel(self):
+        client, deleted = _sync_client()
+        seen = []
+        with JobMonitor(client, poll_interval=0.01) as monitor:
+            fast = monitor.submit("job-1")
+            slow = monitor.submit("never", "batch")
+            fast.add_done_callback(seen.append)
+            done, not_done = concurrent.futures.wait([fast, slow], timeout=5, return_when=concurrent.futures.FIRST_COMPLETED)
+            assert done == {fast} and not_done == {slow}
+            assert seen == [fast]
+
+            with pytest.raises(concurrent.futures.TimeoutError):
+                slow.result(timeout=0.05)
+            assert slow.cancel()
+            assert slow.cancelled()
+            # The DELETE is sent from the monitor's thread, not by cancel() itself
+            assert slow.remote_cancel.result(timeout=5) is True
+            assert slow.remote_cancelled is True
+            assert deleted == ["/v2/batch/scrape/never"]
+            assert "never" not in monitor.pending()
+            # Finished futures cannot be cancelled and do not touch the server
+            assert not fast.cancel()
+        assert len(deleted) == 1
+
+    def test_errors_surface_from_result(self):
+        client, _ = _sync_client()
+        with JobMonitor(client, poll_interval=0.01) as monitor:
+            future = monitor.submit("never", timeout=0.1)
+            with pytest.raises(TimeoutError):
+                future.result(timeout=5)
+        assert isinstance(future, JobFuture)
+
+
+    def test_cancel_loses_race_with_resolution(self):
+        client, deleted = _sync_client()
+        with JobMonitor(client, poll_interval=0.01) as monitor:
+            future = monitor.submit("job-1")
+            future.result(timeout=5)
+            # Already resolved: no cancel and no DELETE
+            assert not future.cancel()
+            assert future.remote_cancel is None and future.remote_cancelled is None
+        assert deleted == []
+
+
+class TestAsyncJobFuture:
+    @staticmethod
+    def _client():
+        polls = {}
+        deleted = []
+
+        def handler(request):
+            path = request.url.path
+            if request.method == "DELETE":
+                deleted.append(path)
+                return httpx.Response(200, json={"success": True, "status": "cancelled"})
+            job_id = path.rsplit("/", 1)[1]
+            polls[job_id] = polls.get(job_id, 0) + 1
+            return httpx.Response(200, json=_status(job_id, polls[job_id]))
+
+        client = AsyncHttpClient("key", "https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+        return client, deleted
+
+    @pytest.mark.asyncio
+    async def test_gather_and_as_completed(self):
+        client, _ = self._client()
+        async with AsyncJobMonitor(client, poll_interval=0.01, max_concurrency=8) as monitor:
+            futures = [monitor.submit(f"job-{1 + i % 4}-{i}", "batch") for i in range(100)]
+            assert all(isinstance(f, AsyncJobFuture) for f in futures)
+            first = next(asyncio.as_completed(futures))
+            assert (await first).status == "completed"
+            jobs = await asyncio.wait_for(asyncio.gather(*futures), 10)
+        assert [job.status for job in jobs] == ["completed"] * 100
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_task_cancellation_cancels_job(self):
+        client, deleted = self._client()
+        async with AsyncJobMonitor(client, poll_interval=0.01) as monitor:
+            future = monitor.submit("never")
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(future, 0.1)
+            assert future.cancelled()
+            assert await future.remote_cancel is True
+            assert deleted == ["/v2/crawl/never"]
+            assert monitor.pending() == []
+
+            kept = monitor.submit("job-2")
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.shield(kept), 0.001)
+            assert (await kept).status == "completed"
+        assert len(deleted) == 1
+        await client.close()
+
+
+def test_async_monitor_survives_a_new_event_loop():
+    client, _ = TestAsyncJobFuture._client()
+    monitor = AsyncJobMonitor(client, poll_interval=0.01)
+
+    async def run(job_id):
+        return await asyncio.wait_for(monitor.submit(job_id), 5)
+
+    # A client reused across asyncio.run calls restarts its scheduler on the new loop
+    assert asyncio.run(run("job-1")).status == "completed"
+    assert asyncio.run(run("job-2")).status == "completed"
+
+    async def close():
+        await monitor.close()
+        await client.close()
+
+    asyncio.run(close())
+
+
+def test_client_reopens_its_monitor_after_close():
+    from firecrawl.v2.client import FirecrawlClient
+
+    mock, _ = _sync_client()
+    with FirecrawlClient(api_key="key") as client:
+        client.http_client.get = mock.get
+        first = client._job_monitor = client.monitor(poll_interval=0.01)
+    assert client._job_monitor is None
+    # Leaving the with block does not leave the client unusable
+    future = client.job_future("job-1")
+    assert client._job_monitor is not first
+    assert future.result(timeout=10).status == "completed"
+    client.close()
@@ -0,0 +1,136 @@
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from firecrawl.v2.monitor import JobMonitor
+from firecrawl.v2.utils.deadline import DeadlineExceededError
+from firecrawl.v2.utils.polling import AdaptivePolling
+
+
+def _response(status, payload):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload).encode()
+    response._content_consumed = True
+    return response
+
+
+def _client(polls_to_finish=2, missing=()):
+    """Mock client whose jobs finish on their ``polls_to_finish``-th status check."""
+    lock = threading.Lock()
+    requested = []
+
+    def get(url, **kwargs):
+        path = url.split("?")[0]
+        job_id = path.rstrip("/").rsplit("/", 1)[1]
+        with lock:
+            requested.append((time.monotonic(), job_id, threading.current_thread().name))
+            polls = sum(1 for _, j, _ in requested if j == job_id)
+        if job_id in missing:
+            return _response(404, {"success": False, "error": "Job not found"})
+        done = polls >= polls_to_finish
+        if "/extract/" in path:
+            return _response(200, {"success": True, "status": "completed" if done else "processing", "data": {"ok": True}})
+        return _response(200, {
+            "success": True,
+            "status": "completed" if done else "scraping",
+            "completed": polls,
+            "total": polls_to_finish,
+            "next": None,
+            "data": [{"markdown": f"{job_id} {polls}"}],
+        })
+
+    client = Mock()
+    client.get.side_effect = get
+    client.metrics = None
+    return client, requested
+
+
+class TestJobMonitor:
+    def test_mixed_jobs_complete_on_one_thread(self):
+        client, requested = _client(polls_to_finish=3)
+        results = {}
+        threads_before = threading.active_count()
+        with JobMonitor(client, poll_interval=0.01) as monitor:
+            for i in range(30):
+                monitor.watch(f"crawl-{i}", "crawl", lambda job, i=i: results.__setitem__(f"crawl-{i}", job))
+            monitor.watch("batch-0", "batch", lambda job: results.__setitem__("batch-0", job))
+            monitor.watch("extract-0", "extract", lambda job: results.__setitem__("extract-0", job))
+            assert threading.active_count() == threads_before + 1
+            assert monitor.wait(timeout=10)
+
+        assert len(results) == 32
+        assert all(job.status == "completed" for job in results.values())
+        # Documents of every poll are gathered incrementally
+        assert [doc.markdown for doc in results["crawl-7"].data] == ["crawl-7 1", "crawl-7 2", "crawl-7 3"]
+        assert results["extract-0"].data == {"ok": True}
+        assert {name for _, _, name in requested} == {"firecrawl-monitor"}
+
+    def test_first_polls_are_spread(self):
+        client, requested = _client(polls_to_finish=1)
+        with JobMonitor(client, poll_interval=0.3) as monitor:
+            started = time.monotonic()
+            for i in range(40):
+                monitor.watch(f"job-{i}")
+            assert monitor.wait(timeout=5)
+        offsets = sorted(t - started for t, _, _ in requested)
+        assert len(offsets) == 40
+        # Spread over the interval rather than fired in one burst
+        assert offsets[-1] - offsets[0] > 0.15
+        assert offsets[-1] < 0.6
+
+    def test_errors_and_timeouts_reach_on_error(self):
+        client, _ = _client(polls_to_finish=1000, missing=("gone",))
+        errors = {}
+        with JobMonitor(client, poll_interval=0.01, max_errors=2) as monitor:
+            monitor.watch("gone", on_error=lambda exc: errors.__setitem__("gone", exc))
+            monitor.watch("slow", on_error=lambda exc: errors.__setitem__("slow", exc), timeout=0.2)
+            assert monitor.wait(timeout=5)
+        assert isinstance(errors["slow"], DeadlineExceededError)
+        assert "not found" in str(errors["gone"]).lower()
+
+    def test_status_checks_are_bounded(self):
+        client, _ = _client(polls_to_finish=2)
+        answer = client.get.side_effect
+        budgets = []
+        hung = []
+
+        def get(url, **kwargs):
+            budgets.append(kwargs["deadline"].remaining())
+            if "/hung" in url:
+                # What the HTTP client raises once a check's budget runs out
+                hung.append(url)
+                raise DeadlineExceededError("GET timed out")
+            return answer(url, **kwargs)
+
+        client.get.side_effect = get
+        done, errors = [], []
+        with JobMonitor(client, poll_interval=0.01, request_timeout=0.5) as monitor:
+            monitor.watch("hung", on_error=errors.append)
+            monitor.watch("ok", callback=done.append)
+            assert monitor.wait(timeout=5)
+
+        assert all(budget is not None and budget <= 0.5 for budget in budgets)
+        # A timed-out check is retried like any failure instead of ending the job at once
+        assert len(hung) == 3 and isinstance(errors[0], DeadlineExceededError)
+        assert done[0].status == "completed"
+
+    def test_unwatch_and_concurrency(self):
+        client, requested = _client(polls_to_finish=2)
+        done = []
+        with JobMonitor(client, poll_interval=0.01, max_concurrency=4, polling=AdaptivePolling(min_interval=0.01)) as monitor:
+            monitor.watch("kept", "batch", done.append)
+            monitor.watch("dropped", "batch", done.append)
+            assert monitor.unwatch("dropped")
+            assert not monitor.unwatch("dropped")
+            with pytest.raises(ValueError):
+                monitor.watch("kept", "batch")
+            assert monitor.wait(timeout=5)
+        assert [job.status for job in done] == ["completed"]
+        assert "dropped" not in {job_id for _, job_id, _ in requested}
+        with pytest.raises(RuntimeError):
+            monitor.watch("late")
@@ -0,0 +1,228 @@
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from firecrawl.v2.watcher_hub import WatcherHub
+
+
+class DummyHttpClient:
+    def __init__(self, api_url: str = "http://localhost", api_key: str = "TEST"):
+        self.api_url = api_url
+        self.api_key = api_key
+
+
+class DummyClient:
+    def __init__(self):
+        self.http_client = DummyHttpClient()
+
+
+class FakeWebSocket:
+    def __init__(self, messages, hang=False):
+        self._messages = list(messages)
+        self._hang = hang
+
+    async def recv(self):
+        if not self._messages:
+            if self._hang:
+                await asyncio.sleep(10)
+            raise ConnectionError("closed")
+        await asyncio.sleep(0.005)
+        return json.dumps(self._messages.pop(0))
+
+
+class FakeConnect:
+    def __init__(self, ws):
+        self._ws = ws
+
+    async def __aenter__(self):
+        return self._ws
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _messages(job_id):
+    return [
+        {"type": "document", "data": {"url": f"https://example.com/{job_id}", "rawHtml": "<html>"}},
+        {"type": "done", "data": {"status": "completed", "completed": 1, "total": 1, "data": []}},
+    ]
+
+
+def _patch_connect(monkeypatch, factory):
+    import websockets
+
+    uris = []
+
+    def fake_connect(uri, *args, **kwargs):
+        uris.append(uri)
+        return FakeConnect(factory(uri.rsplit("/", 1)[1]))
+
+    monkeypatch.setattr(websockets, "connect", fake_connect)
+    return uris
+
+
+def _poll_transport(polls):
+    def handler(request):
+        job_id = request.url.path.rsplit("/", 1)[1]
+        polls.append(job_id)
+        return httpx.Response(200, json={
+            "success": True,
+            "status": "completed",
+            "completed": 1,
+            "total": 1,
+            "next": None,
+            "data": [{"markdown": f"# {job_id}"}],
+        })
+
+    return httpx.MockTransport(handler)
+
+
+def test_routes_many_jobs_over_one_thread(monkeypatch):
+    uris = _patch_connect(monkeypatch, lambda job_id: FakeWebSocket(_messages(job_id)))
+    threads_before = threading.active_count()
+    documents = {}
+    finished = []
+
+    with WatcherHub(DummyClient(), poll_interval=0.01) as hub:
+        watches = []
+        for i in range(50):
+            kind = "crawl" if i % 2 else "batch"
+            watch = hub.watch(f"job-{i}", kind, listener=lambda status, i=i: finished.append((i, status.status)))
+            watch.add_event_listener("document", lambda detail: documents.setdefault(detail["id"], detail["data"]["url"]))
+            watches.append(watch)
+        # One loop thread for every job, not a thread per job
+        assert threading.active_count() <= threads_before + 1
+        assert hub.wait(timeout=5)
+        assert hub.pending() == []
+
+    assert all(watch.status == "completed" and watch.transport == "websocket" for watch in watches)
+    assert sorted(finished) == [(i, "completed") for i in range(50)]
+    assert documents == {f"job-{i}": f"https://example.com/job-{i}" for i in range(50)}
+    assert "ws://localhost/v2/crawl/job-1" in uris and "ws://localhost/v2/batch/scrape/job-0" in uris
+    assert threading.active_count() <= threads_before
+
+
+def test_falls_back_to_shared_poller(monkeypatch):
+    # The socket drops before the job is done, so the poller has to finish it
+    _patch_connect(monkeypatch, lambda job_id: FakeWebSocket([{"type": "catchup", "data": {"status": "scraping", "data": []}}]))
+    polls = []
+    done = []
+
+    with WatcherHub(DummyClient(), poll_interval=0.01, transport=_poll_transport(polls)) as hub:
+        watch = hub.watch("dropped", "batch")
+        watch.add_event_listener("done", done.append)
+        assert watch.wait(timeout=5)
+
+    assert watch.status == "completed" and watch.transport == "http"
+    assert polls == ["dropped"]
+    assert done[0]["data"] == [{"markdown": "# dropped"}]
+
+
+def test_connection_limit_and_idle_timeout(monkeypatch):
+    _patch_connect(monkeypatch, lambda job_id: FakeWebSocket([], hang=True))
+    polls = []
+
+    with WatcherHub(
+        DummyClient(), poll_interval=0.01, max_connections=2, idle_timeout=0.2, transport=_poll_transport(polls)
+    ) as hub:
+        watches = [hub.watch(f"job-{i}") for i in range(5)]
+        # Jobs past the connection limit go straight to the poller
+        assert watches[4].wait(timeout=5)
+        assert hub.stats()["websockets"] == 2
+        # Idle sockets are closed and their jobs polled as well
+        assert hub.wait(timeout=5)
+        assert hub.stats() == {"jobs": 0, "websockets": 0, "polled": 0}
+
+    assert sorted(polls) == [f"job-{i}" for i in range(5)]
+
+
+def test_timeout_and_unwatch(monkeypatch):
+    _patch_connect(monkeypatch, lambda job_id: FakeWebSocket([], hang=True))
+    errors = []
+
+    with WatcherHub(DummyClient(), idle_timeout=10) as hub:
+        timed_out = hub.watch("slow", timeout=0.1)
+        timed_out.add_event_listener("error", errors.append)
+        dropped = hub.watch("dropped")
+        assert timed_out.wait(timeout=5)
+        assert hub.unwatch("dropped")
+        assert not hub.unwatch("dropped")
+        assert hub.pending() == []
+        with pytest.raises(ValueError):
+            hub.watch("x", "extract")
+
+    assert errors[0]["id"] == "slow" and "timed out" in errors[0]["error"]
+    assert not dropped.done()
+
+
+def test_polled_jobs_stream_progress_and_cancellation(monkeypatch):
+    _patch_connect(monkeypatch, lambda job_id: FakeWebSocket([]))
+    polls = {}
+
+    def handler(request):
+        job_id = request.url.path.rsplit("/", 1)[1]
+        count = polls[job_id] = polls.get(job_id, 0) + 1
+        skip = int(request.url.params.get("skip", 0))
+        final = "cancelled" if job_id == "stopped" else "completed"
+        docs = [{"markdown": f"# {i}"} for i in range(min(count, 3))][skip:]
+        return httpx.Response(200, json={
+            "success": True,
+            "status": final if count >= 3 else "scraping",
+            "completed": min(count, 3),
+            "total": 3,
+            "next": None,
+            "data": docs,
+        })
+
+    snapshots = {"running": [], "stopped": []}
+    documents = []
+    done = []
+
+    with WatcherHub(DummyClient(), poll_interval=0.01, transport=httpx.MockTransport(handler)) as hub:
+        for job_id in snapshots:
+            kind = "batch" if job_id == "stopped" else "crawl"
+            watch = hub.watch(job_id, kind, listener=lambda status, job_id=job_id: snapshots[job_id].append(status.status))
+            watch.add_event_listener("document", lambda detail: documents.append(detail["data"]["markdown"]))
+            watch.add_event_listener("done", done.append)
+        assert hub.wait(timeout=5)
+
+    # Every poll is reported, not just the final status
+    assert snapshots["running"] == ["scraping", "scraping", "completed"]
+    assert snapshots["stopped"] == ["scraping", "scraping", "cancelled"]
+    assert sorted(documents) == sorted(["# 0", "# 1", "# 2"] * 2)
+    assert sorted(detail["status"] for detail in done) == ["cancelled", "completed"]
+
+
+def test_poller_shares_the_client_http_configuration(monkeypatch):
+    from firecrawl.v2.client import FirecrawlClient
+    from firecrawl.v2.utils.circuit_breaker import CircuitBreaker
+    from firecrawl.v2.utils.retry import RetryPolicy
+
+    _patch_connect(monkeypatch, lambda job_id: FakeWebSocket([]))
+    attempts = []
+
+    def handler(request):
+        attempts.append(request.url.path)
+        if len(attempts) == 1:
+            return httpx.Response(503, json={"success": False, "error": "busy"})
+        return httpx.Response(200, json={"success": True, "status": "completed", "completed": 0, "total": 0, "data": []})
+
+    breaker = CircuitBreaker()
+    client = FirecrawlClient(
+        api_key="key",
+        api_url="http://localhost",
+        retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0),
+        circuit_breaker=breaker,
+    )
+    with WatcherHub(client, poll_interval=0.01, transport=httpx.MockTransport(handler)) as hub:
+        assert hub.watch("job").wait(timeout=5)
+        assert hub._http.retry_policy is client.http_client.retry_policy
+        assert hub._http.circuit_breaker is breaker
+
+    # The 503 was retried by the client's policy and counted in its metrics
+    assert len(attempts) == 2
+    assert client.metrics.get("retries") == 1
+    client.close()
@@ -59,12 +59,14 @@ class V2Proxy:
             self.search = client_instance.search
             self.crawl = client_instance.crawl
             self.get_crawl_status = client_instance.get_crawl_status
+            self.iter_crawl_documents = client_instance.iter_crawl_documents
             self.cancel_crawl = client_instance.cancel_crawl
             self.start_crawl = client_instance.start_crawl
             self.crawl_params_preview = client_instance.crawl_params_preview
             self.extract = client_instance.extract
             self.start_batch_scrape = client_instance.start_batch_scrape
             self.get_batch_scrape_status = client_instance.get_batch_scrape_status
+            self.iter_batch_documents = client_instance.iter_batch_documents
             self.cancel_batch_scrape = client_instance.cancel_batch_scrape
             self.batch_scrape = client_instance.batch_scrape
             self.get_batch_scrape_errors = client_instance.get_batch_scrape_errors
@@ -111,6 +113,7 @@ class AsyncV2Proxy:
             self.start_crawl = client_instance.start_crawl
             self.wait_crawl = client_instance.wait_crawl
             self.get_crawl_status = client_instance.get_crawl_status
+            self.iter_crawl_documents = client_instance.iter_crawl_documents
             self.cancel_crawl = client_instance.cancel_crawl
             self.get_crawl_errors = client_instance.get_crawl_errors
             self.get_active_crawls = client_instance.get_active_crawls
@@ -123,6 +126,7 @@ class AsyncV2Proxy:
 
             self.start_batch_scrape = client_instance.start_batch_scrape
             self.get_batch_scrape_status = client_instance.get_batch_scrape_status
+            self.iter_batch_documents = client_instance.iter_batch_documents
             self.cancel_batch_scrape = client_instance.cancel_batch_scrape
             self.wait_batch_scrape = client_instance.wait_batch_scrape
             self.batch_scrape = client_instance.batch_scrape
@@ -175,6 +179,7 @@ class Firecrawl:
         self.start_crawl = self._v2_client.start_crawl
         self.crawl_params_preview = self._v2_client.crawl_params_preview
         self.get_crawl_status = self._v2_client.get_crawl_status
+        self.iter_crawl_documents = self._v2_client.iter_crawl_documents
         self.cancel_crawl = self._v2_client.cancel_crawl
         self.get_crawl_errors = self._v2_client.get_crawl_errors
         self.get_active_crawls = self._v2_client.get_active_crawls
@@ -182,6 +187,7 @@ class Firecrawl:
 
         self.start_batch_scrape = self._v2_client.start_batch_scrape
         self.get_batch_scrape_status = self._v2_client.get_batch_scrape_status
+        self.iter_batch_documents = self._v2_client.iter_batch_documents
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
@@ -195,6 +201,22 @@ class Firecrawl:
         self.get_token_usage = self._v2_client.get_token_usage
 
         self.watcher = self._v2_client.watcher
+        self.watcher_hub = self._v2_client.watcher_hub
+        self.monitor = self._v2_client.monitor
+        self.job_future = self._v2_client.job_future
+        self.submit_crawl = self._v2_client.submit_crawl
+        self.submit_batch_scrape = self._v2_client.submit_batch_scrape
+        self.submit_extract = self._v2_client.submit_extract
+
+    def close(self) -> None:
+        """Release pooled HTTP connections held by the v2 client."""
+        self._v2_client.close()
+
+    def __enter__(self) -> "Firecrawl":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
         
 class AsyncFirecrawl:
     """Async unified Firecrawl client (v2 by default, v1 under ``.v1``)."""
@@ -219,6 +241,7 @@ class AsyncFirecrawl:
 
         self.start_crawl = self._v2_client.start_crawl
         self.get_crawl_status = self._v2_client.get_crawl_status
+        self.iter_crawl_documents = self._v2_client.iter_crawl_documents
         self.cancel_crawl = self._v2_client.cancel_crawl
         self.crawl = self._v2_client.crawl
         self.get_crawl_errors = self._v2_client.get_crawl_errors
@@ -227,6 +250,7 @@ class AsyncFirecrawl:
 
         self.start_batch_scrape = self._v2_client.start_batch_scrape
         self.get_batch_scrape_status = self._v2_client.get_batch_scrape_status
+        self.iter_batch_documents = self._v2_client.iter_batch_documents
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
@@ -240,6 +264,23 @@ class AsyncFirecrawl:
         self.get_token_usage = self._v2_client.get_token_usage
 
         self.watcher = self._v2_client.watcher
+        self.monitor = self._v2_client.monitor
+        self.job_future = self._v2_client.job_future
+        self.submit_crawl = self._v2_client.submit_crawl
+        self.submit_batch_scrape = self._v2_client.submit_batch_scrape
+        self.submit_extract = self._v2_client.submit_extract
+
+    async def close(self) -> None:
+        """Release pooled HTTP connections held by the v1 and v2 clients."""
+        if self._v1_client:
+            await self._v1_client.close()
+        await self._v2_client.close()
+
+    async def __aenter__(self) -> "AsyncFirecrawl":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
 
 # Export Firecrawl as an alias for FirecrawlApp
 FirecrawlApp = Firecrawl
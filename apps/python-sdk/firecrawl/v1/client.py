@@ -24,6 +24,8 @@ import websockets
 import aiohttp
 import asyncio
 
+from ..v2.utils.polling import FixedPolling, PollingStrategy
+
 logger : logging.Logger = logging.getLogger("firecrawl")
 
 def get_version():
@@ -458,16 +460,22 @@ class V1FirecrawlApp:
     This is used by the unified client to provide version-specific access
     through app.v1.method_name() patterns.
     """
-    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None) -> None:
+    def __init__(
+            self,
+            api_key: Optional[str] = None,
+            api_url: Optional[str] = None,
+            polling: Optional[PollingStrategy] = None) -> None:
         """
         Initialize the V1FirecrawlApp instance with API key, API URL.
 
         Args:
             api_key (Optional[str]): API key for authenticating with the Firecrawl API.
             api_url (Optional[str]): Base URL for the Firecrawl API.
+            polling (Optional[PollingStrategy]): Pacing of crawl status polls (default: fixed poll_interval).
         """
         self.api_key = api_key or os.getenv('FIRECRAWL_API_KEY')
         self.api_url = api_url or os.getenv('FIRECRAWL_API_URL', 'https://api.firecrawl.dev')
+        self.polling = polling
         
         # Only require API key when using cloud service
         if 'api.firecrawl.dev' in self.api_url and self.api_key is None:
@@ -2306,6 +2314,7 @@ class V1FirecrawlApp:
         Raises:
             Exception: If the job fails or an error occurs during status checks.
         """
+        schedule = (self.polling or FixedPolling()).schedule(max(poll_interval, 2))
         while True:
             api_url = f'{self.api_url}/v1/crawl/{id}'
 
@@ -2328,12 +2337,13 @@ class V1FirecrawlApp:
                                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
                             data.extend(status_data.get('data', []))
                         status_data['data'] = data
+                        schedule.record(job=id)
                         return V1CrawlStatusResponse(**status_data)
                     else:
                         raise Exception('Crawl job completed but no data was returned')
                 elif status_data['status'] in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
-                    poll_interval=max(poll_interval,2)
-                    time.sleep(poll_interval)  # Wait for the specified interval before checking again
+                    # Wait for the next poll as paced by the polling strategy
+                    time.sleep(schedule.next_delay(status_data.get('completed'), status_data.get('total')))
                 else:
                     raise Exception(f'Crawl job failed or was stopped. Status: {status_data["status"]}')
             else:
@@ -2777,9 +2787,85 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
     Provides non-blocking alternatives to all V1FirecrawlApp operations.
     """
 
-    def __init__(self, api_key: str, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+            self,
+            api_key: str,
+            api_url: str = "https://api.firecrawl.dev",
+            *,
+            connector_limit: int = 100,
+            connector_limit_per_host: int = 0,
+            dns_cache_ttl: Optional[int] = 300,
+            keepalive_timeout: float = 30.0,
+            polling: Optional[PollingStrategy] = None):
+        """
+        Initialize the AsyncV1FirecrawlApp instance.
+
+        A single aiohttp ClientSession is shared by every request made through this
+        instance, so warm connections are reused by job status polls and pagination.
+        Call close() (or use ``async with``) to release it.
+
+        Args:
+            api_key (str): API key for authenticating with the Firecrawl API.
+            api_url (str): Base URL for the Firecrawl API.
+            connector_limit (int): Total number of simultaneous connections (0 for no limit).
+            connector_limit_per_host (int): Simultaneous connections per host (0 for no limit).
+            dns_cache_ttl (Optional[int]): Seconds to cache DNS lookups (None caches forever).
+            keepalive_timeout (float): Seconds an idle connection is kept open for reuse.
+            polling (Optional[PollingStrategy]): Pacing of crawl status polls (default: fixed poll_interval).
+        """
         # Reuse V1 helpers (_prepare_headers, _validate_kwargs, _ensure_schema_dict, _get_error_message)
-        super().__init__(api_key=api_key, api_url=api_url)
+        super().__init__(api_key=api_key, api_url=api_url, polling=polling)
+        self._connector_limit = connector_limit
+        self._connector_limit_per_host = connector_limit_per_host
+        self._dns_cache_ttl = dns_cache_ttl
+        self._keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared ClientSession, creating it on first use.
+
+        aiohttp sessions are bound to the event loop that created them, so a new
+        session is opened if the current loop differs from the previous one. The
+        previous session is closed on its loop if that loop is still running in
+        another thread; otherwise it is dropped and the leak logged at debug level.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            if self._session is not None and not self._session.closed:
+                self._retire_session(self._session, self._session_loop)
+            connector = aiohttp.TCPConnector(
+                limit=self._connector_limit,
+                limit_per_host=self._connector_limit_per_host,
+                ttl_dns_cache=self._dns_cache_ttl,
+                use_dns_cache=True,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+        return self._session
+
+    @staticmethod
+    def _retire_session(session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Close a session replaced by one for a new loop, on the loop that owns its connections."""
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        logger.debug("Dropping an aiohttp session whose event loop has stopped; its connections are not closed")
+
+    async def close(self) -> None:
+        """Close the shared ClientSession and its pooled connections."""
+        session, self._session = self._session, None
+        self._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def __aenter__(self) -> "AsyncV1FirecrawlApp":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
 
     async def _async_request(
             self,
@@ -2808,23 +2894,23 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
             aiohttp.ClientError: If the request fails after all retries.
             Exception: If max retries are exceeded or other errors occur.
         """
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(retries):
-                try:
-                    async with session.request(
-                        method=method, url=url, headers=headers, json=data
-                    ) as response:
-                        if response.status == 502:
-                            await asyncio.sleep(backoff_factor * (2 ** attempt))
-                            continue
-                        if response.status >= 300:
-                            await self._handle_error(response, f"make {method} request")
-                        return await response.json()
-                except aiohttp.ClientError as e:
-                    if attempt == retries - 1:
-                        raise e
-                    await asyncio.sleep(backoff_factor * (2 ** attempt))
-            raise Exception("Max retries exceeded")
+        session = await self._get_session()
+        for attempt in range(retries):
+            try:
+                async with session.request(
+                    method=method, url=url, headers=headers, json=data
+                ) as response:
+                    if response.status == 502:
+                        await asyncio.sleep(backoff_factor * (2 ** attempt))
+                        continue
+                    if response.status >= 300:
+                        await self._handle_error(response, f"make {method} request")
+                    return await response.json()
+            except aiohttp.ClientError as e:
+                if attempt == retries - 1:
+                    raise e
+                await asyncio.sleep(backoff_factor * (2 ** attempt))
+        raise Exception("Max retries exceeded")
 
     async def _async_post_request(
             self, url: str, data: Dict[str, Any], headers: Dict[str, str],
@@ -3730,6 +3816,7 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
         Raises:
             Exception: If the job fails or an error occurs during status checks
         """
+        schedule = (self.polling or FixedPolling()).schedule(max(poll_interval, 2))
         while True:
             status_data = await self._async_get_request(
                 f'{self.api_url}/v1/crawl/{id}',
@@ -3750,11 +3837,12 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
                         data.extend(next_data.get('data', []))
                         status_data = next_data
                     status_data['data'] = data
+                    schedule.record(job=id)
                     return V1CrawlStatusResponse(**status_data)
                 else:
                     raise Exception('Job completed but no data was returned')
             elif status_data.get('status') in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
-                await asyncio.sleep(max(poll_interval, 2))
+                await asyncio.sleep(schedule.next_delay(status_data.get('completed'), status_data.get('total')))
             else:
                 raise Exception(f'Job failed or was stopped. Status: {status_data["status"]}')
 
@@ -4055,9 +4143,9 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
             Exception: If cancellation fails
         """
         headers = self._prepare_headers()
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(f'{self.api_url}/v1/crawl/{id}', headers=headers) as response:
-                return await response.json()
+        session = await self._get_session()
+        async with session.delete(f'{self.api_url}/v1/crawl/{id}', headers=headers) as response:
+            return await response.json()
 
     async def get_extract_status(self, job_id: str) -> V1ExtractResponse[Any]:
         """
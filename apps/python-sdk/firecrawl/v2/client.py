@@ -5,7 +5,9 @@ This module provides the main client class that orchestrates all v2 functionalit
 """
 
 import os
-from typing import Optional, List, Dict, Any, Callable, Union, Literal
+import threading
+from typing import Optional, List, Dict, Any, Callable, Iterator, Union, Literal
+from requests.adapters import BaseAdapter
 from .types import (
     ClientConfig,
     ScrapeOptions,
@@ -37,9 +39,18 @@ from .types import (
     PDFAction,
     Location,
     PaginationConfig,
+    WarmupReport,
 )
 from .utils.http_client import HttpClient
 from .utils.error_handler import FirecrawlError
+from .utils.metrics import ClientMetrics
+from .utils.rate_limit import RateLimiter
+from .utils.concurrency import ConcurrencyController
+from .utils.retry import RetryPolicy
+from .utils.hedging import HedgePolicy
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.checkpoint import CheckpointStore
+from .utils.polling import PollingStrategy
 from .methods import scrape as scrape_module
 from .methods import crawl as crawl_module  
 from .methods import batch as batch_module
@@ -49,6 +60,9 @@ from .methods import batch as batch_methods
 from .methods import usage as usage_methods
 from .methods import extract as extract_module
 from .watcher import Watcher
+from .watcher_hub import WatcherHub
+from .monitor import JobMonitor, MonitorKind
+from .futures import JobFuture
 
 class FirecrawlClient:
     """
@@ -63,7 +77,18 @@ class FirecrawlClient:
         api_url: str = "https://api.firecrawl.dev",
         timeout: Optional[float] = None,
         max_retries: int = 3,
-        backoff_factor: float = 0.5
+        backoff_factor: float = 0.5,
+        pool_connections: int = 10,
+        max_connections_per_host: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        request_compression_threshold: Optional[int] = None,
+        transport: Optional[Union[str, BaseAdapter]] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        polling: Optional[PollingStrategy] = None,
     ):
         """
         Initialize the Firecrawl client.
@@ -74,6 +99,19 @@ class FirecrawlClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             backoff_factor: Exponential backoff factor for retries (e.g. 0.5 means wait 0.5s, then 1s, then 2s between retries)
+            pool_connections: Number of per-host connection pools to cache
+            max_connections_per_host: Maximum number of pooled connections per host
+            pool_block: Block when the connection pool is exhausted instead of opening extra connections
+            keep_alive: Reuse connections between requests
+            retry_policy: Custom retry policy (overrides max_retries/backoff_factor)
+            rate_limiter: Client-side per-endpoint rate limiter (e.g. ``RateLimiter.per_minute({"scrape": 100})``)
+            request_compression_threshold: Gzip request bodies of at least this many bytes (e.g. large batch scrapes)
+            transport: ``unix:///path/to.sock`` for a colocated self-hosted API, or a
+                ``requests`` adapter for ``api_url``
+            hedge_policy: Hedge slow ``scrape()`` calls with a duplicate request (see ``HedgePolicy``)
+            circuit_breaker: Per-endpoint-family breaker that fails fast with ``CircuitOpenError`` while open
+            polling: Strategy pacing the status polls of ``crawl``/``batch_scrape``/``extract``
+                (e.g. ``AdaptivePolling()``; default: fixed ``poll_interval``)
         """
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
@@ -92,7 +130,61 @@ class FirecrawlClient:
             backoff_factor=backoff_factor
         )
         
-        self.http_client = HttpClient(api_key, api_url)
+        self.http_client = HttpClient(
+            api_key,
+            api_url,
+            pool_connections=pool_connections,
+            max_connections_per_host=max_connections_per_host,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            retry_policy=retry_policy or RetryPolicy(max_attempts=max_retries, backoff_factor=backoff_factor),
+            rate_limiter=rate_limiter,
+            request_compression_threshold=request_compression_threshold,
+            transport=transport,
+            circuit_breaker=circuit_breaker,
+        )
+        self.hedge_policy = hedge_policy
+        self.polling = polling
+        self._job_monitor: Optional[JobMonitor] = None
+        self._job_monitor_lock = threading.Lock()
+
+    @property
+    def metrics(self) -> ClientMetrics:
+        """Request and retry counters recorded by this client."""
+        return self.http_client.metrics
+
+    def close(self) -> None:
+        """Close pooled HTTP connections held by this client."""
+        with self._job_monitor_lock:
+            monitor, self._job_monitor = self._job_monitor, None
+        if monitor is not None:
+            # The next job_future/submit_* starts a fresh monitor, as the HTTP pool reopens lazily
+            monitor.close()
+        self.http_client.close()
+
+    def __enter__(self) -> "FirecrawlClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def warmup(self, n_connections: int = 1, *, timeout: Optional[float] = 10.0) -> WarmupReport:
+        """
+        Prepare a freshly started worker for its first request.
+
+        Triggers deferred imports and model builds, pre-resolves the API host
+        and opens ``n_connections`` pooled connections (capped at
+        ``max_connections_per_host``). The returned report times each step,
+        e.g. for a readiness probe.
+
+        Args:
+            n_connections: Connections to open and keep in the pool
+            timeout: Connect timeout per connection
+
+        Returns:
+            WarmupReport with per-step durations in seconds
+        """
+        return self.http_client.warmup(n_connections, timeout=timeout)
     
     def scrape(
         self,
@@ -167,6 +259,8 @@ class FirecrawlClient:
                 store_in_cache=store_in_cache,
             ).items() if v is not None}
         ) if any(v is not None for v in [formats, headers, include_tags, exclude_tags, only_main_content, timeout, wait_for, mobile, parsers, actions, location, skip_tls_verification, remove_base64_images, fast_mode, use_mock, block_ads, proxy, max_age, store_in_cache]) else None
+        if self.hedge_policy is not None:
+            return scrape_module.hedged_scrape(self.http_client, url, options, policy=self.hedge_policy)
         return scrape_module.scrape(self.http_client, url, options)
 
     def search(
@@ -230,7 +324,9 @@ class FirecrawlClient:
         scrape_options: Optional[ScrapeOptions] = None,
         zero_data_retention: bool = False,
         poll_interval: int = 2,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        cancel_on_timeout: bool = False,
+        partial_on_timeout: bool = False
     ) -> CrawlJob:
         """
         Start a crawl job and wait for it to complete.
@@ -254,6 +350,8 @@ class FirecrawlClient:
             zero_data_retention: Whether to delete data after 24 hours
             poll_interval: Seconds between status checks
             timeout: Maximum seconds to wait (None for no timeout)
+            cancel_on_timeout: Cancel the crawl server-side (best effort) if timeout is reached
+            partial_on_timeout: Return the documents scraped by timeout (``is_partial``) instead of raising
             
         Returns:
             CrawlJob when job completes
@@ -286,7 +384,10 @@ class FirecrawlClient:
             self.http_client, 
             request, 
             poll_interval=poll_interval, 
-            timeout=timeout
+            timeout=timeout,
+            polling=self.polling,
+            cancel_on_timeout=cancel_on_timeout,
+            partial_on_timeout=partial_on_timeout
         )
     
     def start_crawl(
@@ -381,6 +482,32 @@ class FirecrawlClient:
             job_id,
             pagination_config=pagination_config
         )
+
+    def iter_crawl_documents(
+        self,
+        job_id: str,
+        pagination_config: Optional[PaginationConfig] = None,
+        *,
+        checkpoint: Optional[CheckpointStore] = None
+    ) -> Iterator[Document]:
+        """
+        Lazily iterate over a crawl job's documents with constant memory.
+        
+        Unlike ``get_crawl_status``, pages are fetched as the iterator advances
+        and earlier pages are not retained.
+        
+        Args:
+            job_id: ID of the crawl job
+            pagination_config: Optional pagination limits (``max_pages``, ``max_results``, ``max_wait_time``)
+            checkpoint: Optional store (e.g. ``FileCheckpointStore``) recording the cursor
+                after each consumed page so a restarted download resumes there
+            
+        Returns:
+            Iterator yielding one Document at a time
+        """
+        return crawl_module.iter_crawl_documents(
+            self.http_client, job_id, pagination_config, checkpoint=checkpoint
+        )
     
     def get_crawl_errors(self, crawl_id: str) -> CrawlErrorsResponse:
         """
@@ -558,6 +685,7 @@ class FirecrawlClient:
             ignore_invalid_urls=ignore_invalid_urls,
             poll_interval=poll_interval,
             timeout=timeout,
+            polling=self.polling,
         )
 
     def start_batch_scrape(
@@ -682,6 +810,28 @@ class FirecrawlClient:
             pagination_config=pagination_config
         )
 
+    def iter_batch_documents(
+        self,
+        job_id: str,
+        pagination_config: Optional[PaginationConfig] = None,
+        *,
+        checkpoint: Optional[CheckpointStore] = None
+    ) -> Iterator[Document]:
+        """Lazily iterate over a batch job's documents with constant memory.
+
+        Args:
+            job_id: Batch job ID
+            pagination_config: Optional pagination limits (``max_pages``, ``max_results``, ``max_wait_time``)
+            checkpoint: Optional store recording the cursor after each consumed page
+                so a restarted download resumes there
+
+        Returns:
+            Iterator yielding one Document at a time; earlier pages are not retained
+        """
+        return batch_module.iter_batch_documents(
+            self.http_client, job_id, pagination_config, checkpoint=checkpoint
+        )
+
     def cancel_batch_scrape(self, job_id: str) -> bool:
         """Cancel a running batch scrape job.
 
@@ -719,6 +869,22 @@ class FirecrawlClient:
         """Get current concurrency and maximum allowed for this team/key (v2)."""
         return usage_methods.get_concurrency(self.http_client)
 
+    def concurrency_controller(self, **kwargs: Any) -> ConcurrencyController:
+        """
+        Create an adaptive concurrency controller for fanning out requests.
+
+        The limit is seeded from ``get_concurrency()`` and periodically re-synced
+        with it. Keyword arguments are passed to ``ConcurrencyController``.
+
+        Returns:
+            A controller for ``run_concurrently`` or ``controller.slot()``
+        """
+        kwargs.setdefault("refresh", self.get_concurrency)
+        kwargs.setdefault("metrics", self.metrics)
+        controller = ConcurrencyController(**kwargs)
+        controller.update_from_server(self.get_concurrency(), seed=True)
+        return controller
+
     def get_credit_usage(self):
         """Get remaining credits for this team/key (v2)."""
         return usage_methods.get_credit_usage(self.http_client)
@@ -748,6 +914,91 @@ class FirecrawlClient:
         """
         return Watcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout)
 
+    def watcher_hub(
+        self,
+        *,
+        poll_interval: float = 2,
+        max_connections: int = 256,
+        idle_timeout: float = 60.0,
+    ) -> WatcherHub:
+        """Create a hub that watches many crawl and batch jobs from one event loop thread.
+
+        Args:
+            poll_interval: Seconds between HTTP polls of jobs without a WebSocket
+            max_connections: WebSockets open at once; further jobs are polled
+            idle_timeout: Seconds without a message before a job falls back to polling
+
+        Returns:
+            WatcherHub instance
+        """
+        return WatcherHub(
+            self,
+            poll_interval=poll_interval,
+            max_connections=max_connections,
+            idle_timeout=idle_timeout,
+        )
+
+    def monitor(
+        self,
+        *,
+        poll_interval: float = 2,
+        polling: Optional[PollingStrategy] = None,
+        jitter: float = 0.1,
+        max_concurrency: int = 1,
+        request_timeout: Optional[float] = 30.0,
+    ) -> JobMonitor:
+        """Create a monitor that polls many crawl, batch and extract jobs from one thread.
+
+        Args:
+            poll_interval: Seconds between status checks of one job
+            polling: Strategy pacing each job's polls (defaults to the client's)
+            jitter: Fraction by which each delay is randomly stretched or shrunk
+            max_concurrency: Status checks in flight at once
+            request_timeout: Seconds one status check may take (None for no limit)
+
+        Returns:
+            JobMonitor sharing this client's connection pool
+        """
+        return JobMonitor(
+            self.http_client,
+            poll_interval=poll_interval,
+            polling=polling or self.polling,
+            jitter=jitter,
+            max_concurrency=max_concurrency,
+            request_timeout=request_timeout,
+        )
+
+    def job_future(self, job_id: str, kind: MonitorKind = "crawl", *, timeout: Optional[float] = None) -> JobFuture:
+        """Wrap a started job in a future resolved by the client's shared monitor.
+
+        Args:
+            job_id: ID returned by ``start_crawl``/``start_batch_scrape``/``start_extract``
+            kind: Job kind ("crawl", "batch" or "extract")
+            timeout: Seconds after which the future fails with ``DeadlineExceededError``
+
+        Returns:
+            JobFuture usable with ``concurrent.futures.wait``/``as_completed``
+        """
+        with self._job_monitor_lock:
+            if self._job_monitor is None:
+                self._job_monitor = self.monitor(max_concurrency=4)
+        return self._job_monitor.submit(job_id, kind, timeout=timeout)
+
+    def submit_crawl(self, url: str, **kwargs: Any) -> JobFuture:
+        """Start a crawl (same options as ``start_crawl``) and return a future of its final ``CrawlJob``."""
+        return self.job_future(self.start_crawl(url, **kwargs).id, "crawl")
+
+    def submit_batch_scrape(self, urls: List[str], **kwargs: Any) -> JobFuture:
+        """Start a batch scrape and return a future of its final ``BatchScrapeJob``.
+
+        Takes the same options as ``start_batch_scrape``.
+        """
+        return self.job_future(self.start_batch_scrape(urls, **kwargs).id, "batch")
+
+    def submit_extract(self, urls: Optional[List[str]] = None, **kwargs: Any) -> JobFuture:
+        """Start an extract (same options as ``start_extract``) and return a future of its final ``ExtractResponse``."""
+        return self.job_future(self.start_extract(urls, **kwargs).id, "extract")
+
     def batch_scrape(
         self,
         urls: List[str],
@@ -780,9 +1031,16 @@ class FirecrawlClient:
         idempotency_key: Optional[str] = None,
         poll_interval: int = 2,
         wait_timeout: Optional[int] = None,
+        cancel_on_timeout: bool = False,
+        partial_on_timeout: bool = False,
     ):
         """
         Start a batch scrape job and wait until completion.
+
+        With ``cancel_on_timeout=True`` the job is cancelled server-side (best
+        effort) if ``wait_timeout`` is reached; with ``partial_on_timeout=True``
+        the documents scraped by then are returned (``is_partial``) instead of
+        raising.
         """
         options = ScrapeOptions(
             **{k: v for k, v in dict(
@@ -821,5 +1079,8 @@ class FirecrawlClient:
             idempotency_key=idempotency_key,
             poll_interval=poll_interval,
             timeout=wait_timeout,
+            polling=self.polling,
+            cancel_on_timeout=cancel_on_timeout,
+            partial_on_timeout=partial_on_timeout,
         )
     
\ No newline at end of file
@@ -4,9 +4,11 @@ Async v2 client mirroring the regular client surface using true async HTTP trans
 
 import os
 import asyncio
-from typing import Optional, List, Dict, Any, Union, Callable, Literal
+import httpx
+from typing import Optional, List, Dict, Any, AsyncIterator, Union, Callable, Literal
 from .types import (
     ScrapeOptions,
+    Document,
     CrawlRequest,
     WebhookConfig,
     SearchRequest,
@@ -14,6 +16,7 @@ from .types import (
     SourceOption,
     CrawlResponse,
     CrawlJob,
+    BatchScrapeJob,
     CrawlParamsRequest,
     CrawlParamsData,
     CrawlErrorsResponse,
@@ -32,9 +35,21 @@ from .types import (
     PDFAction,
     Location,
     PaginationConfig,
+    WarmupReport,
 )
 from .utils.http_client import HttpClient
 from .utils.http_client_async import AsyncHttpClient
+from .utils.metrics import ClientMetrics
+from .utils.rate_limit import RateLimiter
+from .utils.concurrency import ConcurrencyController
+from .utils.retry import RetryPolicy
+from .utils.hedging import HedgePolicy
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.deadline import Deadline, DeadlineExceededError
+from .utils.pagination import DeltaCursor
+from .utils.checkpoint import CheckpointStore
+from .utils.polling import FixedPolling, PollingStrategy
+from .utils.cancellation import acancel_remote, start_timed_out
 
 from .methods.aio import scrape as async_scrape  # type: ignore[attr-defined]
 from .methods.aio import batch as async_batch  # type: ignore[attr-defined]
@@ -45,15 +60,109 @@ from .methods.aio import usage as async_usage # type: ignore[attr-defined]
 from .methods.aio import extract as async_extract  # type: ignore[attr-defined]
 
 from .watcher_async import AsyncWatcher
+from .monitor import AsyncJobMonitor, MonitorKind
+from .futures import AsyncJobFuture
+
+# Waiter options of crawl()/batch_scrape() that are not part of the job request
+_WAIT_OPTIONS = ("poll_interval", "timeout", "cancel_on_timeout", "partial_on_timeout")
+
 
 class AsyncFirecrawlClient:
-    def __init__(self, api_key: Optional[str] = None, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: str = "https://api.firecrawl.dev",
+        *,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        request_compression_threshold: Optional[int] = None,
+        transport: Optional[Union[str, httpx.AsyncBaseTransport]] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        polling: Optional[PollingStrategy] = None,
+    ):
+        """
+        Initialize the async Firecrawl client.
+
+        Args:
+            api_key: Firecrawl API key (or set FIRECRAWL_API_KEY env var)
+            api_url: Base URL for the Firecrawl API
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept before being closed
+            http2: Multiplex requests over HTTP/2 (requires ``httpx[http2]``)
+            retry_policy: Retry policy shared by the async and sync transports
+            rate_limiter: Client-side per-endpoint rate limiter shared by the async and sync transports
+            request_compression_threshold: Gzip request bodies of at least this many bytes (e.g. large batch scrapes)
+            transport: ``unix:///path/to.sock`` for a colocated self-hosted API (used by both transports),
+                or an ``httpx.AsyncBaseTransport`` for the async transport
+            hedge_policy: Hedge slow ``scrape()`` calls with a duplicate request; the loser is cancelled
+            circuit_breaker: Per-endpoint-family breaker shared by the async and sync transports
+            polling: Strategy pacing the status polls of ``crawl``/``batch_scrape``/``extract``
+                (e.g. ``AdaptivePolling()``; default: fixed ``poll_interval``)
+        """
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
         if not api_key:
             raise ValueError("API key is required. Set FIRECRAWL_API_KEY or pass api_key.")
-        self.http_client = HttpClient(api_key, api_url)
-        self.async_http_client = AsyncHttpClient(api_key, api_url)
+        retry_policy = retry_policy or RetryPolicy()
+        self.metrics = ClientMetrics()
+        self.http_client = HttpClient(
+            api_key,
+            api_url,
+            retry_policy=retry_policy,
+            metrics=self.metrics,
+            rate_limiter=rate_limiter,
+            request_compression_threshold=request_compression_threshold,
+            transport=transport if isinstance(transport, str) else None,
+            circuit_breaker=circuit_breaker,
+        )
+        self.async_http_client = AsyncHttpClient(
+            api_key,
+            api_url,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            retry_policy=retry_policy,
+            metrics=self.metrics,
+            rate_limiter=rate_limiter,
+            request_compression_threshold=request_compression_threshold,
+            transport=transport,
+            circuit_breaker=circuit_breaker,
+        )
+        self.hedge_policy = hedge_policy
+        self.polling = polling
+        self._job_monitor: Optional[AsyncJobMonitor] = None
+
+    async def close(self) -> None:
+        """Close pooled connections held by this client."""
+        monitor, self._job_monitor = self._job_monitor, None
+        if monitor is not None:
+            await monitor.close()
+        await self.async_http_client.close()
+        self.http_client.close()
+
+    async def __aenter__(self) -> "AsyncFirecrawlClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def warmup(self, n_connections: int = 1, *, timeout: Optional[float] = 10.0) -> WarmupReport:
+        """
+        Prepare a freshly started worker for its first request.
+
+        Triggers deferred imports and model builds, pre-resolves the API host
+        and opens up to ``n_connections`` keep-alive connections on the async
+        transport (see ``AsyncHttpClient.warmup``). Connections belong to the
+        running event loop, so call this from the loop that will send requests.
+        """
+        return await self.async_http_client.warmup(n_connections, timeout=timeout)
 
     # Scrape
     async def scrape(
@@ -62,6 +171,8 @@ class AsyncFirecrawlClient:
         **kwargs,
     ):
         options = ScrapeOptions(**{k: v for k, v in kwargs.items() if v is not None}) if kwargs else None
+        if self.hedge_policy is not None:
+            return await async_scrape.hedged_scrape(self.async_http_client, url, options, policy=self.hedge_policy)
         return await async_scrape.scrape(self.async_http_client, url, options)
 
     # Search
@@ -77,23 +188,73 @@ class AsyncFirecrawlClient:
         request = CrawlRequest(url=url, **kwargs)
         return await async_crawl.start_crawl(self.async_http_client, request)
 
-    async def wait_crawl(self, job_id: str, poll_interval: int = 2, timeout: Optional[int] = None) -> CrawlJob:
-        # simple polling loop using blocking get (ok for test-level async)
-        start = asyncio.get_event_loop().time()
-        while True:
-            status = await async_crawl.get_crawl_status(self.async_http_client, job_id)
-            if status.status in ["completed", "failed"]:
-                return status
-            if timeout and (asyncio.get_event_loop().time() - start) > timeout:
-                raise TimeoutError("Crawl wait timed out")
-            await asyncio.sleep(poll_interval)
+    async def wait_crawl(
+        self,
+        job_id: str,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        *,
+        deadline: Optional[Deadline] = None,
+        polling: Optional[PollingStrategy] = None,
+        cancel_on_timeout: bool = False,
+        partial_on_timeout: bool = False,
+        cursor: Optional[DeltaCursor] = None,
+    ) -> CrawlJob:
+        # Status and page requests share the deadline; a zero timeout means no timeout
+        if deadline is None:
+            deadline = Deadline(timeout or None)
+        # Polls fetch only documents finished since the previous poll
+        if cursor is None:
+            cursor = DeltaCursor()
+        schedule = (polling or self.polling or FixedPolling()).schedule(poll_interval)
+        last: Optional[CrawlJob] = None
+        try:
+            while True:
+                status = last = await async_crawl.get_crawl_status(
+                    self.async_http_client, job_id, deadline=deadline, cursor=cursor
+                )
+                if status.status in ["completed", "failed"]:
+                    schedule.record(self.metrics, job_id)
+                    return status
+                delay = schedule.next_delay(getattr(status, "completed", None), getattr(status, "total", None))
+                if not deadline.expired():
+                    await asyncio.sleep(deadline.clip(delay))
+                if deadline.expired():
+                    raise DeadlineExceededError("Crawl wait timed out")
+        except DeadlineExceededError as exc:
+            # Opt-in: stop the server-side crawl too, on timeout or task cancellation
+            if cancel_on_timeout:
+                exc.remote_cancelled = await acancel_remote(async_crawl.cancel_crawl, self.async_http_client, job_id)
+            # Opt-in: hand back what was scraped so far
+            if partial_on_timeout and last is not None:
+                return cursor.partial(last, self.async_http_client, f"/v2/crawl/{job_id}")
+            raise
+        except asyncio.CancelledError:
+            if cancel_on_timeout:
+                await acancel_remote(async_crawl.cancel_crawl, self.async_http_client, job_id, reason="cancellation")
+            raise
 
     async def crawl(self, **kwargs) -> CrawlJob:
-        # wrapper combining start and wait
-        resp = await self.start_crawl(**{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout")})
+        # wrapper combining start and wait under one deadline
+        deadline = Deadline(kwargs.get("timeout") or None)
+        request = CrawlRequest(
+            **{k: v for k, v in kwargs.items() if k not in _WAIT_OPTIONS}
+        )
+        try:
+            resp = await async_crawl.start_crawl(self.async_http_client, request, deadline=deadline)
+        except DeadlineExceededError as exc:
+            if kwargs.get("cancel_on_timeout"):
+                # The crawl may exist, but without its ID it cannot be cancelled
+                exc.remote_cancelled = start_timed_out(self.async_http_client, "crawl")
+            raise
         poll_interval = kwargs.get("poll_interval", 2)
-        timeout = kwargs.get("timeout")
-        return await self.wait_crawl(resp.id, poll_interval=poll_interval, timeout=timeout)
+        return await self.wait_crawl(
+            resp.id,
+            poll_interval=poll_interval,
+            deadline=deadline,
+            cancel_on_timeout=kwargs.get("cancel_on_timeout", False),
+            partial_on_timeout=kwargs.get("partial_on_timeout", False),
+        )
 
     async def get_crawl_status(
         self, 
@@ -106,6 +267,18 @@ class AsyncFirecrawlClient:
             pagination_config=pagination_config
         )
 
+    def iter_crawl_documents(
+        self,
+        job_id: str,
+        pagination_config: Optional[PaginationConfig] = None,
+        *,
+        checkpoint: Optional[CheckpointStore] = None
+    ) -> AsyncIterator[Document]:
+        """Lazily iterate (``async for``) over a crawl job's documents with constant memory."""
+        return async_crawl.iter_crawl_documents(
+            self.async_http_client, job_id, pagination_config, checkpoint=checkpoint
+        )
+
     async def cancel_crawl(self, job_id: str) -> bool:
         return await async_crawl.cancel_crawl(self.async_http_client, job_id)
 
@@ -145,23 +318,76 @@ class AsyncFirecrawlClient:
     async def start_batch_scrape(self, urls: List[str], **kwargs) -> Any:
         return await async_batch.start_batch_scrape(self.async_http_client, urls, **kwargs)
 
-    async def wait_batch_scrape(self, job_id: str, poll_interval: int = 2, timeout: Optional[int] = None) -> Any:
-        start = asyncio.get_event_loop().time()
-        while True:
-            status = await async_batch.get_batch_scrape_status(self.async_http_client, job_id)
-            if status.status in ["completed", "failed", "cancelled"]:
-                return status
-            if timeout and (asyncio.get_event_loop().time() - start) > timeout:
-                raise TimeoutError("Batch wait timed out")
-            await asyncio.sleep(poll_interval)
+    async def wait_batch_scrape(
+        self,
+        job_id: str,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        *,
+        deadline: Optional[Deadline] = None,
+        polling: Optional[PollingStrategy] = None,
+        cancel_on_timeout: bool = False,
+        partial_on_timeout: bool = False,
+        cursor: Optional[DeltaCursor] = None,
+    ) -> Any:
+        if deadline is None:
+            deadline = Deadline(timeout or None)
+        if cursor is None:
+            cursor = DeltaCursor()
+        schedule = (polling or self.polling or FixedPolling()).schedule(poll_interval)
+        last: Optional[BatchScrapeJob] = None
+        try:
+            while True:
+                status = last = await async_batch.get_batch_scrape_status(
+                    self.async_http_client, job_id, deadline=deadline, cursor=cursor
+                )
+                if status.status in ["completed", "failed", "cancelled"]:
+                    schedule.record(self.metrics, job_id)
+                    return status
+                delay = schedule.next_delay(getattr(status, "completed", None), getattr(status, "total", None))
+                if not deadline.expired():
+                    await asyncio.sleep(deadline.clip(delay))
+                if deadline.expired():
+                    raise DeadlineExceededError("Batch wait timed out")
+        except DeadlineExceededError as exc:
+            if cancel_on_timeout:
+                exc.remote_cancelled = await acancel_remote(
+                    async_batch.cancel_batch_scrape, self.async_http_client, job_id
+                )
+            if partial_on_timeout and last is not None:
+                return cursor.partial(last, self.async_http_client, f"/v2/batch/scrape/{job_id}")
+            raise
+        except asyncio.CancelledError:
+            if cancel_on_timeout:
+                await acancel_remote(
+                    async_batch.cancel_batch_scrape, self.async_http_client, job_id, reason="cancellation"
+                )
+            raise
 
     async def batch_scrape(self, urls: List[str], **kwargs) -> Any:
-        # waiter wrapper
-        start = await self.start_batch_scrape(urls, **{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout")})
+        # waiter wrapper; start and wait share one deadline
+        deadline = Deadline(kwargs.get("timeout") or None)
+        try:
+            start = await async_batch.start_batch_scrape(
+                self.async_http_client,
+                urls,
+                deadline=deadline,
+                **{k: v for k, v in kwargs.items() if k not in _WAIT_OPTIONS},
+            )
+        except DeadlineExceededError as exc:
+            if kwargs.get("cancel_on_timeout"):
+                # The job may exist, but without its ID it cannot be cancelled
+                exc.remote_cancelled = start_timed_out(self.async_http_client, "batch scrape")
+            raise
         job_id = start.id
         poll_interval = kwargs.get("poll_interval", 2)
-        timeout = kwargs.get("timeout")
-        return await self.wait_batch_scrape(job_id, poll_interval=poll_interval, timeout=timeout)
+        return await self.wait_batch_scrape(
+            job_id,
+            poll_interval=poll_interval,
+            deadline=deadline,
+            cancel_on_timeout=kwargs.get("cancel_on_timeout", False),
+            partial_on_timeout=kwargs.get("partial_on_timeout", False),
+        )
 
     async def get_batch_scrape_status(
         self, 
@@ -174,6 +400,18 @@ class AsyncFirecrawlClient:
             pagination_config=pagination_config
         )
 
+    def iter_batch_documents(
+        self,
+        job_id: str,
+        pagination_config: Optional[PaginationConfig] = None,
+        *,
+        checkpoint: Optional[CheckpointStore] = None
+    ) -> AsyncIterator[Document]:
+        """Lazily iterate (``async for``) over a batch job's documents with constant memory."""
+        return async_batch.iter_batch_documents(
+            self.async_http_client, job_id, pagination_config, checkpoint=checkpoint
+        )
+
     async def cancel_batch_scrape(self, job_id: str) -> bool:
         return await async_batch.cancel_batch_scrape(self.async_http_client, job_id)
 
@@ -210,6 +448,7 @@ class AsyncFirecrawlClient:
             ignore_invalid_urls=ignore_invalid_urls,
             poll_interval=poll_interval,
             timeout=timeout,
+            polling=self.polling,
         )
 
     async def get_extract_status(self, job_id: str):
@@ -246,6 +485,14 @@ class AsyncFirecrawlClient:
         from .methods.aio import usage as async_usage  # type: ignore[attr-defined]
         return await async_usage.get_concurrency(self.async_http_client)
 
+    async def concurrency_controller(self, **kwargs: Any) -> ConcurrencyController:
+        """Create an adaptive concurrency controller seeded from and re-synced with ``get_concurrency()``."""
+        kwargs.setdefault("async_refresh", self.get_concurrency)
+        kwargs.setdefault("metrics", self.metrics)
+        controller = ConcurrencyController(**kwargs)
+        controller.update_from_server(await self.get_concurrency(), seed=True)
+        return controller
+
     async def get_credit_usage(self):
         from .methods.aio import usage as async_usage  # type: ignore[attr-defined]
         return await async_usage.get_credit_usage(self.async_http_client)
@@ -265,3 +512,58 @@ class AsyncFirecrawlClient:
     ) -> AsyncWatcher:
         return AsyncWatcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout)
 
+    def monitor(
+        self,
+        *,
+        poll_interval: float = 2,
+        polling: Optional[PollingStrategy] = None,
+        jitter: float = 0.1,
+        max_concurrency: int = 1,
+        request_timeout: Optional[float] = 30.0,
+    ) -> AsyncJobMonitor:
+        """Create a monitor that polls many crawl, batch and extract jobs from one task."""
+        return AsyncJobMonitor(
+            self.async_http_client,
+            poll_interval=poll_interval,
+            polling=polling or self.polling,
+            jitter=jitter,
+            max_concurrency=max_concurrency,
+            request_timeout=request_timeout,
+        )
+
+    def job_future(
+        self,
+        job_id: str,
+        kind: MonitorKind = "crawl",
+        *,
+        timeout: Optional[float] = None,
+    ) -> AsyncJobFuture:
+        """Wrap a started job in an awaitable resolved by the client's shared monitor.
+
+        Call it inside the event loop the monitor runs on.
+        """
+        if self._job_monitor is None:
+            self._job_monitor = self.monitor(max_concurrency=4)
+        return self._job_monitor.submit(job_id, kind, timeout=timeout)
+
+    async def submit_crawl(self, url: str, **kwargs) -> AsyncJobFuture:
+        """Start a crawl (same options as ``start_crawl``) and return an awaitable of its final ``CrawlJob``."""
+        started = await self.start_crawl(url, **kwargs)
+        return self.job_future(started.id, "crawl")
+
+    async def submit_batch_scrape(self, urls: List[str], **kwargs) -> AsyncJobFuture:
+        """Start a batch scrape and return an awaitable of its final ``BatchScrapeJob``.
+
+        Takes the same options as ``start_batch_scrape``.
+        """
+        started = await self.start_batch_scrape(urls, **kwargs)
+        return self.job_future(started.id, "batch")
+
+    async def submit_extract(self, urls: Optional[List[str]] = None, **kwargs) -> AsyncJobFuture:
+        """Start an extract and return an awaitable of its final ``ExtractResponse``.
+
+        Takes the same options as ``start_extract``.
+        """
+        started = await self.start_extract(urls, **kwargs)
+        return self.job_future(started.id, "extract")
+
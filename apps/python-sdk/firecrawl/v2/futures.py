@@ -0,0 +1,92 @@
+"""
+Future handles for crawl, batch scrape and extract jobs.
+
+``JobFuture`` is a ``concurrent.futures.Future`` and ``AsyncJobFuture`` an
+``asyncio.Future``, so the standard helpers (``as_completed``, ``wait``,
+``asyncio.gather``) compose many jobs. Both are resolved by a shared
+``JobMonitor``/``AsyncJobMonitor`` rather than a thread or wait loop per job.
+Cancelling a handle stops tracking the job and cancels it server-side.
+"""
+
+import asyncio
+import concurrent.futures
+from typing import Any, Optional
+
+
+class JobFuture(concurrent.futures.Future):
+    """
+    Final status of a job (``CrawlJob``, ``BatchScrapeJob`` or ``ExtractResponse``).
+
+    ``result(timeout)`` returns the status once the job is completed, failed
+    or cancelled, and raises the polling error if the job could not be
+    tracked to the end. ``cancel()`` returns at once and has the monitor call
+    ``cancel_crawl`` or ``cancel_batch_scrape`` in the background;
+    ``remote_cancel`` is a future of the server's answer.
+    """
+
+    def __init__(self, monitor: Any, job_id: str, kind: str) -> None:
+        super().__init__()
+        self.job_id = job_id
+        self.kind = kind
+        self.remote_cancel: "Optional[concurrent.futures.Future[bool]]" = None
+        self._monitor = monitor
+
+    @property
+    def remote_cancelled(self) -> Optional[bool]:
+        """Whether the server confirmed the cancellation (None until it answered)."""
+        if self.remote_cancel is None or not self.remote_cancel.done():
+            return None
+        return self.remote_cancel.result()
+
+    def cancel(self) -> bool:
+        # Settle the future first: the monitor may resolve it at any moment
+        if not super().cancel():
+            return False
+        self._monitor.unwatch(self.job_id)
+        self.remote_cancel = self._monitor._cancel_in_background(self.job_id, self.kind)
+        return True
+
+    def _resolve(self, status: Any) -> None:
+        try:
+            self.set_result(status)
+        except concurrent.futures.InvalidStateError:
+            # Cancelled while the final status was on its way
+            pass
+
+    def _fail(self, error: BaseException) -> None:
+        try:
+            self.set_exception(error)
+        except concurrent.futures.InvalidStateError:
+            pass
+
+
+class AsyncJobFuture(asyncio.Future):
+    """
+    Awaitable final status of a job, resolved by an ``AsyncJobMonitor``.
+
+    ``cancel()`` (including cancellation of a task awaiting the handle, e.g.
+    by ``asyncio.wait_for``) stops tracking and cancels the job server-side in
+    the background; ``asyncio.shield`` the handle to keep the job running.
+    """
+
+    def __init__(self, monitor: Any, job_id: str, kind: str) -> None:
+        super().__init__()
+        self.job_id = job_id
+        self.kind = kind
+        self.remote_cancel: "Optional[asyncio.Future[bool]]" = None
+        self._monitor = monitor
+
+    def cancel(self, *args: Any, **kwargs: Any) -> bool:
+        if self.done():
+            return False
+        self._monitor.unwatch(self.job_id)
+        self.remote_cancel = self._monitor._cancel_in_background(self.job_id, self.kind)
+        return super().cancel(*args, **kwargs)
+
+    def _resolve(self, status: Any) -> None:
+        if not self.done():
+            self.set_result(status)
+
+    def _fail(self, error: BaseException) -> None:
+        if not self.done():
+            self.set_exception(error)
@@ -1,9 +1,16 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 from ...types import ScrapeOptions, WebhookConfig, Document, BatchScrapeResponse, BatchScrapeJob, PaginationConfig
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.validation import prepare_scrape_options
 from ...utils.error_handler import handle_response_error
 from ...utils.normalize import normalize_document_input
+from ...utils.json_codec import decode_response
+from ...utils.json_stream import AsyncStreamedPage, aiter_page_items
+from ...utils.deadline import Deadline
+from ...utils.checkpoint import CheckpointStore
+from ...utils.pagination import (
+    DeltaCursor, afetch_new_documents, afetch_pages_parallel, aiter_documents, anext_page, aprefetch_pages
+)
 import time
 
 
@@ -30,12 +37,18 @@ def _prepare(urls: List[str], *, options: Optional[ScrapeOptions] = None, **kwar
     return payload
 
 
-async def start_batch_scrape(client: AsyncHttpClient, urls: List[str], **kwargs) -> BatchScrapeResponse:
+async def start_batch_scrape(
+    client: AsyncHttpClient,
+    urls: List[str],
+    *,
+    deadline: Optional[Deadline] = None,
+    **kwargs
+) -> BatchScrapeResponse:
     payload = _prepare(urls, **kwargs)
-    response = await client.post("/v2/batch/scrape", payload)
+    response = await client.post("/v2/batch/scrape", payload, deadline=deadline)
     if response.status_code >= 400:
         handle_response_error(response, "start batch scrape")
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     return BatchScrapeResponse(id=body.get("id"), url=body.get("url"), invalid_urls=body.get("invalidURLs"))
@@ -44,7 +57,10 @@ async def start_batch_scrape(client: AsyncHttpClient, urls: List[str], **kwargs)
 async def get_batch_scrape_status(
     client: AsyncHttpClient, 
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    deadline: Optional[Deadline] = None,
+    cursor: Optional[DeltaCursor] = None
 ) -> BatchScrapeJob:
     """
     Get the status of a batch scrape job.
@@ -53,6 +69,10 @@ async def get_batch_scrape_status(
         client: Async HTTP client instance
         job_id: ID of the batch scrape job
         pagination_config: Optional configuration for pagination behavior
+        deadline: Optional end-to-end deadline shared by the status and page requests
+        cursor: Wait-loop state; when given only documents past it are fetched,
+            appended to it, and the job carries all documents collected so far
+            (``pagination_config`` is ignored)
         
     Returns:
         BatchScrapeJob containing job status and data
@@ -60,14 +80,30 @@ async def get_batch_scrape_status(
     Raises:
         Exception: If the status check fails
     """
-    response = await client.get(f"/v2/batch/scrape/{job_id}")
+    if cursor is not None:
+        # Delta poll: skip the documents collected by earlier polls
+        body = await afetch_new_documents(
+            client, f"/v2/batch/scrape/{job_id}", cursor, action="get batch scrape status", deadline=deadline
+        )
+        return BatchScrapeJob(
+            status=body.get("status"),
+            completed=body.get("completed", 0),
+            total=body.get("total", 0),
+            credits_used=body.get("creditsUsed"),
+            expires_at=body.get("expiresAt"),
+            data=list(cursor.documents),
+        )
+
+    stream = bool(pagination_config and pagination_config.stream_pages)
+    response = await client.get(f"/v2/batch/scrape/{job_id}", stream=stream, deadline=deadline)
     if response.status_code >= 400:
         handle_response_error(response, "get batch scrape status")
-    body = response.json()
+    # Streamed pages decode `data` one document at a time
+    body = await AsyncStreamedPage.open(response) if stream else decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     docs: List[Document] = []
-    for doc in body.get("data", []) or []:
+    async for doc in aiter_page_items(body):
         if isinstance(doc, dict):
             normalized = normalize_document_input(doc)
             docs.append(Document(**normalized))
@@ -75,11 +111,14 @@ async def get_batch_scrape_status(
     # Handle pagination if requested
     auto_paginate = pagination_config.auto_paginate if pagination_config else True
     if auto_paginate and body.get("next"):
-        docs = await _fetch_all_batch_pages_async(
+        # Completed jobs can be fetched by offset ranges concurrently
+        parallel = await afetch_pages_parallel(client, body, docs, pagination_config, deadline=deadline)
+        docs = parallel if parallel is not None else await _fetch_all_batch_pages_async(
             client, 
             body.get("next"), 
             docs, 
-            pagination_config
+            pagination_config,
+            deadline=deadline
         )
     
     return BatchScrapeJob(
@@ -97,7 +136,9 @@ async def _fetch_all_batch_pages_async(
     client: AsyncHttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    deadline: Optional[Deadline] = None
 ) -> List[Document]:
     """
     Fetch all pages of batch scrape results asynchronously.
@@ -107,6 +148,7 @@ async def _fetch_all_batch_pages_async(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        deadline: Optional end-to-end deadline bounding every page request
         
     Returns:
         List of all documents from all pages
@@ -119,57 +161,99 @@ async def _fetch_all_batch_pages_async(
     max_pages = pagination_config.max_pages if pagination_config else None
     max_results = pagination_config.max_results if pagination_config else None
     max_wait_time = pagination_config.max_wait_time if pagination_config else None
+    stream = bool(pagination_config and pagination_config.stream_pages)
+    prefetch_depth = pagination_config.prefetch_depth if pagination_config else 0
+
+    # Pipelined mode: whole pages are downloaded ahead while this loop parses
+    pages = (
+        aprefetch_pages(client, current_url, prefetch_depth, max_pages=max_pages, deadline=deadline)
+        if prefetch_depth and current_url
+        else None
+    )
+    stream = stream and pages is None
     
     start_time = time.monotonic()
     
-    while current_url:
-        # Check pagination limits
-        if (max_pages is not None) and (page_count >= max_pages):
-            break
+    try:
+        while current_url:
+            # Check pagination limits
+            if (max_pages is not None) and (page_count >= max_pages):
+                break
             
-        if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
-            break
+            if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
+                break
         
-        # Fetch next page
-        response = await client.get(current_url)
+            # Fetch next page
+            response = await anext_page(pages) if pages is not None else None
+            if response is None:
+                # No prefetcher, or it stopped while a cursor remains: fetch directly
+                response = await client.get(current_url, stream=stream, deadline=deadline)
         
-        if response.status_code >= 400:
-            # Log error but continue with what we have
-            import logging
-            logger = logging.getLogger("firecrawl")
-            logger.warning(f"Failed to fetch next page: {response.status_code}")
-            break
+            if response.status_code >= 400:
+                # Log error but continue with what we have
+                import logging
+                logger = logging.getLogger("firecrawl")
+                logger.warning(f"Failed to fetch next page: {response.status_code}")
+                break
         
-        page_data = response.json()
+            page_data = await AsyncStreamedPage.open(response) if stream else decode_response(response)
         
-        if not page_data.get("success"):
-            break
+            if not page_data.get("success"):
+                break
         
-        # Add documents from this page
-        for doc in page_data.get("data", []) or []:
-            if isinstance(doc, dict):
-                # Check max_results limit
-                if (max_results is not None) and (len(documents) >= max_results):
-                    break
-                normalized = normalize_document_input(doc)
-                documents.append(Document(**normalized))
+            # Add documents from this page
+            async for doc in aiter_page_items(page_data):
+                if isinstance(doc, dict):
+                    # Check max_results limit
+                    if (max_results is not None) and (len(documents) >= max_results):
+                        break
+                    normalized = normalize_document_input(doc)
+                    documents.append(Document(**normalized))
+            if stream:
+                await page_data.aclose()
         
-        # Check if we hit max_results limit
-        if (max_results is not None) and (len(documents) >= max_results):
-            break
+            # Check if we hit max_results limit
+            if (max_results is not None) and (len(documents) >= max_results):
+                break
         
-        # Get next URL
-        current_url = page_data.get("next")
-        page_count += 1
+            # Get next URL
+            current_url = page_data.get("next")
+            page_count += 1
+    finally:
+        if pages is not None:
+            await pages.aclose()
     
     return documents
 
 
-async def cancel_batch_scrape(client: AsyncHttpClient, job_id: str) -> bool:
-    response = await client.delete(f"/v2/batch/scrape/{job_id}")
+def iter_batch_documents(
+    client: AsyncHttpClient,
+    job_id: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    deadline: Optional[Deadline] = None,
+    checkpoint: Optional[CheckpointStore] = None
+) -> AsyncIterator[Document]:
+    """
+    Lazily iterate over the documents of a batch scrape job (``async for``).
+    
+    Pages are fetched one at a time and released before the next cursor is
+    followed, so memory stays constant regardless of batch size. With a
+    ``checkpoint`` store an interrupted iteration resumes at the last consumed page.
+    """
+    return aiter_documents(
+        client, f"/v2/batch/scrape/{job_id}", pagination_config, action="get batch scrape status", deadline=deadline,
+        checkpoint=checkpoint,
+    )
+
+
+async def cancel_batch_scrape(
+    client: AsyncHttpClient, job_id: str, *, deadline: Optional[Deadline] = None
+) -> bool:
+    response = await client.delete(f"/v2/batch/scrape/{job_id}", deadline=deadline)
     if response.status_code >= 400:
         handle_response_error(response, "cancel batch scrape")
-    body = response.json()
+    body = decode_response(response)
     return body.get("status") == "cancelled"
 
 
@@ -177,7 +261,7 @@ async def get_batch_scrape_errors(client: AsyncHttpClient, job_id: str) -> Dict[
     response = await client.get(f"/v2/batch/scrape/{job_id}/errors")
     if response.status_code >= 400:
         handle_response_error(response, "get batch scrape errors")
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     return body
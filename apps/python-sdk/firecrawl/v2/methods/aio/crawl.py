@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, AsyncIterator, List
 from ...types import (
     CrawlRequest,
     CrawlJob,
@@ -16,6 +16,13 @@ from ...utils.error_handler import handle_response_error
 from ...utils.validation import prepare_scrape_options
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.normalize import normalize_document_input
+from ...utils.json_codec import decode_response
+from ...utils.json_stream import AsyncStreamedPage, aiter_page_items
+from ...utils.deadline import Deadline
+from ...utils.checkpoint import CheckpointStore
+from ...utils.pagination import (
+    DeltaCursor, afetch_new_documents, afetch_pages_parallel, aiter_documents, anext_page, aprefetch_pages
+)
 import time
 
 
@@ -59,13 +66,19 @@ def _prepare_crawl_request(request: CrawlRequest) -> dict:
     return data
 
 
-async def start_crawl(client: AsyncHttpClient, request: CrawlRequest) -> CrawlResponse:
+async def start_crawl(
+    client: AsyncHttpClient,
+    request: CrawlRequest,
+    *,
+    deadline: Optional[Deadline] = None
+) -> CrawlResponse:
     """
     Start a crawl job for a website.
     
     Args:
         client: Async HTTP client instance
         request: CrawlRequest containing URL and options
+        deadline: Optional end-to-end deadline bounding the request
         
     Returns:
         CrawlResponse with job information
@@ -75,10 +88,10 @@ async def start_crawl(client: AsyncHttpClient, request: CrawlRequest) -> CrawlRe
         Exception: If the crawl operation fails to start
     """
     payload = _prepare_crawl_request(request)
-    response = await client.post("/v2/crawl", payload)
+    response = await client.post("/v2/crawl", payload, deadline=deadline)
     if response.status_code >= 400:
         handle_response_error(response, "start crawl")
-    body = response.json()
+    body = decode_response(response)
     if body.get("success"):
         return CrawlResponse(id=body.get("id"), url=body.get("url"))
     raise Exception(body.get("error", "Unknown error occurred"))
@@ -87,7 +100,10 @@ async def start_crawl(client: AsyncHttpClient, request: CrawlRequest) -> CrawlRe
 async def get_crawl_status(
     client: AsyncHttpClient, 
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    deadline: Optional[Deadline] = None,
+    cursor: Optional[DeltaCursor] = None
 ) -> CrawlJob:
     """
     Get the status of a crawl job.
@@ -96,6 +112,10 @@ async def get_crawl_status(
         client: Async HTTP client instance
         job_id: ID of the crawl job
         pagination_config: Optional configuration for pagination limits
+        deadline: Optional end-to-end deadline shared by the status and page requests
+        cursor: Wait-loop state; when given only documents past it are fetched,
+            appended to it, and the job carries all documents collected so far
+            (``pagination_config`` is ignored)
         
     Returns:
         CrawlJob with job information
@@ -103,13 +123,29 @@ async def get_crawl_status(
     Raises:
         Exception: If the status check fails
     """
-    response = await client.get(f"/v2/crawl/{job_id}")
+    if cursor is not None:
+        # Delta poll: skip the documents collected by earlier polls
+        body = await afetch_new_documents(
+            client, f"/v2/crawl/{job_id}", cursor, action="get crawl status", deadline=deadline
+        )
+        return CrawlJob(
+            status=body.get("status"),
+            completed=body.get("completed", 0),
+            total=body.get("total", 0),
+            credits_used=body.get("creditsUsed", 0),
+            expires_at=body.get("expiresAt"),
+            data=list(cursor.documents),
+        )
+
+    stream = bool(pagination_config and pagination_config.stream_pages)
+    response = await client.get(f"/v2/crawl/{job_id}", stream=stream, deadline=deadline)
     if response.status_code >= 400:
         handle_response_error(response, "get crawl status")
-    body = response.json()
+    # Streamed pages decode `data` one document at a time
+    body = await AsyncStreamedPage.open(response) if stream else decode_response(response)
     if body.get("success"):
         documents = []
-        for doc_data in body.get("data", []):
+        async for doc_data in aiter_page_items(body):
             if isinstance(doc_data, dict):
                 normalized = normalize_document_input(doc_data)
                 documents.append(Document(**normalized))
@@ -117,11 +153,14 @@ async def get_crawl_status(
         # Handle pagination if requested
         auto_paginate = pagination_config.auto_paginate if pagination_config else True
         if auto_paginate and body.get("next"):
-            documents = await _fetch_all_pages_async(
+            # Completed jobs can be fetched by offset ranges concurrently
+            parallel = await afetch_pages_parallel(client, body, documents, pagination_config, deadline=deadline)
+            documents = parallel if parallel is not None else await _fetch_all_pages_async(
                 client, 
                 body.get("next"), 
                 documents, 
-                pagination_config
+                pagination_config,
+                deadline=deadline
             )
         
         return CrawlJob(
@@ -140,7 +179,9 @@ async def _fetch_all_pages_async(
     client: AsyncHttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    deadline: Optional[Deadline] = None
 ) -> List[Document]:
     """
     Fetch all pages of crawl results asynchronously.
@@ -150,6 +191,7 @@ async def _fetch_all_pages_async(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        deadline: Optional end-to-end deadline bounding every page request
         
     Returns:
         List of all documents from all pages
@@ -162,59 +204,110 @@ async def _fetch_all_pages_async(
     max_pages = pagination_config.max_pages if pagination_config else None
     max_results = pagination_config.max_results if pagination_config else None
     max_wait_time = pagination_config.max_wait_time if pagination_config else None
+    stream = bool(pagination_config and pagination_config.stream_pages)
+    prefetch_depth = pagination_config.prefetch_depth if pagination_config else 0
+
+    # Pipelined mode: whole pages are downloaded ahead while this loop parses
+    pages = (
+        aprefetch_pages(client, current_url, prefetch_depth, max_pages=max_pages, deadline=deadline)
+        if prefetch_depth and current_url
+        else None
+    )
+    stream = stream and pages is None
     
     start_time = time.monotonic()
     
-    while current_url:
-        # Check pagination limits (treat 0 as a valid limit)
-        if (max_pages is not None) and page_count >= max_pages:
-            break
+    try:
+        while current_url:
+            # Check pagination limits (treat 0 as a valid limit)
+            if (max_pages is not None) and page_count >= max_pages:
+                break
 
-        if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
-            break
+            if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
+                break
         
-        # Fetch next page
-        response = await client.get(current_url)
+            # Fetch next page
+            response = await anext_page(pages) if pages is not None else None
+            if response is None:
+                # No prefetcher, or it stopped while a cursor remains: fetch directly
+                response = await client.get(current_url, stream=stream, deadline=deadline)
         
-        if response.status_code >= 400:
-            # Log error but continue with what we have
-            import logging
-            logger = logging.getLogger("firecrawl")
-            logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
-            break
+            if response.status_code >= 400:
+                # Log error but continue with what we have
+                import logging
+                logger = logging.getLogger("firecrawl")
+                logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
+                break
         
-        page_data = response.json()
+            page_data = await AsyncStreamedPage.open(response) if stream else decode_response(response)
         
-        if not page_data.get("success"):
-            break
+            if not page_data.get("success"):
+                break
         
-        # Add documents from this page
-        for doc_data in page_data.get("data", []):
-            if isinstance(doc_data, dict):
-                # Check max_results limit
-                if (max_results is not None) and (len(documents) >= max_results):
-                    break
-                normalized = normalize_document_input(doc_data)
-                documents.append(Document(**normalized))
+            # Add documents from this page
+            async for doc_data in aiter_page_items(page_data):
+                if isinstance(doc_data, dict):
+                    # Check max_results limit
+                    if (max_results is not None) and (len(documents) >= max_results):
+                        break
+                    normalized = normalize_document_input(doc_data)
+                    documents.append(Document(**normalized))
+            if stream:
+                await page_data.aclose()
         
-        # Check if we hit max_results limit
-        if (max_results is not None) and (len(documents) >= max_results):
-            break
+            # Check if we hit max_results limit
+            if (max_results is not None) and (len(documents) >= max_results):
+                break
         
-        # Get next URL
-        current_url = page_data.get("next")
-        page_count += 1
+            # Get next URL
+            current_url = page_data.get("next")
+            page_count += 1
+    finally:
+        if pages is not None:
+            await pages.aclose()
     
     return documents
 
 
-async def cancel_crawl(client: AsyncHttpClient, job_id: str) -> bool:
+def iter_crawl_documents(
+    client: AsyncHttpClient,
+    job_id: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    deadline: Optional[Deadline] = None,
+    checkpoint: Optional[CheckpointStore] = None
+) -> AsyncIterator[Document]:
+    """
+    Lazily iterate over the documents of a crawl job (``async for``).
+    
+    Pages are fetched one at a time and released before the next cursor is
+    followed, so memory stays constant regardless of crawl size.
+    
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the crawl job
+        pagination_config: Optional pagination limits
+        deadline: Optional end-to-end deadline bounding every page request
+        checkpoint: Optional store that records the cursor after each consumed
+            page; iterating the same job again resumes from it
+        
+    Returns:
+        Async iterator of Document
+    """
+    return aiter_documents(
+        client, f"/v2/crawl/{job_id}", pagination_config, action="get crawl status", deadline=deadline,
+        checkpoint=checkpoint,
+    )
+
+
+async def cancel_crawl(client: AsyncHttpClient, job_id: str, *, deadline: Optional[Deadline] = None) -> bool:
     """
     Cancel a crawl job.
     
     Args:
         client: Async HTTP client instance
         job_id: ID of the crawl job
+        deadline: Time budget for the request (None for the client default)
         
     Returns:
         True if cancellation was successful
@@ -222,10 +315,10 @@ async def cancel_crawl(client: AsyncHttpClient, job_id: str) -> bool:
     Raises:
         Exception: If the cancellation operation fails
     """
-    response = await client.delete(f"/v2/crawl/{job_id}")
+    response = await client.delete(f"/v2/crawl/{job_id}", deadline=deadline)
     if response.status_code >= 400:
         handle_response_error(response, "cancel crawl")
-    body = response.json()
+    body = decode_response(response)
     return body.get("status") == "cancelled"
 
 
@@ -252,7 +345,7 @@ async def crawl_params_preview(client: AsyncHttpClient, request: CrawlParamsRequ
     response = await client.post("/v2/crawl/params-preview", payload)
     if response.status_code >= 400:
         handle_response_error(response, "crawl params preview")
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     params_data = body.get("data", {})
@@ -298,7 +391,7 @@ async def get_crawl_errors(client: AsyncHttpClient, crawl_id: str) -> CrawlError
     response = await client.get(f"/v2/crawl/{crawl_id}/errors")
     if response.status_code >= 400:
         handle_response_error(response, "check crawl errors")
-    body = response.json()
+    body = decode_response(response)
     payload = body.get("data", body)
     normalized = {
         "errors": payload.get("errors", []),
@@ -323,7 +416,7 @@ async def get_active_crawls(client: AsyncHttpClient) -> ActiveCrawlsResponse:
     response = await client.get("/v2/crawl/active")
     if response.status_code >= 400:
         handle_response_error(response, "get active crawls")
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     crawls_in = body.get("crawls", [])
@@ -4,6 +4,9 @@ import asyncio
 from ...types import ExtractResponse, ScrapeOptions
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.validation import prepare_scrape_options
+from ...utils.json_codec import decode_response
+from ...utils.deadline import Deadline, DeadlineExceededError
+from ...utils.polling import FixedPolling, PollingStrategy
 
 
 def _prepare_extract_request(
@@ -54,6 +57,7 @@ async def start_extract(
     show_sources: Optional[bool] = None,
     scrape_options: Optional[ScrapeOptions] = None,
     ignore_invalid_urls: Optional[bool] = None,
+    deadline: Optional[Deadline] = None,
 ) -> ExtractResponse:
     body = _prepare_extract_request(
         urls,
@@ -66,13 +70,18 @@ async def start_extract(
         scrape_options=scrape_options,
         ignore_invalid_urls=ignore_invalid_urls,
     )
-    resp = await client.post("/v2/extract", body)
-    return ExtractResponse(**resp.json())
+    resp = await client.post("/v2/extract", body, deadline=deadline)
+    return ExtractResponse(**decode_response(resp))
 
 
-async def get_extract_status(client: AsyncHttpClient, job_id: str) -> ExtractResponse:
-    resp = await client.get(f"/v2/extract/{job_id}")
-    return ExtractResponse(**resp.json())
+async def get_extract_status(
+    client: AsyncHttpClient,
+    job_id: str,
+    *,
+    deadline: Optional[Deadline] = None,
+) -> ExtractResponse:
+    resp = await client.get(f"/v2/extract/{job_id}", deadline=deadline)
+    return ExtractResponse(**decode_response(resp))
 
 
 async def wait_extract(
@@ -81,15 +90,39 @@ async def wait_extract(
     *,
     poll_interval: int = 2,
     timeout: Optional[int] = None,
+    deadline: Optional[Deadline] = None,
+    polling: Optional[PollingStrategy] = None,
 ) -> ExtractResponse:
-    start_ts = asyncio.get_event_loop().time()
+    """
+    Poll an extract job until it finishes or the deadline passes.
+
+    On timeout the last status seen is returned, whether the time ran out
+    between polls or during a status request; ``DeadlineExceededError`` is
+    raised only if no status was received at all.
+    """
+    # A zero timeout returns the first status, without bounding its request
+    poll_once = timeout == 0
+    if deadline is None:
+        deadline = Deadline(timeout or None)
+    # Extract status carries no progress counts; adaptive strategies only back off
+    schedule = (polling or FixedPolling()).schedule(max(1, poll_interval))
+    status: Optional[ExtractResponse] = None
     while True:
-        status = await get_extract_status(client, job_id)
+        try:
+            status = await get_extract_status(client, job_id, deadline=deadline)
+        except DeadlineExceededError:
+            # Running out of time mid-request ends the wait like running out between polls
+            if status is None:
+                raise
+            return status
         if status.status in ("completed", "failed", "cancelled"):
+            schedule.record(getattr(client, "metrics", None), job_id)
             return status
-        if timeout is not None and (asyncio.get_event_loop().time() - start_ts) > timeout:
+        if poll_once or deadline.expired():
+            return status
+        await asyncio.sleep(deadline.clip(schedule.next_delay()))
+        if deadline.expired():
             return status
-        await asyncio.sleep(max(1, poll_interval))
 
 
 async def extract(
@@ -106,7 +139,9 @@ async def extract(
     ignore_invalid_urls: Optional[bool] = None,
     poll_interval: int = 2,
     timeout: Optional[int] = None,
+    polling: Optional[PollingStrategy] = None,
 ) -> ExtractResponse:
+    deadline = Deadline(timeout or None)
     started = await start_extract(
         client,
         urls,
@@ -118,9 +153,12 @@ async def extract(
         show_sources=show_sources,
         scrape_options=scrape_options,
         ignore_invalid_urls=ignore_invalid_urls,
+        deadline=deadline,
     )
     job_id = getattr(started, "id", None)
     if not job_id:
         return started
-    return await wait_extract(client, job_id, poll_interval=poll_interval, timeout=timeout)
+    return await wait_extract(
+        client, job_id, poll_interval=poll_interval, timeout=timeout, deadline=deadline, polling=polling
+    )
 
@@ -1,9 +1,12 @@
+import uuid
 from typing import Optional, Dict, Any
 from ...types import ScrapeOptions, Document
 from ...utils.normalize import normalize_document_input
 from ...utils.error_handler import handle_response_error
 from ...utils.validation import prepare_scrape_options, validate_scrape_options
 from ...utils.http_client_async import AsyncHttpClient
+from ...utils.json_codec import decode_response
+from ...utils.hedging import HedgePolicy, hedged_call_async
 
 
 async def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -> Dict[str, Any]:
@@ -19,15 +22,36 @@ async def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = N
     return payload
 
 
-async def scrape(client: AsyncHttpClient, url: str, options: Optional[ScrapeOptions] = None) -> Document:
+async def scrape(
+    client: AsyncHttpClient,
+    url: str,
+    options: Optional[ScrapeOptions] = None,
+    *,
+    idempotency_key: Optional[str] = None,
+) -> Document:
     payload = await _prepare_scrape_request(url, options)
-    response = await client.post("/v2/scrape", payload)
+    headers = client._headers(idempotency_key) if idempotency_key else None
+    response = await client.post("/v2/scrape", payload, headers=headers)
     if response.status_code >= 400:
         handle_response_error(response, "scrape")
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     document_data = body.get("data", {})
     normalized = normalize_document_input(document_data)
     return Document(**normalized)
 
+
+async def hedged_scrape(
+    client: AsyncHttpClient,
+    url: str,
+    options: Optional[ScrapeOptions] = None,
+    *,
+    policy: HedgePolicy,
+    idempotency_key: Optional[str] = None,
+) -> Document:
+    await _prepare_scrape_request(url, options)
+    key = idempotency_key or str(uuid.uuid4())
+    return await hedged_call_async(
+        lambda: scrape(client, url, options, idempotency_key=key), policy, client.metrics
+    )
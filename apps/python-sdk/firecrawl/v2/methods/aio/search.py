@@ -11,6 +11,7 @@ from ...types import (
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.error_handler import handle_response_error
 from ...utils.validation import validate_scrape_options, prepare_scrape_options
+from ...utils.json_codec import decode_response
 
 T = TypeVar("T")
 
@@ -36,7 +37,7 @@ async def search(
         response = await client.post("/v2/search", request_data)
         if response.status_code != 200:
             handle_response_error(response, "search")
-        response_data = response.json()
+        response_data = decode_response(response)
         if not response_data.get("success"):
             handle_response_error(response, "search")
         data = response_data.get("data", {}) or {}
@@ -1,5 +1,6 @@
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.error_handler import handle_response_error
+from ...utils.json_codec import decode_response
 from ...types import ConcurrencyCheck, CreditUsage, TokenUsage
 
 
@@ -7,7 +8,7 @@ async def get_concurrency(client: AsyncHttpClient) -> ConcurrencyCheck:
     resp = await client.get("/v2/concurrency-check")
     if resp.status_code >= 400:
         handle_response_error(resp, "get concurrency")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
@@ -21,7 +22,7 @@ async def get_credit_usage(client: AsyncHttpClient) -> CreditUsage:
     resp = await client.get("/v2/team/credit-usage")
     if resp.status_code >= 400:
         handle_response_error(resp, "get credit usage")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
@@ -32,7 +33,7 @@ async def get_token_usage(client: AsyncHttpClient) -> TokenUsage:
     resp = await client.get("/v2/team/token-usage")
     if resp.status_code >= 400:
         handle_response_error(resp, "get token usage")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
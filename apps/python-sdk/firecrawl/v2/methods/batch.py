@@ -3,7 +3,7 @@ Batch scraping functionality for Firecrawl v2 API.
 """
 
 import time
-from typing import Optional, List, Callable, Dict, Any, Union
+from typing import Optional, List, Callable, Dict, Any, Iterator, Union
 from ..types import (
     BatchScrapeRequest,
     BatchScrapeResponse,
@@ -15,6 +15,15 @@ from ..types import (
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
 from ..utils.normalize import normalize_document_input
+from ..utils.json_codec import decode_response
+from ..utils.json_stream import StreamedPage
+from ..utils.deadline import Deadline, DeadlineExceededError
+from ..utils.cancellation import cancel_remote, start_timed_out
+from ..utils.checkpoint import CheckpointStore
+from ..utils.polling import FixedPolling, PollingStrategy
+from ..utils.pagination import (
+    DeltaCursor, fetch_new_documents, fetch_pages_parallel, iter_documents, prefetch_pages
+)
 from ..types import CrawlErrorsResponse
 
 
@@ -30,6 +39,7 @@ def start_batch_scrape(
     zero_data_retention: Optional[bool] = None,
     integration: Optional[str] = None,
     idempotency_key: Optional[str] = None,
+    deadline: Optional[Deadline] = None,
 ) -> BatchScrapeResponse:
     """
     Start a batch scrape job for multiple URLs.
@@ -38,6 +48,7 @@ def start_batch_scrape(
         client: HTTP client instance
         urls: List of URLs to scrape
         options: Scraping options
+        deadline: Optional end-to-end deadline bounding the request
         
     Returns:
         BatchScrapeResponse containing job information
@@ -59,14 +70,14 @@ def start_batch_scrape(
     
     # Make the API request
     headers = client._prepare_headers(idempotency_key)  # type: ignore[attr-defined]
-    response = client.post("/v2/batch/scrape", request_data, headers=headers)
+    response = client.post("/v2/batch/scrape", request_data, headers=headers, deadline=deadline)
     
     # Handle errors
     if not response.ok:
         handle_response_error(response, "start batch scrape")
     
     # Parse response
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     return BatchScrapeResponse(
@@ -79,7 +90,10 @@ def start_batch_scrape(
 def get_batch_scrape_status(
     client: HttpClient,
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    deadline: Optional[Deadline] = None,
+    cursor: Optional[DeltaCursor] = None
 ) -> BatchScrapeJob:
     """
     Get the status of a batch scrape job.
@@ -88,6 +102,10 @@ def get_batch_scrape_status(
         client: HTTP client instance
         job_id: ID of the batch scrape job
         pagination_config: Optional configuration for pagination behavior
+        deadline: Optional end-to-end deadline shared by the status and page requests
+        cursor: Wait-loop state; when given only documents past it are fetched,
+            appended to it, and the job carries all documents collected so far
+            (``pagination_config`` is ignored)
         
     Returns:
         BatchScrapeJob containing job status and data
@@ -95,15 +113,31 @@ def get_batch_scrape_status(
     Raises:
         FirecrawlError: If the status check fails
     """
+    if cursor is not None:
+        # Delta poll: skip the documents collected by earlier polls
+        body = fetch_new_documents(
+            client, f"/v2/batch/scrape/{job_id}", cursor, action="get batch scrape status", deadline=deadline
+        )
+        return BatchScrapeJob(
+            status=body.get("status"),
+            completed=body.get("completed", 0),
+            total=body.get("total", 0),
+            credits_used=body.get("creditsUsed"),
+            expires_at=body.get("expiresAt"),
+            data=list(cursor.documents),
+        )
+
+    stream = bool(pagination_config and pagination_config.stream_pages)
+
     # Make the API request
-    response = client.get(f"/v2/batch/scrape/{job_id}")
+    response = client.get(f"/v2/batch/scrape/{job_id}", stream=stream, deadline=deadline)
     
     # Handle errors
     if not response.ok:
         handle_response_error(response, "get batch scrape status")
     
-    # Parse response
-    body = response.json()
+    # Parse response (streamed pages decode `data` one document at a time)
+    body = StreamedPage(response) if stream else decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
@@ -117,11 +151,14 @@ def get_batch_scrape_status(
     # Handle pagination if requested
     auto_paginate = pagination_config.auto_paginate if pagination_config else True
     if auto_paginate and body.get("next"):
-        documents = _fetch_all_batch_pages(
+        # Completed jobs can be fetched by offset ranges concurrently
+        parallel = fetch_pages_parallel(client, body, documents, pagination_config, deadline=deadline)
+        documents = parallel if parallel is not None else _fetch_all_batch_pages(
             client, 
             body.get("next"), 
             documents, 
-            pagination_config
+            pagination_config,
+            deadline=deadline
         )
 
     return BatchScrapeJob(
@@ -139,7 +176,9 @@ def _fetch_all_batch_pages(
     client: HttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    deadline: Optional[Deadline] = None
 ) -> List[Document]:
     """
     Fetch all pages of batch scrape results.
@@ -149,6 +188,7 @@ def _fetch_all_batch_pages(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        deadline: Optional end-to-end deadline bounding every page request
         
     Returns:
         List of all documents from all pages
@@ -161,55 +201,112 @@ def _fetch_all_batch_pages(
     max_pages = pagination_config.max_pages if pagination_config else None
     max_results = pagination_config.max_results if pagination_config else None
     max_wait_time = pagination_config.max_wait_time if pagination_config else None
+    stream = bool(pagination_config and pagination_config.stream_pages)
+    prefetch_depth = pagination_config.prefetch_depth if pagination_config else 0
+
+    # Pipelined mode: whole pages are downloaded ahead while this loop parses
+    pages = (
+        prefetch_pages(client, current_url, prefetch_depth, max_pages=max_pages, deadline=deadline)
+        if prefetch_depth and current_url
+        else None
+    )
+    stream = stream and pages is None
     
     start_time = time.monotonic()
     
-    while current_url:
-        # Check pagination limits (treat 0 as a valid limit)
-        if (max_pages is not None) and page_count >= max_pages:
-            break
+    try:
+        while current_url:
+            # Check pagination limits (treat 0 as a valid limit)
+            if (max_pages is not None) and page_count >= max_pages:
+                break
         
-        if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
-            break
+            if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
+                break
         
-        # Fetch next page
-        response = client.get(current_url)
+            # Fetch next page
+            response = next(pages, None) if pages is not None else None
+            if response is None:
+                # No prefetcher, or it stopped while a cursor remains: fetch directly
+                response = client.get(current_url, stream=stream, deadline=deadline)
         
-        if not response.ok:
-            # Log error but continue with what we have
-            import logging
-            logger = logging.getLogger("firecrawl")
-            logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
-            break
+            if not response.ok:
+                # Log error but continue with what we have
+                import logging
+                logger = logging.getLogger("firecrawl")
+                logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
+                break
         
-        page_data = response.json()
+            page_data = StreamedPage(response) if stream else decode_response(response)
         
-        if not page_data.get("success"):
-            break
+            if not page_data.get("success"):
+                break
         
-        # Add documents from this page
-        for doc in page_data.get("data", []) or []:
-            if isinstance(doc, dict):
-                # Check max_results limit
-                if max_results is not None and len(documents) >= max_results:
-                    break
-                normalized = normalize_document_input(doc)
-                documents.append(Document(**normalized))
+            # Add documents from this page
+            for doc in page_data.get("data", []) or []:
+                if isinstance(doc, dict):
+                    # Check max_results limit
+                    if max_results is not None and len(documents) >= max_results:
+                        break
+                    normalized = normalize_document_input(doc)
+                    documents.append(Document(**normalized))
+            if stream:
+                page_data.close()
         
-        # Check if we hit max_results limit after adding all docs from this page
-        if max_results is not None and len(documents) >= max_results:
-            break
+            # Check if we hit max_results limit after adding all docs from this page
+            if max_results is not None and len(documents) >= max_results:
+                break
         
-        # Get next URL
-        current_url = page_data.get("next")
-        page_count += 1
+            # Get next URL
+            current_url = page_data.get("next")
+            page_count += 1
+    finally:
+        if pages is not None:
+            pages.close()
     
     return documents
 
 
+def iter_batch_documents(
+    client: HttpClient,
+    job_id: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    deadline: Optional[Deadline] = None,
+    checkpoint: Optional[CheckpointStore] = None
+) -> Iterator[Document]:
+    """
+    Lazily iterate over the documents of a batch scrape job.
+    
+    Pages are fetched one at a time as the iterator advances and each page is
+    released before the next ``next`` cursor is followed, so memory stays
+    constant regardless of batch size.
+    
+    Args:
+        client: HTTP client instance
+        job_id: ID of the batch scrape job
+        pagination_config: Optional limits (``max_pages``, ``max_results``,
+            ``max_wait_time``; ``auto_paginate=False`` yields only the first page)
+        deadline: Optional end-to-end deadline bounding every page request
+        checkpoint: Optional store that records the cursor after each consumed
+            page; iterating the same job again resumes from it
+        
+    Returns:
+        Iterator of Document
+        
+    Raises:
+        FirecrawlError: If the first status page cannot be fetched
+    """
+    return iter_documents(
+        client, f"/v2/batch/scrape/{job_id}", pagination_config, action="get batch scrape status", deadline=deadline,
+        checkpoint=checkpoint,
+    )
+
+
 def cancel_batch_scrape(
     client: HttpClient,
-    job_id: str
+    job_id: str,
+    *,
+    deadline: Optional[Deadline] = None
 ) -> bool:
     """
     Cancel a running batch scrape job.
@@ -217,6 +314,7 @@ def cancel_batch_scrape(
     Args:
         client: HTTP client instance
         job_id: ID of the batch scrape job to cancel
+        deadline: Time budget for the request (None for the client default)
         
     Returns:
         BatchScrapeStatusResponse with updated status
@@ -225,14 +323,14 @@ def cancel_batch_scrape(
         FirecrawlError: If the cancellation fails
     """
     # Make the API request
-    response = client.delete(f"/v2/batch/scrape/{job_id}")
+    response = client.delete(f"/v2/batch/scrape/{job_id}", deadline=deadline)
     
     # Handle errors
     if not response.ok:
         handle_response_error(response, "cancel batch scrape")
     
     # Parse response
-    body = response.json()
+    body = decode_response(response)
     return body.get("status") == "cancelled"
 
 
@@ -240,7 +338,13 @@ def wait_for_batch_completion(
     client: HttpClient,
     job_id: str,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    *,
+    deadline: Optional[Deadline] = None,
+    polling: Optional[PollingStrategy] = None,
+    cancel_on_timeout: bool = False,
+    partial_on_timeout: bool = False,
+    cursor: Optional[DeltaCursor] = None
 ) -> BatchScrapeJob:
     """
     Wait for a batch scrape job to complete, polling for status updates.
@@ -249,30 +353,57 @@ def wait_for_batch_completion(
         client: HTTP client instance
         job_id: ID of the batch scrape job
         poll_interval: Seconds between status checks
-        timeout: Maximum seconds to wait (None for no timeout)
+        timeout: Maximum seconds to wait (None or 0 for no timeout)
+        deadline: End-to-end deadline to use instead of ``timeout`` (e.g. one
+            shared with the request that started the job)
+        polling: Strategy pacing the polls (default: ``poll_interval`` fixed)
+        cancel_on_timeout: Cancel the batch scrape server-side (best effort)
+            when the deadline is reached
+        partial_on_timeout: When the deadline is reached, return the documents
+            collected so far as a job flagged ``is_partial`` instead of raising
+        cursor: Continue a previous wait (``DeltaCursor.resume(partial_job)``)
+            without downloading its documents again
         
     Returns:
-        BatchScrapeStatusResponse when job completes
+        BatchScrapeStatusResponse when job completes (or a partial one, see
+        ``partial_on_timeout``)
         
     Raises:
-        FirecrawlError: If the job fails or timeout is reached
-        TimeoutError: If timeout is reached
+        FirecrawlError: If the job fails
+        TimeoutError: If the deadline is reached (``DeadlineExceededError``;
+            ``remote_cancelled`` tells whether the job was cancelled)
     """
-    start_time = time.monotonic()
+    if deadline is None:
+        deadline = Deadline(timeout or None)
+    # Each poll downloads only the documents finished since the previous one
+    if cursor is None:
+        cursor = DeltaCursor()
+    schedule = (polling or FixedPolling()).schedule(poll_interval)
+    last: Optional[BatchScrapeJob] = None
     
-    while True:
-        status_job = get_batch_scrape_status(client, job_id)
-        
-        # Check if job is complete
-        if status_job.status in ["completed", "failed", "cancelled"]:
-            return status_job
-        
-        # Check timeout
-        if timeout and (time.monotonic() - start_time) > timeout:
-            raise TimeoutError(f"Batch scrape job {job_id} did not complete within {timeout} seconds")
-        
-        # Wait before next poll
-        time.sleep(poll_interval)
+    try:
+        while True:
+            status_job = last = get_batch_scrape_status(client, job_id, deadline=deadline, cursor=cursor)
+            
+            # Check if job is complete
+            if status_job.status in ["completed", "failed", "cancelled"]:
+                schedule.record(getattr(client, "metrics", None), job_id)
+                return status_job
+            
+            # Wait before next poll, never past the deadline
+            delay = schedule.next_delay(status_job.completed, status_job.total)
+            if not deadline.expired():
+                time.sleep(deadline.clip(delay))
+            if deadline.expired():
+                raise DeadlineExceededError(
+                    f"Batch scrape job {job_id} did not complete within {deadline.timeout} seconds"
+                )
+    except DeadlineExceededError as exc:
+        if cancel_on_timeout:
+            exc.remote_cancelled = cancel_remote(cancel_batch_scrape, client, job_id)
+        if partial_on_timeout and last is not None:
+            return cursor.partial(last, client, f"/v2/batch/scrape/{job_id}")
+        raise
 
 
 def batch_scrape(
@@ -288,7 +419,10 @@ def batch_scrape(
     integration: Optional[str] = None,
     idempotency_key: Optional[str] = None,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    polling: Optional[PollingStrategy] = None,
+    cancel_on_timeout: bool = False,
+    partial_on_timeout: bool = False
 ) -> BatchScrapeJob:
     """
     Start a batch scrape job and wait for it to complete.
@@ -298,7 +432,13 @@ def batch_scrape(
         urls: List of URLs to scrape
         options: Scraping options
         poll_interval: Seconds between status checks
-        timeout: Maximum seconds to wait (None for no timeout)
+        timeout: Maximum seconds for the whole operation (None for no timeout);
+            starting, polling and pagination share this budget
+        polling: Strategy pacing the status polls (default: ``poll_interval`` fixed)
+        cancel_on_timeout: Cancel the batch scrape server-side (best effort) if ``timeout`` is reached
+            while waiting; a start request cut off by it returns no ID to cancel
+            (``remote_cancelled`` is False)
+        partial_on_timeout: Return what was scraped by ``timeout`` (``is_partial``) instead of raising
         
     Returns:
         BatchScrapeStatusResponse when job completes
@@ -307,25 +447,40 @@ def batch_scrape(
         FirecrawlError: If the batch scrape fails to start or complete
         TimeoutError: If timeout is reached
     """
+    deadline = Deadline(timeout or None)
+
     # Start the batch scrape
-    start = start_batch_scrape(
-        client,
-        urls,
-        options=options,
-        webhook=webhook,
-        append_to_id=append_to_id,
-        ignore_invalid_urls=ignore_invalid_urls,
-        max_concurrency=max_concurrency,
-        zero_data_retention=zero_data_retention,
-        integration=integration,
-        idempotency_key=idempotency_key,
-    )
+    try:
+        start = start_batch_scrape(
+            client,
+            urls,
+            options=options,
+            webhook=webhook,
+            append_to_id=append_to_id,
+            ignore_invalid_urls=ignore_invalid_urls,
+            max_concurrency=max_concurrency,
+            zero_data_retention=zero_data_retention,
+            integration=integration,
+            idempotency_key=idempotency_key,
+            deadline=deadline,
+        )
+    except DeadlineExceededError as exc:
+        if cancel_on_timeout:
+            # The job may exist, but without its ID it cannot be cancelled
+            exc.remote_cancelled = start_timed_out(client, "batch scrape")
+        raise
 
     job_id = start.id
 
     # Wait for completion
     return wait_for_batch_completion(
-        client, job_id, poll_interval, timeout
+        client,
+        job_id,
+        poll_interval,
+        deadline=deadline,
+        polling=polling,
+        cancel_on_timeout=cancel_on_timeout,
+        partial_on_timeout=partial_on_timeout,
     )
 
 
@@ -493,7 +648,7 @@ def get_batch_scrape_errors(client: HttpClient, job_id: str) -> CrawlErrorsRespo
     if not response.ok:
         handle_response_error(response, "get batch scrape errors")
 
-    body = response.json()
+    body = decode_response(response)
     payload = body.get("data", body)
     normalized = {
         "errors": payload.get("errors", []),
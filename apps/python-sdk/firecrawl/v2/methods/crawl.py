@@ -3,7 +3,7 @@ Crawling functionality for Firecrawl v2 API.
 """
 
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from ..types import (
     CrawlRequest,
     CrawlJob,
@@ -12,6 +12,15 @@ from ..types import (
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
 from ..utils.normalize import normalize_document_input
+from ..utils.json_codec import decode_response
+from ..utils.json_stream import StreamedPage
+from ..utils.deadline import Deadline, DeadlineExceededError
+from ..utils.cancellation import cancel_remote, start_timed_out
+from ..utils.checkpoint import CheckpointStore
+from ..utils.polling import FixedPolling, PollingStrategy
+from ..utils.pagination import (
+    DeltaCursor, fetch_new_documents, fetch_pages_parallel, iter_documents, prefetch_pages
+)
 
 
 def _validate_crawl_request(request: CrawlRequest) -> None:
@@ -103,13 +112,19 @@ def _prepare_crawl_request(request: CrawlRequest) -> dict:
     return data
 
 
-def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
+def start_crawl(
+    client: HttpClient,
+    request: CrawlRequest,
+    *,
+    deadline: Optional[Deadline] = None
+) -> CrawlResponse:
     """
     Start a crawl job for a website.
     
     Args:
         client: HTTP client instance
         request: CrawlRequest containing URL and options
+        deadline: Optional end-to-end deadline bounding the request
         
     Returns:
         CrawlResponse with job information
@@ -120,12 +135,12 @@ def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
     """
     request_data = _prepare_crawl_request(request)
     
-    response = client.post("/v2/crawl", request_data)
+    response = client.post("/v2/crawl", request_data, deadline=deadline)
     
     if not response.ok:
         handle_response_error(response, "start crawl")
     
-    response_data = response.json()
+    response_data = decode_response(response)
     
     if response_data.get("success"):
         job_data = {
@@ -141,7 +156,10 @@ def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
 def get_crawl_status(
     client: HttpClient, 
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    deadline: Optional[Deadline] = None,
+    cursor: Optional[DeltaCursor] = None
 ) -> CrawlJob:
     """
     Get the status of a crawl job.
@@ -150,6 +168,10 @@ def get_crawl_status(
         client: HTTP client instance
         job_id: ID of the crawl job
         pagination_config: Optional configuration for pagination behavior
+        deadline: Optional end-to-end deadline shared by the status and page requests
+        cursor: Wait-loop state; when given only documents past it are fetched,
+            appended to it, and the job carries all documents collected so far
+            (``pagination_config`` is ignored)
         
     Returns:
         CrawlJob with current status and data
@@ -157,15 +179,29 @@ def get_crawl_status(
     Raises:
         Exception: If the status check fails
     """
+    if cursor is not None:
+        # Delta poll: skip the documents collected by earlier polls
+        body = fetch_new_documents(client, f"/v2/crawl/{job_id}", cursor, action="get crawl status", deadline=deadline)
+        return CrawlJob(
+            status=body.get("status"),
+            completed=body.get("completed", 0),
+            total=body.get("total", 0),
+            credits_used=body.get("creditsUsed", 0),
+            expires_at=body.get("expiresAt"),
+            data=list(cursor.documents),
+        )
+
+    stream = bool(pagination_config and pagination_config.stream_pages)
+
     # Make the API request
-    response = client.get(f"/v2/crawl/{job_id}")
+    response = client.get(f"/v2/crawl/{job_id}", stream=stream, deadline=deadline)
     
     # Handle errors
     if not response.ok:
         handle_response_error(response, "get crawl status")
     
-    # Parse response
-    response_data = response.json()
+    # Parse response (streamed pages decode `data` one document at a time)
+    response_data = StreamedPage(response) if stream else decode_response(response)
     
     if response_data.get("success"):
         # The API returns status fields at the top level, not in a data field
@@ -184,11 +220,14 @@ def get_crawl_status(
         # Handle pagination if requested
         auto_paginate = pagination_config.auto_paginate if pagination_config else True
         if auto_paginate and response_data.get("next") and not (pagination_config and pagination_config.max_results is not None and len(documents) >= pagination_config.max_results):
-            documents = _fetch_all_pages(
+            # Completed jobs can be fetched by offset ranges concurrently
+            parallel = fetch_pages_parallel(client, response_data, documents, pagination_config, deadline=deadline)
+            documents = parallel if parallel is not None else _fetch_all_pages(
                 client, 
                 response_data.get("next"), 
                 documents, 
-                pagination_config
+                pagination_config,
+                deadline=deadline
             )
         
         # Create CrawlJob with current status and data
@@ -209,7 +248,9 @@ def _fetch_all_pages(
     client: HttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    deadline: Optional[Deadline] = None
 ) -> List[Document]:
     """
     Fetch all pages of crawl results.
@@ -219,6 +260,7 @@ def _fetch_all_pages(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        deadline: Optional end-to-end deadline bounding every page request
         
     Returns:
         List of all documents from all pages
@@ -231,61 +273,117 @@ def _fetch_all_pages(
     max_pages = pagination_config.max_pages if pagination_config else None
     max_results = pagination_config.max_results if pagination_config else None
     max_wait_time = pagination_config.max_wait_time if pagination_config else None
+    stream = bool(pagination_config and pagination_config.stream_pages)
+    prefetch_depth = pagination_config.prefetch_depth if pagination_config else 0
+
+    # Pipelined mode: whole pages are downloaded ahead while this loop parses
+    pages = (
+        prefetch_pages(client, current_url, prefetch_depth, max_pages=max_pages, deadline=deadline)
+        if prefetch_depth and current_url
+        else None
+    )
+    stream = stream and pages is None
     
     start_time = time.monotonic()
     
-    while current_url:
-        # Check pagination limits (treat 0 as a valid limit)
-        if (max_pages is not None) and page_count >= max_pages:
-            break
+    try:
+        while current_url:
+            # Check pagination limits (treat 0 as a valid limit)
+            if (max_pages is not None) and page_count >= max_pages:
+                break
 
-        if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
-            break
-        
-        # Fetch next page
-        response = client.get(current_url)
-        
-        if not response.ok:
-            # Log error but continue with what we have
-            import logging
-            logger = logging.getLogger("firecrawl")
-            logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
-            break
-        
-        page_data = response.json()
-        
-        if not page_data.get("success"):
-            break
-        
-        # Add documents from this page
-        data_list = page_data.get("data", [])
-        for doc_data in data_list:
-            if isinstance(doc_data, str):
-                continue
-            else:
-                # Check max_results limit BEFORE adding each document
-                if max_results is not None and len(documents) >= max_results:
-                    break
-                documents.append(Document(**normalize_document_input(doc_data)))
-        
-        # Check if we hit max_results limit
-        if max_results is not None and len(documents) >= max_results:
-            break
-        
-        # Get next URL
-        current_url = page_data.get("next")
-        page_count += 1
+            if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
+                break
+        
+            # Fetch next page
+            response = next(pages, None) if pages is not None else None
+            if response is None:
+                # No prefetcher, or it stopped while a cursor remains: fetch directly
+                response = client.get(current_url, stream=stream, deadline=deadline)
+        
+            if not response.ok:
+                # Log error but continue with what we have
+                import logging
+                logger = logging.getLogger("firecrawl")
+                logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
+                break
+        
+            page_data = StreamedPage(response) if stream else decode_response(response)
+        
+            if not page_data.get("success"):
+                break
+        
+            # Add documents from this page
+            data_list = page_data.get("data", [])
+            for doc_data in data_list:
+                if isinstance(doc_data, str):
+                    continue
+                else:
+                    # Check max_results limit BEFORE adding each document
+                    if max_results is not None and len(documents) >= max_results:
+                        break
+                    documents.append(Document(**normalize_document_input(doc_data)))
+            if stream:
+                page_data.close()
+        
+            # Check if we hit max_results limit
+            if max_results is not None and len(documents) >= max_results:
+                break
+        
+            # Get next URL
+            current_url = page_data.get("next")
+            page_count += 1
+    finally:
+        if pages is not None:
+            pages.close()
     
     return documents
 
 
-def cancel_crawl(client: HttpClient, job_id: str) -> bool:
+def iter_crawl_documents(
+    client: HttpClient,
+    job_id: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    deadline: Optional[Deadline] = None,
+    checkpoint: Optional[CheckpointStore] = None
+) -> Iterator[Document]:
+    """
+    Lazily iterate over the documents of a crawl job.
+    
+    Pages are fetched one at a time as the iterator advances and each page is
+    released before the next ``next`` cursor is followed, so memory stays
+    constant regardless of crawl size.
+    
+    Args:
+        client: HTTP client instance
+        job_id: ID of the crawl job
+        pagination_config: Optional limits (``max_pages``, ``max_results``,
+            ``max_wait_time``; ``auto_paginate=False`` yields only the first page)
+        deadline: Optional end-to-end deadline bounding every page request
+        checkpoint: Optional store that records the cursor after each consumed
+            page; iterating the same job again resumes from it
+        
+    Returns:
+        Iterator of Document
+        
+    Raises:
+        FirecrawlError: If the first status page cannot be fetched
+    """
+    return iter_documents(
+        client, f"/v2/crawl/{job_id}", pagination_config, action="get crawl status", deadline=deadline,
+        checkpoint=checkpoint,
+    )
+
+
+def cancel_crawl(client: HttpClient, job_id: str, *, deadline: Optional[Deadline] = None) -> bool:
     """
     Cancel a running crawl job.
     
     Args:
         client: HTTP client instance
         job_id: ID of the crawl job to cancel
+        deadline: Time budget for the request (None for the client default)
         
     Returns:
         bool: True if the crawl was cancelled, False otherwise
@@ -293,12 +391,12 @@ def cancel_crawl(client: HttpClient, job_id: str) -> bool:
     Raises:
         Exception: If the cancellation fails
     """
-    response = client.delete(f"/v2/crawl/{job_id}")
+    response = client.delete(f"/v2/crawl/{job_id}", deadline=deadline)
     
     if not response.ok:
         handle_response_error(response, "cancel crawl")
     
-    response_data = response.json()
+    response_data = decode_response(response)
     
     return response_data.get("status") == "cancelled"
 
@@ -306,7 +404,13 @@ def wait_for_crawl_completion(
     client: HttpClient,
     job_id: str,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    *,
+    deadline: Optional[Deadline] = None,
+    polling: Optional[PollingStrategy] = None,
+    cancel_on_timeout: bool = False,
+    partial_on_timeout: bool = False,
+    cursor: Optional[DeltaCursor] = None
 ) -> CrawlJob:
     """
     Wait for a crawl job to complete, polling for status updates.
@@ -315,37 +419,68 @@ def wait_for_crawl_completion(
         client: HTTP client instance
         job_id: ID of the crawl job
         poll_interval: Seconds between status checks
-        timeout: Maximum seconds to wait (None for no timeout)
+        timeout: Maximum seconds to wait (None for no timeout); 0 checks the
+            status once and times out unless the crawl is already done
+        deadline: End-to-end deadline to use instead of ``timeout`` (e.g. one
+            shared with the request that started the job)
+        polling: Strategy pacing the polls (default: ``poll_interval`` fixed)
+        cancel_on_timeout: Cancel the crawl server-side (best effort) when the
+            deadline is reached
+        partial_on_timeout: When the deadline is reached, return the documents
+            collected so far as a job flagged ``is_partial`` instead of raising
+        cursor: Continue a previous wait (``DeltaCursor.resume(partial_job)``)
+            without downloading its documents again
         
     Returns:
-        CrawlJob when job completes
+        CrawlJob when job completes (or a partial one, see ``partial_on_timeout``)
         
     Raises:
         Exception: If the job fails
-        TimeoutError: If timeout is reached
+        TimeoutError: If the deadline is reached (``DeadlineExceededError``;
+            ``remote_cancelled`` tells whether the crawl was cancelled)
     """
-    start_time = time.monotonic()
+    # A zero timeout polls once without bounding the request, then times out
+    poll_once = timeout == 0
+    if deadline is None:
+        deadline = Deadline(timeout or None)
+    # Each poll downloads only the documents finished since the previous one
+    if cursor is None:
+        cursor = DeltaCursor()
+    schedule = (polling or FixedPolling()).schedule(poll_interval)
+    last: Optional[CrawlJob] = None
     
-    while True:
-        crawl_job = get_crawl_status(client, job_id)
-        
-        # Check if job is complete
-        if crawl_job.status in ["completed", "failed"]:
-            return crawl_job
-        
-        # Check timeout
-        if timeout is not None and (time.monotonic() - start_time) > timeout:
-            raise TimeoutError(f"Crawl job {job_id} did not complete within {timeout} seconds")
-        
-        # Wait before next poll
-        time.sleep(poll_interval)
+    try:
+        while True:
+            crawl_job = last = get_crawl_status(client, job_id, deadline=deadline, cursor=cursor)
+            
+            # Check if job is complete
+            if crawl_job.status in ["completed", "failed"]:
+                schedule.record(getattr(client, "metrics", None), job_id)
+                return crawl_job
+            
+            # Wait before next poll, never past the deadline
+            delay = schedule.next_delay(crawl_job.completed, crawl_job.total)
+            if not poll_once and not deadline.expired():
+                time.sleep(deadline.clip(delay))
+            if poll_once or deadline.expired():
+                limit = timeout if poll_once else deadline.timeout
+                raise DeadlineExceededError(f"Crawl job {job_id} did not complete within {limit} seconds")
+    except DeadlineExceededError as exc:
+        if cancel_on_timeout:
+            exc.remote_cancelled = cancel_remote(cancel_crawl, client, job_id)
+        if partial_on_timeout and last is not None:
+            return cursor.partial(last, client, f"/v2/crawl/{job_id}")
+        raise
 
 
 def crawl(
     client: HttpClient,
     request: CrawlRequest,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    polling: Optional[PollingStrategy] = None,
+    cancel_on_timeout: bool = False,
+    partial_on_timeout: bool = False
 ) -> CrawlJob:
     """
     Start a crawl job and wait for it to complete.
@@ -354,7 +489,14 @@ def crawl(
         client: HTTP client instance
         request: CrawlRequest containing URL and options
         poll_interval: Seconds between status checks
-        timeout: Maximum seconds to wait (None for no timeout)
+        timeout: Maximum seconds for the whole operation (None for no timeout);
+            starting, polling and pagination share this budget. 0 starts the
+            crawl, checks its status once and times out unless it is done
+        polling: Strategy pacing the status polls (default: ``poll_interval`` fixed)
+        cancel_on_timeout: Cancel the crawl server-side (best effort) if ``timeout`` is reached
+            while waiting; a start request cut off by it returns no ID to cancel
+            (``remote_cancelled`` is False)
+        partial_on_timeout: Return what was scraped by ``timeout`` (``is_partial``) instead of raising
         
     Returns:
         CrawlJob when job completes
@@ -364,13 +506,28 @@ def crawl(
         Exception: If the crawl fails to start or complete
         TimeoutError: If timeout is reached
     """
+    deadline = Deadline(timeout or None)
+
     # Start the crawl
-    crawl_job = start_crawl(client, request)
+    try:
+        crawl_job = start_crawl(client, request, deadline=deadline)
+    except DeadlineExceededError as exc:
+        if cancel_on_timeout:
+            # The crawl may exist, but without its ID it cannot be cancelled
+            exc.remote_cancelled = start_timed_out(client, "crawl")
+        raise
     job_id = crawl_job.id
     
     # Wait for completion
     return wait_for_crawl_completion(
-        client, job_id, poll_interval, timeout
+        client,
+        job_id,
+        poll_interval,
+        timeout,
+        deadline=deadline,
+        polling=polling,
+        cancel_on_timeout=cancel_on_timeout,
+        partial_on_timeout=partial_on_timeout,
     )
 
 
@@ -410,7 +567,7 @@ def crawl_params_preview(client: HttpClient, request: CrawlParamsRequest) -> Cra
         handle_response_error(response, "crawl params preview")
     
     # Parse response
-    response_data = response.json()
+    response_data = decode_response(response)
     
     if response_data.get("success"):
         params_data = response_data.get("data", {})
@@ -511,7 +668,7 @@ def get_crawl_errors(http_client: HttpClient, crawl_id: str) -> CrawlErrorsRespo
         handle_response_error(response, "check crawl errors")
 
     try:
-        body = response.json()
+        body = decode_response(response)
         payload = body.get("data", body)
         # Manual key normalization since we avoid Pydantic aliases
         normalized = {
@@ -541,7 +698,7 @@ def get_active_crawls(client: HttpClient) -> ActiveCrawlsResponse:
     if not response.ok:
         handle_response_error(response, "get active crawls")
 
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
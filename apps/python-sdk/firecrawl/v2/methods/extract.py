@@ -5,6 +5,9 @@ from ..types import ExtractResponse, ScrapeOptions
 from ..utils.http_client import HttpClient
 from ..utils.validation import prepare_scrape_options
 from ..utils.error_handler import handle_response_error
+from ..utils.json_codec import decode_response
+from ..utils.deadline import Deadline, DeadlineExceededError
+from ..utils.polling import FixedPolling, PollingStrategy
 
 
 def _prepare_extract_request(
@@ -55,6 +58,7 @@ def start_extract(
     show_sources: Optional[bool] = None,
     scrape_options: Optional[ScrapeOptions] = None,
     ignore_invalid_urls: Optional[bool] = None,
+    deadline: Optional[Deadline] = None,
 ) -> ExtractResponse:
     body = _prepare_extract_request(
         urls,
@@ -67,17 +71,22 @@ def start_extract(
         scrape_options=scrape_options,
         ignore_invalid_urls=ignore_invalid_urls,
     )
-    resp = client.post("/v2/extract", body)
+    resp = client.post("/v2/extract", body, deadline=deadline)
     if not resp.ok:
         handle_response_error(resp, "extract")
-    return ExtractResponse(**resp.json())
+    return ExtractResponse(**decode_response(resp))
 
 
-def get_extract_status(client: HttpClient, job_id: str) -> ExtractResponse:
-    resp = client.get(f"/v2/extract/{job_id}")
+def get_extract_status(
+    client: HttpClient,
+    job_id: str,
+    *,
+    deadline: Optional[Deadline] = None,
+) -> ExtractResponse:
+    resp = client.get(f"/v2/extract/{job_id}", deadline=deadline)
     if not resp.ok:
         handle_response_error(resp, "extract-status")
-    return ExtractResponse(**resp.json())
+    return ExtractResponse(**decode_response(resp))
 
 
 def wait_extract(
@@ -86,15 +95,39 @@ def wait_extract(
     *,
     poll_interval: int = 2,
     timeout: Optional[int] = None,
+    deadline: Optional[Deadline] = None,
+    polling: Optional[PollingStrategy] = None,
 ) -> ExtractResponse:
-    start_ts = time.time()
+    """
+    Poll an extract job until it finishes or the deadline passes.
+
+    On timeout the last status seen is returned, whether the time ran out
+    between polls or during a status request; ``DeadlineExceededError`` is
+    raised only if no status was received at all.
+    """
+    # A zero timeout returns the first status, without bounding its request
+    poll_once = timeout == 0
+    if deadline is None:
+        deadline = Deadline(timeout or None)
+    # Extract status carries no progress counts; adaptive strategies only back off
+    schedule = (polling or FixedPolling()).schedule(max(1, poll_interval))
+    status: Optional[ExtractResponse] = None
     while True:
-        status = get_extract_status(client, job_id)
+        try:
+            status = get_extract_status(client, job_id, deadline=deadline)
+        except DeadlineExceededError:
+            # Running out of time mid-request ends the wait like running out between polls
+            if status is None:
+                raise
+            return status
         if status.status in ("completed", "failed", "cancelled"):
+            schedule.record(getattr(client, "metrics", None), job_id)
             return status
-        if timeout is not None and (time.time() - start_ts) > timeout:
+        if poll_once or deadline.expired():
+            return status
+        time.sleep(deadline.clip(schedule.next_delay()))
+        if deadline.expired():
             return status
-        time.sleep(max(1, poll_interval))
 
 
 def extract(
@@ -111,7 +144,9 @@ def extract(
     ignore_invalid_urls: Optional[bool] = None,
     poll_interval: int = 2,
     timeout: Optional[int] = None,
+    polling: Optional[PollingStrategy] = None,
 ) -> ExtractResponse:
+    deadline = Deadline(timeout or None)
     started = start_extract(
         client,
         urls,
@@ -123,9 +158,12 @@ def extract(
         show_sources=show_sources,
         scrape_options=scrape_options,
         ignore_invalid_urls=ignore_invalid_urls,
+        deadline=deadline,
     )
     job_id = getattr(started, "id", None)
     if not job_id:
         return started
-    return wait_extract(client, job_id, poll_interval=poll_interval, timeout=timeout)
+    return wait_extract(
+        client, job_id, poll_interval=poll_interval, timeout=timeout, deadline=deadline, polling=polling
+    )
 
@@ -2,10 +2,13 @@
 Scraping functionality for Firecrawl v2 API.
 """
 
+import uuid
 from typing import Optional, Dict, Any
 from ..types import ScrapeOptions, Document
 from ..utils.normalize import normalize_document_input
 from ..utils import HttpClient, handle_response_error, prepare_scrape_options, validate_scrape_options
+from ..utils.json_codec import decode_response
+from ..utils.hedging import HedgePolicy, hedged_call
 
 
 def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -> Dict[str, Any]:
@@ -33,7 +36,13 @@ def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -
 
     return request_data
 
-def scrape(client: HttpClient, url: str, options: Optional[ScrapeOptions] = None) -> Document:
+def scrape(
+    client: HttpClient,
+    url: str,
+    options: Optional[ScrapeOptions] = None,
+    *,
+    idempotency_key: Optional[str] = None,
+) -> Document:
     """
     Scrape a single URL and return the document.
     
@@ -44,21 +53,52 @@ def scrape(client: HttpClient, url: str, options: Optional[ScrapeOptions] = None
         client: HTTP client instance
         url: URL to scrape
         options: Scraping options (snake_case)
+        idempotency_key: Optional ``x-idempotency-key`` header value
         
     Returns:
         Document
     """
     payload = _prepare_scrape_request(url, options)
 
-    response = client.post("/v2/scrape", payload)
+    headers = client._prepare_headers(idempotency_key) if idempotency_key else None
+    response = client.post("/v2/scrape", payload, headers=headers)
 
     if not response.ok:
         handle_response_error(response, "scrape")
 
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
     document_data = body.get("data", {})
     normalized = normalize_document_input(document_data)
-    return Document(**normalized)
\ No newline at end of file
+    return Document(**normalized)
+
+
+def hedged_scrape(
+    client: HttpClient,
+    url: str,
+    options: Optional[ScrapeOptions] = None,
+    *,
+    policy: HedgePolicy,
+    idempotency_key: Optional[str] = None,
+) -> Document:
+    """
+    Scrape a single URL, sending a duplicate request if the first is slower than ``policy.delay()``.
+
+    Both attempts carry the same idempotency key and the first successful
+    document is returned. Hedge counters are recorded in ``client.metrics``.
+
+    Args:
+        client: HTTP client instance
+        url: URL to scrape
+        options: Scraping options (snake_case)
+        policy: Hedge delay policy (shared across calls so it learns the latency distribution)
+        idempotency_key: Key shared by both attempts (generated when omitted)
+
+    Returns:
+        Document
+    """
+    _prepare_scrape_request(url, options)  # validate before starting any attempt
+    key = idempotency_key or str(uuid.uuid4())
+    return hedged_call(lambda: scrape(client, url, options, idempotency_key=key), policy, client.metrics)
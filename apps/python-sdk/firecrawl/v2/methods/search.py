@@ -7,6 +7,7 @@ from typing import Dict, Any, Union, List, TypeVar, Type
 from ..types import SearchRequest, SearchData, Document, SearchResultWeb, SearchResultNews, SearchResultImages
 from ..utils.normalize import normalize_document_input
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
+from ..utils.json_codec import decode_response
 
 T = TypeVar("T")
 
@@ -32,7 +33,7 @@ def search(
         response = client.post("/v2/search", request_data)
         if response.status_code != 200:
             handle_response_error(response, "search")
-        response_data = response.json()
+        response_data = decode_response(response)
         if not response_data.get("success"):
             handle_response_error(response, "search")
         data = response_data.get("data", {}) or {}
@@ -1,4 +1,5 @@
 from ..utils import HttpClient, handle_response_error
+from ..utils.json_codec import decode_response
 from ..types import ConcurrencyCheck, CreditUsage, TokenUsage
 
 
@@ -6,7 +7,7 @@ def get_concurrency(client: HttpClient) -> ConcurrencyCheck:
     resp = client.get("/v2/concurrency-check")
     if not resp.ok:
         handle_response_error(resp, "get concurrency")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
@@ -20,7 +21,7 @@ def get_credit_usage(client: HttpClient) -> CreditUsage:
     resp = client.get("/v2/team/credit-usage")
     if not resp.ok:
         handle_response_error(resp, "get credit usage")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
@@ -31,7 +32,7 @@ def get_token_usage(client: HttpClient) -> TokenUsage:
     resp = client.get("/v2/team/token-usage")
     if not resp.ok:
         handle_response_error(resp, "get token usage")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
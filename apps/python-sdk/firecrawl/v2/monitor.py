@@ -0,0 +1,656 @@
+"""
+Poll many crawl, batch scrape and extract jobs from one scheduler.
+
+Usage:
+    monitor = client.monitor()
+    monitor.watch(crawl_id, kind="crawl", callback=lambda job: print(job.status))
+    monitor.watch(batch_id, kind="batch", callback=handle_batch)
+    monitor.wait()
+    monitor.close()
+
+Every watched job gets a due time in one priority queue. A single worker
+(a thread for ``JobMonitor``, a task for ``AsyncJobMonitor``) pops the job
+that is due next, checks its status over the client's
+shared connection pool and re-queues it after the delay its ``PollingStrategy``
+asks for. Due times are jittered so jobs started together do not poll in lock
+step.
+"""
+
+import abc
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple
+
+from .futures import AsyncJobFuture, JobFuture
+from .methods import batch as batch_module
+from .methods import crawl as crawl_module
+from .methods import extract as extract_module
+from .methods.aio import batch as async_batch
+from .methods.aio import crawl as async_crawl
+from .methods.aio import extract as async_extract
+from .utils.deadline import Deadline, DeadlineExceededError
+from .utils.http_client import HttpClient
+from .utils.http_client_async import AsyncHttpClient
+from .utils.pagination import DeltaCursor
+from .utils.polling import FixedPolling, PollingStrategy, PollSchedule
+
+logger = logging.getLogger("firecrawl")
+
+MonitorKind = Literal["crawl", "batch", "extract"]
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+class _MonitoredJob:
+    def __init__(
+        self,
+        job_id: str,
+        kind: MonitorKind,
+        schedule: PollSchedule,
+        deadline: Deadline,
+        callback: Optional[Callable[[Any], None]],
+        on_error: Optional[Callable[[BaseException], None]],
+        on_status: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        self.job_id = job_id
+        self.kind = kind
+        self.schedule = schedule
+        self.deadline = deadline
+        self.callback = callback
+        self.on_error = on_error
+        self.on_status = on_status
+        # Crawl and batch polls download only documents finished since the previous poll
+        self.cursor: Optional[DeltaCursor] = DeltaCursor() if kind != "extract" else None
+        self.errors = 0
+        self.last_status: Any = None
+        self.error: Optional[BaseException] = None
+        self.active = True
+
+
+class _MonitorBase(abc.ABC):
+    """Queue and per-job bookkeeping shared by the thread and asyncio monitors."""
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        poll_interval: float,
+        polling: Optional[PollingStrategy],
+        jitter: float,
+        max_concurrency: int,
+        max_errors: int,
+        request_timeout: Optional[float],
+    ) -> None:
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in [0, 1)")
+        if max_concurrency < 1 or max_errors < 1:
+            raise ValueError("max_concurrency and max_errors must be at least 1")
+        self._client = client
+        self._poll_interval = poll_interval
+        self._polling = polling or FixedPolling()
+        self._jitter = jitter
+        self._max_concurrency = max_concurrency
+        self._max_errors = max_errors
+        self._request_timeout = request_timeout
+        self._queue: List[Tuple[float, int, _MonitoredJob]] = []
+        self._jobs: Dict[str, _MonitoredJob] = {}
+        self._seq = itertools.count()
+        self._closed = False
+
+    def _add(
+        self,
+        job_id: str,
+        kind: MonitorKind,
+        callback: Optional[Callable[[Any], None]],
+        on_error: Optional[Callable[[BaseException], None]],
+        timeout: Optional[float],
+        on_status: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        if kind not in ("crawl", "batch", "extract"):
+            raise ValueError(f"Unknown job kind: {kind}")
+        if self._closed:
+            raise RuntimeError(f"{type(self).__name__} is closed")
+        if job_id in self._jobs:
+            raise ValueError(f"Job {job_id} is already watched")
+        interval = max(1, self._poll_interval) if kind == "extract" else self._poll_interval
+        job = _MonitoredJob(
+            job_id, kind, self._polling.schedule(interval), Deadline(timeout), callback, on_error, on_status
+        )
+        self._jobs[job_id] = job
+        # Spread first checks over one interval instead of firing them all at once
+        self._push(job, random.uniform(0, interval))
+
+    def _remove(self, job_id: str) -> bool:
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return False
+        job.active = False
+        return True
+
+    def _push(self, job: _MonitoredJob, delay: float) -> None:
+        heapq.heappush(self._queue, (time.monotonic() + delay, next(self._seq), job))
+        self._wake()
+
+    @abc.abstractmethod
+    def _wake(self) -> None:
+        """Tell the scheduler the queue changed."""
+
+    def _check_deadline(self, job: _MonitoredJob) -> Deadline:
+        """Budget for one status check: the job's deadline, capped at ``request_timeout``."""
+        if self._request_timeout is None:
+            return job.deadline
+        remaining = job.deadline.remaining()
+        return Deadline(self._request_timeout if remaining is None else min(remaining, self._request_timeout))
+
+    def _pop_due(self) -> Tuple[Optional[_MonitoredJob], Optional[float]]:
+        """The next due job, or None and the seconds until one is due (None: queue empty)."""
+        while self._queue:
+            due = self._queue[0][0]
+            now = time.monotonic()
+            if due > now:
+                return None, due - now
+            job = heapq.heappop(self._queue)[2]
+            if job.active:
+                return job, None
+        return None, None
+
+    def _jittered(self, delay: float) -> float:
+        if not self._jitter:
+            return delay
+        return delay * random.uniform(1 - self._jitter, 1 + self._jitter)
+
+    def _outcome(
+        self, job: _MonitoredJob, status: Any = None, error: Optional[BaseException] = None
+    ) -> Optional[float]:
+        """Digest one status check; returns the delay before the next one, or None once the job is finished."""
+        if error is not None:
+            job.errors += 1
+            # A check cut off by ``request_timeout`` is retried like any other failure
+            if job.errors < self._max_errors and not job.deadline.expired():
+                logger.debug("Status check failed", extra={"job": job.job_id, "error": repr(error)})
+                return job.deadline.clip(self._jittered(job.schedule.baseline))
+            job.error = error
+            return None
+        job.errors = 0
+        job.last_status = status
+        if status.status in TERMINAL_STATUSES:
+            job.schedule.record(getattr(self._client, "metrics", None), job.job_id)
+            return None
+        if job.deadline.expired():
+            job.error = DeadlineExceededError(
+                f"Job {job.job_id} did not complete within {job.deadline.timeout} seconds"
+            )
+            return None
+        if job.kind == "extract":
+            delay = job.schedule.next_delay()
+        else:
+            delay = job.schedule.next_delay(status.completed, status.total)
+        return job.deadline.clip(self._jittered(delay))
+
+    @staticmethod
+    def _notify(job: _MonitoredJob) -> None:
+        handler, arg = (job.on_error, job.error) if job.error is not None else (job.callback, job.last_status)
+        if handler is not None:
+            try:
+                handler(arg)
+            except Exception:
+                logger.debug("Monitor callback raised", exc_info=True)
+
+    @staticmethod
+    def _progress(job: _MonitoredJob, status: Any) -> None:
+        if job.on_status is not None and job.active:
+            try:
+                job.on_status(status)
+            except Exception:
+                logger.debug("Monitor status callback raised", exc_info=True)
+
+
+class JobMonitor(_MonitorBase):
+    """
+    Track many jobs with one polling thread and the client's connection pool.
+
+    ``callback`` receives the final status (``CrawlJob``, ``BatchScrapeJob`` or
+    ``ExtractResponse``) once the job is completed, failed or cancelled;
+    ``on_error`` receives the exception when the job cannot be polled any more
+    (``max_errors`` failed checks in a row, or its ``timeout`` passed).
+    Callbacks run on the monitor's thread and should return quickly.
+
+    Args:
+        client: HTTP client whose connection pool the polls share
+        poll_interval: Seconds between status checks of one job
+        polling: Strategy pacing each job's polls (default: ``poll_interval`` fixed)
+        jitter: Fraction by which each delay is randomly stretched or shrunk
+        max_concurrency: Status checks in flight at once (1 polls on the scheduler thread)
+        max_errors: Failed checks in a row after which a job is dropped
+        request_timeout: Seconds one status check may take (None for no limit
+            besides the job's ``timeout``), so a hung request cannot stall the
+            other jobs; a check that runs over counts as a failed check
+    """
+
+    def __init__(
+        self,
+        client: HttpClient,
+        *,
+        poll_interval: float = 2,
+        polling: Optional[PollingStrategy] = None,
+        jitter: float = 0.1,
+        max_concurrency: int = 1,
+        max_errors: int = 3,
+        request_timeout: Optional[float] = 30.0,
+    ) -> None:
+        super().__init__(
+            client,
+            poll_interval=poll_interval,
+            polling=polling,
+            jitter=jitter,
+            max_concurrency=max_concurrency,
+            max_errors=max_errors,
+            request_timeout=request_timeout,
+        )
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="firecrawl-monitor")
+            if max_concurrency > 1 else None
+        )
+        self._cancels: List[Tuple[str, MonitorKind, "Future[bool]"]] = []
+
+    def watch(
+        self,
+        job_id: str,
+        kind: MonitorKind = "crawl",
+        callback: Optional[Callable[[Any], None]] = None,
+        *,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        timeout: Optional[float] = None,
+        on_status: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Start tracking a job; the first check lands within one ``poll_interval``.
+
+        Args:
+            job_id: ID returned by ``start_crawl``/``start_batch_scrape``/``start_extract``
+            kind: Job kind ("crawl", "batch" or "extract")
+            callback: Called with the final status
+            on_error: Called with the exception if the job cannot be tracked to the end
+            timeout: Seconds after which tracking gives up (``DeadlineExceededError``)
+            on_status: Called with every status seen before the final one
+        """
+        with self._cond:
+            self._add(job_id, kind, callback, on_error, timeout, on_status)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="firecrawl-monitor", daemon=True)
+                self._thread.start()
+
+    def submit(self, job_id: str, kind: MonitorKind = "crawl", *, timeout: Optional[float] = None) -> JobFuture:
+        """Track a job and return a ``concurrent.futures.Future`` resolved with its final status."""
+        future = JobFuture(self, job_id, kind)
+        self.watch(job_id, kind, future._resolve, on_error=future._fail, timeout=timeout)
+        return future
+
+    def cancel_job(self, job_id: str, kind: MonitorKind = "crawl") -> bool:
+        """Cancel the job server-side; extract jobs cannot be cancelled and return False."""
+        if kind == "crawl":
+            return crawl_module.cancel_crawl(self._client, job_id)
+        if kind == "batch":
+            return batch_module.cancel_batch_scrape(self._client, job_id)
+        return False
+
+    def unwatch(self, job_id: str) -> bool:
+        """Stop tracking a job without calling its callbacks; returns whether it was watched."""
+        with self._cond:
+            removed = self._remove(job_id)
+            self._cond.notify_all()
+            return removed
+
+    def pending(self) -> List[str]:
+        """IDs of the jobs still being tracked."""
+        with self._cond:
+            return list(self._jobs)
+
+    def status(self, job_id: str) -> Any:
+        """Most recent status seen for a tracked job (None before its first check)."""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            return job.last_status if job is not None else None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until no job is tracked any more; returns False if ``timeout`` passed first."""
+        deadline = Deadline(timeout)
+        with self._cond:
+            while self._jobs:
+                if deadline.expired():
+                    return False
+                self._cond.wait(deadline.remaining())
+            return True
+
+    def close(self) -> None:
+        """Stop the scheduler; jobs still tracked are dropped without callbacks."""
+        with self._cond:
+            self._closed = True
+            for job in self._jobs.values():
+                job.active = False
+            self._jobs.clear()
+            self._queue.clear()
+            self._cond.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "JobMonitor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _wake(self) -> None:
+        self._cond.notify_all()
+
+    def _cancel_in_background(self, job_id: str, kind: MonitorKind) -> "Future[bool]":
+        """Have the monitor's thread cancel the job server-side; returns a future of the answer."""
+        future: "Future[bool]" = Future()
+        with self._cond:
+            if self._thread is None or self._closed:
+                future.set_result(False)
+                return future
+            self._cancels.append((job_id, kind, future))
+            self._cond.notify_all()
+        return future
+
+    def _cancel_quietly(self, job_id: str, kind: MonitorKind) -> bool:
+        try:
+            return self.cancel_job(job_id, kind)
+        except Exception as exc:
+            logger.warning("Failed to cancel job", extra={"job": job_id, "error": repr(exc)})
+            return False
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                job = None
+                while job is None:
+                    cancels, self._cancels = self._cancels, []
+                    if cancels:
+                        break
+                    if self._closed:
+                        return
+                    job, wait = self._pop_due()
+                    if job is None:
+                        self._cond.wait(wait)
+            if cancels:
+                # Remote cancels go out even when close() is waiting for this thread
+                for job_id, kind, future in cancels:
+                    future.set_result(self._cancel_quietly(job_id, kind))
+                continue
+            self._slots.acquire()
+            if self._executor is None:
+                self._poll(job)
+            else:
+                try:
+                    self._executor.submit(self._poll, job)
+                except RuntimeError:
+                    # Executor shut down by close()
+                    self._slots.release()
+                    return
+
+    def _check(self, job: _MonitoredJob) -> Any:
+        deadline = self._check_deadline(job)
+        if job.kind == "crawl":
+            return crawl_module.get_crawl_status(self._client, job.job_id, deadline=deadline, cursor=job.cursor)
+        if job.kind == "batch":
+            return batch_module.get_batch_scrape_status(self._client, job.job_id, deadline=deadline, cursor=job.cursor)
+        return extract_module.get_extract_status(self._client, job.job_id, deadline=deadline)
+
+    def _poll(self, job: _MonitoredJob) -> None:
+        try:
+            try:
+                status = self._check(job)
+            except Exception as exc:
+                delay = self._outcome(job, error=exc)
+            else:
+                delay = self._outcome(job, status=status)
+                if delay is not None:
+                    self._progress(job, status)
+            with self._cond:
+                if not job.active or self._closed:
+                    return
+                if delay is not None:
+                    self._push(job, delay)
+                    return
+                job.active = False
+            self._notify(job)
+            with self._cond:
+                # Drop the job only after its callback ran, so wait() returns after it
+                if self._jobs.get(job.job_id) is job:
+                    del self._jobs[job.job_id]
+                self._cond.notify_all()
+        finally:
+            self._slots.release()
+
+
+class AsyncJobMonitor(_MonitorBase):
+    """
+    ``JobMonitor`` for ``AsyncFirecrawlClient``: one scheduler task on the running event loop.
+
+    ``watch``/``submit`` must be called from the loop the monitor runs on;
+    callbacks run on that loop and must not block. Up to ``max_concurrency``
+    status checks run concurrently over the client's connection pool, each
+    limited to ``request_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        client: AsyncHttpClient,
+        *,
+        poll_interval: float = 2,
+        polling: Optional[PollingStrategy] = None,
+        jitter: float = 0.1,
+        max_concurrency: int = 1,
+        max_errors: int = 3,
+        request_timeout: Optional[float] = 30.0,
+    ) -> None:
+        super().__init__(
+            client,
+            poll_interval=poll_interval,
+            polling=polling,
+            jitter=jitter,
+            max_concurrency=max_concurrency,
+            max_errors=max_errors,
+            request_timeout=request_timeout,
+        )
+        # Loop-bound primitives are created on first use inside the running loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._due: Optional[asyncio.Event] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._tasks: Set["asyncio.Future[Any]"] = set()
+        self._cancels: Set["asyncio.Future[Any]"] = set()
+
+    def watch(
+        self,
+        job_id: str,
+        kind: MonitorKind = "crawl",
+        callback: Optional[Callable[[Any], None]] = None,
+        *,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        timeout: Optional[float] = None,
+        on_status: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """Start tracking a job; see ``JobMonitor.watch``."""
+        self._ensure_scheduler()
+        self._add(job_id, kind, callback, on_error, timeout, on_status)
+
+    def submit(self, job_id: str, kind: MonitorKind = "crawl", *, timeout: Optional[float] = None) -> AsyncJobFuture:
+        """Track a job and return an awaitable ``asyncio.Future`` resolved with its final status."""
+        future = AsyncJobFuture(self, job_id, kind)
+        self.watch(job_id, kind, future._resolve, on_error=future._fail, timeout=timeout)
+        return future
+
+    async def cancel_job(self, job_id: str, kind: MonitorKind = "crawl") -> bool:
+        """Cancel the job server-side; extract jobs cannot be cancelled and return False."""
+        if kind == "crawl":
+            return await async_crawl.cancel_crawl(self._client, job_id)
+        if kind == "batch":
+            return await async_batch.cancel_batch_scrape(self._client, job_id)
+        return False
+
+    def unwatch(self, job_id: str) -> bool:
+        """Stop tracking a job without calling its callbacks; returns whether it was watched."""
+        removed = self._remove(job_id)
+        if removed and self._changed is not None:
+            self._changed.set()
+        return removed
+
+    def pending(self) -> List[str]:
+        """IDs of the jobs still being tracked."""
+        return list(self._jobs)
+
+    def status(self, job_id: str) -> Any:
+        """Most recent status seen for a tracked job (None before its first check)."""
+        job = self._jobs.get(job_id)
+        return job.last_status if job is not None else None
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until no job is tracked any more; returns False if ``timeout`` passed first."""
+        deadline = Deadline(timeout)
+        while self._jobs:
+            if deadline.expired():
+                return False
+            assert self._changed is not None
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), deadline.remaining())
+            except asyncio.TimeoutError:
+                pass
+        return True
+
+    async def close(self) -> None:
+        """Stop the scheduler and in-flight checks; jobs still tracked are dropped without callbacks."""
+        self._closed = True
+        for job in self._jobs.values():
+            job.active = False
+        self._jobs.clear()
+        self._queue.clear()
+        if self._loop is not asyncio.get_running_loop():
+            # Everything loop-bound belongs to a previous loop and cannot be awaited here
+            self._forget_loop()
+            return
+        if self._cancels:
+            # Remote cancels already requested still go out
+            await asyncio.gather(*list(self._cancels), return_exceptions=True)
+        tasks = list(self._tasks)
+        if self._task is not None:
+            tasks.append(self._task)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self._changed is not None:
+            self._changed.set()
+
+    async def __aenter__(self) -> "AsyncJobMonitor":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _wake(self) -> None:
+        if self._due is not None:
+            self._due.set()
+
+    def _ensure_scheduler(self) -> None:
+        """(Re)start the scheduler task on the running loop, e.g. when a client outlives an ``asyncio.run``."""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+        if self._loop is not None and self._loop is not loop:
+            # Futures and tasks of a previous loop can never be resolved from this one
+            self._forget_loop()
+        self._loop = loop
+        self._due = asyncio.Event()
+        self._changed = asyncio.Event()
+        self._slots = asyncio.Semaphore(self._max_concurrency)
+        self._task = asyncio.ensure_future(self._run())
+
+    def _forget_loop(self) -> None:
+        for job in self._jobs.values():
+            job.active = False
+        self._jobs.clear()
+        self._queue.clear()
+        self._tasks.clear()
+        self._cancels.clear()
+        self._loop = self._task = self._due = self._changed = self._slots = None
+
+    def _spawn(self, coro: Any, tasks: Optional[Set["asyncio.Future[Any]"]] = None) -> "asyncio.Future[Any]":
+        tasks = self._tasks if tasks is None else tasks
+        task = asyncio.ensure_future(coro)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        return task
+
+    def _cancel_in_background(self, job_id: str, kind: MonitorKind) -> "asyncio.Future[Any]":
+        return self._spawn(self._cancel_quietly(job_id, kind), self._cancels)
+
+    async def _cancel_quietly(self, job_id: str, kind: MonitorKind) -> bool:
+        try:
+            return await self.cancel_job(job_id, kind)
+        except Exception as exc:
+            logger.warning("Failed to cancel job", extra={"job": job_id, "error": repr(exc)})
+            return False
+
+    async def _run(self) -> None:
+        assert self._due is not None and self._slots is not None
+        while not self._closed:
+            self._due.clear()
+            job, wait = self._pop_due()
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._due.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._slots.acquire()
+            self._spawn(self._poll(job))
+
+    async def _check(self, job: _MonitoredJob) -> Any:
+        deadline = self._check_deadline(job)
+        if job.kind == "crawl":
+            return await async_crawl.get_crawl_status(self._client, job.job_id, deadline=deadline, cursor=job.cursor)
+        if job.kind == "batch":
+            return await async_batch.get_batch_scrape_status(
+                self._client, job.job_id, deadline=deadline, cursor=job.cursor
+            )
+        return await async_extract.get_extract_status(self._client, job.job_id, deadline=deadline)
+
+    async def _poll(self, job: _MonitoredJob) -> None:
+        assert self._slots is not None and self._changed is not None
+        try:
+            try:
+                status = await self._check(job)
+            except Exception as exc:
+                delay = self._outcome(job, error=exc)
+            else:
+                delay = self._outcome(job, status=status)
+                if delay is not None:
+                    self._progress(job, status)
+            if not job.active or self._closed:
+                return
+            if delay is not None:
+                self._push(job, delay)
+                return
+            job.active = False
+            self._notify(job)
+            if self._jobs.get(job.job_id) is job:
+                del self._jobs[job.job_id]
+            self._changed.set()
+        finally:
+            self._slots.release()
@@ -349,6 +349,8 @@ class CrawlJob(BaseModel):
     expires_at: Optional[datetime] = None
     next: Optional[str] = None
     data: List[Document] = []
+    # Set when a wait timed out with partial_on_timeout; ``next`` then continues after ``data``
+    is_partial: bool = False
 
 class SearchResultWeb(BaseModel):
     """A web search result with URL, title, and description."""
@@ -436,6 +438,8 @@ class BatchScrapeJob(BaseModel):
     expires_at: Optional[datetime] = None
     next: Optional[str] = None
     data: List[Document] = []
+    # Set when a wait timed out with partial_on_timeout; ``next`` then continues after ``data``
+    is_partial: bool = False
 
 # Map types
 class MapOptions(BaseModel):
@@ -684,6 +688,20 @@ class PaginationConfig(BaseModel):
     max_pages: Optional[int] = Field(default=None, ge=0)
     max_results: Optional[int] = Field(default=None, ge=0)
     max_wait_time: Optional[int] = Field(default=None, ge=0)    # seconds
+    stream_pages: bool = False    # decode result pages document-by-document from the socket
+    # Pages downloaded ahead on a background thread/task while the current one is parsed (0 = serial)
+    prefetch_depth: int = Field(default=0, ge=0)
+    # Concurrent skip/limit page downloads once a job is completed (0 = follow next cursors)
+    parallel_pages: int = Field(default=0, ge=0)
+
+class WarmupReport(BaseModel):
+    """Result of ``client.warmup()``; durations are in seconds."""
+    connections: int = 0    # pooled connections opened and parked
+    addresses: List[str] = []    # resolved API host addresses (empty for Unix sockets)
+    imports_seconds: float = 0.0
+    dns_seconds: float = 0.0
+    connect_seconds: float = 0.0
+    total_seconds: float = 0.0
 
 # Response union types
 AnyResponse = Union[
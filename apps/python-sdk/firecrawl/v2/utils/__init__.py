@@ -3,7 +3,47 @@ Utility modules for v2 API client.
 """
 
 from .http_client import HttpClient
-from .error_handler import FirecrawlError, handle_response_error
+from .error_handler import FirecrawlError, IdempotencyConflictError, handle_response_error
 from .validation import validate_scrape_options, prepare_scrape_options
+from .metrics import ClientMetrics
+from .retry import RetryPolicy, RetryBudget
+from .rate_limit import RateLimiter, TokenBucket
+from .json_codec import JsonCodec, get_codec, set_codec
+from .concurrency import ConcurrencyController, run_concurrently, run_concurrently_async
+from .hedging import HedgePolicy
+from .circuit_breaker import CircuitBreaker
+from .deadline import Deadline, DeadlineExceededError
+from .checkpoint import CheckpointStore, FileCheckpointStore, MemoryCheckpointStore
+from .polling import PollingStrategy, FixedPolling, AdaptivePolling
+from .pagination import DeltaCursor
 
-__all__ = ['HttpClient', 'FirecrawlError', 'handle_response_error', 'validate_scrape_options', 'prepare_scrape_options']
\ No newline at end of file
+__all__ = [
+    'HttpClient',
+    'FirecrawlError',
+    'IdempotencyConflictError',
+    'handle_response_error',
+    'validate_scrape_options',
+    'prepare_scrape_options',
+    'ClientMetrics',
+    'RetryPolicy',
+    'RetryBudget',
+    'RateLimiter',
+    'TokenBucket',
+    'ConcurrencyController',
+    'run_concurrently',
+    'run_concurrently_async',
+    'JsonCodec',
+    'get_codec',
+    'set_codec',
+    'HedgePolicy',
+    'CircuitBreaker',
+    'Deadline',
+    'DeadlineExceededError',
+    'CheckpointStore',
+    'FileCheckpointStore',
+    'MemoryCheckpointStore',
+    'PollingStrategy',
+    'FixedPolling',
+    'AdaptivePolling',
+    'DeltaCursor',
+]
@@ -0,0 +1,86 @@
+"""
+Best-effort server-side cancellation for waits that give up on a job.
+
+A crawl or batch scrape keeps running (and using credits and concurrency
+slots) after its local wait times out or its asyncio task is cancelled. With
+``cancel_on_timeout=True`` the waiters send the job's DELETE within
+``CANCEL_TIMEOUT`` seconds. Failures are logged, never raised. The
+``cancel.requested``/``cancel.succeeded``/``cancel.failed`` metrics record
+each outcome.
+
+Only a job whose ID came back can be cancelled: if the deadline cuts off the
+start request itself, the server may still have created the job, and that is
+recorded as a failed cancel.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from .deadline import Deadline
+
+logger = logging.getLogger("firecrawl")
+
+CANCEL_TIMEOUT = 5.0
+
+
+def _record(client: Any, job_id: Optional[str], reason: str, cancelled: bool, error: Optional[BaseException]) -> None:
+    metrics = getattr(client, "metrics", None)
+    if metrics is not None:
+        metrics.increment("cancel.requested")
+        metrics.increment("cancel.succeeded" if cancelled else "cancel.failed")
+    if cancelled:
+        logger.info("Cancelled job after local %s", reason, extra={"job": job_id})
+    else:
+        logger.warning(
+            "Could not cancel job after local %s", reason,
+            extra={"job": job_id, "error": repr(error) if error is not None else None},
+        )
+
+
+def start_timed_out(client: Any, kind: str) -> bool:
+    """Record that the deadline cut off a start request, leaving no job ID to cancel; returns False."""
+    _record(client, None, f"timeout of the {kind} start request (no job ID to cancel)", False, None)
+    return False
+
+
+def cancel_remote(
+    cancel: Callable[..., bool],
+    client: Any,
+    job_id: str,
+    *,
+    reason: str = "timeout",
+    timeout: float = CANCEL_TIMEOUT,
+) -> bool:
+    """
+    Call ``cancel(client, job_id, deadline=...)`` within ``timeout`` seconds.
+
+    Returns:
+        True if the server confirmed the cancellation; False if it did not or
+        the request failed
+    """
+    error: Optional[BaseException] = None
+    try:
+        cancelled = bool(cancel(client, job_id, deadline=Deadline(timeout)))
+    except Exception as exc:
+        cancelled, error = False, exc
+    _record(client, job_id, reason, cancelled, error)
+    return cancelled
+
+
+async def acancel_remote(
+    cancel: Callable[..., Awaitable[bool]],
+    client: Any,
+    job_id: str,
+    *,
+    reason: str = "timeout",
+    timeout: float = CANCEL_TIMEOUT,
+) -> bool:
+    """Async ``cancel_remote``; also safe to await while handling ``CancelledError``."""
+    error: Optional[BaseException] = None
+    try:
+        cancelled = bool(await asyncio.wait_for(cancel(client, job_id, deadline=Deadline(timeout)), timeout))
+    except Exception as exc:
+        cancelled, error = False, exc
+    _record(client, job_id, reason, cancelled, error)
+    return cancelled
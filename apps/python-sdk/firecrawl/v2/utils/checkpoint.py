@@ -0,0 +1,109 @@
+"""
+Checkpoint stores for resumable result downloads.
+
+``iter_crawl_documents``/``iter_batch_documents`` given a ``checkpoint`` store
+save the ``next`` cursor and document count after each fully consumed page. A
+restarted worker iterating the same job picks up at that cursor instead of
+page one. Documents of a page that was only partly consumed when the worker
+died are yielded again (at-least-once per page).
+"""
+
+import abc
+import json
+import os
+import re
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+CheckpointState = Dict[str, Any]
+
+
+class CheckpointStore(abc.ABC):
+    """
+    Where download checkpoints live; subclass to persist them elsewhere (Redis, a DB row, ...).
+
+    A state is a small JSON-serializable dict: ``next`` (the cursor to resume
+    from), ``documents`` (documents consumed so far) and ``pages`` (pages
+    followed so far).
+    """
+
+    @abc.abstractmethod
+    def load(self, key: str) -> Optional[CheckpointState]:
+        """The saved state for ``key``, or None if there is none."""
+
+    @abc.abstractmethod
+    def save(self, key: str, state: CheckpointState) -> None:
+        """Store ``state`` for ``key``, replacing any previous one."""
+
+    @abc.abstractmethod
+    def clear(self, key: str) -> None:
+        """Forget ``key``; clearing a missing key is not an error."""
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Process-local store; survives a failed iteration but not a process restart."""
+
+    def __init__(self) -> None:
+        self._states: Dict[str, CheckpointState] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[CheckpointState]:
+        with self._lock:
+            state = self._states.get(key)
+            return dict(state) if state is not None else None
+
+    def save(self, key: str, state: CheckpointState) -> None:
+        with self._lock:
+            self._states[key] = dict(state)
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._states.pop(key, None)
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    One small JSON file per job in ``directory``.
+
+    Files are written to a temporary name and atomically renamed, so a crash
+    mid-write leaves the previous checkpoint intact.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, re.sub(r"[^A-Za-z0-9_.-]", "_", key) + ".json")
+
+    def load(self, key: str) -> Optional[CheckpointState]:
+        try:
+            with open(self.path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # Unreadable checkpoint: start over rather than fail the download
+            return None
+
+    def save(self, key: str, state: CheckpointState) -> None:
+        fd, tmp = tempfile.mkstemp(prefix=".checkpoint-", dir=self.directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def clear(self, key: str) -> None:
+        try:
+            os.unlink(self.path(key))
+        except FileNotFoundError:
+            pass
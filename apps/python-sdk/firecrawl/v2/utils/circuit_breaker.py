@@ -0,0 +1,269 @@
+"""
+Per-endpoint-family circuit breakers for the v2 HTTP layer.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from .endpoints import endpoint_family
+from .error_handler import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+StateChangeHook = Callable[[str, str, str], None]
+
+
+class Circuit:
+    """
+    Breaker state for one endpoint family.
+
+    While ``closed`` the outcomes of the last ``window`` calls are kept; once
+    at least ``min_calls`` have been seen and the share of failures (transport
+    errors and 5xx) or of calls slower than ``slow_call_duration`` reaches its
+    threshold, the circuit opens. An open circuit rejects calls for
+    ``open_duration`` seconds, then goes ``half_open`` and lets
+    ``half_open_probes`` calls through: if they all succeed it closes again,
+    any failure reopens it.
+
+    Every transition starts a new epoch. Calls are tagged with the epoch they
+    were admitted in, and outcomes from an earlier epoch are ignored, so a
+    slow call admitted before the circuit opened does not count as a probe.
+    """
+
+    def __init__(
+        self,
+        family: str,
+        *,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate_threshold: float = 0.8,
+        window: int = 20,
+        min_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_probes: int = 1,
+    ) -> None:
+        self.family = family
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.half_open_probes = half_open_probes
+        self.state = CLOSED
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def _transition(self, new_state: str, now: float) -> Tuple[str, str]:
+        old_state, self.state = self.state, new_state
+        self._epoch += 1
+        if new_state == OPEN:
+            self._opened_at = now
+        self._outcomes.clear()
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        return old_state, new_state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.open_duration - time.monotonic())
+
+    def allow(self) -> Tuple[bool, Optional[Tuple[str, str]]]:
+        """
+        Admit or reject one call.
+
+        Returns whether the call may proceed and the ``(old, new)`` state
+        transition it caused, if any. Admitted calls must be reported with
+        ``record`` (or ``release`` if no outcome was observed).
+        """
+        allowed, change, _ = self.admit()
+        return allowed, change
+
+    def admit(self) -> Tuple[bool, Optional[Tuple[str, str]], int]:
+        """``allow()`` plus the epoch the call was admitted in, to pass to ``record``/``release``."""
+        with self._lock:
+            now = time.monotonic()
+            change = None
+            if self.state == OPEN:
+                if now - self._opened_at < self.open_duration:
+                    return False, None, self._epoch
+                change = self._transition(HALF_OPEN, now)
+            if self.state == HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_probes:
+                    return False, change, self._epoch
+                self._probes_in_flight += 1
+            return True, change, self._epoch
+
+    def release(self, epoch: Optional[int] = None) -> None:
+        """Return a half-open probe slot taken by a call that produced no outcome."""
+        with self._lock:
+            if epoch is not None and epoch != self._epoch:
+                return
+            if self.state == HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
+
+    def record(self, success: bool, latency: float, epoch: Optional[int] = None) -> Optional[Tuple[str, str]]:
+        """
+        Record the outcome of an admitted call; returns the state transition it caused, if any.
+
+        ``epoch`` is the one ``admit`` returned for the call; outcomes of calls
+        admitted before the last transition are ignored. Without it the call is
+        assumed to belong to the current epoch.
+        """
+        slow = self.slow_call_duration is not None and latency >= self.slow_call_duration
+        with self._lock:
+            now = time.monotonic()
+            if epoch is not None and epoch != self._epoch:
+                # Admitted under an earlier state, e.g. before the circuit opened
+                return None
+            if self.state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if not success or slow:
+                    return self._transition(OPEN, now)
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_probes:
+                    return self._transition(CLOSED, now)
+                return None
+            if self.state == OPEN:
+                # A call admitted before the circuit opened
+                return None
+
+            self._outcomes.append((not success, slow))
+            total = len(self._outcomes)
+            if total < self.min_calls:
+                return None
+            failures = sum(1 for failed, _ in self._outcomes if failed)
+            slow_calls = sum(1 for _, was_slow in self._outcomes if was_slow)
+            if failures / total >= self.failure_rate_threshold or (
+                self.slow_call_duration is not None and slow_calls / total >= self.slow_call_rate_threshold
+            ):
+                return self._transition(OPEN, now)
+            return None
+
+
+class CircuitBreaker:
+    """
+    Circuit breakers keyed by endpoint family, shared by every request of a client.
+
+    ``families`` restricts breaking to the given families (see
+    ``endpoint_family``: ``scrape``, ``crawl_status``, ...); all families are
+    covered when it is None. Remaining keyword arguments configure each
+    ``Circuit``. ``on_state_change(family, old_state, new_state)`` hooks are
+    called outside the breaker's locks on every transition, e.g. for alerting.
+
+    While a family's circuit is open, requests to it raise ``CircuitOpenError``
+    before anything is sent, including retries of an in-progress request.
+    """
+
+    def __init__(
+        self,
+        *,
+        families: Optional[Iterable[str]] = None,
+        on_state_change: Optional[StateChangeHook] = None,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate_threshold: float = 0.8,
+        window: int = 20,
+        min_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_probes: int = 1,
+    ) -> None:
+        if not 0 < failure_rate_threshold <= 1 or not 0 < slow_call_rate_threshold <= 1:
+            raise ValueError("rate thresholds must be in (0, 1]")
+        if window < 1 or min_calls < 1 or half_open_probes < 1:
+            raise ValueError("window, min_calls and half_open_probes must be at least 1")
+        self.families = set(families) if families is not None else None
+        self._hooks: List[StateChangeHook] = [on_state_change] if on_state_change else []
+        self._settings = dict(
+            failure_rate_threshold=failure_rate_threshold,
+            slow_call_duration=slow_call_duration,
+            slow_call_rate_threshold=slow_call_rate_threshold,
+            window=window,
+            min_calls=min_calls,
+            open_duration=open_duration,
+            half_open_probes=half_open_probes,
+        )
+        self._circuits: Dict[str, Circuit] = {}
+        self._lock = threading.Lock()
+
+    def add_state_change_hook(self, hook: StateChangeHook) -> None:
+        """Register ``hook(family, old_state, new_state)``."""
+        self._hooks.append(hook)
+
+    def circuit(self, endpoint: str) -> Optional[Circuit]:
+        """Return the circuit guarding ``endpoint``, or None if its family is not covered."""
+        family = endpoint_family(endpoint)
+        circuit = self._circuits.get(family)
+        if circuit is not None:
+            return circuit
+        if self.families is not None and family not in self.families:
+            return None
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None:
+                circuit = Circuit(family, **self._settings)
+                self._circuits[family] = circuit
+        return circuit
+
+    def state(self, endpoint_or_family: str) -> str:
+        """Current state for an endpoint path or family name (``closed`` if never used)."""
+        circuit = self._circuits.get(endpoint_or_family) or self._circuits.get(endpoint_family(endpoint_or_family))
+        return circuit.state if circuit is not None else CLOSED
+
+    def _notify(self, family: str, change: Optional[Tuple[str, str]]) -> None:
+        if change is None:
+            return
+        for hook in list(self._hooks):
+            hook(family, change[0], change[1])
+
+    def before_request(self, endpoint: str) -> Optional[int]:
+        """
+        Admit a request to ``endpoint``.
+
+        Returns the epoch the request was admitted in (None if its family is
+        not covered); pass it to ``record``/``release`` for the request.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open (or its half-open probes are taken)
+        """
+        circuit = self.circuit(endpoint)
+        if circuit is None:
+            return None
+        allowed, change, epoch = circuit.admit()
+        self._notify(circuit.family, change)
+        if not allowed:
+            retry_after = circuit.retry_after()
+            raise CircuitOpenError(
+                f"Circuit open for '{circuit.family}' endpoints; failing fast"
+                + (f" (retry in {retry_after:.1f}s)" if retry_after else ""),
+                family=circuit.family,
+                retry_after=retry_after,
+            )
+        return epoch
+
+    def record(self, endpoint: str, success: bool, latency: float, epoch: Optional[int] = None) -> None:
+        """Report the outcome of an admitted request (``epoch`` as returned by ``before_request``)."""
+        circuit = self.circuit(endpoint)
+        if circuit is not None:
+            self._notify(circuit.family, circuit.record(success, latency, epoch))
+
+    def release(self, endpoint: str, epoch: Optional[int] = None) -> None:
+        """Release an admitted request that ended without an outcome (e.g. cancelled)."""
+        circuit = self.circuit(endpoint)
+        if circuit is not None:
+            circuit.release(epoch)
+
+    @staticmethod
+    def is_failure(status_code: int) -> bool:
+        """Server-side failures that count against a circuit (5xx)."""
+        return status_code >= 500
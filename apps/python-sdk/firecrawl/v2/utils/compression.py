@@ -0,0 +1,54 @@
+"""
+Content-encoding negotiation and request-body compression for the v2 HTTP clients.
+"""
+
+import gzip
+from typing import Iterable, List, Optional, Tuple
+
+# Most compact first; servers pick the first coding they support
+_PREFERENCE = ("zstd", "br", "gzip", "deflate")
+
+
+def _supported(decoders: Iterable[str]) -> List[str]:
+    available = set(decoders)
+    return [coding for coding in _PREFERENCE if coding in available]
+
+
+def requests_encodings() -> List[str]:
+    """Content codings the installed urllib3 can decode (``br``/``zstd`` need brotli/zstandard)."""
+    try:
+        from urllib3.response import HTTPResponse
+
+        return _supported(HTTPResponse.CONTENT_DECODERS)
+    except (ImportError, AttributeError):
+        return ["gzip", "deflate"]
+
+
+def httpx_encodings() -> List[str]:
+    """Content codings the installed httpx can decode (``br``/``zstd`` need brotli/zstandard)."""
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+
+        return _supported(SUPPORTED_DECODERS)
+    except (ImportError, AttributeError):
+        return ["gzip", "deflate"]
+
+
+def accept_encoding(encodings: Iterable[str]) -> str:
+    return ", ".join(encodings)
+
+
+def compress_body(body: bytes, threshold: Optional[int]) -> Tuple[bytes, Optional[str]]:
+    """
+    Gzip ``body`` if it is at least ``threshold`` bytes.
+
+    Returns the (possibly unchanged) body and the ``Content-Encoding`` to send,
+    or None when the body was left as-is (threshold disabled, body too small,
+    or compression did not make it smaller).
+    """
+    if threshold is None or len(body) < threshold:
+        return body, None
+    compressed = gzip.compress(body, compresslevel=6, mtime=0)
+    if len(compressed) >= len(body):
+        return body, None
+    return compressed, "gzip"
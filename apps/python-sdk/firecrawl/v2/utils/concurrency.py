@@ -0,0 +1,336 @@
+"""
+Adaptive client-side concurrency control for fan-out workloads.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import httpx
+import requests
+
+from ..types import ConcurrencyCheck
+from .error_handler import CircuitOpenError, RateLimitError, RequestTimeoutError
+from .metrics import ClientMetrics
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_OVERLOAD_ERRORS = (
+    RateLimitError,
+    CircuitOpenError,
+    RequestTimeoutError,
+    requests.Timeout,
+    httpx.TimeoutException,
+    TimeoutError,
+    asyncio.TimeoutError,
+)
+
+# Latency differences below this are jitter, not congestion
+_LATENCY_NOISE = 0.01
+
+
+class ConcurrencyController:
+    """
+    AIMD limiter handing out slots to threads and asyncio tasks.
+
+    - The limit grows by ``increase_step`` after a full window of successful
+      slots (one window is ``limit`` completions) while the error rate stays
+      below ``max_error_rate`` and the smoothed latency stays within
+      ``latency_tolerance`` times the best latency observed.
+    - A 429 (``RateLimitError``) or a timeout multiplies the limit by
+      ``decrease_factor``. Only slots acquired since the last decrease can
+      trigger another one, so a burst of failures from the same wave backs off
+      once rather than collapsing the limit to ``min_limit``.
+    - The upper bound follows the team's ``max_concurrency`` from
+      ``/v2/concurrency-check``: pass ``refresh`` (or ``async_refresh``) and the
+      controller re-syncs every ``refresh_interval`` seconds.
+
+    Use ``slot()`` from threads and ``async_slot()`` from tasks; both can share
+    one controller.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        *,
+        min_limit: int = 1,
+        max_limit: Optional[int] = None,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        max_error_rate: float = 0.05,
+        latency_tolerance: float = 2.0,
+        refresh: Optional[Callable[[], ConcurrencyCheck]] = None,
+        async_refresh: Optional[Callable[[], Awaitable[ConcurrencyCheck]]] = None,
+        refresh_interval: float = 60.0,
+        metrics: Optional[ClientMetrics] = None,
+    ) -> None:
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.max_error_rate = max_error_rate
+        self.latency_tolerance = latency_tolerance
+        self.refresh_interval = refresh_interval
+        self.metrics = metrics or ClientMetrics()
+        self._refresh = refresh
+        self._async_refresh = async_refresh
+        self._next_refresh = time.monotonic() + refresh_interval
+
+        self._limit = float(self._clamp(initial_limit))
+        self._in_flight = 0
+        self._epoch = 0
+        self._successes = 0
+        self._error_rate = 0.0
+        self._latency: Optional[float] = None
+        self._best_latency: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current number of slots that may be held at once."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _clamp(self, limit: float) -> float:
+        if self.max_limit is not None:
+            limit = min(limit, self.max_limit)
+        return max(float(self.min_limit), limit)
+
+    # ---- server sync ----
+
+    def update_from_server(self, check: ConcurrencyCheck, *, seed: bool = False) -> None:
+        """
+        Apply a ``/v2/concurrency-check`` result.
+
+        ``max_concurrency`` becomes the upper bound; with ``seed=True`` the limit
+        is also reset to the team's current headroom.
+        """
+        with self._lock:
+            if check.max_concurrency:
+                self.max_limit = max(self.min_limit, int(check.max_concurrency))
+            if seed:
+                headroom = (check.max_concurrency or self.min_limit) - (check.concurrency or 0)
+                self._limit = self._clamp(headroom)
+            else:
+                self._limit = self._clamp(self._limit)
+            self.metrics.increment("concurrency.refreshes")
+            self._wake_locked()
+
+    def _refresh_due(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_refresh:
+                return False
+            # Claim this refresh so concurrent callers don't all hit the API
+            self._next_refresh = now + self.refresh_interval
+            return True
+
+    def maybe_refresh(self) -> None:
+        """Re-sync with the server if ``refresh_interval`` has elapsed."""
+        if self._refresh is None or not self._refresh_due():
+            return
+        try:
+            self.update_from_server(self._refresh())
+        except Exception:
+            self.metrics.increment("concurrency.refresh_errors")
+
+    async def maybe_refresh_async(self) -> None:
+        """Async variant of ``maybe_refresh``; falls back to running ``refresh`` in an executor."""
+        if (self._async_refresh is None and self._refresh is None) or not self._refresh_due():
+            return
+        try:
+            if self._async_refresh is not None:
+                check = await self._async_refresh()
+            else:
+                check = await asyncio.get_running_loop().run_in_executor(None, self._refresh)
+            self.update_from_server(check)
+        except Exception:
+            self.metrics.increment("concurrency.refresh_errors")
+
+    # ---- slot accounting ----
+
+    def _try_acquire_locked(self) -> bool:
+        if self._in_flight < int(self._limit):
+            self._in_flight += 1
+            return True
+        return False
+
+    def _wake_locked(self) -> None:
+        # Hand free slots straight to async waiters, then let blocked threads compete
+        while self._async_waiters and self._in_flight < int(self._limit):
+            loop, fut = self._async_waiters.popleft()
+            self._in_flight += 1
+            loop.call_soon_threadsafe(self._grant, fut)
+        self._cond.notify_all()
+
+    def _grant(self, fut: "asyncio.Future[None]") -> None:
+        if fut.cancelled():
+            self._release()
+        else:
+            fut.set_result(None)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._wake_locked()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a slot is free; returns False if ``timeout`` elapses first."""
+        with self._cond:
+            acquired = self._cond.wait_for(self._try_acquire_locked, timeout)
+        if acquired:
+            self.metrics.increment("concurrency.acquired")
+        return acquired
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a slot is free."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_acquire_locked():
+                self.metrics.increment("concurrency.acquired")
+                return
+            fut: "asyncio.Future[None]" = loop.create_future()
+            self._async_waiters.append((loop, fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._async_waiters.remove((loop, fut))
+                except ValueError:
+                    pass
+            if fut.done() and not fut.cancelled():
+                self._release()
+            raise
+        self.metrics.increment("concurrency.acquired")
+
+    # ---- AIMD feedback ----
+
+    def _record(self, epoch: int, started: float, exc: Optional[BaseException]) -> None:
+        latency = time.monotonic() - started
+        with self._lock:
+            failed = exc is not None
+            self._error_rate = 0.9 * self._error_rate + (0.1 if failed else 0.0)
+
+            if isinstance(exc, _OVERLOAD_ERRORS):
+                if epoch == self._epoch:
+                    self._epoch += 1
+                    self._successes = 0
+                    self._limit = self._clamp(self._limit * self.decrease_factor)
+                    self.metrics.increment("concurrency.decreases")
+                return
+            if failed:
+                return
+
+            self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+            if self._best_latency is None or latency < self._best_latency:
+                self._best_latency = latency
+
+            self._successes += 1
+            healthy = self._error_rate <= self.max_error_rate and (
+                self._latency <= self._best_latency * self.latency_tolerance + _LATENCY_NOISE
+            )
+            if healthy and self._successes >= int(self._limit):
+                self._successes = 0
+                new_limit = self._clamp(self._limit + self.increase_step)
+                if new_limit > self._limit:
+                    self._limit = new_limit
+                    self.metrics.increment("concurrency.increases")
+                    self._wake_locked()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one slot for the duration of the block and learn from its outcome."""
+        self.maybe_refresh()
+        self.acquire()
+        epoch, started = self._epoch, time.monotonic()
+        try:
+            yield
+        except BaseException as exc:
+            self._record(epoch, started, exc)
+            raise
+        else:
+            self._record(epoch, started, None)
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Async counterpart of ``slot()``."""
+        await self.maybe_refresh_async()
+        await self.acquire_async()
+        epoch, started = self._epoch, time.monotonic()
+        try:
+            yield
+        except BaseException as exc:
+            self._record(epoch, started, exc)
+            raise
+        else:
+            self._record(epoch, started, None)
+        finally:
+            self._release()
+
+
+def run_concurrently(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    controller: ConcurrencyController,
+    *,
+    max_workers: int = 32,
+) -> List[R]:
+    """
+    Call ``fn`` on every item from a thread pool, gated by ``controller``.
+
+    Results are returned in input order; the first exception raised by ``fn``
+    is re-raised after all calls finish.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def call(item: T) -> R:
+        with controller.slot():
+            return fn(item)
+
+    workers = min(len(items), max(max_workers, controller.min_limit))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(call, item) for item in items]
+    return [f.result() for f in futures]
+
+
+async def run_concurrently_async(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    controller: ConcurrencyController,
+) -> List[R]:
+    """Await ``fn`` on every item concurrently, gated by ``controller``; results keep input order."""
+
+    async def call(item: T) -> R:
+        async with controller.async_slot():
+            return await fn(item)
+
+    return await asyncio.gather(*(call(item) for item in items))
@@ -0,0 +1,85 @@
+"""
+End-to-end deadlines for multi-request operations (start, poll, paginate).
+"""
+
+import time
+from typing import Optional, Tuple
+
+import httpx
+
+
+class DeadlineExceededError(TimeoutError):
+    """
+    Raised when an operation's deadline passes before it completes.
+
+    Waits run with ``cancel_on_timeout=True`` set ``remote_cancelled`` to
+    whether the server confirmed cancelling the job.
+    """
+
+    remote_cancelled: Optional[bool] = None
+
+
+class Deadline:
+    """
+    An absolute time budget shared by every HTTP call of one operation.
+
+    Each call gets a connect timeout of at most ``connect_timeout`` and a read
+    timeout equal to the remaining budget, so a hung socket can never outlive
+    the operation. An unbounded deadline (``timeout=None``) leaves calls
+    without a timeout, as before.
+    """
+
+    def __init__(self, timeout: Optional[float], *, connect_timeout: float = 10.0) -> None:
+        if timeout is not None and timeout < 0:
+            raise ValueError("timeout must be non-negative")
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.expires_at: Optional[float] = time.monotonic() + timeout if timeout is not None else None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None when unbounded."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def check(self, action: str = "operation") -> None:
+        """
+        Raises:
+            DeadlineExceededError: If the deadline has passed
+        """
+        if self.expired():
+            raise self.error(action)
+
+    def error(self, action: str = "operation") -> DeadlineExceededError:
+        return DeadlineExceededError(f"Deadline of {self.timeout} seconds exceeded during {action}")
+
+    def fits(self, seconds: float) -> bool:
+        """True if something starting after ``seconds`` (e.g. a retry backoff) still starts in time."""
+        remaining = self.remaining()
+        return remaining is None or remaining > seconds
+
+    def clip(self, seconds: float) -> float:
+        """``seconds`` capped to the remaining budget (for poll and backoff sleeps)."""
+        remaining = self.remaining()
+        return seconds if remaining is None else min(seconds, remaining)
+
+    def request_timeout(self) -> Optional[Tuple[float, float]]:
+        """``(connect, read)`` timeouts for ``requests``, or None when unbounded."""
+        remaining = self.remaining()
+        if remaining is None:
+            return None
+        # A zero timeout means "no timeout" to some transports; keep it strictly positive
+        remaining = max(remaining, 0.001)
+        return min(self.connect_timeout, remaining), remaining
+
+    def httpx_timeout(self) -> Optional[httpx.Timeout]:
+        """The same budget as an ``httpx.Timeout`` (write and pool waits share the read budget)."""
+        timeouts = self.request_timeout()
+        if timeouts is None:
+            return None
+        connect, read = timeouts
+        return httpx.Timeout(read, connect=connect)
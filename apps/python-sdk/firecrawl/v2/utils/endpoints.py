@@ -0,0 +1,41 @@
+"""
+Endpoint classification helpers for the v2 HTTP layer.
+"""
+
+import re
+from urllib.parse import urlparse
+
+_VERSION_SEGMENT = re.compile(r"v\d+")
+_USAGE_ENDPOINTS = {"team", "concurrency-check"}
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    Group an endpoint path (or absolute URL) into a coarse family.
+
+    Job submissions map to the resource name and job lookups (status polls,
+    pagination, errors, cancellation) to ``<resource>_status``:
+
+    - ``/v2/scrape`` -> ``scrape``; ``/v2/search`` -> ``search``; ``/v2/map`` -> ``map``
+    - ``/v2/crawl`` and ``/v2/crawl/params-preview`` -> ``crawl``
+    - ``/v2/crawl/{id}``, ``/v2/crawl/{id}/errors``, ``/v2/crawl/active`` -> ``crawl_status``
+    - ``/v2/batch/scrape`` -> ``batch``; ``/v2/batch/scrape/{id}`` -> ``batch_status``
+    - ``/v2/extract`` -> ``extract``; ``/v2/extract/{id}`` -> ``extract_status``
+    - ``/v2/team/*`` and ``/v2/concurrency-check`` -> ``usage``
+    """
+    parts = [p for p in urlparse(endpoint).path.split("/") if p]
+    if parts and _VERSION_SEGMENT.fullmatch(parts[0]):
+        parts = parts[1:]
+    if not parts:
+        return "root"
+
+    if parts[0] == "batch" and len(parts) > 1:
+        name, rest = "batch", parts[2:]
+    else:
+        name, rest = parts[0], parts[1:]
+
+    if name in _USAGE_ENDPOINTS:
+        return "usage"
+    if not rest or rest[0] == "params-preview":
+        return name
+    return f"{name}_status"
@@ -51,6 +51,28 @@ class InternalServerError(FirecrawlError):
     pass
 
 
+class CircuitOpenError(FirecrawlError):
+    """Raised without sending a request while the endpoint's circuit breaker is open."""
+
+    def __init__(self, message: str, family: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.family = family
+        self.retry_after = retry_after
+
+
+class IdempotencyConflictError(FirecrawlError):
+    """
+    Raised when a retried request is rejected with 409 because its idempotency key was already used.
+
+    An earlier attempt (one that timed out or got a 5xx) was in fact accepted,
+    so the job it started exists. The API does not return that job's ID.
+    """
+
+    def __init__(self, message: str, idempotency_key: str, status_code: Optional[int] = 409, response: Any = None):
+        super().__init__(message, status_code, response)
+        self.idempotency_key = idempotency_key
+
+
 def handle_response_error(response: requests.Response, action: str) -> None:
     """
     Handle API response errors and raise appropriate exceptions.
@@ -0,0 +1,190 @@
+"""
+Hedged requests: re-issue a slow call once it exceeds a latency percentile.
+
+The first attempt starts immediately. If it has not finished after the
+policy's delay (a percentile of recently observed latencies), an identical
+hedge is sent and whichever succeeds first wins. Async losers are cancelled;
+a sync loser cannot be interrupted mid-request, so it finishes on its worker
+thread and its result is discarded.
+
+Metrics (``hedge.*`` in ``ClientMetrics``):
+
+- ``hedge.calls``: hedged calls made
+- ``hedge.sent``: duplicate requests issued
+- ``hedge.won``: calls answered by the hedge rather than the original
+- ``hedge.latency_saved_seconds``: estimated time saved by winning hedges,
+  from the latencies observed above the hedge delay
+"""
+
+import asyncio
+import bisect
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Awaitable, Callable, Deque, List, Optional, TypeVar
+
+from .metrics import ClientMetrics
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """
+    When to hedge, learned from a sliding window of call latencies.
+
+    Args:
+        percentile: Hedge once a call is slower than this fraction of recent calls
+        window: Number of recent latencies kept
+        min_samples: Samples needed before the percentile is trusted;
+            ``initial_delay`` is used until then
+        initial_delay: Hedge delay in seconds while warming up
+        min_delay: Lower bound on the delay (avoids doubling fast calls)
+        max_delay: Upper bound on the delay (None for no bound)
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        *,
+        window: int = 256,
+        min_samples: int = 20,
+        initial_delay: float = 2.0,
+        min_delay: float = 0.05,
+        max_delay: Optional[float] = None,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if window < 1 or min_samples < 1:
+            raise ValueError("window and min_samples must be at least 1")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a completed attempt."""
+        with self._lock:
+            self._samples.append(latency)
+
+    def _sorted(self) -> List[float]:
+        with self._lock:
+            return sorted(self._samples)
+
+    def delay(self) -> float:
+        """Seconds to wait for the first attempt before sending a hedge."""
+        samples = self._sorted()
+        if len(samples) < self.min_samples:
+            value = self.initial_delay
+        else:
+            value = samples[min(len(samples) - 1, int(self.percentile * len(samples)))]
+        value = max(value, self.min_delay)
+        if self.max_delay is not None:
+            value = min(value, self.max_delay)
+        return value
+
+    def expected_latency(self, at_least: float) -> float:
+        """Mean recent latency among calls slower than ``at_least`` (``at_least`` if none were)."""
+        samples = self._sorted()
+        slow = samples[bisect.bisect_right(samples, at_least):]
+        return sum(slow) / len(slow) if slow else at_least
+
+
+def _record_win(policy: HedgePolicy, metrics: ClientMetrics, elapsed: float) -> None:
+    metrics.increment("hedge.won")
+    # The original was still running at ``elapsed``; estimate how much longer it had left
+    saved = policy.expected_latency(elapsed) - elapsed
+    if saved > 0:
+        metrics.increment("hedge.latency_saved_seconds", saved)
+
+
+def _start_thread(fn: Callable[[], T], policy: HedgePolicy) -> "Future[T]":
+    future: "Future[T]" = Future()
+    future.set_running_or_notify_cancel()
+
+    def run() -> None:
+        started = time.monotonic()
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            policy.record(time.monotonic() - started)
+            future.set_result(result)
+
+    threading.Thread(target=run, name="firecrawl-hedge", daemon=True).start()
+    return future
+
+
+def hedged_call(fn: Callable[[], T], policy: HedgePolicy, metrics: ClientMetrics) -> T:
+    """
+    Call ``fn`` with a hedge: a second ``fn()`` starts if the first exceeds ``policy.delay()``.
+
+    ``fn`` must be safe to run twice concurrently. The first successful result
+    is returned; if every attempt fails, the original attempt's error is raised.
+    """
+    metrics.increment("hedge.calls")
+    started = time.monotonic()
+    primary = _start_thread(fn, policy)
+    done, _ = wait([primary], timeout=policy.delay())
+    if done:
+        return primary.result()
+
+    metrics.increment("hedge.sent")
+    hedge = _start_thread(fn, policy)
+    pending = {primary, hedge}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                if future is hedge:
+                    _record_win(policy, metrics, time.monotonic() - started)
+                return future.result()
+    return primary.result()
+
+
+async def _timed(fn: Callable[[], Awaitable[T]], policy: HedgePolicy) -> T:
+    started = time.monotonic()
+    result = await fn()
+    policy.record(time.monotonic() - started)
+    return result
+
+
+async def hedged_call_async(
+    fn: Callable[[], Awaitable[T]], policy: HedgePolicy, metrics: ClientMetrics
+) -> T:
+    """Async ``hedged_call``: ``fn`` is a coroutine factory and the losing attempt is cancelled."""
+    metrics.increment("hedge.calls")
+    started = time.monotonic()
+    primary = asyncio.ensure_future(_timed(fn, policy))
+    tasks = [primary]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=policy.delay())
+        if done:
+            return primary.result()
+
+        metrics.increment("hedge.sent")
+        hedge = asyncio.ensure_future(_timed(fn, policy))
+        tasks.append(hedge)
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is hedge:
+                        elapsed = time.monotonic() - started
+                        _record_win(policy, metrics, elapsed)
+                        # The cancelled original took at least this long; keep the tail visible
+                        policy.record(elapsed)
+                    return task.result()
+        return primary.result()
+    finally:
+        # Cancel the loser (or both attempts if the caller itself was cancelled)
+        unfinished = [task for task in tasks if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
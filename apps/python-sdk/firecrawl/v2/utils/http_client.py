@@ -2,20 +2,202 @@
 HTTP client utilities for v2 API.
 """
 
+import threading
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from urllib.parse import urlparse, urlunparse, urljoin
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 from .get_version import get_version
+from . import compression, json_codec
+from .transport import UnixSocketAdapter, mount_prefix, unix_socket_path
+from .metrics import ClientMetrics
+from .rate_limit import RateLimiter
+from .circuit_breaker import CircuitBreaker
+from .error_handler import CircuitOpenError, IdempotencyConflictError
+from .deadline import Deadline
+from .retry import RetryDecision, RetryPolicy, idempotency_key, parse_retry_after
+from . import warmup as warmup_steps
+from ..types import WarmupReport
 
 version = get_version()
 
+
+def _is_connect_error(exc: requests.RequestException) -> bool:
+    """True if the request failed before any bytes reached the server."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    if isinstance(exc, requests.ConnectionError):
+        reason = getattr(exc.args[0], "reason", None) if exc.args else None
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
 class HttpClient:
-    """HTTP client with retry logic and error handling."""
-    
-    def __init__(self, api_key: str, api_url: str):
+    """
+    HTTP client with connection pooling, retry logic and error handling.
+
+    All requests go through a single ``requests.Session`` so TCP/TLS connections
+    are kept alive and reused across scrapes, status polls and pagination hops.
+    The underlying urllib3 pool is thread-safe, so one client can be shared by a
+    thread pool. Call ``close()`` (or use the client as a context manager) to
+    release pooled connections; a closed client transparently reopens its
+    session on the next request.
+
+    ``Accept-Encoding`` advertises every coding urllib3 can decode (gzip,
+    deflate, plus br/zstd when brotli/zstandard are installed) and the wire vs.
+    decoded sizes of requests and responses are recorded in ``metrics``
+    (``bytes.request.*`` / ``bytes.response.*``).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str,
+        *,
+        pool_connections: int = 10,
+        max_connections_per_host: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics: Optional[ClientMetrics] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        request_compression_threshold: Optional[int] = None,
+        transport: Optional[Union[str, BaseAdapter]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        """
+        Initialize the HTTP client.
+
+        Args:
+            api_key: Firecrawl API key
+            api_url: Base URL for the Firecrawl API
+            pool_connections: Number of per-host connection pools to cache
+            max_connections_per_host: Maximum number of connections kept per host
+            pool_block: Block when the per-host pool is exhausted instead of opening
+                extra, non-pooled connections
+            keep_alive: Keep connections open between requests (sends ``Connection: close`` when False)
+            retry_policy: Retry behaviour for failed requests (defaults to ``RetryPolicy()``)
+            metrics: Counter registry for request/retry statistics
+            rate_limiter: Client-side per-endpoint rate limiter; requests wait for a
+                token before every attempt and 429s slow the endpoint down
+            request_compression_threshold: Gzip JSON request bodies of at least this
+                many bytes (None sends them uncompressed)
+            transport: ``unix:///path/to.sock`` to reach a colocated API over a Unix
+                domain socket, or a ``requests`` adapter to mount for ``api_url``
+            circuit_breaker: Per-endpoint-family breaker; while a family's circuit is
+                open its requests raise ``CircuitOpenError`` without being sent
+        """
         self.api_key = api_key
         self.api_url = api_url
+        self.pool_connections = pool_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.metrics = metrics or ClientMetrics()
+        self.rate_limiter = rate_limiter
+        self.request_compression_threshold = request_compression_threshold
+        self.transport = transport
+        self.circuit_breaker = circuit_breaker
+        self.unix_socket_path: Optional[str] = None
+        if isinstance(transport, str):
+            self.unix_socket_path = unix_socket_path(transport)
+            if urlparse(api_url).scheme != "http":
+                raise ValueError("Unix socket transports require a plain http:// api_url")
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.max_connections_per_host,
+            pool_block=self.pool_block,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if self.transport is not None:
+            # Only requests to the API go through the custom transport
+            if self.unix_socket_path is not None:
+                api_adapter: BaseAdapter = UnixSocketAdapter(
+                    self.unix_socket_path,
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.max_connections_per_host,
+                    pool_block=self.pool_block,
+                    max_retries=0,
+                )
+            else:
+                api_adapter = self.transport
+            session.mount(mount_prefix(self.api_url), api_adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        session.headers["Accept-Encoding"] = compression.accept_encoding(compression.requests_encodings())
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled session, created on first use."""
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+                session = self._session
+        return session
+
+    def close(self) -> None:
+        """Close the pooled session and release all kept-alive connections."""
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def warmup(self, n_connections: int = 1, *, timeout: Optional[float] = 10.0) -> WarmupReport:
+        """
+        Pay first-request costs up front.
+
+        Imports deferred modules, resolves the API host and opens
+        ``n_connections`` pooled connections to it (at most
+        ``max_connections_per_host``), so the first real request starts on a
+        connected, TLS-negotiated socket.
+
+        Args:
+            n_connections: Connections to open and park in the pool
+            timeout: Connect timeout per connection
+
+        Returns:
+            WarmupReport with the number of connections opened and the time taken per step
+
+        Raises:
+            OSError: If the host cannot be resolved or connected to
+                (``requests.ConnectionError`` for connect failures)
+        """
+        started = time.monotonic()
+        warmup_steps.warm_imports()
+        imported = time.monotonic()
+        addresses = [] if self.unix_socket_path is not None else warmup_steps.resolve_host(self.api_url)
+        resolved = time.monotonic()
+        connections = warmup_steps.open_pooled_connections(
+            self.session, self.api_url, min(n_connections, self.max_connections_per_host), timeout
+        )
+        finished = time.monotonic()
+        return WarmupReport(
+            connections=connections,
+            addresses=addresses,
+            imports_seconds=imported - started,
+            dns_seconds=resolved - imported,
+            connect_seconds=finished - resolved,
+            total_seconds=finished - started,
+        )
 
     def _build_url(self, endpoint: str) -> str:
         base = urlparse(self.api_url)
@@ -38,139 +220,263 @@ class HttpClient:
             path = ep2.path or "/"
             return urlunparse((base.scheme or "https", base.netloc, path, "", ep2.query, ""))
         return urljoin(base_str, endpoint)
-    
+
     def _prepare_headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
         """Prepare headers for API requests."""
         headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.api_key}',
         }
-        
+
         if idempotency_key:
             headers['x-idempotency-key'] = idempotency_key
-            
+
         return headers
-    
-    def post(
+
+    def _record_retry(self, reason: str) -> None:
+        self.metrics.increment("retries")
+        self.metrics.increment(f"retries.{reason}")
+
+    def _record_throttle(self, waited: float) -> None:
+        if waited > 0:
+            self.metrics.increment("rate_limit.throttled")
+            self.metrics.increment("rate_limit.wait_seconds", waited)
+
+    def _admit(self, endpoint: str) -> Optional[int]:
+        """Admit an attempt through the circuit breaker; returns the circuit epoch it was admitted in."""
+        if self.circuit_breaker is None:
+            return None
+        try:
+            return self.circuit_breaker.before_request(endpoint)
+        except CircuitOpenError:
+            self.metrics.increment("circuit.rejected")
+            raise
+
+    def _record_outcome(
+        self, endpoint: str, started: float, status_code: Optional[int] = None, epoch: Optional[int] = None
+    ) -> None:
+        """Report an attempt to the circuit breaker (``status_code`` None for transport errors)."""
+        if self.circuit_breaker is not None:
+            success = status_code is not None and not CircuitBreaker.is_failure(status_code)
+            self.circuit_breaker.record(endpoint, success, time.monotonic() - started, epoch)
+
+    def _release(self, endpoint: str, epoch: Optional[int] = None) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release(endpoint, epoch)
+
+    def _record_response_bytes(self, response: requests.Response) -> None:
+        """Count wire (possibly compressed) and decoded bytes of a fully read response."""
+        content = response.content
+        raw = getattr(response, "raw", None)
+        wire = raw.tell() if raw is not None and hasattr(raw, "tell") else None
+        if not isinstance(content, bytes) or not isinstance(wire, int):
+            return
+        self.metrics.increment("bytes.response.wire", wire)
+        self.metrics.increment("bytes.response.decoded", len(content))
+        encoding = response.headers.get("Content-Encoding")
+        if encoding:
+            self.metrics.increment(f"compression.responses.{encoding.lower()}")
+
+    def _request(
         self,
+        method: str,
         endpoint: str,
-        data: Dict[str, Any],
+        *,
+        json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
-        retries: int = 3,
-        backoff_factor: float = 0.5
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        stream: bool = False,
+        deadline: Optional[Deadline] = None
     ) -> requests.Response:
-        """Make a POST request with retry logic."""
+        """
+        Send a request over the pooled session, retrying according to ``retry_policy``.
+
+        ``retries`` (total attempts) and ``backoff_factor`` override the policy
+        defaults for this call. When retries are exhausted the last response is
+        returned (or the last transport error raised) for the caller to handle.
+        With ``stream=True`` the body is left on the socket for the caller to
+        read incrementally (and close).
+
+        A bounded ``deadline`` replaces ``timeout``: every attempt gets connect
+        and read timeouts from the remaining budget, retries that would not fit
+        are skipped, and ``DeadlineExceededError`` is raised once it has passed.
+        """
         if headers is None:
             headers = self._prepare_headers()
 
-        data['origin'] = f'python-sdk@{version}'
-            
+        body = None
+        raw_size = 0
+        if json is not None:
+            # Encode (and compress) once; retries resend the same bytes
+            body = json_codec.dumps(json)
+            raw_size = len(body)
+            if not any(k.lower() == "content-type" for k in headers):
+                headers = {**headers, "Content-Type": "application/json"}
+            body, content_encoding = compression.compress_body(body, self.request_compression_threshold)
+            if content_encoding:
+                headers = {**headers, "Content-Encoding": content_encoding}
+
         url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
+        policy = self.retry_policy
+        idempotent = policy.is_idempotent(method, headers)
+        key = idempotency_key(headers) if method.upper() == "POST" else None
+        policy.on_request()
+        self.metrics.increment("requests")
+
+        attempt = 0
+        while True:
+            if deadline is not None:
+                deadline.check(f"{method} {endpoint}")
+            epoch = self._admit(endpoint)
+            if self.rate_limiter is not None:
+                try:
+                    self._record_throttle(self.rate_limiter.acquire(endpoint))
+                except BaseException:
+                    self._release(endpoint, epoch)
+                    raise
+            if body is not None:
+                self.metrics.increment("bytes.request.raw", raw_size)
+                self.metrics.increment("bytes.request.wire", len(body))
+            attempt_timeout = timeout
+            if deadline is not None and deadline.remaining() is not None:
+                attempt_timeout = deadline.request_timeout()
+            started = time.monotonic()
             try:
-                response = requests.post(
+                response = self.session.request(
+                    method,
                     url,
                     headers=headers,
-                    json=data,
-                    timeout=timeout
+                    data=body,
+                    timeout=attempt_timeout,
+                    stream=stream
+                )
+            except requests.RequestException as e:
+                self._record_outcome(endpoint, started, epoch=epoch)
+                if deadline is not None and deadline.expired():
+                    self.metrics.increment("retries.gave_up.deadline")
+                    raise deadline.error(f"{method} {endpoint}") from e
+                decision = policy.for_exception(
+                    attempt,
+                    e,
+                    idempotent=idempotent,
+                    connect_error=_is_connect_error(e),
+                    max_attempts=retries,
+                    backoff_factor=backoff_factor,
+                )
+                if decision.delay is not None and deadline is not None and not deadline.fits(decision.delay):
+                    decision = RetryDecision(None, "deadline")
+                if decision.delay is None:
+                    self.metrics.increment(f"retries.gave_up.{decision.reason}")
+                    raise
+                self._record_retry(decision.reason)
+                time.sleep(decision.delay)
+                attempt += 1
+                continue
+            except BaseException:
+                self._release(endpoint, epoch)
+                raise
+
+            self._record_outcome(endpoint, started, response.status_code, epoch)
+            retry_after = response.headers.get("Retry-After")
+            if self.rate_limiter is not None:
+                self.rate_limiter.record(endpoint, response.status_code, parse_retry_after(retry_after))
+            if attempt and key is not None and response.status_code == 409:
+                # An earlier attempt was accepted after all; its job exists but the 409 does not name it
+                self.metrics.increment("retries.idempotency_conflict")
+                raise IdempotencyConflictError(
+                    f"{method} {endpoint} was retried, but the server had already accepted an earlier attempt "
+                    f"with idempotency key {key!r}; the job it started is running and its ID was not returned",
+                    key,
+                    response.status_code,
+                    response,
                 )
 
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
+            decision = policy.for_response(
+                attempt,
+                response.status_code,
+                idempotent=idempotent,
+                retry_after=retry_after,
+                max_attempts=retries,
+                backoff_factor=backoff_factor,
+            )
+            if decision.delay is not None and deadline is not None and not deadline.fits(decision.delay):
+                decision = RetryDecision(None, "deadline")
+            if decision.delay is None:
+                if decision.reason != "not_retryable":
+                    self.metrics.increment(f"retries.gave_up.{decision.reason}")
+                if not stream:
+                    self._record_response_bytes(response)
                 return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in POST request")
-    
+
+            # Drain the body so the connection goes back to the pool
+            response.close()
+            self._record_retry(decision.reason)
+            time.sleep(decision.delay)
+            attempt += 1
+
+    def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        deadline: Optional[Deadline] = None
+    ) -> requests.Response:
+        """Make a POST request with retry logic."""
+        data['origin'] = f'python-sdk@{version}'
+        return self._request(
+            "POST",
+            endpoint,
+            json=data,
+            headers=headers,
+            timeout=timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            deadline=deadline,
+        )
+
     def get(
         self,
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
-        retries: int = 3,
-        backoff_factor: float = 0.5
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        stream: bool = False,
+        deadline: Optional[Deadline] = None
     ) -> requests.Response:
-        """Make a GET request with retry logic."""
-        if headers is None:
-            headers = self._prepare_headers()
+        """Make a GET request with retry logic (``stream=True`` defers reading the body)."""
+        return self._request(
+            "GET",
+            endpoint,
+            headers=headers,
+            timeout=timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            stream=stream,
+            deadline=deadline,
+        )
 
-        url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
-            try:
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    timeout=timeout
-                )
-                
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in GET request")
-    
     def delete(
         self,
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
-        retries: int = 3,
-        backoff_factor: float = 0.5
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        deadline: Optional[Deadline] = None
     ) -> requests.Response:
         """Make a DELETE request with retry logic."""
-        if headers is None:
-            headers = self._prepare_headers()
-            
-        url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
-            try:
-                response = requests.delete(
-                    url,
-                    headers=headers,
-                    timeout=timeout
-                )
-                
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in DELETE request")
\ No newline at end of file
+        return self._request(
+            "DELETE",
+            endpoint,
+            headers=headers,
+            timeout=timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            deadline=deadline,
+        )
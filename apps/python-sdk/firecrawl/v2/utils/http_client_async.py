@@ -1,25 +1,190 @@
+import asyncio
+import logging
+import time
 import httpx
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
+from urllib.parse import urlparse
 from .get_version import get_version
+from . import compression, json_codec
+from .transport import unix_socket_path
+from .metrics import ClientMetrics
+from .rate_limit import RateLimiter
+from .circuit_breaker import CircuitBreaker
+from .error_handler import CircuitOpenError, IdempotencyConflictError
+from .deadline import Deadline
+from .retry import RetryDecision, RetryPolicy, idempotency_key, parse_retry_after
+from . import warmup as warmup_steps
+from ..types import WarmupReport
 
 version = get_version()
 
+logger = logging.getLogger("firecrawl")
+
 
 class AsyncHttpClient:
-    def __init__(self, api_key: str, api_url: str):
+    """
+    Async HTTP client backed by a pooled ``httpx.AsyncClient``.
+
+    Connections are kept alive and shared by all in-flight requests. With
+    ``http2=True`` (requires ``pip install httpx[http2]``) concurrent scrapes and
+    status polls are multiplexed over a handful of connections.
+
+    httpx connections are bound to the event loop that opened them, so the
+    underlying client is created lazily and recreated if it is used from a
+    different loop (e.g. across separate ``asyncio.run`` calls). The replaced
+    client is closed on its own loop if that loop is still running in another
+    thread; a client whose loop has stopped cannot be closed from here, so its
+    sockets are left to the garbage collector (logged at debug level).
+
+    Failed requests are retried according to ``retry_policy``; pass the same
+    policy and ``metrics`` as a sync ``HttpClient`` to share the retry budget and
+    counters between them, and the same ``rate_limiter`` to throttle both
+    against one set of per-endpoint limits.
+
+    Responses are negotiated with every content coding httpx can decode (gzip,
+    deflate, plus br/zstd when brotli/zstandard are installed); JSON bodies of at
+    least ``request_compression_threshold`` bytes are sent gzip-compressed.
+    Wire and decoded byte counts are recorded in ``metrics``.
+
+    ``transport`` routes requests over a Unix domain socket
+    (``unix:///path/to.sock``) or a custom ``httpx.AsyncBaseTransport``; URLs are
+    still built from ``api_url``.
+
+    With a ``circuit_breaker``, requests to an endpoint family whose circuit is
+    open raise ``CircuitOpenError`` immediately; share one breaker with the sync
+    client so both see the same endpoint health.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str,
+        *,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics: Optional[ClientMetrics] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        request_compression_threshold: Optional[int] = None,
+        transport: Optional[Union[str, httpx.AsyncBaseTransport]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
         self.api_key = api_key
         self.api_url = api_url
-        self._client = httpx.AsyncClient(
-            base_url=api_url,
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.metrics = metrics or ClientMetrics()
+        self.rate_limiter = rate_limiter
+        self.request_compression_threshold = request_compression_threshold
+        self.transport = transport
+        self.circuit_breaker = circuit_breaker
+        self.unix_socket_path: Optional[str] = None
+        if isinstance(transport, str):
+            self.unix_socket_path = unix_socket_path(transport)
+            if urlparse(api_url).scheme != "http":
+                raise ValueError("Unix socket transports require a plain http:// api_url")
+        self._client_instance: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.api_url,
             headers={
-                "Authorization": f"Bearer {api_key}",
+                "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
+                "Accept-Encoding": compression.accept_encoding(compression.httpx_encodings()),
             },
-            limits=httpx.Limits(max_keepalive_connections=0),
+            limits=self.limits,
+            http2=self.http2,
+            transport=self._create_transport(),
         )
 
+    def _create_transport(self) -> Optional[httpx.AsyncBaseTransport]:
+        if self.unix_socket_path is not None:
+            return httpx.AsyncHTTPTransport(uds=self.unix_socket_path, limits=self.limits, http2=self.http2)
+        # A user-supplied transport is shared by every client this instance creates
+        return self.transport
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        client = self._client_instance
+        if client is None or client.is_closed or (loop is not None and self._client_loop is not loop):
+            # Connections owned by a previous (possibly closed) loop cannot be reused
+            if client is not None and not client.is_closed:
+                self._retire(client, self._client_loop)
+            client = self._create_client()
+            self._client_instance = client
+            self._client_loop = loop
+        return client
+
+    def _retire(self, client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Close a client replaced by one for a new loop, on the loop that owns its connections."""
+        if self.unix_socket_path is None and self.transport is not None:
+            # The user's transport is shared with the new client; closing the old one would close it too
+            return
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        logger.debug("Dropping an httpx client whose event loop has stopped; its connections are not closed")
+
     async def close(self) -> None:
-        await self._client.aclose()
+        client, self._client_instance = self._client_instance, None
+        self._client_loop = None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def warmup(self, n_connections: int = 1, *, timeout: Optional[float] = 10.0) -> WarmupReport:
+        """
+        Pay first-request costs up front (see ``HttpClient.warmup``).
+
+        httpx cannot open idle connections directly, so ``n_connections``
+        concurrent ``HEAD /`` requests are sent; each opens a connection that
+        stays in the keep-alive pool (at most ``max_keepalive_connections``).
+        With HTTP/2 they may share a single connection.
+
+        Raises:
+            OSError: If the host cannot be resolved
+            httpx.HTTPError: If the API cannot be reached
+        """
+        started = time.monotonic()
+        warmup_steps.warm_imports()
+        imported = time.monotonic()
+        addresses = [] if self.unix_socket_path is not None else await warmup_steps.resolve_host_async(self.api_url)
+        resolved = time.monotonic()
+        count = n_connections
+        for cap in (self.limits.max_keepalive_connections, self.limits.max_connections):
+            if cap is not None:
+                count = min(count, cap)
+        client = self._client
+        responses = await asyncio.gather(*(client.head("/", timeout=timeout) for _ in range(max(count, 0))))
+        for response in responses:
+            await response.aclose()
+        finished = time.monotonic()
+        return WarmupReport(
+            connections=len(responses),
+            addresses=addresses,
+            imports_seconds=imported - started,
+            dns_seconds=resolved - imported,
+            connect_seconds=finished - resolved,
+            total_seconds=finished - started,
+        )
 
     def _headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
         headers: Dict[str, str] = {}
@@ -27,20 +192,180 @@ class AsyncHttpClient:
             headers["x-idempotency-key"] = idempotency_key
         return headers
 
+    def _record_retry(self, reason: str) -> None:
+        self.metrics.increment("retries")
+        self.metrics.increment(f"retries.{reason}")
+
+    def _record_throttle(self, waited: float) -> None:
+        if waited > 0:
+            self.metrics.increment("rate_limit.throttled")
+            self.metrics.increment("rate_limit.wait_seconds", waited)
+
+    def _admit(self, endpoint: str) -> Optional[int]:
+        """Admit an attempt through the circuit breaker; returns the circuit epoch it was admitted in."""
+        if self.circuit_breaker is None:
+            return None
+        try:
+            return self.circuit_breaker.before_request(endpoint)
+        except CircuitOpenError:
+            self.metrics.increment("circuit.rejected")
+            raise
+
+    def _record_outcome(
+        self, endpoint: str, started: float, status_code: Optional[int] = None, epoch: Optional[int] = None
+    ) -> None:
+        """Report an attempt to the circuit breaker (``status_code`` None for transport errors)."""
+        if self.circuit_breaker is not None:
+            success = status_code is not None and not CircuitBreaker.is_failure(status_code)
+            self.circuit_breaker.record(endpoint, success, time.monotonic() - started, epoch)
+
+    def _release(self, endpoint: str, epoch: Optional[int] = None) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release(endpoint, epoch)
+
+    def _record_response_bytes(self, response: httpx.Response) -> None:
+        """Count wire (possibly compressed) and decoded bytes of a fully read response."""
+        self.metrics.increment("bytes.response.wire", response.num_bytes_downloaded)
+        self.metrics.increment("bytes.response.decoded", len(response.content))
+        encoding = response.headers.get("Content-Encoding")
+        if encoding:
+            self.metrics.increment(f"compression.responses.{encoding.lower()}")
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+        deadline: Optional[Deadline] = None,
+    ) -> httpx.Response:
+        """
+        Send a request, retrying according to ``retry_policy``.
+
+        With ``stream=True`` a successful response's body is left unread for the
+        caller to consume with ``aiter_bytes()`` and must be closed with
+        ``aclose()``; error responses are read so they can be reported.
+
+        A bounded ``deadline`` replaces ``timeout`` (see ``HttpClient._request``).
+        """
+        merged_headers = {**self._headers(), **(headers or {})}
+        body = None
+        raw_size = 0
+        if json is not None:
+            # Encode (and compress) once; retries resend the same bytes
+            body = json_codec.dumps(json)
+            raw_size = len(body)
+            body, content_encoding = compression.compress_body(body, self.request_compression_threshold)
+            if content_encoding:
+                merged_headers["Content-Encoding"] = content_encoding
+        policy = self.retry_policy
+        idempotent = policy.is_idempotent(method, merged_headers)
+        key = idempotency_key(merged_headers) if method.upper() == "POST" else None
+        policy.on_request()
+        self.metrics.increment("requests")
+
+        attempt = 0
+        while True:
+            if deadline is not None:
+                deadline.check(f"{method} {endpoint}")
+            epoch = self._admit(endpoint)
+            if self.rate_limiter is not None:
+                try:
+                    self._record_throttle(await self.rate_limiter.acquire_async(endpoint))
+                except BaseException:
+                    self._release(endpoint, epoch)
+                    raise
+            if body is not None:
+                self.metrics.increment("bytes.request.raw", raw_size)
+                self.metrics.increment("bytes.request.wire", len(body))
+            attempt_timeout: Any = timeout
+            if deadline is not None and deadline.remaining() is not None:
+                attempt_timeout = deadline.httpx_timeout()
+            started = time.monotonic()
+            try:
+                client = self._client
+                request = client.build_request(
+                    method, endpoint, content=body, headers=merged_headers, timeout=attempt_timeout
+                )
+                response = await client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                self._record_outcome(endpoint, started, epoch=epoch)
+                if deadline is not None and deadline.expired():
+                    self.metrics.increment("retries.gave_up.deadline")
+                    raise deadline.error(f"{method} {endpoint}") from e
+                decision = policy.for_exception(
+                    attempt,
+                    e,
+                    idempotent=idempotent,
+                    connect_error=isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)),
+                )
+                if decision.delay is not None and deadline is not None and not deadline.fits(decision.delay):
+                    decision = RetryDecision(None, "deadline")
+                if decision.delay is None:
+                    self.metrics.increment(f"retries.gave_up.{decision.reason}")
+                    raise
+                self._record_retry(decision.reason)
+                await asyncio.sleep(decision.delay)
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled (e.g. a losing hedge): no outcome to report
+                self._release(endpoint, epoch)
+                raise
+
+            self._record_outcome(endpoint, started, response.status_code, epoch)
+            retry_after = response.headers.get("Retry-After")
+            if self.rate_limiter is not None:
+                self.rate_limiter.record(endpoint, response.status_code, parse_retry_after(retry_after))
+            if attempt and key is not None and response.status_code == 409:
+                if stream:
+                    await response.aread()
+                self.metrics.increment("retries.idempotency_conflict")
+                raise IdempotencyConflictError(
+                    f"{method} {endpoint} was retried, but the server had already accepted an earlier attempt "
+                    f"with idempotency key {key!r}; the job it started is running and its ID was not returned",
+                    key,
+                    response.status_code,
+                    response,
+                )
+
+            decision = policy.for_response(
+                attempt,
+                response.status_code,
+                idempotent=idempotent,
+                retry_after=retry_after,
+            )
+            if decision.delay is not None and deadline is not None and not deadline.fits(decision.delay):
+                decision = RetryDecision(None, "deadline")
+            if decision.delay is None:
+                if decision.reason != "not_retryable":
+                    self.metrics.increment(f"retries.gave_up.{decision.reason}")
+                if stream and response.status_code >= 400:
+                    await response.aread()
+                if not stream:
+                    self._record_response_bytes(response)
+                return response
+
+            await response.aclose()
+            self._record_retry(decision.reason)
+            await asyncio.sleep(decision.delay)
+            attempt += 1
+
     async def post(
         self,
         endpoint: str,
         data: Dict[str, Any],
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
     ) -> httpx.Response:
         payload = dict(data)
         payload["origin"] = f"python-sdk@{version}"
-        return await self._client.post(
-            endpoint,
-            json=payload,
-            headers={**self._headers(), **(headers or {})},
-            timeout=timeout,
+        return await self._request(
+            "POST", endpoint, json=payload, headers=headers, timeout=timeout, deadline=deadline
         )
 
     async def get(
@@ -48,9 +373,11 @@ class AsyncHttpClient:
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
+        stream: bool = False,
+        deadline: Optional[Deadline] = None,
     ) -> httpx.Response:
-        return await self._client.get(
-            endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
+        return await self._request(
+            "GET", endpoint, headers=headers, timeout=timeout, stream=stream, deadline=deadline
         )
 
     async def delete(
@@ -58,8 +385,7 @@ class AsyncHttpClient:
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
     ) -> httpx.Response:
-        return await self._client.delete(
-            endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
-        )
+        return await self._request("DELETE", endpoint, headers=headers, timeout=timeout, deadline=deadline)
 
@@ -0,0 +1,153 @@
+"""
+Pluggable JSON codec for the v2 client.
+
+Uses orjson when installed, then msgspec, then the standard library. All
+codecs decode straight from response bytes and encode to UTF-8 bytes, so hot
+paths (status polls, pagination, WebSocket messages, request bodies) skip the
+intermediate ``str`` that ``response.json()``/``json.dumps`` build.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+class JsonCodec:
+    """A named pair of ``loads(bytes) -> obj`` / ``dumps(obj) -> bytes`` functions."""
+
+    def __init__(self, name: str, loads: Callable[[JsonInput], Any], dumps: Callable[[Any], bytes]) -> None:
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+def _stdlib_loads(data: JsonInput) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec("stdlib", _stdlib_loads, _stdlib_dumps)
+
+
+def _orjson_codec() -> Optional[JsonCodec]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=options)
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            return _stdlib_dumps(obj)
+
+    return JsonCodec("orjson", orjson.loads, dumps)
+
+
+def _msgspec_codec() -> Optional[JsonCodec]:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def loads(data: JsonInput) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return encoder.encode(obj)
+        except (TypeError, OverflowError):
+            return _stdlib_dumps(obj)
+
+    return JsonCodec("msgspec", loads, dumps)
+
+
+_FACTORIES = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "stdlib": _stdlib_codec,
+}
+
+
+def _default_codec() -> JsonCodec:
+    for factory in (_orjson_codec, _msgspec_codec):
+        codec = factory()
+        if codec is not None:
+            return codec
+    return _stdlib_codec()
+
+
+_codec = _default_codec()
+
+
+def get_codec() -> JsonCodec:
+    """Return the codec currently used by the client."""
+    return _codec
+
+
+def set_codec(codec: Union[str, JsonCodec]) -> JsonCodec:
+    """
+    Select the JSON codec used by the client.
+
+    Args:
+        codec: ``"orjson"``, ``"msgspec"``, ``"stdlib"`` or a custom ``JsonCodec``
+
+    Returns:
+        The codec now in use
+
+    Raises:
+        ValueError: If the codec name is unknown or its library is not installed
+    """
+    global _codec
+    if isinstance(codec, str):
+        factory = _FACTORIES.get(codec)
+        if factory is None:
+            raise ValueError(f"Unknown JSON codec: {codec!r}")
+        resolved = factory()
+        if resolved is None:
+            raise ValueError(f"JSON codec {codec!r} is not installed")
+        codec = resolved
+    _codec = codec
+    return codec
+
+
+def loads(data: JsonInput) -> Any:
+    """Decode JSON from bytes (or str) with the active codec."""
+    return _codec.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON bytes with the active codec."""
+    return _codec.dumps(obj)
+
+
+def decode_response(response: Any) -> Any:
+    """
+    Decode a ``requests``/``httpx`` response body with the active codec.
+
+    Falls back to ``response.json()`` for response-like objects that do not
+    expose their raw body as bytes.
+    """
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return _codec.loads(content)
+    return response.json()
@@ -0,0 +1,358 @@
+"""
+Incremental decoding of paginated status responses.
+
+Crawl and batch status pages are a JSON object whose ``data`` array can hold
+dozens of full documents. ``JsonObjectStream`` consumes the body chunk by
+chunk and decodes each element of that array on its own, so a caller can
+normalize and drop one document before the next is parsed instead of holding
+the raw page, its decoded dict and the ``Document`` models at once.
+"""
+
+import re
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import json_codec
+
+# Decoder events: ("field", key, value) for a top-level member,
+# ("item", key, value) for one element of the streamed array ``key``
+Event = Tuple[str, str, Any]
+
+FIELD = "field"
+ITEM = "item"
+
+_WHITESPACE = b" \t\r\n"
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[,\]}\s]")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_INCOMPLETE = object()
+
+
+class _ValueScanner:
+    """Finds the end of one JSON value in a growing buffer, resuming where the last call stopped."""
+
+    __slots__ = ("start", "pos", "depth", "in_string", "scalar")
+
+    def __init__(self, buf: bytearray, start: int) -> None:
+        self.start = start
+        first = buf[start]
+        self.depth = 0
+        self.in_string = first == 0x22  # '"'
+        self.scalar = first not in b'"[{'
+        self.pos = start + 1 if self.in_string else start
+
+    def shift(self, offset: int) -> None:
+        self.start -= offset
+        self.pos -= offset
+
+    def end(self, buf: bytearray, eof: bool) -> Optional[int]:
+        """Return the end offset (exclusive) of the value, or None if more bytes are needed."""
+        if self.scalar:
+            m = _SCALAR_END.search(buf, self.pos)
+            if m is None:
+                if eof:
+                    return len(buf)
+                self.pos = len(buf)
+                return None
+            return m.start()
+
+        pos = self.pos
+        while True:
+            if self.in_string:
+                m = _STRING_SPECIAL.search(buf, pos)
+                if m is None:
+                    self.pos = len(buf)
+                    return None
+                if buf[m.start()] == 0x5C:  # backslash escapes the next byte
+                    if m.end() >= len(buf):
+                        self.pos = m.start()
+                        return None
+                    pos = m.end() + 1
+                    continue
+                self.in_string = False
+                pos = m.end()
+                if self.depth == 0:
+                    return pos
+                continue
+
+            m = _STRUCTURAL.search(buf, pos)
+            if m is None:
+                self.pos = len(buf)
+                return None
+            c = buf[m.start()]
+            pos = m.end()
+            if c == 0x22:
+                self.in_string = True
+            elif c in b"[{":
+                self.depth += 1
+            else:
+                self.depth -= 1
+                if self.depth == 0:
+                    return pos
+
+
+class JsonObjectStream:
+    """
+    Push parser for a top-level JSON object with one large array member.
+
+    ``feed(chunk)`` returns the events completed by that chunk: each top-level
+    member other than ``array_key`` as ``("field", key, value)`` and each
+    element of ``array_key`` as ``("item", array_key, value)``. Values are
+    decoded with the active ``json_codec``. Call ``close()`` after the last
+    chunk to flush trailing scalars and detect truncated bodies.
+    """
+
+    def __init__(self, array_key: str = "data") -> None:
+        self.array_key = array_key
+        self._buf = bytearray()
+        self._off = 0
+        self._state = "start"
+        self._key: Optional[str] = None
+        self._scanner: Optional[_ValueScanner] = None
+
+    def _skip(self, chars: bytes) -> Optional[int]:
+        buf, off = self._buf, self._off
+        n = len(buf)
+        while off < n and buf[off] in chars:
+            off += 1
+        self._off = off
+        return buf[off] if off < n else None
+
+    def _scan(self, eof: bool) -> Any:
+        """Decode the value at the cursor, or return ``_INCOMPLETE`` if it is not fully buffered yet."""
+        if self._scanner is None:
+            self._scanner = _ValueScanner(self._buf, self._off)
+        end = self._scanner.end(self._buf, eof)
+        if end is None:
+            return _INCOMPLETE
+        value = json_codec.loads(bytes(self._buf[self._scanner.start:end]))
+        self._off = end
+        self._scanner = None
+        return value
+
+    def _run(self, eof: bool) -> List[Event]:
+        events: List[Event] = []
+        while True:
+            state = self._state
+            if state == "start":
+                c = self._skip(_WHITESPACE)
+                if c is None:
+                    break
+                if c != 0x7B:  # '{'
+                    raise ValueError("Expected a JSON object")
+                self._off += 1
+                self._state = "key"
+            elif state == "key":
+                c = self._skip(_WHITESPACE + b",")
+                if c is None:
+                    break
+                if c == 0x7D:  # '}'
+                    self._off += 1
+                    self._state = "done"
+                    continue
+                key = self._scan(eof)
+                if key is _INCOMPLETE:
+                    break
+                self._key = key
+                self._state = "colon"
+            elif state == "colon":
+                c = self._skip(_WHITESPACE)
+                if c is None:
+                    break
+                if c != 0x3A:  # ':'
+                    raise ValueError("Expected ':' after object key")
+                self._off += 1
+                self._state = "value"
+            elif state == "value":
+                c = self._skip(_WHITESPACE)
+                if c is None:
+                    break
+                if self._key == self.array_key and c == 0x5B:  # '['
+                    self._off += 1
+                    self._state = "items"
+                    continue
+                value = self._scan(eof)
+                if value is _INCOMPLETE:
+                    break
+                events.append((FIELD, self._key, value))
+                self._state = "key"
+            elif state == "items":
+                c = self._skip(_WHITESPACE + b",")
+                if c is None:
+                    break
+                if c == 0x5D:  # ']'
+                    self._off += 1
+                    self._state = "key"
+                    continue
+                value = self._scan(eof)
+                if value is _INCOMPLETE:
+                    break
+                events.append((ITEM, self.array_key, value))
+            else:
+                break
+
+        # Drop consumed bytes so the buffer only ever holds the value in progress
+        if self._off:
+            del self._buf[:self._off]
+            if self._scanner is not None:
+                self._scanner.shift(self._off)
+            self._off = 0
+        return events
+
+    def feed(self, chunk: bytes) -> List[Event]:
+        """Add ``chunk`` to the buffer and return the events it completes."""
+        if chunk:
+            self._buf += chunk
+        return self._run(eof=False)
+
+    def close(self) -> List[Event]:
+        """Flush the remaining buffer; raises ``ValueError`` if the object is incomplete."""
+        events = self._run(eof=True)
+        if self._state != "done":
+            raise ValueError("Truncated JSON response body")
+        return events
+
+
+def iter_events(chunks: Iterable[bytes], array_key: str = "data") -> Iterator[Event]:
+    """Yield events from an iterable of body chunks."""
+    stream = JsonObjectStream(array_key)
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    yield from stream.close()
+
+
+async def aiter_events(chunks: AsyncIterator[bytes], array_key: str = "data") -> AsyncIterator[Event]:
+    """Async variant of ``iter_events``."""
+    stream = JsonObjectStream(array_key)
+    async for chunk in chunks:
+        for event in stream.feed(chunk):
+            yield event
+    for event in stream.close():
+        yield event
+
+
+class StreamedPage:
+    """
+    A status page whose ``data`` array is read lazily from the response.
+
+    Members that precede the array (``success``, ``status``, ``next``, ... in
+    the API's key order) are read on construction and available via ``get``.
+    ``get(array_key)`` (or iterating the page) yields the array's elements one
+    at a time; members after the array become available once it is consumed.
+    The response is closed when iteration finishes or on ``close()``.
+    """
+
+    def __init__(self, response: Any, array_key: str = "data", chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.array_key = array_key
+        self.fields: Dict[str, Any] = {}
+        self._response = response
+        self._events = iter_events(response.iter_content(chunk_size=chunk_size), array_key)
+        self._pending: List[Any] = []
+        self._consumed = False
+        try:
+            for kind, key, value in self._events:
+                if kind == ITEM:
+                    self._pending.append(value)
+                    break
+                self.fields[key] = value
+            else:
+                self._finish()
+        except BaseException:
+            self.close()
+            raise
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == self.array_key:
+            return iter(self)
+        return self.fields.get(key, default)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._consumed:
+            return
+        self._consumed = True
+        try:
+            while self._pending:
+                yield self._pending.pop()
+            for kind, key, value in self._events:
+                if kind == ITEM:
+                    yield value
+                else:
+                    self.fields[key] = value
+        finally:
+            self.close()
+
+    def _finish(self) -> None:
+        self._consumed = True
+        self.close()
+
+    def close(self) -> None:
+        self._response.close()
+
+
+class AsyncStreamedPage:
+    """
+    Async counterpart of ``StreamedPage`` for streamed ``httpx`` responses.
+
+    Build one with ``await AsyncStreamedPage.open(response)``, which reads the
+    members preceding the array before returning.
+    """
+
+    def __init__(self, response: Any, array_key: str = "data") -> None:
+        self.array_key = array_key
+        self.fields: Dict[str, Any] = {}
+        self._response = response
+        self._events = aiter_events(response.aiter_bytes(), array_key)
+        self._pending: List[Any] = []
+        self._consumed = False
+
+    @classmethod
+    async def open(cls, response: Any, array_key: str = "data") -> "AsyncStreamedPage":
+        page = cls(response, array_key)
+        try:
+            async for kind, key, value in page._events:
+                if kind == ITEM:
+                    page._pending.append(value)
+                    break
+                page.fields[key] = value
+            else:
+                page._consumed = True
+                await page.aclose()
+        except BaseException:
+            await page.aclose()
+            raise
+        return page
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == self.array_key:
+            return self.__aiter__()
+        return self.fields.get(key, default)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        if self._consumed:
+            return
+        self._consumed = True
+        try:
+            while self._pending:
+                yield self._pending.pop()
+            async for kind, key, value in self._events:
+                if kind == ITEM:
+                    yield value
+                else:
+                    self.fields[key] = value
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._response.aclose()
+
+
+async def aiter_page_items(page: Any, array_key: str = "data") -> AsyncIterator[Any]:
+    """Iterate a page's array items whether it was decoded eagerly (dict) or streamed."""
+    if isinstance(page, AsyncStreamedPage):
+        async for item in page:
+            yield item
+    else:
+        for item in page.get(array_key) or []:
+            yield item
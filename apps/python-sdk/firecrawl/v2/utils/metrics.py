@@ -0,0 +1,39 @@
+"""
+Lightweight client-side metrics for the v2 HTTP layer.
+"""
+
+import threading
+from typing import Dict
+
+
+class ClientMetrics:
+    """
+    Thread-safe named counters shared by the sync and async HTTP clients.
+
+    Counters are plain dotted names (e.g. ``retries.status.429``) so new
+    subsystems can record values without registering them first.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Add ``value`` to the counter ``name`` (created at zero on first use)."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def get(self, name: str, default: float = 0) -> float:
+        """Return the current value of ``name``."""
+        with self._lock:
+            return self._counters.get(name, default)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return a copy of all counters."""
+        with self._lock:
+            return dict(self._counters)
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self._counters.clear()
@@ -0,0 +1,682 @@
+"""
+Lazy iteration over paginated crawl and batch scrape results.
+
+``get_crawl_status``/``get_batch_scrape_status`` collect every page into one
+``List[Document]``. The iterators here stream-decode one page at a time,
+yield its documents one by one and only then follow the ``next`` cursor, so
+at most one document (plus the read buffer of the current page) is held in
+memory however large the job is.
+
+``prefetch_pages``/``aprefetch_pages`` pipeline pagination for
+``PaginationConfig(prefetch_depth=N)``: pages are downloaded by a background
+thread (or task) that requests each ``next`` cursor as soon as it is seen,
+while the caller decodes and normalizes the page before it.
+
+``fetch_pages_parallel``/``afetch_pages_parallel`` serve
+``PaginationConfig(parallel_pages=N)`` for completed jobs, whose pages no
+longer change: the page size and offsets are derived from the first page's
+``next`` cursor and the remaining ranges are fetched N at a time.
+
+``fetch_new_documents``/``afetch_new_documents`` back the wait loops: a
+``DeltaCursor`` remembers the documents already collected and the server
+offset after them, so each poll downloads only what finished since the last.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, TypeVar
+from urllib.parse import parse_qs, urlparse
+
+from ..types import BatchScrapeJob, CrawlJob, Document, PaginationConfig
+from . import json_codec
+from .checkpoint import CheckpointStore
+from .deadline import Deadline
+from .error_handler import handle_response_error
+from .http_client import HttpClient
+from .http_client_async import AsyncHttpClient
+from .json_codec import decode_response
+from .json_stream import FIELD, AsyncStreamedPage, JsonObjectStream, StreamedPage
+from .normalize import normalize_document_input
+
+logger = logging.getLogger("firecrawl")
+
+JobT = TypeVar("JobT", CrawlJob, BatchScrapeJob)
+
+# Bytes scanned per step when looking for a page's ``next`` cursor; the API
+# writes it before ``data`` so it is normally found in the first step.
+_PEEK_CHUNK = 2048
+
+
+def peek_next(content: bytes) -> Optional[str]:
+    """
+    Read the ``next`` cursor of a raw status page without decoding its documents.
+
+    Scans the body in small steps and stops at the first document; if the
+    cursor comes after ``data`` the whole page is decoded instead.
+    """
+    stream = JsonObjectStream()
+    view = memoryview(content)
+    try:
+        for start in range(0, len(view), _PEEK_CHUNK):
+            for kind, key, value in stream.feed(view[start:start + _PEEK_CHUNK]):
+                if kind != FIELD:
+                    return json_codec.loads(content).get("next")
+                if key == "next":
+                    return value
+        for kind, key, value in stream.close():
+            if kind == FIELD and key == "next":
+                return value
+    except ValueError:
+        return None
+    return None
+
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def prefetch_pages(
+    client: HttpClient,
+    url: str,
+    depth: int,
+    *,
+    max_pages: Optional[int] = None,
+    deadline: Optional[Deadline] = None,
+) -> Iterator[Any]:
+    """
+    Yield the fully read responses of ``url`` and the pages its ``next`` cursors link to.
+
+    A background thread downloads pages while the caller decodes them: as soon
+    as a page's body is in, its ``next`` cursor is peeked and the following
+    request goes out, keeping up to ``depth`` pages fetched or in flight ahead
+    of the one the caller is working on. At most ``max_pages`` pages are
+    requested. A non-2xx page is yielded and ends the sequence. Close the
+    generator (or exhaust it) to stop the background thread.
+    """
+    if depth < 1:
+        raise ValueError("depth must be at least 1")
+    slots = threading.Semaphore(depth)
+    pages: "queue.Queue[Any]" = queue.Queue()
+    stop = threading.Event()
+
+    def produce() -> None:
+        next_url: Optional[str] = url
+        fetched = 0
+        try:
+            while next_url and (max_pages is None or fetched < max_pages):
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                response = client.get(next_url, deadline=deadline)
+                fetched += 1
+                pages.put(response)
+                if not response.ok:
+                    break
+                next_url = peek_next(response.content)
+        except BaseException as e:  # re-raised in the consuming thread
+            pages.put(_Failure(e))
+        finally:
+            pages.put(_DONE)
+
+    producer = threading.Thread(target=produce, name="firecrawl-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            slots.release()
+            yield item
+    finally:
+        stop.set()
+
+
+async def anext_page(pages: AsyncIterator[Any]) -> Optional[Any]:
+    """The next prefetched page, or None once the prefetcher is done (``anext(pages, None)`` before 3.10)."""
+    try:
+        return await pages.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+async def aprefetch_pages(
+    client: AsyncHttpClient,
+    url: str,
+    depth: int,
+    *,
+    max_pages: Optional[int] = None,
+    deadline: Optional[Deadline] = None,
+) -> AsyncIterator[Any]:
+    """Async counterpart of ``prefetch_pages``; pages are downloaded by a background task."""
+    if depth < 1:
+        raise ValueError("depth must be at least 1")
+    slots = asyncio.Semaphore(depth)
+    pages: "asyncio.Queue[Any]" = asyncio.Queue()
+
+    async def produce() -> None:
+        next_url: Optional[str] = url
+        fetched = 0
+        try:
+            while next_url and (max_pages is None or fetched < max_pages):
+                await slots.acquire()
+                response = await client.get(next_url, deadline=deadline)
+                fetched += 1
+                pages.put_nowait(response)
+                if response.status_code >= 400:
+                    break
+                next_url = peek_next(response.content)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            pages.put_nowait(_Failure(e))
+        finally:
+            pages.put_nowait(_DONE)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            slots.release()
+            yield item
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+
+
+class _PageLimits:
+    """``PaginationConfig`` limits, counted the same way as the list-building helpers."""
+
+    def __init__(self, pagination_config: Optional[PaginationConfig]) -> None:
+        config = pagination_config or PaginationConfig()
+        self.auto_paginate = config.auto_paginate
+        self.max_pages = config.max_pages
+        self.max_results = config.max_results
+        self.max_wait_time = config.max_wait_time
+        self.prefetch_depth = config.prefetch_depth
+        self.pages_followed = 0
+        self.results = 0
+        self.resumed = False
+        self._started: Optional[float] = None
+
+    def resume(self, state: Dict[str, Any]) -> Optional[str]:
+        """Restore the counters of a checkpoint; returns the cursor to continue from."""
+        next_url = state.get("next")
+        if next_url:
+            self.results = int(state.get("documents", 0))
+            self.pages_followed = int(state.get("pages", 0))
+            self.resumed = True
+        return next_url
+
+    def checkpoint(self, next_url: str) -> Dict[str, Any]:
+        return {"next": next_url, "documents": self.results, "pages": self.pages_followed}
+
+    def max_requests(self) -> Optional[int]:
+        """Upper bound on page requests, including the first page."""
+        if not self.auto_paginate:
+            return 1
+        if self.max_pages is None:
+            return None
+        # A resumed download starts on a followed page
+        return self.max_pages - self.pages_followed if self.resumed else self.max_pages + 1
+
+    def results_exhausted(self) -> bool:
+        return self.max_results is not None and self.results >= self.max_results
+
+    def may_follow(self, next_url: Optional[str]) -> bool:
+        """Whether the ``next`` cursor of the page just read should be fetched."""
+        if not next_url or not self.auto_paginate or self.results_exhausted():
+            return False
+        if self.max_pages is not None and self.pages_followed >= self.max_pages:
+            return False
+        if self._started is None:
+            self._started = time.monotonic()
+        elif self.max_wait_time is not None and time.monotonic() - self._started > self.max_wait_time:
+            return False
+        return True
+
+
+def iter_documents(
+    client: HttpClient,
+    endpoint: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    action: str = "get status",
+    deadline: Optional[Deadline] = None,
+    checkpoint: Optional[CheckpointStore] = None,
+) -> Iterator[Document]:
+    """
+    Yield the documents of a status endpoint and the pages its ``next`` cursors link to.
+
+    ``pagination_config`` limits apply as in ``get_crawl_status``
+    (``auto_paginate=False`` stops after the first page). Pages are always
+    stream-decoded; ``stream_pages`` is implied. With ``prefetch_depth`` the
+    following pages are downloaded in the background while the current one is
+    being decoded (memory then grows to ``prefetch_depth`` raw pages).
+
+    With a ``checkpoint`` store the cursor and counters are saved under
+    ``endpoint`` after each consumed page and iteration resumes from a saved
+    checkpoint; it is cleared once the iteration runs to completion (an early
+    ``break`` or a failed page keeps it).
+
+    Raises:
+        FirecrawlError: If the first page cannot be fetched (later page failures
+            are logged and end the iteration, like the list-building helpers)
+    """
+    limits = _PageLimits(pagination_config)
+    state = checkpoint.load(endpoint) if checkpoint is not None else None
+    start = (limits.resume(state) if state else None) or endpoint
+    url: Optional[str] = start
+    first = True
+    pages = (
+        prefetch_pages(client, start, limits.prefetch_depth, max_pages=limits.max_requests(), deadline=deadline)
+        if limits.prefetch_depth
+        else None
+    )
+    try:
+        while url:
+            # Past the prefetcher's last page (e.g. a cursor it could not peek): fetch directly
+            response = next(pages, None) if pages is not None else None
+            if response is None:
+                response = client.get(url, stream=True, deadline=deadline)
+            if not response.ok:
+                if first:
+                    handle_response_error(response, action)
+                response.close()
+                logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
+                return
+            page = StreamedPage(response)
+            try:
+                if not page.get("success"):
+                    if first:
+                        raise Exception(page.get("error", "Unknown error occurred"))
+                    return
+                for doc in page:
+                    if limits.results_exhausted():
+                        break
+                    if isinstance(doc, dict):
+                        limits.results += 1
+                        yield Document(**normalize_document_input(doc))
+                next_url = page.get("next")
+            finally:
+                page.close()
+            if not first or limits.resumed:
+                limits.pages_followed += 1
+            first = False
+            url = next_url if limits.may_follow(next_url) else None
+            if url and checkpoint is not None:
+                # Every document of this page has been consumed
+                checkpoint.save(endpoint, limits.checkpoint(url))
+        if checkpoint is not None:
+            checkpoint.clear(endpoint)
+    finally:
+        if pages is not None:
+            pages.close()
+
+
+async def aiter_documents(
+    client: AsyncHttpClient,
+    endpoint: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    action: str = "get status",
+    deadline: Optional[Deadline] = None,
+    checkpoint: Optional[CheckpointStore] = None,
+) -> AsyncIterator[Document]:
+    """Async counterpart of ``iter_documents``."""
+    limits = _PageLimits(pagination_config)
+    state = checkpoint.load(endpoint) if checkpoint is not None else None
+    start = (limits.resume(state) if state else None) or endpoint
+    url: Optional[str] = start
+    first = True
+    pages = (
+        aprefetch_pages(client, start, limits.prefetch_depth, max_pages=limits.max_requests(), deadline=deadline)
+        if limits.prefetch_depth
+        else None
+    )
+    try:
+        while url:
+            # Past the prefetcher's last page (e.g. a cursor it could not peek): fetch directly
+            response = await anext_page(pages) if pages is not None else None
+            if response is None:
+                response = await client.get(url, stream=True, deadline=deadline)
+            if response.status_code >= 400:
+                # Error responses come back already read
+                if first:
+                    handle_response_error(response, action)
+                logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
+                return
+            page = await AsyncStreamedPage.open(response)
+            try:
+                if not page.get("success"):
+                    if first:
+                        raise Exception(page.get("error", "Unknown error occurred"))
+                    return
+                async for doc in page:
+                    if limits.results_exhausted():
+                        break
+                    if isinstance(doc, dict):
+                        limits.results += 1
+                        yield Document(**normalize_document_input(doc))
+                next_url = page.get("next")
+            finally:
+                await page.aclose()
+            if not first or limits.resumed:
+                limits.pages_followed += 1
+            first = False
+            url = next_url if limits.may_follow(next_url) else None
+            if url and checkpoint is not None:
+                # Every document of this page has been consumed
+                checkpoint.save(endpoint, limits.checkpoint(url))
+        if checkpoint is not None:
+            checkpoint.clear(endpoint)
+    finally:
+        if pages is not None:
+            await pages.aclose()
+
+
+class DeltaCursor:
+    """Documents a wait loop has collected so far and the ``skip`` offset of the next one."""
+
+    def __init__(self) -> None:
+        self.skip = 0
+        self.documents: List[Document] = []
+
+    @classmethod
+    def resume(cls, job: Any) -> "DeltaCursor":
+        """Cursor continuing after a partial job (``is_partial``) returned by a timed-out wait."""
+        cursor = cls()
+        cursor.documents = list(job.data)
+        skip = _skip_of(job.next)
+        cursor.skip = skip if skip is not None else len(job.data)
+        return cursor
+
+    def url(self, endpoint: str) -> str:
+        return f"{endpoint}?skip={self.skip}" if self.skip else endpoint
+
+    def partial(self, job: JobT, client: Any, endpoint: str) -> JobT:
+        """
+        ``job`` (the last status seen) with every document collected so far,
+        flagged ``is_partial`` and with ``next`` pointing past those documents.
+        """
+        api_url = (getattr(client, "api_url", None) or "").rstrip("/")
+        return job.model_copy(
+            update={
+                "data": list(self.documents),
+                "next": f"{api_url}{endpoint}?skip={self.skip}",
+                "is_partial": True,
+            }
+        )
+
+    def advance(self, page: Dict[str, Any]) -> Optional[str]:
+        """
+        Add a page's documents and move past them.
+
+        Returns the ``next`` cursor if it points beyond what was already read;
+        while a job runs the API keeps returning ``next`` at the current offset
+        until more documents finish, which ends this poll.
+        """
+        data = page.get("data") or []
+        for doc in data:
+            if isinstance(doc, dict):
+                self.documents.append(Document(**normalize_document_input(doc)))
+        next_url = page.get("next")
+        offset = _skip_of(next_url)
+        if offset is None:
+            # No cursor: every finished document has been read
+            self.skip += len(data)
+            return None
+        advanced = offset > self.skip
+        self.skip = max(self.skip, offset)
+        return next_url if advanced else None
+
+
+def _skip_of(next_url: Optional[str]) -> Optional[int]:
+    if not next_url:
+        return None
+    try:
+        return int(parse_qs(urlparse(next_url).query)["skip"][0])
+    except (KeyError, ValueError):
+        return None
+
+
+def fetch_new_documents(
+    client: HttpClient,
+    endpoint: str,
+    cursor: DeltaCursor,
+    *,
+    action: str = "get status",
+    deadline: Optional[Deadline] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch the status of ``endpoint`` plus only the documents past ``cursor``.
+
+    New documents are appended to ``cursor.documents``. Returns the decoded
+    first page (its status fields describe the whole job).
+
+    Raises:
+        FirecrawlError: If the status page cannot be fetched (later page
+            failures are logged and retried on the next poll)
+    """
+    response = client.get(cursor.url(endpoint), deadline=deadline)
+    if not response.ok:
+        handle_response_error(response, action)
+    status = decode_response(response)
+    if not status.get("success"):
+        raise Exception(status.get("error", "Unknown error occurred"))
+    url = cursor.advance(status)
+    while url:
+        response = client.get(url, deadline=deadline)
+        if not response.ok:
+            logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
+            break
+        page = decode_response(response)
+        if not page.get("success"):
+            break
+        url = cursor.advance(page)
+    return status
+
+
+async def afetch_new_documents(
+    client: AsyncHttpClient,
+    endpoint: str,
+    cursor: DeltaCursor,
+    *,
+    action: str = "get status",
+    deadline: Optional[Deadline] = None,
+) -> Dict[str, Any]:
+    """Async counterpart of ``fetch_new_documents``."""
+    response = await client.get(cursor.url(endpoint), deadline=deadline)
+    if response.status_code >= 400:
+        handle_response_error(response, action)
+    status = decode_response(response)
+    if not status.get("success"):
+        raise Exception(status.get("error", "Unknown error occurred"))
+    url = cursor.advance(status)
+    while url:
+        response = await client.get(url, deadline=deadline)
+        if response.status_code >= 400:
+            logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
+            break
+        page = decode_response(response)
+        if not page.get("success"):
+            break
+        url = cursor.advance(page)
+    return status
+
+
+Chunk = Tuple[int, int]
+
+
+def _plan_chunks(
+    page: Dict[str, Any], documents: List[Document], pagination_config: PaginationConfig
+) -> Optional[Tuple[str, List[Chunk]]]:
+    """
+    Split the rest of a completed job into ``[start, end)`` offset ranges.
+
+    Returns None when parallel fetching does not apply (not enabled, job still
+    running, or no ``skip`` offset in the ``next`` cursor); callers then walk
+    the cursors serially.
+    """
+    if not pagination_config.parallel_pages:
+        return None
+    if page.get("status") != "completed":
+        return None
+    total = page.get("total")
+    next_url = page.get("next")
+    size = _skip_of(next_url)
+    if not total or not next_url or not size:
+        return None
+    base = urlparse(next_url)._replace(query="", fragment="").geturl()
+    end = int(total)
+    if pagination_config.max_results is not None:
+        end = min(end, size + max(0, pagination_config.max_results - len(documents)))
+    chunks = [(start, min(start + size, end)) for start in range(size, end, size)]
+    if pagination_config.max_pages is not None:
+        chunks = chunks[: pagination_config.max_pages]
+    return base, chunks
+
+
+def _chunk_url(base: str, start: int, end: int) -> str:
+    return f"{base}?skip={start}&limit={end - start}"
+
+
+def _advance_chunk(page: Dict[str, Any], end: int, documents: List[Document]) -> Optional[int]:
+    """Collect a range page's documents; returns the offset still missing from the range, if any."""
+    for doc in page.get("data") or []:
+        if isinstance(doc, dict):
+            documents.append(Document(**normalize_document_input(doc)))
+    offset = _skip_of(page.get("next"))
+    if offset is None or offset >= end:
+        return None
+    # The page was cut short (the API caps page bytes): fill the gap
+    return offset
+
+
+def _assemble(
+    documents: List[Document], chunks: List[Tuple[List[Document], bool]], max_results: Optional[int]
+) -> List[Document]:
+    result = list(documents)
+    for chunk_documents, complete in chunks:
+        result.extend(chunk_documents)
+        if not complete:
+            # Keep the result a contiguous prefix, as serial pagination would
+            break
+    if max_results is not None:
+        del result[max_results:]
+    return result
+
+
+def fetch_pages_parallel(
+    client: HttpClient,
+    page: Dict[str, Any],
+    documents: List[Document],
+    pagination_config: Optional[PaginationConfig],
+    *,
+    deadline: Optional[Deadline] = None,
+) -> Optional[List[Document]]:
+    """
+    Fetch the remaining pages of a completed job concurrently and return all documents in order.
+
+    ``page`` is the decoded first status page and ``documents`` its documents.
+    Each range is requested as ``?skip=&limit=`` over the pooled connections;
+    a range page cut short by the API's size cap is completed from its own
+    ``next`` cursor. A failed range is logged and ends the result there.
+    Returns None when offsets cannot be inferred.
+    """
+    if pagination_config is None:
+        return None
+    plan = _plan_chunks(page, documents, pagination_config)
+    if plan is None:
+        return None
+    base, chunks = plan
+    max_wait_time = pagination_config.max_wait_time
+    started = time.monotonic()
+
+    def fetch(chunk: Chunk) -> Tuple[List[Document], bool]:
+        start, end = chunk
+        fetched: List[Document] = []
+        missing: Optional[int] = start
+        while missing is not None:
+            if max_wait_time is not None and time.monotonic() - started > max_wait_time:
+                return fetched, False
+            response = client.get(_chunk_url(base, missing, end), deadline=deadline)
+            if not response.ok:
+                logger.warning("Failed to fetch page", extra={"status_code": response.status_code, "skip": missing})
+                return fetched, False
+            body = decode_response(response)
+            if not body.get("success"):
+                return fetched, False
+            previous, missing = missing, _advance_chunk(body, end, fetched)
+            if missing is not None and missing <= previous:
+                return fetched, False
+        return fetched, True
+
+    if not chunks:
+        return _assemble(documents, [], pagination_config.max_results)
+    with ThreadPoolExecutor(max_workers=min(pagination_config.parallel_pages, len(chunks))) as pool:
+        results = list(pool.map(fetch, chunks))
+    return _assemble(documents, results, pagination_config.max_results)
+
+
+async def afetch_pages_parallel(
+    client: AsyncHttpClient,
+    page: Dict[str, Any],
+    documents: List[Document],
+    pagination_config: Optional[PaginationConfig],
+    *,
+    deadline: Optional[Deadline] = None,
+) -> Optional[List[Document]]:
+    """Async counterpart of ``fetch_pages_parallel``; ranges are fetched as concurrent requests."""
+    if pagination_config is None:
+        return None
+    plan = _plan_chunks(page, documents, pagination_config)
+    if plan is None:
+        return None
+    base, chunks = plan
+    max_wait_time = pagination_config.max_wait_time
+    started = time.monotonic()
+    slots = asyncio.Semaphore(pagination_config.parallel_pages)
+
+    async def fetch(chunk: Chunk) -> Tuple[List[Document], bool]:
+        start, end = chunk
+        fetched: List[Document] = []
+        missing: Optional[int] = start
+        async with slots:
+            while missing is not None:
+                if max_wait_time is not None and time.monotonic() - started > max_wait_time:
+                    return fetched, False
+                response = await client.get(_chunk_url(base, missing, end), deadline=deadline)
+                if response.status_code >= 400:
+                    logger.warning(
+                        "Failed to fetch page", extra={"status_code": response.status_code, "skip": missing}
+                    )
+                    return fetched, False
+                body = decode_response(response)
+                if not body.get("success"):
+                    return fetched, False
+                previous, missing = missing, _advance_chunk(body, end, fetched)
+                if missing is not None and missing <= previous:
+                    return fetched, False
+        return fetched, True
+
+    results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+    return _assemble(documents, list(results), pagination_config.max_results)
@@ -0,0 +1,176 @@
+"""
+Polling strategies for the wait loops (crawl, batch scrape, extract, v1 crawl).
+
+A ``PollingStrategy`` is configuration; every wait creates a ``PollSchedule``
+from it that sees each status (``completed``/``total`` when the job reports
+them) and returns how long to sleep before the next poll. ``FixedPolling``
+keeps the classic fixed ``poll_interval``; ``AdaptivePolling`` estimates the
+finish time from progress between polls.
+"""
+
+import abc
+import logging
+import math
+import time
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger("firecrawl")
+
+
+class PollSchedule:
+    """
+    Sleep durations for one wait; call ``next_delay`` after every unfinished poll.
+
+    ``baseline`` is the fixed interval the wait would otherwise use, so
+    ``polls_saved`` can compare against it. ``polls`` counts the unfinished
+    polls seen so far (the final, finished poll is not included).
+    """
+
+    def __init__(self, baseline: float) -> None:
+        self.baseline = baseline
+        self.polls = 0
+        self._started = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def next_delay(self, completed: Optional[int] = None, total: Optional[int] = None) -> float:
+        """Record a poll that found the job unfinished and return the seconds to sleep."""
+        self.polls += 1
+        return max(0.0, self._delay(completed, total))
+
+    def _delay(self, completed: Optional[int], total: Optional[int]) -> float:
+        return self.baseline
+
+    def polls_saved(self) -> int:
+        """Polls a fixed ``baseline`` interval would have made so far minus polls made (negative: extra polls)."""
+        if self.baseline <= 0:
+            return 0
+        return math.floor(self.elapsed / self.baseline) + 1 - (self.polls + 1)
+
+    def record(self, metrics: Any = None, job: str = "job") -> None:
+        """Report the finished wait to ``metrics`` (``polling.polls``/``polling.saved``) and the debug log."""
+        polls = self.polls + 1
+        saved = self.polls_saved()
+        if metrics is not None:
+            metrics.increment("polling.polls", polls)
+            metrics.increment("polling.saved", saved)
+        logger.debug(
+            "Wait finished", extra={"job": job, "polls": polls, "polls_saved": saved, "elapsed": self.elapsed}
+        )
+
+
+class PollingStrategy(abc.ABC):
+    """Decides how a wait loop paces its status polls; subclass and implement ``schedule``."""
+
+    @abc.abstractmethod
+    def schedule(self, poll_interval: float) -> PollSchedule:
+        """Start the schedule of one wait; ``poll_interval`` is the caller's fixed interval."""
+
+
+class _FixedSchedule(PollSchedule):
+    def __init__(self, interval: float, baseline: float) -> None:
+        super().__init__(baseline)
+        self.interval = interval
+
+    def _delay(self, completed: Optional[int], total: Optional[int]) -> float:
+        return self.interval
+
+
+class FixedPolling(PollingStrategy):
+    """Sleep the same interval between polls (``interval`` defaults to the wait's ``poll_interval``)."""
+
+    def __init__(self, interval: Optional[float] = None) -> None:
+        if interval is not None and interval < 0:
+            raise ValueError("interval must be non-negative")
+        self.interval = interval
+
+    def schedule(self, poll_interval: float) -> PollSchedule:
+        return _FixedSchedule(poll_interval if self.interval is None else self.interval, poll_interval)
+
+
+class _AdaptiveSchedule(PollSchedule):
+    def __init__(self, policy: "AdaptivePolling", baseline: float) -> None:
+        super().__init__(baseline)
+        self.policy = policy
+        self._interval = policy.initial_interval
+        self._last: Optional[Tuple[float, int]] = None  # (time, completed) of the previous poll
+        self._rate: Optional[float] = None  # smoothed documents per second
+
+    def _delay(self, completed: Optional[int], total: Optional[int]) -> float:
+        policy = self.policy
+        now = time.monotonic()
+        if self.polls == 1:
+            # Small jobs often finish within a second: look again soon
+            if completed is not None:
+                self._last = (now, completed)
+            return self._interval
+        if completed is None or not total:
+            # No progress figures (or the total is still unknown): plain backoff
+            self._interval = min(policy.max_interval, self._interval * policy.backoff)
+            return self._clamp(self._interval)
+        previous, self._last = self._last, (now, completed)
+        if previous is not None and now > previous[0]:
+            progress = completed - previous[1]
+            if progress > 0:
+                rate = progress / (now - previous[0])
+                self._rate = rate if self._rate is None else (
+                    policy.smoothing * rate + (1 - policy.smoothing) * self._rate
+                )
+            else:
+                # Stalled: back off from the current interval
+                self._interval = min(policy.max_interval, self._interval * policy.backoff)
+                return self._clamp(self._interval)
+        remaining = max(0, total - completed)
+        if self._rate is None:
+            self._interval = min(policy.max_interval, self._interval * policy.backoff)
+            return self._clamp(self._interval)
+        if remaining == 0:
+            # Everything is scraped; only the final status flip is pending
+            self._interval = policy.min_interval
+            return self._interval
+        # Aim at a fraction of the estimated time left, so polls tighten towards the finish
+        self._interval = self._clamp(policy.eta_fraction * remaining / self._rate)
+        return self._interval
+
+    def _clamp(self, interval: float) -> float:
+        return min(self.policy.max_interval, max(self.policy.min_interval, interval))
+
+
+class AdaptivePolling(PollingStrategy):
+    """
+    Poll fast early, back off while progress is slow and tighten near the expected finish.
+
+    The first poll comes after ``initial_interval``. Once two polls have seen
+    ``completed`` grow, the sleep is ``eta_fraction`` of the estimated time
+    left (``(total - completed) / rate``, with ``rate`` smoothed across polls);
+    without progress the interval grows by ``backoff``. Sleeps are clamped to
+    ``[min_interval, max_interval]``.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_interval: float = 0.5,
+        min_interval: float = 0.25,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        eta_fraction: float = 0.5,
+        smoothing: float = 0.5,
+    ) -> None:
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("intervals must satisfy 0 < min_interval <= max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        if not 0 < eta_fraction <= 1 or not 0 < smoothing <= 1:
+            raise ValueError("eta_fraction and smoothing must be in (0, 1]")
+        self.initial_interval = min(max_interval, max(min_interval, initial_interval))
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.eta_fraction = eta_fraction
+        self.smoothing = smoothing
+
+    def schedule(self, poll_interval: float) -> PollSchedule:
+        return _AdaptiveSchedule(self, poll_interval)
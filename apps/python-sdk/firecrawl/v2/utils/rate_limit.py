@@ -0,0 +1,170 @@
+"""
+Client-side rate limiting for the v2 HTTP layer.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+from .endpoints import endpoint_family
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket usable from threads and asyncio tasks alike.
+
+    Callers reserve a token under a lock and then wait outside it, so waiters
+    are served in arrival order whether they block a thread (``acquire``) or
+    suspend a task (``acquire_async``).
+
+    The rate adapts AIMD-style: ``on_rate_limited`` multiplies it by
+    ``decrease_factor`` (and honours ``Retry-After`` by pausing the bucket),
+    ``on_success`` adds back ``recovery_step`` of the configured rate per
+    response until the configured rate is reached again.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        min_rate: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        recovery_step: float = 0.05,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, float(rate))
+        self.min_rate = min_rate if min_rate is not None else self.max_rate / 20
+        self.decrease_factor = decrease_factor
+        self.recovery_step = recovery_step
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """Block the calling thread until a token is available; returns the time waited."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Suspend the calling task until a token is available; returns the time waited."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """Multiplicatively lower the rate after a 429 and pause for ``retry_after`` seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            if retry_after:
+                # Owe enough tokens that the next reservation waits out the server's delay
+                self._tokens = min(self._tokens, -retry_after * self.rate)
+
+    def on_success(self) -> None:
+        """Additively recover towards the configured rate."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery_step)
+
+
+class RateLimiter:
+    """
+    Per-endpoint-family token buckets shared by every request of a client.
+
+    ``rates`` maps endpoint families (see ``endpoint_family``: ``scrape``,
+    ``search``, ``crawl``, ``crawl_status``, ``batch_status``, ...) to requests
+    per second; families without an entry use ``default_rate`` or are not
+    limited when it is None. Use ``RateLimiter.per_minute`` to express plan
+    limits in requests per minute.
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        *,
+        default_rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        recovery_step: float = 0.05,
+    ) -> None:
+        self.rates = dict(rates or {})
+        self.default_rate = default_rate
+        self.burst = burst
+        self.decrease_factor = decrease_factor
+        self.recovery_step = recovery_step
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, rates: Dict[str, float], **kwargs) -> "RateLimiter":
+        """Build a limiter from requests-per-minute limits."""
+        default = kwargs.pop("default_rate", None)
+        return cls(
+            {family: rpm / 60.0 for family, rpm in rates.items()},
+            default_rate=default / 60.0 if default is not None else None,
+            **kwargs,
+        )
+
+    def bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        """Return the bucket governing ``endpoint``, or None if it is not limited."""
+        family = endpoint_family(endpoint)
+        bucket = self._buckets.get(family)
+        if bucket is not None:
+            return bucket
+        rate = self.rates.get(family, self.default_rate)
+        if rate is None:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(family)
+            if bucket is None:
+                bucket = TokenBucket(
+                    rate,
+                    self.burst,
+                    decrease_factor=self.decrease_factor,
+                    recovery_step=self.recovery_step,
+                )
+                self._buckets[family] = bucket
+        return bucket
+
+    def acquire(self, endpoint: str) -> float:
+        bucket = self.bucket(endpoint)
+        return bucket.acquire() if bucket is not None else 0.0
+
+    async def acquire_async(self, endpoint: str) -> float:
+        bucket = self.bucket(endpoint)
+        return await bucket.acquire_async() if bucket is not None else 0.0
+
+    def record(self, endpoint: str, status_code: int, retry_after: Optional[float] = None) -> None:
+        """Feed a response status back into the endpoint's bucket."""
+        bucket = self.bucket(endpoint)
+        if bucket is None:
+            return
+        if status_code == 429:
+            bucket.on_rate_limited(retry_after)
+        elif status_code < 400:
+            bucket.on_success()
@@ -0,0 +1,195 @@
+"""
+Retry policy shared by the sync and async v2 HTTP clients.
+"""
+
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Mapping, NamedTuple, Optional
+
+
+class RetryDecision(NamedTuple):
+    """Outcome of a retry check: ``delay`` is None when the request must not be retried."""
+
+    delay: Optional[float]
+    reason: str
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of the client's traffic.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    during an outage at most ~``ratio`` extra load is generated on top of the
+    original requests. ``min_tokens`` lets a quiet client still retry, and the
+    bucket never holds more than ``max_tokens``.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0) -> None:
+        if ratio < 0:
+            raise ValueError("ratio must be non-negative")
+        self.ratio = ratio
+        self.max_tokens = max(max_tokens, min_tokens)
+        self._tokens = float(min_tokens)
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            return self._tokens
+
+    def deposit(self) -> None:
+        """Record an original (non-retry) request."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Spend one token for a retry; returns False when the budget is exhausted."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds.
+
+    Returns None when the header is missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def idempotency_key(headers: Optional[Mapping[str, str]]) -> Optional[str]:
+    """The request's ``x-idempotency-key`` header value, if any."""
+    for name, value in (headers or {}).items():
+        if name.lower() == "x-idempotency-key" and value:
+            return value
+    return None
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    - Status codes in ``retry_statuses`` and transport errors are retried with
+      full-jitter exponential backoff (``uniform(0, min(max_backoff, backoff_factor * 2**attempt))``)
+      so a fleet of workers does not retry in lockstep.
+    - A ``Retry-After`` header on 429/503 responses overrides the backoff (plus a
+      small jitter); responses asking for more than ``max_retry_after`` seconds are
+      returned to the caller instead.
+    - GET/DELETE and POSTs carrying an ``x-idempotency-key`` are idempotent and
+      retried on any retryable failure. Other POSTs are only retried when the
+      server did not process them: ``safe_post_statuses`` and connection failures.
+      If a keyed POST's retry gets 409 (key already used), an earlier attempt
+      was accepted after all; the HTTP clients raise ``IdempotencyConflictError``.
+    - Retries are drawn from a shared ``RetryBudget``.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE", "PUT"})
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: Iterable[int] = (429, 502, 503, 504),
+        safe_post_statuses: Iterable[int] = (429, 502, 503),
+        max_retry_after: float = 60.0,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.safe_post_statuses = frozenset(safe_post_statuses)
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def is_idempotent(self, method: str, headers: Optional[Mapping[str, str]] = None) -> bool:
+        if method.upper() in self.IDEMPOTENT_METHODS:
+            return True
+        return idempotency_key(headers) is not None
+
+    def on_request(self) -> None:
+        """Record an original request against the retry budget."""
+        self.budget.deposit()
+
+    def backoff(self, attempt: int, backoff_factor: Optional[float] = None) -> float:
+        factor = self.backoff_factor if backoff_factor is None else backoff_factor
+        cap = min(self.max_backoff, factor * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    def _decide(self, attempt: int, max_attempts: Optional[int], delay: float, reason: str) -> RetryDecision:
+        limit = self.max_attempts if max_attempts is None else max_attempts
+        if attempt + 1 >= limit:
+            return RetryDecision(None, "exhausted")
+        if not self.budget.try_withdraw():
+            return RetryDecision(None, "budget_exhausted")
+        return RetryDecision(delay, reason)
+
+    def for_response(
+        self,
+        attempt: int,
+        status_code: int,
+        *,
+        idempotent: bool,
+        retry_after: Optional[str] = None,
+        max_attempts: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+    ) -> RetryDecision:
+        """Decide whether a response with ``status_code`` should be retried."""
+        if status_code not in self.retry_statuses:
+            return RetryDecision(None, "not_retryable")
+        if not idempotent and status_code not in self.safe_post_statuses:
+            return RetryDecision(None, "not_idempotent")
+
+        delay = self.backoff(attempt, backoff_factor)
+        server_delay = parse_retry_after(retry_after) if status_code in (429, 503) else None
+        if server_delay is not None:
+            if server_delay > self.max_retry_after:
+                return RetryDecision(None, "retry_after_too_long")
+            factor = self.backoff_factor if backoff_factor is None else backoff_factor
+            delay = server_delay + random.uniform(0, factor)
+        return self._decide(attempt, max_attempts, delay, f"status.{status_code}")
+
+    def for_exception(
+        self,
+        attempt: int,
+        exc: BaseException,
+        *,
+        idempotent: bool,
+        connect_error: bool,
+        max_attempts: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+    ) -> RetryDecision:
+        """
+        Decide whether a transport error should be retried.
+
+        ``connect_error`` marks failures that happened before the request was
+        sent, which are safe to retry even for non-idempotent POSTs.
+        """
+        if not idempotent and not connect_error:
+            return RetryDecision(None, "not_idempotent")
+        return self._decide(
+            attempt, max_attempts, self.backoff(attempt, backoff_factor), f"error.{type(exc).__name__}"
+        )
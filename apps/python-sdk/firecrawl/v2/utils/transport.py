@@ -0,0 +1,86 @@
+"""
+Alternative transports for the v2 HTTP clients (Unix domain sockets, custom adapters).
+
+A transport only changes how bytes reach the API; URLs are still built from
+``api_url`` (which also supplies the ``Host`` header), so a colocated
+self-hosted API can be reached with e.g.::
+
+    FirecrawlClient(api_url="http://localhost:3002", transport="unix:///var/run/firecrawl.sock")
+"""
+
+import socket
+from typing import Any, Optional
+from urllib.parse import unquote, urlparse
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+
+UNIX_SCHEMES = ("unix", "http+unix")
+
+
+def unix_socket_path(transport: str) -> str:
+    """
+    Extract the socket path from a ``unix:///path`` or ``http+unix:///path`` URL.
+
+    The requests-unixsocket style with a percent-encoded host
+    (``http+unix://%2Fvar%2Frun%2Ffirecrawl.sock``) is accepted too.
+
+    Raises:
+        ValueError: If ``transport`` is not a Unix socket URL
+    """
+    parsed = urlparse(transport)
+    if parsed.scheme not in UNIX_SCHEMES:
+        raise ValueError(f"Unsupported transport URL: {transport!r} (expected unix:///path/to.sock)")
+    path = unquote(parsed.netloc) + parsed.path if parsed.netloc else parsed.path
+    if not path:
+        raise ValueError(f"Missing socket path in transport URL: {transport!r}")
+    return path
+
+
+def _unix_pool_class(path: str) -> type:
+    class UnixHTTPConnection(HTTPConnection):
+        def _new_conn(self) -> socket.socket:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            if isinstance(self.timeout, (int, float)):
+                sock.settimeout(self.timeout)
+            try:
+                sock.connect(path)
+            except OSError:
+                sock.close()
+                raise
+            return sock
+
+    class UnixHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = UnixHTTPConnection
+
+    return UnixHTTPConnectionPool
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """``requests`` adapter sending plain-HTTP requests over a Unix domain socket."""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["socket_path"]
+
+    def __init__(self, socket_path: str, **kwargs: Any) -> None:
+        self.socket_path = socket_path
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _unix_pool_class(self.socket_path)}
+
+
+def mount_prefix(api_url: str) -> str:
+    """URL prefix under which a custom adapter is mounted so only API requests use it."""
+    parsed = urlparse(api_url)
+    return f"{parsed.scheme}://{parsed.netloc}/"
+
+
+def websocket_connect(uri: str, *, unix_socket_path: Optional[str] = None, **kwargs: Any) -> Any:
+    """``websockets.connect`` (or ``unix_connect`` when a socket path is set) for watchers."""
+    import websockets
+
+    if unix_socket_path:
+        return websockets.unix_connect(unix_socket_path, uri, **kwargs)
+    return websockets.connect(uri, **kwargs)
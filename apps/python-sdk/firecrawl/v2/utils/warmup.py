@@ -0,0 +1,126 @@
+"""
+Warm-up helpers for latency-sensitive workers.
+
+The first request of a fresh process otherwise pays for deferred imports,
+first-use model validation, DNS, TCP and TLS before doing useful work; the
+clients' ``warmup()`` does all of that up front and reports the time per step.
+"""
+
+import asyncio
+import socket
+from typing import Any, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from ..types import BatchScrapeJob, CrawlJob, Document
+from . import json_codec
+from .normalize import normalize_document_input
+
+_SAMPLE_DOCUMENT = {
+    "markdown": "",
+    "metadata": {"sourceURL": "https://example.com", "statusCode": 200, "ogTitle": ""},
+}
+
+
+def warm_imports() -> None:
+    """Import lazily loaded modules and run first-use validation of the result models."""
+    try:
+        import websockets  # noqa: F401  (imported on first watcher connect)
+    except ImportError:
+        pass
+    codec = json_codec.get_codec()
+    payload = codec.loads(codec.dumps({"success": True, "data": [_SAMPLE_DOCUMENT]}))
+    document = Document(**normalize_document_input(payload["data"][0]))
+    CrawlJob(status="completed", completed=1, total=1, data=[document])
+    BatchScrapeJob(status="completed", completed=1, total=1, data=[document])
+
+
+def _host_port(api_url: str) -> Tuple[Optional[str], int]:
+    parsed = urlparse(api_url)
+    return parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80)
+
+
+def _addresses(infos: List[Any]) -> List[str]:
+    addresses: List[str] = []
+    for info in infos:
+        address = str(info[4][0])
+        if address not in addresses:
+            addresses.append(address)
+    return addresses
+
+
+def resolve_host(api_url: str) -> List[str]:
+    """
+    Resolve the API host so the system resolver cache is hot for the first connect.
+
+    Raises:
+        OSError: If the host cannot be resolved
+    """
+    host, port = _host_port(api_url)
+    if not host:
+        return []
+    return _addresses(socket.getaddrinfo(host, port, type=socket.SOCK_STREAM))
+
+
+async def resolve_host_async(api_url: str) -> List[str]:
+    """``resolve_host`` without blocking the event loop."""
+    host, port = _host_port(api_url)
+    if not host:
+        return []
+    loop = asyncio.get_running_loop()
+    return _addresses(await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM))
+
+
+def open_pooled_connections(
+    session: requests.Session, url: str, count: int, timeout: Optional[float] = None
+) -> int:
+    """
+    Open up to ``count`` connections to ``url``'s host and park them in the session's pool.
+
+    Connections are handed back to the same urllib3 pool later requests use, so
+    they start on an established (and, for https, TLS-negotiated) socket.
+    Returns the number of connections parked; custom non-``HTTPAdapter``
+    transports cannot be pre-connected and yield 0.
+
+    Raises:
+        requests.ConnectionError: If a connection cannot be established (already
+            opened ones stay pooled)
+    """
+    adapter = session.get_adapter(url)
+    if count <= 0 or not isinstance(adapter, HTTPAdapter):
+        return 0
+    # Proxy and TLS settings (incl. environment overrides) as Session.request resolves them
+    settings = session.merge_environment_settings(url, {}, None, None, None)
+    if hasattr(adapter, "get_connection_with_tls_context"):
+        # requests >= 2.32.2 keys pools by TLS settings; match what requests will use
+        request = requests.Request("GET", url).prepare()
+        pool = adapter.get_connection_with_tls_context(
+            request, settings["verify"], settings["proxies"], settings["cert"]
+        )
+    else:
+        pool = adapter.get_connection(url, settings["proxies"])
+
+    opened = []
+    try:
+        for _ in range(count):
+            conn = pool._get_conn()
+            opened.append(conn)
+            if conn.sock is None:
+                if timeout is not None:
+                    conn.timeout = timeout
+                conn.connect()
+    except BaseException as e:
+        # A failed connection goes back as an empty slot
+        failed = opened.pop()
+        failed.close()
+        pool._put_conn(None)
+        if isinstance(e, urllib3.exceptions.HTTPError):
+            raise requests.ConnectionError(e) from e
+        raise
+    finally:
+        for conn in opened:
+            pool._put_conn(conn)
+    return len(opened)
@@ -8,14 +8,13 @@ Usage:
 """
 
 import asyncio
-import json
 import threading
 from typing import Callable, List, Optional, Literal, Union, Dict, Any
 
-import websockets
-
 from .types import CrawlJob, BatchScrapeJob, Document
 from .utils.normalize import normalize_document_input
+from .utils import json_codec
+from .utils.transport import websocket_connect
 
 
 JobKind = Literal["crawl", "batch"]
@@ -43,6 +42,7 @@ class Watcher:
         http_client = getattr(client, "http_client", None)
         self._api_url: Optional[str] = getattr(http_client, "api_url", None)
         self._api_key: Optional[str] = getattr(http_client, "api_key", None)
+        self._socket_path: Optional[str] = getattr(http_client, "unix_socket_path", None)
 
         # v1-parity state and event handlers
         self.status: str = "scraping"
@@ -93,7 +93,9 @@ class Watcher:
             headers_list.append(("Authorization", f"Bearer {self._api_key}"))
 
         try:
-            async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
+            async with websocket_connect(
+                uri, unix_socket_path=self._socket_path, max_size=None, additional_headers=headers_list
+            ) as websocket:
                 deadline = asyncio.get_event_loop().time() + self._timeout if self._timeout else None
                 while not self._stop.is_set():
                     # Use short recv timeouts to allow HTTP polling fallback
@@ -123,7 +125,7 @@ class Watcher:
                         return
 
                     try:
-                        body = json.loads(msg)
+                        body = json_codec.loads(msg)
                     except Exception:
                         continue
 
@@ -8,15 +8,15 @@ Usage:
 
 import asyncio
 import inspect
-import json
 import time
 from typing import AsyncIterator, Dict, List, Literal, Optional
 
-import websockets
 from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, ConnectionClosedError
 
 from .types import BatchScrapeJob, CrawlJob, Document
 from .utils.normalize import normalize_document_input
+from .utils import json_codec
+from .utils.transport import websocket_connect
 
 JobKind = Literal["crawl", "batch"]
 
@@ -40,10 +40,12 @@ class AsyncWatcher:
         if http_client is not None:
             self._api_url = getattr(http_client, "api_url", None)
             self._api_key = getattr(http_client, "api_key", None)
+            self._socket_path = getattr(http_client, "unix_socket_path", None)
         else:
             # Allow passing the top-level Firecrawl client directly
             self._api_url = getattr(client, "api_url", None)
             self._api_key = getattr(client, "api_key", None)
+            self._socket_path = None
 
         self._status: str = "scraping"
         self._data: List[Dict] = []
@@ -67,7 +69,9 @@ class AsyncWatcher:
 
         # Attempt to establish WS; on failure, fall back to HTTP polling immediately
         try:
-            async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
+            async with websocket_connect(
+                uri, unix_socket_path=self._socket_path, max_size=None, additional_headers=headers_list
+            ) as websocket:
                 deadline = asyncio.get_event_loop().time() + self._timeout if self._timeout else None
                 # Pre-yield a snapshot if available to ensure progress is visible
                 try:
@@ -111,7 +115,7 @@ class AsyncWatcher:
                                 return
                             await asyncio.sleep(1)
                     try:
-                        body = json.loads(msg)
+                        body = json_codec.loads(msg)
                     except Exception:
                         continue
 
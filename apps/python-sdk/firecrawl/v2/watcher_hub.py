@@ -0,0 +1,455 @@
+"""
+Watch many crawl and batch jobs from one background event loop.
+
+Usage:
+    hub = client.watcher_hub()
+    watch = hub.watch(job_id, kind="crawl")
+    watch.add_listener(lambda status: print(status.status))
+    watch.wait()
+    hub.close()
+
+``Watcher`` runs a thread and an event loop per job. ``WatcherHub`` runs one
+loop thread for all of them: each job's WebSocket is a task on that loop,
+messages are routed to the job's listeners, and jobs whose socket drops,
+stays quiet for ``idle_timeout`` or finds all ``max_connections`` in use are
+handed to one shared HTTP poller (an ``AsyncJobMonitor``).
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Union
+
+from .monitor import AsyncJobMonitor
+from .types import BatchScrapeJob, CrawlJob, Document
+from .utils import json_codec
+from .utils.deadline import Deadline, DeadlineExceededError
+from .utils.http_client_async import AsyncHttpClient
+from .utils.normalize import normalize_document_input
+from .utils.transport import websocket_connect
+
+JobKind = Literal["crawl", "batch"]
+JobType = Union[CrawlJob, BatchScrapeJob]
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+def _snapshot(kind: JobKind, status: str, payload: Dict[str, Any], documents: List[Dict[str, Any]]) -> JobType:
+    docs = [Document(**normalize_document_input(doc)) for doc in documents if isinstance(doc, dict)]
+    model = CrawlJob if kind == "crawl" else BatchScrapeJob
+    return model(
+        status=status,
+        completed=payload.get("completed", 0),
+        total=payload.get("total", 0),
+        credits_used=payload.get("creditsUsed", 0 if kind == "crawl" else None),
+        expires_at=payload.get("expiresAt"),
+        next=payload.get("next"),
+        data=docs,
+    )
+
+
+class HubWatch:
+    """
+    One job watched by a ``WatcherHub``; the listener API mirrors ``Watcher``.
+
+    Listeners and event handlers run on the hub's loop thread and must not
+    block. ``transport`` tells whether updates currently arrive over the
+    job's WebSocket (``"websocket"``) or the shared poller (``"http"``); polled
+    jobs emit a snapshot per poll. "done" is dispatched for completed and
+    cancelled jobs alike, with the final ``status`` in its detail.
+    """
+
+    def __init__(self, job_id: str, kind: JobKind) -> None:
+        self.job_id = job_id
+        self.kind = kind
+        self.status: str = "scraping"
+        self.data: List[Dict[str, Any]] = []
+        self.error: Optional[BaseException] = None
+        self.transport: Optional[str] = None
+        self._listeners: List[Callable[[JobType], None]] = []
+        self._event_handlers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {
+            "done": [],
+            "error": [],
+            "document": [],
+        }
+        self._done = threading.Event()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def add_listener(self, callback: Callable[[JobType], None]) -> None:
+        self._listeners.append(callback)
+
+    def add_event_listener(self, event_type: str, handler: Callable[[Dict[str, Any]], None]) -> None:
+        if event_type in self._event_handlers:
+            self._event_handlers[event_type].append(handler)
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finished (or failed or timed out); False if ``timeout`` passed first."""
+        return self._done.wait(timeout)
+
+    def _emit(self, status: JobType) -> None:
+        for cb in list(self._listeners):
+            try:
+                cb(status)
+            except Exception:
+                pass
+
+    def _dispatch(self, event_type: str, detail: Dict[str, Any]) -> None:
+        for handler in list(self._event_handlers.get(event_type, [])):
+            try:
+                handler(detail)
+            except Exception:
+                pass
+
+    def _add_document(self, doc: Any) -> None:
+        if isinstance(doc, dict):
+            self.data.append(doc)
+            self._dispatch("document", {"data": doc, "id": self.job_id})
+
+    def _finish(self, status: str, error: Any = None) -> None:
+        if self._done.is_set():
+            return
+        self.status = status
+        if status in ("completed", "cancelled") and error is None:
+            # A cancelled job ends with "done" too; ``status`` tells the two apart
+            self._dispatch("done", {"status": status, "data": self.data, "id": self.job_id})
+        elif status == "failed" or error is not None:
+            self._dispatch("error", {"status": status, "data": self.data, "error": error, "id": self.job_id})
+        self._done.set()
+
+    def _handle(self, body: Dict[str, Any]) -> bool:
+        """Apply one WebSocket message; returns True once the job is finished."""
+        msg_type = body.get("type")
+        if msg_type == "error":
+            self._safe_emit("failed", {}, [])
+            self._finish("failed", body.get("error"))
+            return True
+        if msg_type == "catchup":
+            payload = body.get("data") or {}
+            self.status = payload.get("status", self.status)
+            for doc in payload.get("data") or []:
+                self._add_document(doc)
+            return False
+        if msg_type == "document":
+            self._add_document(body.get("data"))
+            return False
+        if msg_type == "done":
+            payload = body.get("data") or {}
+            for doc in payload.get("data") or []:
+                if isinstance(doc, dict):
+                    self.data.append(doc)
+            self._safe_emit("completed", payload, self.data)
+            self._finish("completed")
+            return True
+        payload = body.get("data", body)
+        if not isinstance(payload, dict) or "status" not in payload:
+            return False
+        status = payload["status"]
+        self.status = status
+        self._safe_emit(status, payload, payload.get("data") or [])
+        if status in TERMINAL_STATUSES:
+            self._finish(status)
+            return True
+        return False
+
+    def _safe_emit(self, status: str, payload: Dict[str, Any], documents: List[Dict[str, Any]]) -> None:
+        try:
+            snapshot = _snapshot(self.kind, status, payload, documents)
+        except Exception:
+            return
+        self._emit(snapshot)
+
+    def _progress(self, job: JobType) -> None:
+        """A status from the HTTP poller: dispatch its new documents and emit the snapshot."""
+        if self._done.is_set():
+            return
+        # The poller's statuses carry every document collected so far
+        for doc in job.data[len(self.data):]:
+            self._add_document(doc.model_dump(exclude_none=True))
+        self.status = job.status
+        self._emit(job)
+
+    def _settle(self, job: JobType) -> None:
+        """Final status from the HTTP poller."""
+        if self._done.is_set():
+            return
+        self._progress(job)
+        self._finish(job.status)
+
+
+class WatcherHub:
+    """
+    Watch many crawl and batch jobs from one background thread and event loop.
+
+    Args:
+        client: Client providing ``http_client``, whose API URL, key, transport,
+            retry policy, rate limiter, circuit breaker and metrics the hub shares
+        poll_interval: Seconds between HTTP polls of jobs without a WebSocket
+        max_connections: WebSockets open at once; further jobs are polled
+        idle_timeout: Seconds without a message after which a socket is closed
+            and its job polled instead
+        poll_concurrency: HTTP status checks in flight at once
+        transport: ``httpx`` transport for the HTTP poller (default: the client's)
+    """
+
+    def __init__(
+        self,
+        client: object,
+        *,
+        poll_interval: float = 2,
+        max_connections: int = 256,
+        idle_timeout: float = 60.0,
+        poll_concurrency: int = 4,
+        transport: Any = None,
+    ) -> None:
+        if max_connections < 0:
+            raise ValueError("max_connections must be non-negative")
+        http_client = getattr(client, "http_client", None)
+        self._http_client = http_client
+        self._polling = getattr(client, "polling", None)
+        self._api_url: Optional[str] = getattr(http_client, "api_url", None)
+        self._api_key: Optional[str] = getattr(http_client, "api_key", None)
+        self._socket_path: Optional[str] = getattr(http_client, "unix_socket_path", None)
+        if not self._api_url:
+            raise ValueError("API URL is required for WatcherHub")
+        self._poll_interval = poll_interval
+        self._max_connections = max_connections
+        self._idle_timeout = idle_timeout
+        self._poll_concurrency = poll_concurrency
+        self._transport = transport if transport is not None else (
+            f"unix://{self._socket_path}" if self._socket_path else None
+        )
+        self._watches: Dict[str, HubWatch] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._http: Optional[AsyncHttpClient] = None
+        self._poller: Optional[AsyncJobMonitor] = None
+        self._sockets: Set["asyncio.Task[None]"] = set()
+        self._open_sockets = 0
+        self._closed = False
+
+    def start(self) -> None:
+        """Start the loop thread (``watch`` does this on first use)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            if self._closed:
+                raise RuntimeError("WatcherHub is closed")
+            loop = asyncio.new_event_loop()
+            self._loop = loop
+            self._thread = threading.Thread(target=self._serve, args=(loop,), name="firecrawl-watcher-hub", daemon=True)
+            self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._setup(), loop).result()
+
+    def watch(
+        self,
+        job_id: str,
+        kind: JobKind = "crawl",
+        listener: Optional[Callable[[JobType], None]] = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> HubWatch:
+        """
+        Start watching a job.
+
+        Args:
+            job_id: Crawl or batch scrape job ID
+            kind: Job kind ("crawl" or "batch")
+            listener: Called with each status snapshot
+            timeout: Seconds after which watching gives up (an "error" event)
+
+        Returns:
+            HubWatch to add listeners to and wait on
+        """
+        if kind not in ("crawl", "batch"):
+            raise ValueError(f"Unknown job kind: {kind}")
+        self.start()
+        watch = HubWatch(job_id, kind)
+        if listener is not None:
+            watch.add_listener(listener)
+        with self._lock:
+            if job_id in self._watches:
+                raise ValueError(f"Job {job_id} is already watched")
+            self._watches[job_id] = watch
+        assert self._loop is not None
+        self._loop.call_soon_threadsafe(self._begin, watch, Deadline(timeout))
+        return watch
+
+    def unwatch(self, job_id: str) -> bool:
+        """Stop watching a job (closing its socket); returns whether it was watched."""
+        with self._lock:
+            watch = self._watches.pop(job_id, None)
+        if watch is None:
+            return False
+        assert self._loop is not None
+        self._loop.call_soon_threadsafe(self._drop, watch)
+        return True
+
+    def pending(self) -> List[str]:
+        """IDs of the jobs still being watched."""
+        with self._lock:
+            return [job_id for job_id, watch in self._watches.items() if not watch.done()]
+
+    def stats(self) -> Dict[str, int]:
+        """Jobs watched, open WebSockets and jobs on the HTTP poller."""
+        with self._lock:
+            active = [watch for watch in self._watches.values() if not watch.done()]
+        polled = sum(1 for watch in active if watch.transport == "http")
+        return {"jobs": len(active), "websockets": self._open_sockets, "polled": polled}
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every watched job is done; returns False if ``timeout`` passed first."""
+        deadline = Deadline(timeout)
+        with self._lock:
+            watches = list(self._watches.values())
+        for watch in watches:
+            if not watch.wait(deadline.remaining()):
+                return False
+        return True
+
+    def close(self) -> None:
+        """Close every socket and the poller and stop the loop thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def __enter__(self) -> "WatcherHub":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # Everything below runs on the hub's loop thread
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    async def _setup(self) -> None:
+        # Polls go through the owning client's retries, rate limits, breaker and metrics
+        source = self._http_client
+        self._http = AsyncHttpClient(
+            self._api_key or "",
+            self._api_url or "",
+            retry_policy=getattr(source, "retry_policy", None),
+            metrics=getattr(source, "metrics", None),
+            rate_limiter=getattr(source, "rate_limiter", None),
+            request_compression_threshold=getattr(source, "request_compression_threshold", None),
+            transport=self._transport,
+            circuit_breaker=getattr(source, "circuit_breaker", None),
+        )
+        self._poller = AsyncJobMonitor(
+            self._http,
+            poll_interval=self._poll_interval,
+            polling=self._polling,
+            max_concurrency=self._poll_concurrency,
+        )
+
+    async def _shutdown(self) -> None:
+        tasks = list(self._sockets)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self._poller is not None:
+            await self._poller.close()
+        if self._http is not None:
+            await self._http.close()
+
+    def _begin(self, watch: HubWatch, deadline: Deadline) -> None:
+        if self._closed or watch.done():
+            return
+        if self._open_sockets >= self._max_connections:
+            self._poll(watch, deadline)
+            return
+        self._open_sockets += 1
+        watch.transport = "websocket"
+        watch._task = asyncio.ensure_future(self._run_ws(watch, deadline))
+        self._sockets.add(watch._task)
+        watch._task.add_done_callback(self._sockets.discard)
+
+    def _drop(self, watch: HubWatch) -> None:
+        if watch._task is not None:
+            watch._task.cancel()
+        if self._poller is not None:
+            self._poller.unwatch(watch.job_id)
+
+    def _ws_url(self, watch: HubWatch) -> str:
+        ws_base = (self._api_url or "").replace("https://", "wss://").replace("http://", "ws://", 1)
+        if watch.kind == "crawl":
+            return f"{ws_base}/v2/crawl/{watch.job_id}"
+        return f"{ws_base}/v2/batch/scrape/{watch.job_id}"
+
+    async def _run_ws(self, watch: HubWatch, deadline: Deadline) -> None:
+        headers = [("Authorization", f"Bearer {self._api_key}")] if self._api_key else []
+        try:
+            async with websocket_connect(
+                self._ws_url(watch), unix_socket_path=self._socket_path, max_size=None, additional_headers=headers
+            ) as websocket:
+                while True:
+                    try:
+                        msg = await asyncio.wait_for(websocket.recv(), deadline.clip(self._idle_timeout))
+                    except asyncio.TimeoutError:
+                        # Quiet socket (or out of time): let the shared poller take over
+                        break
+                    try:
+                        body = json_codec.loads(msg)
+                    except Exception:
+                        continue
+                    if isinstance(body, dict) and watch._handle(body):
+                        self._forget(watch)
+                        return
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Connection error: fall back to HTTP polling below
+            pass
+        finally:
+            self._open_sockets -= 1
+            watch._task = None
+        if not watch.done() and not self._closed and self._is_watched(watch):
+            self._poll(watch, deadline)
+
+    def _poll(self, watch: HubWatch, deadline: Deadline) -> None:
+        if deadline.expired():
+            self._fail(watch, DeadlineExceededError(f"Watching job {watch.job_id} timed out"))
+            return
+        assert self._poller is not None
+        watch.transport = "http"
+        self._poller.watch(
+            watch.job_id,
+            watch.kind,
+            lambda job: self._settled(watch, job),
+            on_error=lambda exc: self._fail(watch, exc),
+            timeout=deadline.remaining(),
+            on_status=watch._progress,
+        )
+
+    def _settled(self, watch: HubWatch, job: JobType) -> None:
+        watch._settle(job)
+        self._forget(watch)
+
+    def _fail(self, watch: HubWatch, error: BaseException) -> None:
+        watch.error = error
+        watch._finish(watch.status, str(error))
+        self._forget(watch)
+
+    def _is_watched(self, watch: HubWatch) -> bool:
+        with self._lock:
+            return self._watches.get(watch.job_id) is watch
+
+    def _forget(self, watch: HubWatch) -> None:
+        with self._lock:
+            if self._watches.get(watch.job_id) is watch:
+                del self._watches[watch.job_id]